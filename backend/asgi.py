@@ -0,0 +1,212 @@
+# ASGI Entry Point - jalankan dengan: uvicorn asgi:application --workers 2
+# Flask app tetap jadi satu-satunya implementasi route; request WSGI dijalankan di executor
+# terbatas supaya event loop tidak ikut terblokir oleh fuzzy scan yang berat
+import asyncio  # Event loop ASGI
+import io  # Body request buat wsgi.input
+import json  # Body response error
+import os  # Konfigurasi dari environment
+import sys  # wsgi.errors
+import threading  # Counter request aktif
+from concurrent.futures import ThreadPoolExecutor  # Executor matching CPU-bound
+
+mlPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'machinelearning'))  # Direktori modul ML (structuredLog)
+if mlPath not in sys.path:  # Cek apakah path sudah ada
+    sys.path.append(mlPath)  # Tambah ke Python path
+from structuredLog import getLogger  # Logger terstruktur
+
+logger = getLogger('asgi')  # Logger stage asgi
+
+ASGI_MAX_WORKERS = int(os.environ.get('ASGI_MAX_WORKERS', '4'))  # Thread yang menjalankan pipeline
+ASGI_MAX_QUEUE = int(os.environ.get('ASGI_MAX_QUEUE', '16'))  # Request yang boleh antre saat semua thread sibuk
+ASGI_REQUEST_TIMEOUT = float(os.environ.get('ASGI_REQUEST_TIMEOUT', '30'))  # Batas waktu satu request (detik)
+ASGI_SHUTDOWN_TIMEOUT = float(os.environ.get('ASGI_SHUTDOWN_TIMEOUT', '30'))  # Batas tunggu request aktif saat shutdown
+ASGI_MAX_BODY = int(os.environ.get('ASGI_MAX_BODY', str(1024 * 1024)))  # Ukuran body maksimal (byte)
+CLIENT_DISCONNECTED = object()  # Penanda readBody: client putus sebelum body lengkap
+
+def errorBody(source, answer):  # Body error dengan bentuk JSON yang sama seperti service
+    return json.dumps({"intent": None, "answer": answer, "source": source}, sort_keys=True, separators=(',', ':')).encode('utf-8')  # JSON bytes (format sama dengan jsonify)
+
+class BoundedExecutor:  # ThreadPoolExecutor dengan batas request aktif (jalan + antre)
+    def __init__(self, maxWorkers, maxQueue):  # Konstruktor executor
+        self.executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix='ask')  # Thread pool
+        self.capacity = maxWorkers + maxQueue  # Total slot
+        self.active = 0  # Request yang sedang jalan/antre
+        self._futures = set()  # Future yang belum selesai (dibatalkan saat shutdown)
+        self._lock = threading.Lock()  # Lock counter
+        self._idle = threading.Condition(self._lock)  # Notifikasi saat semua request selesai
+
+    def trySubmit(self, fn, *args):  # Submit kalau masih ada slot, None kalau penuh
+        with self._lock:  # Akses eksklusif
+            if self.active >= self.capacity:  # Executor penuh
+                return None  # Tolak (backpressure)
+            self.active += 1  # Ambil slot
+        try:
+            future = self.executor.submit(fn, *args)  # Jalankan di thread pool
+        except RuntimeError:  # Executor sudah shutdown
+            self._release(None)  # Kembalikan slot
+            return None  # Tolak
+        with self._lock:  # Akses eksklusif
+            self._futures.add(future)  # Catat future aktif
+        future.add_done_callback(self._release)  # Slot dilepas saat selesai/dibatalkan
+        return future  # Return future
+
+    def _release(self, future):  # Lepas satu slot
+        with self._lock:  # Akses eksklusif
+            self._futures.discard(future)  # Future sudah selesai
+            self.active -= 1  # Kembalikan slot
+            if self.active == 0:  # Tidak ada request aktif
+                self._idle.notify_all()  # Bangunkan yang menunggu drain
+
+    def drain(self, timeout):  # Tunggu semua request aktif selesai
+        with self._lock:  # Akses eksklusif
+            return self._idle.wait_for(lambda: self.active == 0, timeout)  # True kalau sudah kosong
+
+    def shutdown(self):  # Matikan thread pool
+        with self._lock:  # Akses eksklusif
+            futures = list(self._futures)  # Future yang belum selesai
+        for future in futures:  # Batalkan yang masih antre (yang sedang jalan tidak terpengaruh)
+            future.cancel()  # Sama dengan cancel_futures=True, yang baru ada sejak Python 3.9
+        self.executor.shutdown(wait=False)  # Tanpa menunggu request yang sedang jalan
+
+def buildEnviron(scope, body):  # Konversi scope ASGI ke environ WSGI
+    server = scope.get('server') or ('localhost', 80)  # Host server
+    client = scope.get('client') or ('', 0)  # Alamat client
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False
+    }
+    for rawName, rawValue in scope.get('headers', []):  # Loop header request
+        name = rawName.decode('latin-1').upper().replace('-', '_')  # Nama header versi CGI
+        value = rawValue.decode('latin-1')  # Nilai header
+        if name == 'CONTENT_TYPE':  # Header khusus tanpa prefix HTTP_
+            environ['CONTENT_TYPE'] = value  # Simpan content type
+            continue  # Header berikutnya
+        if name == 'CONTENT_LENGTH':  # Panjang dihitung dari body
+            continue  # Skip
+        key = f"HTTP_{name}"  # Key environ
+        environ[key] = f"{environ[key]},{value}" if key in environ else value  # Gabung header ganda
+    return environ  # Return environ
+
+def callWsgi(wsgiApp, environ):  # Jalankan app WSGI (di thread executor)
+    responseStart = {}  # Status dan header response
+
+    def startResponse(status, headers, excInfo=None):  # Callable start_response
+        if excInfo and responseStart:  # Error setelah header dikirim
+            raise excInfo[1].with_traceback(excInfo[2])  # Lempar ulang
+        responseStart['status'] = int(status.split(' ', 1)[0])  # Kode status
+        responseStart['headers'] = [(name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers]  # Header ASGI
+        return lambda data: chunks.append(data)  # Callable write lama
+
+    chunks = []  # Potongan body response
+    result = wsgiApp(environ, startResponse)  # Panggil Flask
+    try:
+        for chunk in result:  # Kumpulkan body
+            chunks.append(chunk)  # Simpan potongan
+    finally:
+        if hasattr(result, 'close'):  # Iterable WSGI bisa punya close()
+            result.close()  # Tutup response
+    return responseStart['status'], responseStart['headers'], b''.join(chunks)  # Status, header, body
+
+class AsgiApplication:  # Adapter ASGI -> Flask dengan executor terbatas
+    def __init__(self, wsgiApp, maxWorkers=ASGI_MAX_WORKERS, maxQueue=ASGI_MAX_QUEUE, requestTimeout=ASGI_REQUEST_TIMEOUT, shutdownTimeout=ASGI_SHUTDOWN_TIMEOUT):  # Konstruktor adapter
+        self.wsgiApp = wsgiApp  # Flask app
+        self.executor = BoundedExecutor(maxWorkers, maxQueue)  # Executor terbatas
+        self.requestTimeout = requestTimeout  # Timeout request
+        self.shutdownTimeout = shutdownTimeout  # Timeout drain saat shutdown
+        self.draining = False  # Flag sedang shutdown
+
+    async def __call__(self, scope, receive, send):  # Entry point ASGI
+        if scope['type'] == 'lifespan':  # Event startup/shutdown server
+            await self.handleLifespan(receive, send)  # Handle lifespan
+        elif scope['type'] == 'http':  # Request HTTP
+            await self.handleHttp(scope, receive, send)  # Handle request
+        else:  # Websocket dan lain-lain tidak didukung
+            raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")  # Tolak scope
+
+    async def handleLifespan(self, receive, send):  # Startup dan graceful shutdown
+        while True:  # Loop event lifespan
+            message = await receive()  # Tunggu event
+            if message['type'] == 'lifespan.startup':  # Server mulai
+                await send({'type': 'lifespan.startup.complete'})  # Detector sudah di-warm-up saat import app
+            elif message['type'] == 'lifespan.shutdown':  # Server berhenti
+                self.draining = True  # Tolak request baru
+                drained = await asyncio.get_running_loop().run_in_executor(None, self.executor.drain, self.shutdownTimeout)  # Tunggu request aktif
+                if not drained:  # Masih ada request setelah timeout
+                    logger.warning("Shutdown dengan %d request aktif", self.executor.active)  # Log request yang ditinggal
+                self.executor.shutdown()  # Matikan thread pool
+                await send({'type': 'lifespan.shutdown.complete'})  # Shutdown selesai
+                return  # Keluar dari lifespan
+
+    async def readBody(self, receive):  # Baca body request (None kalau terlalu besar, CLIENT_DISCONNECTED kalau client putus)
+        body = bytearray()  # Buffer body
+        while True:  # Loop potongan body
+            message = await receive()  # Potongan berikutnya
+            if message['type'] == 'http.disconnect':  # Client putus
+                return CLIENT_DISCONNECTED  # Tidak ada yang perlu dijawab
+            body.extend(message.get('body', b''))  # Tambah potongan
+            if len(body) > ASGI_MAX_BODY:  # Body terlalu besar
+                return None  # Tolak
+            if not message.get('more_body', False):  # Potongan terakhir
+                return bytes(body)  # Return body
+
+    async def sendResponse(self, send, status, headers, body):  # Kirim response ASGI
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})  # Status + header
+        await send({'type': 'http.response.body', 'body': body})  # Body
+
+    async def sendError(self, send, status, source, answer):  # Kirim response error JSON
+        body = errorBody(source, answer)  # Body error
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('latin-1'))]  # Header JSON
+        if status == 503:  # Server penuh/shutdown
+            headers.append((b'retry-after', b'1'))  # Saran retry
+        await self.sendResponse(send, status, headers, body)  # Kirim response
+
+    async def handleHttp(self, scope, receive, send):  # Handle satu request HTTP
+        if self.draining:  # Server sedang shutdown
+            await self.sendError(send, 503, "shutting_down", "Server sedang restart. Coba lagi sebentar.")  # Tolak
+            return  # Selesai
+        body = await self.readBody(receive)  # Baca body
+        if body is CLIENT_DISCONNECTED:  # Client sudah pergi
+            logger.debug("Client putus sebelum body lengkap: %s", scope['path'])  # Log request yang dibuang
+            return  # Tanpa response
+        if body is None:  # Body terlalu besar
+            await self.sendError(send, 413, "request_too_large", "Pertanyaan terlalu panjang.")  # Tolak
+            return  # Selesai
+
+        future = self.executor.trySubmit(callWsgi, self.wsgiApp, buildEnviron(scope, body))  # Jalankan Flask di executor
+        if future is None:  # Executor penuh (backpressure)
+            await self.sendError(send, 503, "overloaded", "Server sedang sibuk. Coba lagi sebentar.")  # Tolak
+            return  # Selesai
+        try:
+            status, headers, responseBody = await asyncio.wait_for(asyncio.wrap_future(future), self.requestTimeout)  # Tunggu hasil
+        except asyncio.TimeoutError:  # Request terlalu lama (yang masih antre ikut dibatalkan)
+            await self.sendError(send, 504, "timeout", "Maaf, pemrosesan pertanyaan terlalu lama. Coba lagi nanti.")  # Timeout
+            return  # Selesai
+        except asyncio.CancelledError:  # Future dibatalkan shutdown (masih antre) atau task request dibatalkan server
+            if not future.cancelled():  # Bukan dari shutdown executor
+                raise  # Teruskan pembatalan task
+            await self.sendError(send, 503, "shutting_down", "Server sedang restart. Coba lagi sebentar.")  # Request antre ditolak
+            return  # Selesai
+        await self.sendResponse(send, status, headers, responseBody)  # Kirim response Flask apa adanya
+
+from app import app as flaskApp  # Flask app (import sekaligus warm-up detector)
+
+application = AsgiApplication(flaskApp)  # App ASGI
+
+if __name__ == '__main__':  # Jalankan langsung dengan uvicorn
+    import uvicorn  # ASGI server (opsional)
+    uvicorn.run(application, host=os.environ.get('ASGI_HOST', '0.0.0.0'), port=int(os.environ.get('ASGI_PORT', '5000')))  # Start server
@@ -1,11 +1,40 @@
 # Request Controller Layer 
-from flask import request, jsonify  # Flask HTTP utilities
-from services.services import detectIntentService  # Import business logic
+import os  # Konfigurasi dari environment
+import sys  # Sistem parameter untuk path
+from flask import Response, request, jsonify  # Flask HTTP utilities
+from services.services import detectIntentService, detectIntentServiceBatch, getReadiness, getMetricsText  # Import business logic
+
+mlPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'machinelearning'))  # Direktori modul ML (structuredLog)
+if mlPath not in sys.path:  # Cek apakah path sudah ada
+    sys.path.append(mlPath)  # Tambah ke Python path
+from structuredLog import getLogger  # Logger terstruktur
+
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', '200'))  # Jumlah pertanyaan maksimal per batch
+
+logger = getLogger('controller')  # Logger stage controller
 
 def handleAskRequest():  # Handle POST requests to /ask endpoint
     requestData = request.get_json()  # Parse JSON from request body
     userQuestion = requestData.get('question', '') if requestData else ''  # Extract question field
-    print(f"DEBUG: Controller received: '{userQuestion}'")  # Log incoming request
+    logger.debug("Controller received: '%s'", userQuestion)  # Log incoming request
     serviceResult = detectIntentService(userQuestion)  # Process through ML pipeline
-    print(f"DEBUG: Service returned: {serviceResult}")  # Log service response
+    logger.debug("Service returned: %s", serviceResult)  # Log service response
     return jsonify(serviceResult)  # Return JSON response
+
+def handleAskBatchRequest():  # Handle POST requests to /ask/batch endpoint
+    requestData = request.get_json()  # Parse JSON from request body
+    userQuestions = requestData.get('questions') if requestData else None  # Extract questions field
+    if not isinstance(userQuestions, list) or not all(isinstance(question, str) for question in userQuestions):  # Validasi input
+        return jsonify({"error": "Field 'questions' harus berupa list string."}), 400  # Bad request
+    if len(userQuestions) > MAX_BATCH_SIZE:  # Batch terlalu besar
+        return jsonify({"error": f"Maksimal {MAX_BATCH_SIZE} pertanyaan per batch."}), 413  # Payload too large
+    logger.debug("Controller received batch of %d questions", len(userQuestions))  # Log incoming request
+    serviceResults = detectIntentServiceBatch(userQuestions)  # Process through ML pipeline
+    return jsonify({"results": serviceResults, "count": len(serviceResults)})  # Return JSON response
+
+def handleReadyRequest():  # Handle GET requests to /ready endpoint
+    readiness = getReadiness()  # Status pipeline, detector, matcher
+    return jsonify(readiness), (200 if readiness['ready'] else 503)  # 503 sampai warm-up selesai
+
+def handleMetricsRequest():  # Handle GET requests to /metrics endpoint
+    return Response(getMetricsText(), mimetype='text/plain; version=0.0.4')  # Prometheus text format
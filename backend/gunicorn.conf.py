@@ -0,0 +1,17 @@
+# Gunicorn Configuration - jalankan dengan: gunicorn -c gunicorn.conf.py app:app
+import os  # Interface OS untuk environment variable
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')  # Alamat server
+workers = int(os.environ.get('GUNICORN_WORKERS', '2'))  # Jumlah worker process
+threads = int(os.environ.get('GUNICORN_THREADS', '4'))  # Thread per worker (detector dipakai bersama)
+preload_app = True  # Load app + NLP detector sekali di master, lalu di-share ke worker lewat fork
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '60'))  # Timeout request (detik)
+
+def pre_fork(server, worker):  # Di master sebelum fork worker: worker scoring hasil warm-up master tidak bisa dipakai worker
+    from machinelearning import matching  # Sudah di-import app (preload)
+    matching.shutdownScoringPool()  # Worker gunicorn fork pool sendiri
+
+def post_fork(server, worker):  # Di worker gunicorn sebelum thread request dibuat
+    from machinelearning import matching  # Sudah di-import app (preload)
+    if matching.wantsScoringPool(matching.getCorpus()):  # MATCH_PARALLEL=1 dan corpus cukup besar
+        matching.startScoringPool()  # Worker scoring milik worker gunicorn ini
@@ -1,6 +1,6 @@
 # API Route Definition Layer
 from flask import Blueprint  # Flask blueprint for route organization
-from controller.controller import handleAskRequest  # Import request handler
+from controller.controller import handleAskRequest, handleAskBatchRequest, handleReadyRequest, handleMetricsRequest  # Import request handler
 
 apiBp = Blueprint('api', __name__)  # Create API blueprint
 
@@ -8,4 +8,14 @@ apiBp = Blueprint('api', __name__)  # Create API blueprint
 def askEndpoint():  # Main chatbot endpoint
     return handleAskRequest()  # Delegate to controller
 
+@apiBp.route('/ask/batch', methods=['POST'])  # Define POST endpoint /ask/batch
+def askBatchEndpoint():  # Batch chatbot endpoint (regression set, bulk FAQ)
+    return handleAskBatchRequest()  # Delegate to controller
 
+@apiBp.route('/ready', methods=['GET'])  # Define GET endpoint /ready
+def readyEndpoint():  # Readiness probe (load balancer / orchestrator)
+    return handleReadyRequest()  # Delegate to controller
+
+@apiBp.route('/metrics', methods=['GET'])  # Define GET endpoint /metrics
+def metricsEndpoint():  # Scrape endpoint Prometheus
+    return handleMetricsRequest()  # Delegate to controller
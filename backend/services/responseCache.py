@@ -0,0 +1,100 @@
+# Response Cache Layer - cache hasil detectIntentService (TTL + LRU + batas memori)
+import json  # Estimasi ukuran response
+import os  # Konfigurasi dari environment
+import threading  # Lock buat akses dari banyak request thread
+import time  # Timestamp TTL
+from collections import OrderedDict  # Dict yang menyimpan urutan akses
+
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', '2048'))  # Jumlah maksimal response
+RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', '300'))  # Umur maksimal response (detik)
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', str(16 * 1024 * 1024)))  # Batas memori (perkiraan byte JSON)
+
+def estimateSize(value):  # Perkiraan ukuran response di memori
+    try:  # Response harus JSON-serializable
+        return len(json.dumps(value, default=str))  # Panjang JSON sebagai proxy ukuran
+    except (TypeError, ValueError):  # Tidak bisa diserialisasi
+        return 0  # Anggap kecil
+
+class ResponseCache:  # Cache response LRU dengan TTL, batas memori dan versi dataset
+    def __init__(self, maxEntries=RESPONSE_CACHE_SIZE, ttlSeconds=RESPONSE_CACHE_TTL, maxBytes=RESPONSE_CACHE_MAX_BYTES):  # Konstruktor cache
+        self.maxEntries = maxEntries  # Jumlah maksimal item
+        self.ttlSeconds = ttlSeconds  # Umur maksimal item
+        self.maxBytes = maxBytes  # Total ukuran maksimal
+        self._data = OrderedDict()  # key -> (response, createdAt, size), urut dari yang paling lama dipakai
+        self._lock = threading.Lock()  # Lock akses data
+        self._bytes = 0  # Total ukuran item
+        self._version = None  # Versi dataset saat item disimpan
+        self.hits = 0  # Jumlah cache hit
+        self.misses = 0  # Jumlah cache miss
+        self.evictions = 0  # Jumlah item yang dibuang karena kapasitas
+        self.expirations = 0  # Jumlah item yang kedaluwarsa
+        self.invalidations = 0  # Jumlah reset karena dataset berubah
+
+    def _checkVersion(self, version):  # Reset cache kalau dataset berubah (dipanggil dengan lock)
+        if version != self._version:  # Dataset sudah ganti
+            if self._data:  # Ada item lama
+                self.invalidations += 1  # Catat invalidasi
+            self._data.clear()  # Buang semua item
+            self._bytes = 0  # Reset ukuran
+            self._version = version  # Simpan versi baru
+
+    def _remove(self, key):  # Hapus satu item (dipanggil dengan lock)
+        _, _, size = self._data.pop(key)  # Ambil item
+        self._bytes -= size  # Kurangi ukuran
+
+    def get(self, key, version=None):  # Ambil response, return (response, umur) atau None
+        with self._lock:  # Akses eksklusif
+            self._checkVersion(version)  # Validasi versi dataset
+            entry = self._data.get(key)  # Cari item
+            if entry is None:  # Tidak ada
+                self.misses += 1  # Catat miss
+                return None  # Cache miss
+            response, createdAt, _ = entry  # Isi item
+            age = time.monotonic() - createdAt  # Umur item
+            if self.ttlSeconds > 0 and age > self.ttlSeconds:  # Sudah kedaluwarsa
+                self._remove(key)  # Buang item
+                self.expirations += 1  # Catat expirasi
+                self.misses += 1  # Catat miss
+                return None  # Cache miss
+            self._data.move_to_end(key)  # Tandai baru dipakai
+            self.hits += 1  # Catat hit
+            return response, age  # Cache hit
+
+    def put(self, key, response, version=None):  # Simpan response ke cache
+        if self.maxEntries <= 0:  # Cache dimatikan
+            return  # Tidak simpan apa-apa
+        size = estimateSize(response)  # Ukuran response
+        if self.maxBytes > 0 and size > self.maxBytes:  # Lebih besar dari seluruh cache
+            return  # Tidak disimpan
+        with self._lock:  # Akses eksklusif
+            self._checkVersion(version)  # Validasi versi dataset
+            if key in self._data:  # Ganti item lama
+                self._remove(key)  # Hapus dulu
+            self._data[key] = (response, time.monotonic(), size)  # Simpan item
+            self._bytes += size  # Tambah ukuran
+            while len(self._data) > self.maxEntries or (self.maxBytes > 0 and self._bytes > self.maxBytes):  # Melebihi kapasitas
+                oldestKey = next(iter(self._data))  # Item paling lama dipakai
+                self._remove(oldestKey)  # Buang item
+                self.evictions += 1  # Catat eviction
+
+    def clear(self):  # Kosongkan cache
+        with self._lock:  # Akses eksklusif
+            self._data.clear()  # Hapus semua item
+            self._bytes = 0  # Reset ukuran
+
+    def stats(self):  # Statistik cache
+        with self._lock:  # Baca konsisten
+            lookups = self.hits + self.misses  # Total lookup
+            return {  # Ringkasan statistik
+                'size': len(self._data),
+                'bytes': self._bytes,
+                'maxEntries': self.maxEntries,
+                'maxBytes': self.maxBytes,
+                'ttlSeconds': self.ttlSeconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'hitRate': self.hits / lookups if lookups else 0.0
+            }
@@ -5,88 +5,346 @@ import os   # Interface OS untuk file path
 rootPath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))  # Dapatkan path root project
 if rootPath not in sys.path:  # Cek apakah path sudah ada
     sys.path.append(rootPath)  # Tambah ke Python path
+mlPath = os.path.join(rootPath, 'machinelearning')  # Direktori modul ML (import flat seperti modul ML sendiri)
+if mlPath not in sys.path:  # Cek apakah path sudah ada
+    sys.path.append(mlPath)  # Tambah ke Python path
 
-def detectIntentService(userQuestion):  # Fungsi utama deteksi intent
-    try:  # Coba import modul ML
-        from machinelearning import matching  # Import algoritma matching
-        from machinelearning import preprocessing  # Import text preprocessing
-        from machinelearning import algorithm  # Import orchestrator
-        from machinelearning.nlpIntentDetector import getNlpIntentDetector  # Import NLP detector
-    except ImportError as importError:  # Tangkap error import
-        print(f"DEBUG: Import gagal = {importError}")  # Log error
-        return {  # Return fallback response
-            "intent": None,
-            "answer": "Maaf, sistem bermasalah. Coba lagi nanti.",
-            "source": "import_error"
-        }
+from services.responseCache import ResponseCache  # Cache response query
+from structuredLog import getLogger  # Logger terstruktur
+from pipelineMetrics import timed, observeAnswer, renderMetrics  # Metrics per stage
+
+logger = getLogger('services')  # Logger stage services
+
+responseCache = ResponseCache()  # Cache response bersama semua request thread
+
+def buildCacheKeys(userQuestion, cleanedText, nlpDetector):  # Key cache untuk satu pertanyaan
+    # Jalur NLP hanya bergantung pada preprocessText + preprocess, jalur matching juga pada query lowercase
+    nlpKey = ('nlp', nlpDetector.preprocessText(userQuestion), cleanedText)  # Key response NLP
+    matchingKey = nlpKey + (userQuestion.lower(),)  # Key response matching/fallback
+    return nlpKey, matchingKey  # Return kedua key
+
+def withCacheMetadata(response, hit, age=0.0, batchDeduped=None):  # Tambah metadata cache ke salinan response
+    result = dict(response)  # Jangan ubah response di cache
+    result['cache'] = {'hit': hit, 'ageSeconds': round(age, 3)}  # Metadata cache (hit = dilayani responseCache)
+    if batchDeduped is not None:  # Response batch
+        result['cache']['batchDeduped'] = batchDeduped  # Dilayani dari hasil pertanyaan lain di batch yang sama
+    return result  # Return response
+
+class PipelineError(RuntimeError):  # Pipeline ML tidak bisa dirakit
+    pass
+
+class IntentPipeline:  # Callable pipeline yang di-bind sekali saat startup
+    def __init__(self, preprocess, getDetector, preloadDetector, getDatasetVersion, matchIntent, matchIntentBatch, warmUpMatcher):  # Konstruktor pipeline
+        self.preprocess = preprocess  # Text preprocessing
+        self.getDetector = getDetector  # Ambil NLP detector bersama
+        self.preloadDetector = preloadDetector  # Build NLP detector
+        self.getDatasetVersion = getDatasetVersion  # Versi corpus detector + matcher (invalidasi cache response)
+        self.matchIntent = matchIntent  # Matching CSV (fallback NLP)
+        self.matchIntentBatch = matchIntentBatch  # Matching CSV banyak pertanyaan (userQuestions, processedQueries)
+        self.warmUpMatcher = warmUpMatcher  # Build data + index matching (+ worker scoring kalau MATCH_PARALLEL=1)
+
+def requireCallable(module, *names):  # Ambil callable pertama yang ada di modul
+    for name in names:  # Coba nama sesuai urutan
+        candidate = getattr(module, name, None)  # Ambil atribut
+        if callable(candidate):  # Callable ditemukan
+            return candidate  # Return callable
+    raise PipelineError(f"{module.__name__} tidak punya {' / '.join(names)}")  # Fail fast
+
+def assemblePipeline():  # Import modul ML dan bind callable sekali
+    try:  # Import modul ML
+        from machinelearning import matching  # Algoritma matching
+        from machinelearning import preprocessing  # Text preprocessing
+        from machinelearning import nlpIntentDetector  # Registry NLP detector
+    except ImportError as importError:  # Modul tidak ada
+        raise PipelineError(f"Import gagal = {importError}") from importError  # Fail fast
+
+    if callable(getattr(matching, 'matchIntent', None)):  # Entry point matching utama
+        matchIntent = matching.matchIntent  # Bind langsung
+    else:  # Alternatif fungsi lama
+        matchWithCsv = requireCallable(matching, 'match_with_csv_data')  # Fungsi CSV
+        matchIntent = lambda userQuestion: matchWithCsv(userQuestion, threshold=0.3, topK=1)  # Bind argumen default
+    matchIntentBatch = getattr(matching, 'matchIntentBatch', None)  # Matching batch (ekspansi fuzzy + kandidat bersama)
+    if not callable(matchIntentBatch):  # Modul lama tanpa batch
+        matchIntentBatch = lambda userQuestions, processedQueries=None: [matchIntent(userQuestion) for userQuestion in userQuestions]  # Satu per satu
+    detectorVersion = requireCallable(nlpIntentDetector, 'getDatasetVersion')  # Versi corpus detector
+    matcherVersion = getattr(matching, 'getCorpusVersion', None)  # Versi corpus matcher
+    if not callable(matcherVersion):  # Modul lama tanpa versi corpus
+        matcherVersion = lambda: None  # Corpus matcher tidak pernah berubah
+    return IntentPipeline(
+        preprocess=timed('preprocess')(requireCallable(preprocessing, 'preprocess')),
+        getDetector=requireCallable(nlpIntentDetector, 'getNlpIntentDetector'),
+        preloadDetector=requireCallable(nlpIntentDetector, 'preloadNlpIntentDetector'),
+        getDatasetVersion=lambda: (detectorVersion(), matcherVersion()),
+        matchIntent=matchIntent,
+        matchIntentBatch=matchIntentBatch,
+        warmUpMatcher=requireCallable(matching, 'warmUpMatcher', 'getInvertedIndex')
+    )
+
+_pipeline = None  # Pipeline aktif (dirakit di warmUpService)
+_readiness = {'pipeline': False, 'nlpDetector': False, 'matcher': False}  # Status komponen buat /ready
+
+def getPipeline():  # Ambil pipeline (rakit sekarang kalau belum warm-up)
+    global _pipeline  # Pakai pipeline global
+    if _pipeline is None:  # Belum dirakit
+        _pipeline = assemblePipeline()  # Rakit pipeline
+        _readiness['pipeline'] = True  # Pipeline siap
+    return _pipeline  # Return pipeline
+
+@timed('request')
+def detectIntentService(userQuestion):  # Fungsi utama deteksi intent (terukur)
+    response = runIntentPipeline(userQuestion)  # Jalankan pipeline
+    observeAnswer(response.get('source'))  # Metric cabang yang menjawab
+    return response  # Return response
 
+def importErrorResponse():  # Response saat modul ML tidak bisa dirakit
+    return {  # Return fallback response
+        "intent": None,
+        "answer": "Maaf, sistem bermasalah. Coba lagi nanti.",
+        "source": "import_error"
+    }
+
+def preprocessQuestion(pipeline, userQuestion):  # Preprocess satu pertanyaan, return (cleanedText, sukses)
     try:  # Coba preprocessing text
-        if hasattr(preprocessing, 'preprocess'):  # Cek fungsi ada
-            cleanedText = preprocessing.preprocess(userQuestion)  # Bersihkan text
-            print(f"DEBUG: '{userQuestion}' → '{cleanedText}'")  # Log hasil
-        else:  # Jika preprocess tidak ada
-            cleanedText = userQuestion  # Pakai text asli
+        cleanedText = pipeline.preprocess(userQuestion)  # Bersihkan text
+        logger.debug("'%s' → '%s'", userQuestion, cleanedText)  # Log hasil
+        return cleanedText, True  # Hasil preprocess
     except Exception as preprocessError:  # Tangkap error preprocessing
-        print(f"DEBUG: Preprocessing gagal = {preprocessError}")  # Log error
-        cleanedText = userQuestion  # Fallback ke text asli
+        logger.warning("Preprocessing gagal = %s", preprocessError)  # Log error
+        return userQuestion, False  # Fallback ke text asli
+
+def buildNlpResponse(nlpResult, cleanedText):  # Response dari hasil NLP, None kalau confidence kurang
+    if not (nlpResult and nlpResult.get('confidence', 0) > 0.3):  # Confidence tidak cukup
+        return None  # Lanjut ke matching
+    response = {  # Response structure
+        "intent": nlpResult.get('intent', 'nlp_detected'),
+        "answer": nlpResult.get('answer', ''),
+        "source": "nlp_intent_detector",
+        "processedQuery": cleanedText,
+        "confidence": nlpResult.get('confidence', 0)
+    }
+
+    # Tambahkan link jika ada
+    if nlpResult.get('hasLinks', False) and nlpResult.get('links'):
+        response['links'] = nlpResult['links']  # Tambah link ke response
+        response['hasLinks'] = True  # Flag ada link
+    else:
+        response['hasLinks'] = False  # Tidak ada link
+    return response  # Return response NLP
+
+def buildMatchingResponse(matchedResult, cleanedText):  # Response dari hasil matching tradisional
+    if matchedResult and len(str(matchedResult).strip()) > 0:  # Cek hasil valid
+        return {  # Response sukses
+            "intent": "found",
+            "answer": str(matchedResult).strip(),
+            "source": "machine_learning",
+            "processedQuery": cleanedText,
+            "hasLinks": False  # Matching tradisional tidak ada link
+        }
+    return {  # Response tidak ditemukan
+        "intent": "not_found",
+        "answer": "Maaf, belum bisa jawab. Coba kata kunci lain seperti 'fakultas', 'jurusan', 'akreditas'.",
+        "source": "fallback",
+        "processedQuery": cleanedText,
+        "hasLinks": False  # Fallback tidak ada link
+    }
+
+def runIntentPipeline(userQuestion):  # Pipeline deteksi intent: preprocess -> cache -> NLP -> matching
+    try:  # Ambil pipeline yang sudah dirakit
+        pipeline = getPipeline()  # Callable ML
+    except PipelineError as pipelineError:  # Modul ML tidak lengkap
+        logger.error("Pipeline gagal = %s", pipelineError)  # Log error
+        return importErrorResponse()  # Return fallback response
+
+    cleanedText, _ = preprocessQuestion(pipeline, userQuestion)  # Bersihkan text
+
+    # Cek cache response (key dari query yang sudah dinormalisasi)
+    cacheKeys = None  # Key cache (None kalau detector gagal)
+    datasetVersion = None  # Versi dataset buat invalidasi
+    try:
+        nlpDetector = pipeline.getDetector()  # Ambil NLP detector bersama
+        datasetVersion = pipeline.getDatasetVersion()  # Versi corpus detector + matcher aktif
+        cacheKeys = buildCacheKeys(userQuestion, cleanedText, nlpDetector)  # Key cache
+        for cacheKey in cacheKeys:  # Cek key NLP lalu key matching
+            cached = responseCache.get(cacheKey, datasetVersion)  # Lookup cache
+            if cached is not None:  # Cache hit
+                logger.debug("Cache hit = %s", cacheKey[0])  # Log hit
+                return withCacheMetadata(cached[0], True, cached[1])  # Return response dari cache
+    except Exception as cacheError:  # Handle error cache/detector
+        logger.warning("Cache lookup gagal = %s", cacheError)  # Log error
 
     # Coba NLP Intent Detector dengan link terlebih dahulu
     try:
-        nlpDetector = getNlpIntentDetector()  # Buat instance NLP detector
+        nlpDetector = pipeline.getDetector()  # Ambil NLP detector bersama
         nlpResult = nlpDetector.getAnswerWithLinks(userQuestion)  # Deteksi dengan link
-        print(f"DEBUG: NLP result = {nlpResult}")  # Log hasil NLP
-        
-        if nlpResult and nlpResult.get('confidence', 0) > 0.3:  # Kalau confidence cukup
-            response = {  # Response structure
-                "intent": nlpResult.get('intent', 'nlp_detected'),
-                "answer": nlpResult.get('answer', ''),
-                "source": "nlp_intent_detector",
-                "processedQuery": cleanedText,
-                "confidence": nlpResult.get('confidence', 0)
-            }
-            
-            # Tambahkan link jika ada
-            if nlpResult.get('hasLinks', False) and nlpResult.get('links'):
-                response['links'] = nlpResult['links']  # Tambah link ke response
-                response['hasLinks'] = True  # Flag ada link
-            else:
-                response['hasLinks'] = False  # Tidak ada link
-                
-            return response  # Return hasil NLP
-            
+        logger.debug("NLP result = %s", nlpResult)  # Log hasil NLP (dirakit hanya kalau DEBUG aktif)
+        response = buildNlpResponse(nlpResult, cleanedText)  # Response kalau confidence cukup
+        if response is not None:  # NLP menjawab
+            if cacheKeys:  # Simpan ke cache
+                responseCache.put(cacheKeys[0], response, datasetVersion)  # Key NLP
+            return withCacheMetadata(response, False)  # Return hasil NLP
     except Exception as nlpError:  # Handle error NLP
-        print(f"DEBUG: NLP detection gagal = {nlpError}")  # Log error
+        logger.warning("NLP detection gagal = %s", nlpError)  # Log error
         # Lanjut ke fallback matching
-      # Fallback ke matching tradisional jika NLP gagal
+    # Fallback ke matching tradisional jika NLP gagal
     try:  # Coba matching intent
-        if hasattr(matching, 'matchIntent'):  # Cek fungsi matchIntent ada
-            matchedResult = matching.matchIntent(userQuestion)  # Cari match
-            print(f"DEBUG: Match = {matchedResult[:100] if matchedResult else 'None'}...")  # Log hasil
-        elif hasattr(matching, 'match_with_csv_data'):  # Alternatif fungsi
-            matchedResult = matching.match_with_csv_data(userQuestion, threshold=0.3, topK=1)  # Match CSV
-            print(f"DEBUG: CSV match = {matchedResult[:100] if matchedResult else 'None'}...")  # Log hasil
-        else:  # Tidak ada fungsi matching
-            print("DEBUG: Tidak ada fungsi matching")  # Log info
-            matchedResult = None  # Set None
+        matchedResult = pipeline.matchIntent(userQuestion)  # Cari match
+        logger.debug("Match = %.100s...", matchedResult)  # Log hasil
     except Exception as matchingError:  # Tangkap error matching
-        print(f"DEBUG: Matching gagal = {matchingError}")  # Log error
+        logger.warning("Matching gagal = %s", matchingError)  # Log error
         matchedResult = None  # Set None
-    
-    # Cek hasil matching
-    if matchedResult and len(str(matchedResult).strip()) > 0:  # Cek hasil valid
-        return {  # Return sukses
-            "intent": "found",
-            "answer": str(matchedResult).strip(),
-            "source": "machine_learning",
-            "processedQuery": cleanedText,
-            "hasLinks": False  # Matching tradisional tidak ada link
-        }
-    else:  # Tidak ada hasil
-        return {  # Return tidak ditemukan
-            "intent": "not_found",
-            "answer": "Maaf, belum bisa jawab. Coba kata kunci lain seperti 'fakultas', 'jurusan', 'akreditas'.",
-            "source": "fallback",
-            "processedQuery": cleanedText,
-            "hasLinks": False  # Fallback tidak ada link
-        }
 
+    response = buildMatchingResponse(matchedResult, cleanedText)  # Response matching / fallback
+    if cacheKeys and matchedResult is not None:  # Simpan ke cache (kecuali matching error)
+        responseCache.put(cacheKeys[1], response, datasetVersion)  # Key matching
+    return withCacheMetadata(response, False)  # Return hasil matching
+
+@timed('request_batch')
+def detectIntentServiceBatch(userQuestions):  # Deteksi intent untuk banyak pertanyaan sekaligus (terukur)
+    responses = runIntentPipelineBatch(userQuestions)  # Jalankan pipeline batch
+    for response in responses:  # Metric per pertanyaan
+        observeAnswer(response.get('source'))  # Cabang yang menjawab
+    return responses  # Return response urut input
+
+def detectNlpBatch(pipeline, nlpQuestions):  # Hasil NLP per pertanyaan, None kalau NLP gagal untuk pertanyaan itu
+    try:
+        nlpDetector = pipeline.getDetector()  # Ambil NLP detector bersama
+    except Exception as nlpError:  # Detector tidak tersedia
+        logger.warning("NLP detection gagal = %s", nlpError)  # Log error
+        return [None] * len(nlpQuestions)  # Semua ke matching
+    if hasattr(nlpDetector, 'getAnswersWithLinks'):  # Detector mendukung batch
+        try:
+            return nlpDetector.getAnswersWithLinks(nlpQuestions)  # Deteksi batch dengan link
+        except Exception as nlpError:  # Satu pertanyaan bisa menggagalkan seluruh batch
+            logger.warning("NLP batch gagal = %s, ulang per pertanyaan", nlpError)  # Log error
+    nlpResults = []  # Hasil per pertanyaan
+    for nlpQuestion in nlpQuestions:  # Satu per satu (sama dengan runIntentPipeline)
+        try:
+            nlpResults.append(nlpDetector.getAnswerWithLinks(nlpQuestion))  # Deteksi dengan link
+        except Exception as nlpError:  # Hanya pertanyaan ini yang ke matching
+            logger.warning("NLP detection gagal = %s", nlpError)  # Log error
+            nlpResults.append(None)  # Lanjut ke matching
+    return nlpResults  # Hasil urut nlpQuestions
+
+def runIntentPipelineBatch(userQuestions):  # Pipeline batch: preprocess -> dedupe key normalisasi -> cache -> NLP batch -> matching batch
+    """Hasil per pertanyaan sama dengan runIntentPipeline. Pertanyaan dengan key matching yang sama
+    (buildCacheKeys: varian huruf besar/kecil) diproses sekali walau cache response mati; varian typo tidak
+    digabung karena preprocess dan query lowercase untuk matching ikut di key. NLP dan matching dijalankan
+    satu kali untuk semua pertanyaan unik (probe fuzzy atas gabungan token), lalu disebar sesuai urutan input.
+    cache.hit hanya untuk response dari responseCache, cache.batchDeduped untuk hasil pertanyaan lain di batch"""
+    try:  # Ambil pipeline yang sudah dirakit
+        pipeline = getPipeline()  # Callable ML
+    except PipelineError as pipelineError:  # Modul ML tidak lengkap
+        logger.error("Pipeline gagal = %s", pipelineError)  # Log error
+        return [importErrorResponse() for _ in userQuestions]  # Fallback untuk semua pertanyaan
+
+    # 1. Preprocess sekali per pertanyaan
+    uniqueQuestions = list(dict.fromkeys(userQuestions))  # Pertanyaan identik cukup diproses sekali
+    preprocessed = {userQuestion: preprocessQuestion(pipeline, userQuestion) for userQuestion in uniqueQuestions}  # Pertanyaan -> (cleanedText, sukses)
+
+    # 2. Dedupe per key normalisasi (key matching mencakup key NLP)
+    datasetVersion = None  # Versi dataset buat invalidasi
+    try:
+        nlpDetector = pipeline.getDetector()  # Ambil NLP detector bersama
+        datasetVersion = pipeline.getDatasetVersion()  # Versi corpus detector + matcher aktif
+        cacheKeysOf = {userQuestion: buildCacheKeys(userQuestion, preprocessed[userQuestion][0], nlpDetector) for userQuestion in uniqueQuestions}  # Key cache per pertanyaan
+        groupOf = {userQuestion: cacheKeys[1] for userQuestion, cacheKeys in cacheKeysOf.items()}  # Pertanyaan -> key grup
+    except Exception as cacheError:  # Handle error detector
+        logger.warning("Cache key gagal = %s", cacheError)  # Log error
+        cacheKeysOf = {userQuestion: None for userQuestion in uniqueQuestions}  # Tanpa cache
+        groupOf = {userQuestion: userQuestion for userQuestion in uniqueQuestions}  # Grup = pertanyaan persis
+    groups = {}  # Key grup -> pertanyaan wakil
+    for userQuestion in uniqueQuestions:  # Loop urutan input
+        groups.setdefault(groupOf[userQuestion], userQuestion)  # Pertanyaan pertama jadi wakil
+
+    # 3. Cek cache response per grup
+    results = {}  # Key grup -> response
+    pending = []  # Grup yang belum ada di cache
+    for groupKey, userQuestion in groups.items():  # Loop grup
+        cacheKeys = cacheKeysOf[userQuestion]  # Key cache grup
+        cached = None  # Hasil cache
+        try:
+            for cacheKey in cacheKeys or ():  # Cek key NLP lalu key matching
+                cached = responseCache.get(cacheKey, datasetVersion)  # Lookup cache
+                if cached is not None:  # Cache hit
+                    break  # Tidak perlu key berikutnya
+        except Exception as cacheError:  # Handle error cache
+            logger.warning("Cache lookup gagal = %s", cacheError)  # Log error
+        if cached is not None:  # Cache hit
+            results[groupKey] = withCacheMetadata(cached[0], True, cached[1], batchDeduped=False)  # Response dari cache
+        else:  # Cache miss
+            pending.append(groupKey)  # Proses di pipeline
+
+    # 4. NLP sekali untuk semua key NLP unik
+    nlpGroups = {}  # Key NLP -> grup yang memakainya
+    for groupKey in pending:  # Loop grup yang belum terjawab
+        cacheKeys = cacheKeysOf[groups[groupKey]]  # Key cache grup
+        nlpGroups.setdefault(cacheKeys[0] if cacheKeys else groupKey, []).append(groupKey)  # Grup dengan preprocessText + preprocess sama
+    unanswered = list(pending)  # Grup yang lanjut ke matching
+    if nlpGroups:  # Ada yang perlu NLP
+        nlpQuestions = [groups[groupKeys[0]] for groupKeys in nlpGroups.values()]  # Pertanyaan wakil per key NLP
+        nlpResults = detectNlpBatch(pipeline, nlpQuestions)  # Batch, atau per pertanyaan kalau batch gagal
+        try:
+            unanswered = []  # Dihitung ulang dari hasil NLP
+            for groupKeys, nlpQuestion, nlpResult in zip(nlpGroups.values(), nlpQuestions, nlpResults):  # Loop hasil NLP
+                response = buildNlpResponse(nlpResult, preprocessed[nlpQuestion][0])  # Response kalau confidence cukup
+                if response is None:  # NLP tidak yakin
+                    unanswered.extend(groupKeys)  # Lanjut ke matching
+                    continue  # Key NLP berikutnya
+                cacheKeys = cacheKeysOf[nlpQuestion]  # Key cache
+                if cacheKeys:  # Simpan ke cache
+                    responseCache.put(cacheKeys[0], response, datasetVersion)  # Key NLP
+                for position, groupKey in enumerate(groupKeys):  # Grup dengan key NLP ini
+                    results[groupKey] = withCacheMetadata(response, False, batchDeduped=position > 0)  # Grup berikutnya dilayani dari hasil batch, bukan cache
+        except Exception as nlpError:  # Handle error response NLP
+            logger.warning("NLP response gagal = %s", nlpError)  # Log error
+            unanswered = [groupKey for groupKey in pending if groupKey not in results]  # Semua sisa ke matching
+
+    # 5. Matching sekali untuk semua grup yang belum terjawab
+    if unanswered:  # Ada yang perlu matching
+        matchQuestions = [groups[groupKey] for groupKey in unanswered]  # Pertanyaan wakil
+        processedQueries = [preprocessed[userQuestion][0] if preprocessed[userQuestion][1] else None for userQuestion in matchQuestions]  # Hasil preprocess (None = preprocess ulang di matching)
+        try:  # Coba matching intent
+            matchedResults = pipeline.matchIntentBatch(matchQuestions, processedQueries)  # Cari match semua pertanyaan
+        except Exception as matchingError:  # Tangkap error matching
+            logger.warning("Matching gagal = %s", matchingError)  # Log error
+            matchedResults = [None] * len(matchQuestions)  # Semua None
+        for groupKey, userQuestion, matchedResult in zip(unanswered, matchQuestions, matchedResults):  # Loop hasil matching
+            response = buildMatchingResponse(matchedResult, preprocessed[userQuestion][0])  # Response matching / fallback
+            cacheKeys = cacheKeysOf[userQuestion]  # Key cache
+            if cacheKeys and matchedResult is not None:  # Simpan ke cache (kecuali matching error)
+                responseCache.put(cacheKeys[1], response, datasetVersion)  # Key matching
+            results[groupKey] = withCacheMetadata(response, False, batchDeduped=False)  # Response grup
+
+    # 6. Sebar hasil grup ke urutan input
+    responses = []  # Response urut input
+    served = set()  # Grup yang sudah muncul di batch
+    for userQuestion in userQuestions:  # Loop urutan input
+        groupKey = groupOf[userQuestion]  # Grup pertanyaan ini
+        response = results[groupKey]  # Response grup
+        if groupKey in served:  # Varian/duplikat dalam batch
+            response = withCacheMetadata(response, response['cache']['hit'], response['cache']['ageSeconds'], batchDeduped=True)  # Dilayani dari hasil batch (hit tetap dari responseCache)
+        served.add(groupKey)  # Tandai sudah muncul
+        responses.append(response)  # Simpan response
+    return responses  # Return response urut input
+
+def getResponseCacheStats():  # Statistik cache response
+    return responseCache.stats()  # Hit/miss/eviction cache
+
+def warmUpService():  # Rakit pipeline dan preload model ML sebelum request pertama
+    pipeline = getPipeline()  # Fail fast kalau modul/callable ML tidak ada
+    try:  # Coba build NLP detector
+        pipeline.preloadDetector()  # Build detector sekali untuk semua request
+        _readiness['nlpDetector'] = pipeline.getDetector().datasetLoaded  # Detector siap kalau dataset termuat
+    except Exception as warmUpError:  # Tangkap error warm-up
+        logger.error("Warm-up detector gagal = %s", warmUpError)  # Log error
+    try:  # Coba build data + index matching
+        _readiness['matcher'] = pipeline.warmUpMatcher() is not None  # Matcher siap kalau index terbangun
+    except Exception as warmUpError:  # Tangkap error warm-up
+        logger.error("Warm-up matcher gagal = %s", warmUpError)  # Log error
+    return all(_readiness.values())  # Warm-up sukses
+
+def getMetricsText():  # Metrics Prometheus buat endpoint /metrics
+    return renderMetrics()  # Exposition text
+
+def getReadiness():  # Status readiness buat endpoint /ready
+    return {'ready': all(_readiness.values()), 'checks': dict(_readiness)}  # Status komponen
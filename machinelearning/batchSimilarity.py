@@ -0,0 +1,169 @@
+# Batch Similarity - skor satu query word terhadap seluruh vocabulary sekaligus dengan NumPy
+"""
+Versi batch dari levenshteinDistance, nGramSimilarity dan characterFrequencySimilarity
+di matching.py. Hasilnya sama persis dengan fungsi scalar, tapi satu query word cukup
+beberapa operasi NumPy terhadap seluruh vocabulary.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+BASE_ALPHABET = 'abcdefghijklmnopqrstuvwxyz0123456789' # 36 kolom dasar matrix frekuensi karakter
+
+def _cleanWord(word: str) -> str: # normalisasi sama dengan characterFrequencySimilarity
+    return ''.join(c.lower() for c in word if c.isalnum()) # alnum lowercase
+
+def _ngramSet(word: str, n: int) -> set: # n-gram set sama dengan nGramSimilarity
+    lowered = word.lower() # nGramSimilarity lowercase dulu
+    return set(lowered[i:i+n] for i in range(len(lowered) - n + 1)) # set n-grams
+
+class VocabularyMatrix: # representasi array dari vocabulary buat scoring batch
+    def __init__(self, words: List[str], soundexCodes: Optional[List[str]] = None, norepForms: Optional[List[str]] = None): # build matrix
+        self.words = list(words) # kata vocabulary
+        size = len(self.words) # jumlah kata
+        self.lengths = np.array([len(word) for word in self.words], dtype=np.int32) # panjang kata
+        maxLength = int(self.lengths.max()) if size else 0 # panjang maksimum
+
+        # Kode karakter (padding -1) buat DP edit distance
+        self.codes = np.full((size, maxLength), -1, dtype=np.int32) # matrix kode karakter
+        for row, word in enumerate(self.words): # loop kata
+            self.codes[row, :len(word)] = [ord(char) for char in word] # isi kode
+
+        # Matrix frekuensi karakter: 36 kolom a-z0-9 + kolom tambahan buat karakter lain di vocabulary
+        cleanWords = [_cleanWord(word) for word in self.words] # kata versi clean
+        extraChars = sorted(set(''.join(cleanWords)) - set(BASE_ALPHABET)) # karakter di luar a-z0-9
+        self.alphabet = list(BASE_ALPHABET) + extraChars # alphabet kolom
+        self.charIndex = {char: column for column, char in enumerate(self.alphabet)} # char -> kolom
+        self.cleanLengths = np.array([len(word) for word in cleanWords], dtype=np.int64) # panjang clean
+        self.charCounts = np.zeros((size, len(self.alphabet)), dtype=np.int32) # jumlah karakter per kata
+        for row, word in enumerate(cleanWords): # loop kata clean
+            for char in word: # loop karakter
+                self.charCounts[row, self.charIndex[char]] += 1 # hitung karakter
+
+        # Matrix incidence n-gram (sparse CSR)
+        self.ngramIndex: Dict[int, Dict[str, int]] = {} # n -> {gram: kolom}
+        self.ngramMatrix: Dict[int, sparse.csr_matrix] = {} # n -> matrix kata x gram
+        self.ngramCounts: Dict[int, np.ndarray] = {} # n -> jumlah gram unik per kata
+        for n in (2, 3): # bigram dan trigram
+            self._buildNgramMatrix(n) # build matrix n-gram
+
+        self.soundexCodes = np.array(soundexCodes) if soundexCodes is not None else None # kode soundex
+        self.norepLengths = np.array([len(form) for form in norepForms], dtype=np.int64) if norepForms is not None else None # panjang norep
+
+    def _buildNgramMatrix(self, n: int): # build incidence matrix satu ukuran n-gram
+        gramIndex = {} # gram -> kolom
+        rows, columns = [], [] # koordinat entry matrix
+        counts = np.zeros(len(self.words), dtype=np.int64) # jumlah gram unik
+        for row, word in enumerate(self.words): # loop kata
+            grams = _ngramSet(word, n) # gram kata
+            counts[row] = len(grams) # simpan jumlah
+            for gram in grams: # loop gram
+                rows.append(row) # baris
+                columns.append(gramIndex.setdefault(gram, len(gramIndex))) # kolom
+        data = np.ones(len(rows), dtype=np.int32) # incidence biner
+        self.ngramIndex[n] = gramIndex # simpan index gram
+        self.ngramMatrix[n] = sparse.csr_matrix((data, (rows, columns)), shape=(len(self.words), max(len(gramIndex), 1))) # matrix CSR
+        self.ngramCounts[n] = counts # simpan jumlah gram
+
+def batchLevenshteinDistance(query: str, matrix: VocabularyMatrix, maxDistance: Optional[int] = None, rows: Optional[np.ndarray] = None) -> np.ndarray: # edit distance query vs vocabulary
+    """Levenshtein distance query ke setiap kata (atau subset rows).
+    Dengan maxDistance, jarak > maxDistance dikembalikan sebagai maxDistance + 1."""
+    if rows is None: # semua kata
+        rows = np.arange(len(matrix.words)) # index semua kata
+    lengths = matrix.lengths[rows] # panjang kata subset
+    if len(rows) == 0: # subset kosong
+        return np.zeros(0, dtype=np.int32) # hasil kosong
+    width = int(lengths.max()) # lebar DP
+    codes = matrix.codes[rows, :width] # kode karakter subset
+    cap = maxDistance + 1 if maxDistance is not None else len(query) + width + 1 # batas nilai DP
+    steps = np.arange(width + 1, dtype=np.int32) # offset kolom
+
+    previousRow = np.minimum(np.broadcast_to(steps, (len(rows), width + 1)), cap).astype(np.int32) # row DP awal
+    for i, char in enumerate(query): # loop karakter query (vectorized ke semua kata)
+        substitutions = previousRow[:, :-1] + (codes != ord(char)) # cost substitusi
+        deletions = previousRow[:, 1:] + 1 # cost deletion
+        extended = np.empty_like(previousRow) # kandidat cost sebelum insertion
+        extended[:, 0] = i + 1 # kolom pertama
+        np.minimum(substitutions, deletions, out=extended[:, 1:]) # min substitusi/deletion
+        # insertion berantai: cur[j] = min_k(extended[k] + j - k) -> prefix minimum
+        currentRow = np.minimum.accumulate(extended - steps, axis=1) + steps # cost dengan insertion
+        previousRow = np.minimum(currentRow, cap) # batasi nilai
+        if maxDistance is not None and previousRow.min() > maxDistance: # semua kata melebihi batas
+            return np.full(len(rows), cap, dtype=np.int32) # early exit
+    return previousRow[np.arange(len(rows)), lengths] # jarak di kolom panjang kata
+
+def batchNGramSimilarity(query: str, matrix: VocabularyMatrix, n: int = 2) -> np.ndarray: # n-gram jaccard query vs vocabulary
+    """Sama dengan nGramSimilarity(query, word, n) untuk setiap kata vocabulary"""
+    if not query: # query kosong
+        return np.zeros(len(matrix.words)) # skor 0
+    queryGrams = _ngramSet(query, n) # gram query
+    counts = matrix.ngramCounts[n] # jumlah gram tiap kata
+    columns = [matrix.ngramIndex[n][gram] for gram in queryGrams if gram in matrix.ngramIndex[n]] # kolom gram query
+    if columns: # ada gram yang sama
+        indicator = np.zeros(matrix.ngramMatrix[n].shape[1], dtype=np.int32) # vektor gram query
+        indicator[columns] = 1 # tandai gram query
+        intersection = matrix.ngramMatrix[n].dot(indicator) # |A & B| per kata (sparse mat-vec)
+    else: # tidak ada gram yang sama
+        intersection = np.zeros(len(matrix.words), dtype=np.int64) # irisan kosong
+    union = len(queryGrams) + counts - intersection # |A | B|
+    scores = np.divide(intersection, union, out=np.zeros(len(matrix.words)), where=union > 0) # jaccard
+    if not queryGrams: # query tanpa n-gram
+        scores = np.where(counts == 0, 1.0, 0.0) # kedua kosong = 1.0, salah satu kosong = 0.0
+    else:
+        scores[counts == 0] = 0.0 # kata tanpa n-gram
+    scores[matrix.lengths == 0] = 0.0 # kata kosong
+    return scores # return skor
+
+def batchCharacterFrequencySimilarity(query: str, matrix: VocabularyMatrix) -> np.ndarray: # frekuensi karakter query vs vocabulary
+    """Sama dengan characterFrequencySimilarity(query, word) untuk setiap kata vocabulary"""
+    queryClean = _cleanWord(query) # clean query
+    if not queryClean: # query kosong
+        return np.zeros(len(matrix.words)) # skor 0
+    queryCounts = np.zeros(len(matrix.alphabet), dtype=np.int32) # jumlah karakter query
+    outsideCount = 0 # karakter query yang tidak ada di vocabulary
+    for char in queryClean: # loop karakter query
+        column = matrix.charIndex.get(char) # kolom karakter
+        if column is None: # karakter tidak ada di vocabulary
+            outsideCount += 1 # selisihnya penuh
+        else:
+            queryCounts[column] += 1 # hitung karakter
+    totalDiff = np.abs(matrix.charCounts - queryCounts).sum(axis=1) + outsideCount # L1 selisih frekuensi
+    totalChars = len(queryClean) + matrix.cleanLengths # total karakter
+    scores = np.maximum(0.0, 1.0 - (totalDiff / totalChars)) # similarity
+    scores[matrix.cleanLengths == 0] = 0.0 # kata kosong
+    return scores # return skor
+
+def batchFuzzyCandidates(queryClean: str, matrix: VocabularyMatrix, querySoundex: str, queryNorep: str, threshold: float, maxDistance: int = 4) -> np.ndarray: # kandidat advancedFuzzySimilarity
+    """Index kata yang mungkin punya advancedFuzzySimilarity >= threshold.
+    Komponen Levenshtein, n-gram, frekuensi karakter dan soundex dihitung exact;
+    SequenceMatcher dan pattern typo memakai batas atas. Bobot mengikuti matching.py."""
+    queryLength = len(queryClean) # panjang query
+    lengths = matrix.lengths # panjang kata
+    maxLengths = np.maximum(lengths, queryLength) # panjang maksimum per pasangan
+    totalLengths = lengths + queryLength # total panjang
+    lengthDiff = np.abs(lengths - queryLength) # selisih panjang
+
+    # 1. Levenshtein (hanya kata dengan selisih panjang <= maxDistance yang bisa > 0)
+    levenshteinScore = np.zeros(len(matrix.words)) # skor Levenshtein
+    nearRows = np.nonzero(lengthDiff <= maxDistance)[0] # kata yang mungkin dalam radius
+    distances = batchLevenshteinDistance(queryClean, matrix, maxDistance, nearRows) # edit distance dibatasi
+    adaptiveMax = np.minimum(maxDistance, np.maximum(3, maxLengths[nearRows] // 2)) # adaptive threshold
+    inRadius = distances <= adaptiveMax # dalam threshold
+    levenshteinScore[nearRows[inRadius]] = 1.0 - distances[inRadius] / maxLengths[nearRows[inRadius]] # skor Levenshtein
+
+    # 2-5. N-gram, frekuensi karakter, phonetic
+    bigramScore = batchNGramSimilarity(queryClean, matrix, 2) # bigram
+    trigramScore = batchNGramSimilarity(queryClean, matrix, 3) # trigram
+    charFreqScore = batchCharacterFrequencySimilarity(queryClean, matrix) # frekuensi karakter
+    phoneticScore = np.where(matrix.soundexCodes == querySoundex, 0.8, 0.0) # soundex
+
+    # 6-7. Batas atas SequenceMatcher dan pattern typo
+    sequenceBound = 2.0 * np.minimum(lengths, queryLength) / totalLengths # ratio <= 2*min/total
+    norepLengths = matrix.norepLengths # panjang norep kata
+    patternBound = np.minimum(norepLengths, len(queryNorep)) / np.maximum(norepLengths, len(queryNorep)) * 0.9 # containment terbaik
+
+    bound = (levenshteinScore * 0.25 + bigramScore * 0.20 + trigramScore * 0.15 + charFreqScore * 0.15 + phoneticScore * 0.10 + sequenceBound * 0.10 + patternBound * 0.05) # gabung komponen
+    bound += np.where(lengthDiff <= 2, 0.05, 0.0) # length bonus
+    candidates = bound >= threshold - 1e-9 # lolos batas atas
+    return np.nonzero(candidates)[0] # index kandidat
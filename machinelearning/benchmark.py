@@ -0,0 +1,223 @@
+# Benchmark - workload query tetap lewat setiap stage pipeline, hasil JSON buat dibandingkan antar commit
+"""
+Jalankan dari root repo:
+
+    python machinelearning/benchmark.py --scales 1,10,100 --output bench.json
+    python machinelearning/benchmark.py --scales 1 --compare bench.json
+
+Workload (exact, typo, multiword, nomatch) dijalankan lewat preprocess,
+detectIntentNlp, advancedFuzzySimilarity, matchWithCsvData dan detectIntentService
+untuk corpus sintetis 1x/10x/100x dari corpusScaler (kata diganti + typo, bukan salinan
+identik). Corpus dimuat ke matcher (setProcessedData) dan ke detector baru yang dipasang
+di registry, jadi detectIntentService memakai corpus yang sama. Per stage dan kategori
+dilaporkan throughput, p50/p99 latency dan peak memory (tracemalloc, pass terpisah supaya
+tidak mengganggu timing). Cache response dimatikan dan memo (similarity, ekspansi fuzzy,
+token) dikosongkan sebelum setiap pass terukur, jadi pengulangan tidak mengukur cache hit.
+Setiap kategori diulang sampai minimal MIN_P99_SAMPLES call (--repeat hanya batas bawah jumlah
+pass), jadi p99 selalu terisi; p99 null hanya kalau sampel tetap kurang.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori machinelearning
+rootPath = os.path.dirname(currentDir) # root repo
+for path in (rootPath, os.path.join(rootPath, 'backend')): # import machinelearning.* dan services.* seperti backend
+    if path not in sys.path: # belum ada
+        sys.path.append(path) # tambah ke Python path
+os.environ.setdefault('RESPONSE_CACHE_SIZE', '0') # ukur pipeline, bukan cache response
+os.environ.setdefault('LOG_LEVEL', 'WARNING') # tanpa log per request
+
+BENCHMARK_VERSION = 3 # versi format output (2: corpus corpusScaler, p99 null kalau sampel kurang; 3: pass sampai MIN_P99_SAMPLES call)
+DEFAULT_SCALES = (1, 10, 100) # faktor corpus
+DEFAULT_SEED = 20250621 # seed workload
+MIN_P99_SAMPLES = 100 # di bawah ini p99 nearest-rank sama dengan max, tidak dilaporkan
+
+WORKLOAD = { # query tetap per kategori
+    'exact': ['apa itu itb', 'sejarah itb', 'institut teknologi bandung', 'lokasi kampus ganesha', 'fakultas teknik sipil dan lingkungan', 'visi misi itb'],
+    'typo': ['fakultsa itb', 'sejarh itb', 'institut teknolgi bandng', 'lokasi kampsu ganesa', 'akreditsi prodi', 'jurusn informatka'],
+    'multiword': ['berapa jumlah fakultas dan sekolah di institut teknologi bandung', 'bagaimana cara mendaftar sebagai mahasiswa baru di itb jatinangor', 'kapan itb didirikan dan siapa pendirinya', 'apa saja program studi di sekolah teknik elektro dan informatika'],
+    'nomatch': ['qwerty zxcv', 'resep nasi goreng', 'harga saham hari ini', 'xyzzy plugh']
+}
+
+def scaledCorpus(sourceCsv: str, baseRows: int, scale: int, seed: int, outputDir: str) -> str: # CSV corpus sintetis sebesar scale x corpus asli
+    """Scale 1 memakai CSV asli; selain itu corpusScaler menulis CSV baru di outputDir"""
+    if scale <= 1: # corpus asli
+        return sourceCsv # tanpa generate
+    from corpusScaler import scaleCorpus # generator corpus sintetis (pandas lazy)
+    outputCsv = os.path.join(outputDir, f"corpus_x{scale}.csv") # file sintetis
+    scaleCorpus(sourceCsv, outputCsv, baseRows * scale, seed) # generate baris
+    return outputCsv # path CSV
+
+def fuzzyPairs(dataEntries: List[Dict], seed: int, count: int = 200) -> List[tuple]: # pasangan kata buat advancedFuzzySimilarity
+    rng = random.Random(seed) # random deterministik
+    vocabulary = sorted({word for entry in dataEntries[:500] for word in str(entry.get('processed_content', '')).split() if len(word) > 2}) # kata corpus
+    queryWords = sorted({word for queries in WORKLOAD.values() for query in queries for word in query.split() if len(word) > 2}) # kata workload
+    return [(rng.choice(queryWords), rng.choice(vocabulary)) for _ in range(count)] if vocabulary else [] # pasangan acak
+
+def percentile(sortedValues: List[float], fraction: float) -> float: # percentile nearest-rank
+    if not sortedValues: # tanpa data
+        return 0.0 # nol
+    rank = max(0, min(len(sortedValues) - 1, int(round(fraction * len(sortedValues) + 0.5)) - 1)) # index nearest-rank
+    return sortedValues[rank] # nilai percentile
+
+def passCount(inputs: List, repeat: int) -> int: # jumlah pass workload: minimal repeat, cukup untuk MIN_P99_SAMPLES call
+    return max(repeat, math.ceil(MIN_P99_SAMPLES / len(inputs))) if inputs else repeat # pass terukur
+
+def measure(fn: Callable, inputs: List, repeat: int, resetCaches: Callable[[], None]) -> Dict: # latency per call + throughput
+    latencies = [] # latency per call (detik)
+    passes = passCount(inputs, repeat) # pass terukur
+    for _ in range(passes): # ulang workload
+        resetCaches() # setiap pass mulai tanpa memo
+        for item in inputs: # loop input
+            start = time.perf_counter() # mulai timer
+            fn(item) # jalankan stage
+            latencies.append(time.perf_counter() - start) # catat latency
+    latencies.sort() # urut buat percentile
+    total = sum(latencies) # total waktu
+    return {
+        'calls': len(latencies), # jumlah call
+        'passes': passes, # jumlah pass workload
+        'throughputPerSec': len(latencies) / total if total > 0 else 0.0, # call per detik
+        'meanMs': total / len(latencies) * 1000.0 if latencies else 0.0, # rata-rata
+        'p50Ms': percentile(latencies, 0.50) * 1000.0, # median
+        'p99Ms': percentile(latencies, 0.99) * 1000.0 if len(latencies) >= MIN_P99_SAMPLES else None, # tail latency (None kalau sampel kurang)
+        'maxMs': latencies[-1] * 1000.0 if latencies else 0.0 # latency terburuk
+    }
+
+def peakMemory(fn: Callable, inputs: List, resetCaches: Callable[[], None]) -> int: # peak alokasi satu pass workload (byte)
+    resetCaches() # pass memori juga tanpa memo
+    tracemalloc.start() # mulai tracing
+    try:
+        for item in inputs: # satu pass
+            fn(item) # jalankan stage
+        return tracemalloc.get_traced_memory()[1] # peak
+    finally:
+        tracemalloc.stop() # stop tracing
+
+def buildStages(modules: Dict, detector) -> Dict[str, Callable]: # stage yang diukur
+    return {
+        'preprocess': modules['preprocessing'].preprocess, # normalisasi query
+        'detectIntentNlp': detector.detectIntentNlp, # NLP intent
+        'advancedFuzzySimilarity': lambda pair: modules['matching'].advancedFuzzySimilarity(*pair), # similarity kata
+        'matchWithCsvData': modules['matching'].matchWithCsvData, # matching corpus
+        'detectIntentService': modules['services'].detectIntentService # pipeline penuh
+    }
+
+def gitCommit() -> Optional[str]: # commit yang di-benchmark
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=rootPath, capture_output=True, text=True, timeout=10).stdout.strip() or None # hash pendek
+    except (OSError, subprocess.SubprocessError): # git tidak ada
+        return None # tanpa commit
+
+def resetCaches(modules: Dict, detector) -> Callable[[], None]: # kosongkan semua memo yang diisi query
+    def reset(): # dipanggil sebelum setiap pass terukur
+        modules['matching'].clearMemoCaches() # memo similarity + ekspansi fuzzy + fitur
+        modules['textNormalizer'].clearTokenCaches() # memo token preprocess
+        modules['services'].responseCache.clear() # cache response (kalau RESPONSE_CACHE_SIZE diubah)
+        detector.clearCaches() # memo similarity + postings link detector
+    return reset # callable reset
+
+def runBenchmark(scales=DEFAULT_SCALES, repeat: int = 3, seed: int = DEFAULT_SEED, stageNames: Optional[List[str]] = None, memory: bool = True) -> Dict: # jalankan semua scale
+    from machinelearning import matching, nlpIntentDetector, preprocessing # modul yang sama dengan services
+    from services import services # pipeline penuh
+    import dataLoader, textNormalizer # loader corpus + memo token (import flat seperti modul ML)
+    services.warmUpService() # pipeline + detector + index corpus asli
+    modules = {'matching': matching, 'nlpIntentDetector': nlpIntentDetector, 'preprocessing': preprocessing, 'services': services, 'textNormalizer': textNormalizer} # modul terukur
+    baseEntries = matching.getProcessedData() # corpus asli
+    baseDetector = nlpIntentDetector.getNlpIntentDetector() # detector asli
+    sourceCsv = baseDetector.datasetPath or dataLoader.activeProcessedFile() # CSV corpus asli
+    stageNames = stageNames or ['preprocess', 'detectIntentNlp', 'advancedFuzzySimilarity', 'matchWithCsvData', 'detectIntentService'] # stage yang dijalankan
+    results = [] # baris hasil
+
+    with tempfile.TemporaryDirectory(prefix='bench_corpus_') as corpusDir: # corpus sintetis (+ snapshot) dibuang setelah run
+        for scale in scales: # loop faktor corpus
+            corpusCsv = scaledCorpus(sourceCsv, len(baseEntries), scale, seed, corpusDir) # CSV corpus
+            buildStart = time.perf_counter() # mulai build
+            entries = dataLoader.loadCsvData(corpusCsv) # entry (snapshot di sebelah CSV)
+            matching.setProcessedData(entries) # corpus matcher
+            matching.getInvertedIndex() # fitur + index
+            detector = nlpIntentDetector.NaturalLanguageIntentDetector(corpusCsv) # detector baru dengan dataset yang sama
+            nlpIntentDetector.setNlpIntentDetector(detector) # dipakai detectIntentService
+            buildSeconds = time.perf_counter() - buildStart # waktu load + build index
+            print(f"scale {scale}x: {len(entries)} entries, load + index {buildSeconds:.2f}s", file=sys.stderr) # progress
+            stages = buildStages(modules, detector) # stage callable
+            reset = resetCaches(modules, detector) # reset memo
+
+            for stageName in stageNames: # loop stage
+                fn = stages[stageName] # stage callable
+                workloads = {'pairs': fuzzyPairs(entries, seed)} if stageName == 'advancedFuzzySimilarity' else WORKLOAD # input stage
+                for category, inputs in workloads.items(): # loop kategori
+                    for item in inputs: # warm-up (import lazy, inisialisasi sekali)
+                        fn(item) # jalankan sekali
+                    row = measure(fn, inputs, repeat, reset) # timing
+                    if memory: # pass memori terpisah
+                        row['peakKiB'] = round(peakMemory(fn, inputs, reset) / 1024.0, 1) # peak alokasi
+                    row.update({'scale': scale, 'corpusSize': len(entries), 'indexBuildSeconds': round(buildSeconds, 4), 'stage': stageName, 'workload': category}) # identitas baris
+                    results.append(row) # simpan hasil
+                    p99 = f"{row['p99Ms']:8.3f}ms" if row['p99Ms'] is not None else f"   n<{MIN_P99_SAMPLES}" # p99 atau jumlah sampel kurang
+                    print(f"  {stageName:24s} {category:10s} {row['throughputPerSec']:10.1f}/s p50 {row['p50Ms']:8.3f}ms p99 {p99}", file=sys.stderr) # progress
+
+        matching.reloadProcessedData(force=True) # kembalikan corpus aktif (mengikuti manifest lagi)
+        nlpIntentDetector.setNlpIntentDetector(baseDetector) # detector asli
+    return {
+        'version': BENCHMARK_VERSION, # format output
+        'meta': {
+            'commit': gitCommit(), # commit
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'), # waktu run
+            'python': platform.python_version(), # versi Python
+            'platform': platform.platform(), # OS
+            'cpuCount': os.cpu_count(), # jumlah CPU
+            'repeat': repeat, # pass minimal per kategori
+            'minP99Samples': MIN_P99_SAMPLES, # call minimal per kategori (pass ditambah sampai cukup)
+            'seed': seed, # seed workload + corpus sintetis
+            'corpus': os.path.basename(sourceCsv) # corpus sumber
+        },
+        'results': results # baris hasil
+    }
+
+def compareResults(current: Dict, baseline: Dict) -> List[str]: # ringkasan perubahan vs hasil sebelumnya
+    key = lambda row: (row['scale'], row['stage'], row['workload']) # identitas baris
+    baselineRows = {key(row): row for row in baseline.get('results', [])} # baris baseline
+    lines = [] # baris laporan
+    for row in current['results']: # loop hasil sekarang
+        previous = baselineRows.get(key(row)) # baris baseline
+        if previous is None or not previous['p50Ms']: # tidak ada pembanding
+            continue # skip
+        line = f"{row['scale']:>4}x {row['stage']:24s} {row['workload']:10s} p50 {previous['p50Ms']:8.3f} -> {row['p50Ms']:8.3f}ms ({row['p50Ms'] / previous['p50Ms']:5.2f}x)" # perubahan p50
+        if row.get('p99Ms') is not None and previous.get('p99Ms') is not None: # p99 ada di kedua hasil
+            line += f"  p99 {previous['p99Ms']:8.3f} -> {row['p99Ms']:8.3f}ms" # perubahan p99
+        lines.append(line) # simpan baris
+    return lines # return laporan
+
+if __name__ == '__main__': # jalankan langsung
+    parser = argparse.ArgumentParser(description='Benchmark pipeline chatbot') # argumen CLI
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)), help='faktor corpus, mis. 1,10,100') # faktor corpus
+    parser.add_argument('--repeat', type=int, default=3, help='pass minimal per kategori (ditambah sampai MIN_P99_SAMPLES call)') # pengulangan
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='seed pasangan kata fuzzy') # seed
+    parser.add_argument('--stages', default='', help='subset stage (pisah koma)') # subset stage
+    parser.add_argument('--no-memory', action='store_true', help='lewati pass tracemalloc') # tanpa memori
+    parser.add_argument('--output', default='', help='file JSON hasil (default stdout)') # output
+    parser.add_argument('--compare', default='', help='file JSON hasil sebelumnya') # pembanding
+    args = parser.parse_args() # parse argumen
+
+    report = runBenchmark([int(scale) for scale in args.scales.split(',') if scale], args.repeat, args.seed, [stage for stage in args.stages.split(',') if stage] or None, not args.no_memory) # jalankan benchmark
+    if args.output: # tulis ke file
+        with open(args.output, 'w', encoding='utf-8') as outputFile: # buka file
+            json.dump(report, outputFile, indent=1) # JSON hasil
+    else: # tulis ke stdout
+        json.dump(report, sys.stdout, indent=1) # JSON hasil
+        sys.stdout.write('\n') # newline akhir
+    if args.compare: # bandingkan dengan hasil lama
+        with open(args.compare, encoding='utf-8') as baselineFile: # buka baseline
+            for line in compareResults(report, json.load(baselineFile)): # loop perubahan
+                print(line, file=sys.stderr) # laporan ke stderr
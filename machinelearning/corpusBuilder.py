@@ -0,0 +1,244 @@
+# Corpus Builder - build incremental database/data/*.csv -> processed CSV (high quality + complete + summary + manifest)
+"""
+Langkah 1-3 notebook jupyter/chatbot.ipynb sebagai command line, dengan aturan yang sama:
+filter konten kosong/pendek/tag HTML, preprocess, kategori keyword, quality score 0-100,
+drop duplikat per sumber, threshold high quality 60, record_id berurutan.
+
+Incremental berbasis hash: hasil per baris (content_cleaned, category, quality_score,
+processed_date) disimpan di build cache dengan key hash (content, links), jadi hanya baris
+yang isinya baru/berubah yang di-preprocess ulang. Kalau hash semua file sumber sama
+dengan manifest terakhir, build dilewati.
+
+Output di database/processed/:
+    itb_chatbot_high_quality_<ts>_v<n>.csv   skema processed (dipakai dataLoader / detector)
+    itb_chatbot_complete_<ts>_v<n>.csv       semua baris bersih sebelum threshold
+    processing_summary_<ts>_v<n>.csv         ringkasan (kolom sama dengan summary notebook)
+    manifest.json                            versi build + file aktif + hash sumber (ditulis terakhir)
+
+<n> = versi build di manifest, jadi dua build dalam detik yang sama tidak saling menimpa;
+file output yang sudah ada tidak pernah ditimpa (FileExistsError).
+
+    python machinelearning/corpusBuilder.py            # build kalau ada sumber yang berubah
+    python machinelearning/corpusBuilder.py --force    # build ulang walau tidak ada perubahan
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori machinelearning
+if currentDir not in sys.path: # buat import modul sibling
+    sys.path.append(currentDir) # tambah ke Python path
+from dataLoader import PROCESSED_DIR, MANIFEST_NAME, HIGH_QUALITY_PREFIX, loadManifest # lokasi + manifest corpus
+from preprocessing import preprocess # preprocess yang sama dengan runtime
+
+DATA_DIR = os.path.join(currentDir, 'database', 'data') # CSV hasil scrapper
+SOURCE_SUFFIX = 'ITB.csv' # multikampusITB.csv -> sumber 'multikampus'
+QUALITY_THRESHOLD = 60 # skor minimal high quality
+PIPELINE_VERSION = 1 # naikkan kalau aturan preprocess/kategori/skor berubah (cache baris dibuang)
+MANIFEST_VERSION = 1 # versi format manifest
+BUILD_CACHE_NAME = 'build_cache.json' # hasil per baris dari build sebelumnya
+
+EMPTY_CONTENT = {'nan', 'NaN', '', ' '} # nilai kosong setelah astype(str)
+HTML_TAG_CONTENT = re.compile(r'^(li|div|span|td|tr|ul|ol)$') # konten yang cuma nama tag
+CATEGORY_KEYWORDS = { # kategori -> keyword (urutan = prioritas)
+    'sejarah': ['sejarah', 'didirikan', 'berdiri', 'tahun', 'masa', 'periode', 'awal'],
+    'akademik': ['fakultas', 'jurusan', 'program studi', 'prodi', 'sarjana', 'magister', 'doktor', 'pendidikan'],
+    'fasilitas': ['gedung', 'laboratorium', 'perpustakaan', 'fasilitas', 'kampus', 'ruang'],
+    'mahasiswa': ['mahasiswa', 'siswa', 'peserta didik', 'alumni', 'lulusan'],
+    'penelitian': ['penelitian', 'riset', 'jurnal', 'publikasi', 'inovasi', 'teknologi'],
+    'administrasi': ['pendaftaran', 'daftar', 'syarat', 'berkas', 'administrasi', 'biaya'],
+    'lokasi': ['alamat', 'lokasi', 'jalan', 'bandung', 'jawa barat', 'indonesia'],
+    'umum': ['tentang', 'informasi', 'umum', 'profil', 'overview']
+}
+HIGH_QUALITY_COLUMNS = ['record_id', 'data_source', 'category', 'content', 'content_cleaned', 'content_length', 'quality_score', 'links', 'type', 'processed_date', 'original_index'] # skema processed
+COMPLETE_COLUMNS = HIGH_QUALITY_COLUMNS[1:] # semua baris bersih (tanpa record_id)
+SUMMARY_COLUMNS = ['processing_date', 'total_raw_records', 'total_processed_records', 'high_quality_records', 'quality_threshold', 'data_sources', 'categories_found', 'avg_quality_score', 'export_files'] # skema summary
+
+def categorizeContent(content: str) -> str: # kategori pertama yang keyword-nya muncul
+    contentLower = content.lower() # konten lowercase
+    for category, keywords in CATEGORY_KEYWORDS.items(): # cek tiap kategori
+        if any(keyword in contentLower for keyword in keywords): # ada keyword yang cocok
+            return category # return kategori
+    return 'lainnya' # kategori default
+
+def calculateQualityScore(content: str, links: Optional[str], category: str) -> int: # skor kualitas 0-100
+    score = 40 if len(content) > 100 else 30 if len(content) > 50 else 20 if len(content) > 20 else 10 # skor panjang (10-40)
+    if links is not None and links != '': # ada link (20)
+        score += 20 # tambah skor
+    if category != 'lainnya': # kategori jelas (20)
+        score += 20 # tambah skor
+    wordCount = len(content.split()) # jumlah kata
+    score += 20 if wordCount > 10 else 10 if wordCount > 5 else 0 # skor kekayaan konten (0-20)
+    return score # return total skor
+
+def rowHash(content: str, links: Optional[str]) -> str: # key cache hasil per baris
+    return hashlib.sha1(json.dumps([content, links], ensure_ascii=False).encode('utf-8')).hexdigest() # hash isi baris
+
+def fileHash(path: str) -> str: # sha256 file sumber
+    digest = hashlib.sha256() # hasher
+    with open(path, 'rb') as sourceFile: # baca biner
+        for block in iter(lambda: sourceFile.read(1 << 20), b''): # per 1 MiB
+            digest.update(block) # tambah ke hash
+    return digest.hexdigest() # hash file
+
+def sourceName(path: str) -> str: # nama sumber dari nama file
+    fileName = os.path.basename(path) # nama file
+    return fileName[:-len(SOURCE_SUFFIX)] if fileName.endswith(SOURCE_SUFFIX) else os.path.splitext(fileName)[0] # tanpa suffix
+
+def readSource(path: str) -> Optional[List[Dict]]: # baris CSV sumber (None kalau file kosong)
+    if os.path.getsize(path) == 0: # file kosong dilewati (sama dengan notebook)
+        return None # tanpa baris
+    import pandas as pd # pandas hanya dibutuhkan saat build (aturan NaN sama dengan notebook)
+    frame = pd.read_csv(path) # parse CSV
+    rows = frame.to_dict('records') # baris dict, urutan = original_index
+    return [{key: (None if isinstance(value, float) and value != value else value) for key, value in row.items()} for row in rows] # NaN -> None
+
+def loadBuildCache(cachePath: str) -> Dict[str, Dict]: # hasil per baris build sebelumnya
+    try:
+        with open(cachePath, 'r', encoding='utf-8') as cacheFile: # baca cache
+            cache = json.load(cacheFile) # parse JSON
+    except (OSError, ValueError): # belum ada / rusak
+        return {} # cache kosong
+    return cache.get('rows', {}) if cache.get('pipelineVersion') == PIPELINE_VERSION else {} # buang cache aturan lama
+
+def writeJson(path: str, payload: Dict): # tulis JSON secara atomik
+    tempPath = f"{path}.tmp{os.getpid()}" # file sementara
+    with open(tempPath, 'w', encoding='utf-8') as jsonFile: # tulis JSON
+        json.dump(payload, jsonFile, indent=1, ensure_ascii=False) # isi
+    os.replace(tempPath, path) # ganti atomik
+
+def writeCsv(path: str, records: List[Dict], columns: List[str]): # tulis CSV skema processed secara atomik
+    import pandas as pd # format CSV sama dengan export notebook
+    tempPath = f"{path}.tmp{os.getpid()}" # file sementara
+    pd.DataFrame(records, columns=columns).to_csv(tempPath, index=False, encoding='utf-8') # export
+    os.replace(tempPath, path) # ganti atomik
+
+def cleanSource(rows: List[Dict], name: str, previousCache: Dict[str, Dict], buildCache: Dict[str, Dict], today: str, stats: Dict) -> List[Dict]: # baris bersih satu sumber
+    records = [] # baris hasil
+    seenContent = set() # drop duplikat per sumber (keep first)
+    for originalIndex, row in enumerate(rows): # loop baris sumber
+        value = row.get('content') # nilai content
+        content = 'nan' if value is None else str(value) # astype(str)
+        if len(content) <= 3 or content in EMPTY_CONTENT or HTML_TAG_CONTENT.match(content): # kosong / pendek / tag HTML
+            continue # skip
+        if content in seenContent: # duplikat di sumber yang sama
+            continue # skip
+        seenContent.add(content) # catat konten
+        links = row.get('links') # link mentah
+        key = rowHash(content, links) # key cache baris
+        derived = buildCache.get(key) # baris sama dari sumber lain di build ini
+        if derived is None: # belum dihitung di build ini
+            derived = previousCache.get(key) # hasil build sebelumnya
+            if derived is None: # baris baru / berubah
+                category = categorizeContent(content) # kategori
+                derived = {'contentCleaned': preprocess(content), 'category': category, 'qualityScore': calculateQualityScore(content, links, category), 'processedDate': today} # hitung ulang
+                stats['reprocessed'] += 1 # hitung baris diproses
+            else: # hasil sama dipakai ulang
+                stats['reused'] += 1 # hitung baris dipakai ulang
+            buildCache[key] = derived # cache build ini (baris yang hilang ikut terbuang)
+        records.append({ # baris skema processed
+            'data_source': name, # sumber data
+            'category': derived['category'], # kategori konten
+            'content': content, # konten asli
+            'content_cleaned': derived['contentCleaned'], # konten bersih
+            'content_length': len(content), # panjang konten
+            'quality_score': derived['qualityScore'], # skor kualitas
+            'links': links, # link terkait
+            'type': row.get('type'), # tipe tag
+            'processed_date': derived['processedDate'], # tanggal baris diproses
+            'original_index': originalIndex # index baris di file sumber
+        })
+    return records # return baris bersih
+
+def buildCorpus(dataDir: str = DATA_DIR, processedDir: str = PROCESSED_DIR, threshold: int = QUALITY_THRESHOLD, force: bool = False) -> Dict: # build corpus, return manifest (+ status)
+    """Status 'upToDate' kalau sumber + aturan sama dengan manifest terakhir, selain itu 'built'"""
+    manifestPath = os.path.join(processedDir, MANIFEST_NAME) # manifest corpus
+    previous = loadManifest(manifestPath) # build terakhir
+    sourcePaths = sorted(glob.glob(os.path.join(dataDir, '*.csv'))) # file sumber (urutan stabil)
+    sources = {sourceName(path): {'file': os.path.basename(path), 'sha256': fileHash(path)} for path in sourcePaths} # hash sumber
+    if not force and previous and previous.get('pipelineVersion') == PIPELINE_VERSION and previous.get('qualityThreshold') == threshold \
+            and {name: info['sha256'] for name, info in previous.get('sources', {}).items()} == {name: info['sha256'] for name, info in sources.items()} \
+            and os.path.exists(os.path.join(processedDir, previous.get('highQualityFile', ''))): # tidak ada yang berubah
+        return dict(previous, status='upToDate') # build dilewati
+
+    os.makedirs(processedDir, exist_ok=True) # pastikan direktori ada
+    cachePath = os.path.join(processedDir, BUILD_CACHE_NAME) # cache baris
+    previousCache = loadBuildCache(cachePath) # hasil baris build sebelumnya
+    buildCache: Dict[str, Dict] = {} # hasil baris build ini
+    today = time.strftime('%Y-%m-%d') # tanggal proses baris baru
+    stats = {'reprocessed': 0, 'reused': 0} # statistik incremental
+    master, loadedSources, totalRaw = [], [], 0 # semua baris bersih, sumber terisi, jumlah baris mentah
+    for path in sourcePaths: # loop sumber
+        name = sourceName(path) # nama sumber
+        rows = readSource(path) # baris mentah
+        if rows is None: # file kosong
+            sources[name]['rows'] = 0 # tanpa baris
+            continue # skip
+        sources[name]['rows'] = len(rows) # jumlah baris mentah
+        totalRaw += len(rows) # akumulasi
+        loadedSources.append(name) # sumber terisi
+        master.extend(cleanSource(rows, name, previousCache, buildCache, today, stats)) # baris bersih
+
+    highQuality = [dict(record_id=recordId, **record) for recordId, record in enumerate((record for record in master if record['quality_score'] >= threshold), 1)] # filter + record_id
+    version = (previous or {}).get('version', 0) + 1 # nomor build corpus
+    stamp = f"{time.strftime('%Y%m%d_%H%M%S')}_v{version}" # timestamp + versi nama file (unik per build)
+    files = { # nama file output (relatif processedDir)
+        'highQualityFile': f"{HIGH_QUALITY_PREFIX}{stamp}.csv", # high quality
+        'completeFile': f"itb_chatbot_complete_{stamp}.csv", # semua baris bersih
+        'summaryFile': f"processing_summary_{stamp}.csv" # ringkasan
+    }
+    existing = [name for name in files.values() if os.path.exists(os.path.join(processedDir, name))] # output build lain dengan nama sama
+    if existing: # manifest hilang/di-reset dan nama bentrok
+        raise FileExistsError(f"Output build sudah ada, tidak ditimpa: {', '.join(existing)}") # jangan timpa corpus yang mungkin sedang dipakai
+    writeCsv(os.path.join(processedDir, files['highQualityFile']), highQuality, HIGH_QUALITY_COLUMNS) # export high quality
+    writeCsv(os.path.join(processedDir, files['completeFile']), master, COMPLETE_COLUMNS) # export complete
+    summary = { # ringkasan (kolom sama dengan summary notebook)
+        'processing_date': time.strftime('%Y-%m-%d %H:%M:%S'), # tanggal build
+        'total_raw_records': totalRaw, # baris mentah
+        'total_processed_records': len(master), # baris bersih
+        'high_quality_records': len(highQuality), # baris high quality
+        'quality_threshold': threshold, # threshold
+        'data_sources': ', '.join(loadedSources), # sumber terisi
+        'categories_found': ', '.join(dict.fromkeys(record['category'] for record in highQuality)), # kategori (urutan kemunculan)
+        'avg_quality_score': sum(record['quality_score'] for record in highQuality) / len(highQuality) if highQuality else 0.0, # rata-rata skor
+        'export_files': '; '.join(os.path.relpath(os.path.join(processedDir, files[key]), currentDir) for key in ('highQualityFile', 'completeFile')) # file export
+    }
+    writeCsv(os.path.join(processedDir, files['summaryFile']), [summary], SUMMARY_COLUMNS) # export summary
+
+    manifest = { # manifest build (ditulis terakhir = titik commit build)
+        'manifestVersion': MANIFEST_VERSION, # format manifest
+        'version': version, # nomor build corpus (juga di nama file)
+        'builtAt': summary['processing_date'], # waktu build
+        'pipelineVersion': PIPELINE_VERSION, # versi aturan
+        'qualityThreshold': threshold, # threshold
+        **files, # file aktif
+        'highQualitySha256': fileHash(os.path.join(processedDir, files['highQualityFile'])), # hash output
+        'records': {'raw': totalRaw, 'processed': len(master), 'highQuality': len(highQuality)}, # jumlah baris
+        'rows': stats, # baris diproses ulang / dipakai ulang
+        'sources': sources # hash + jumlah baris per sumber
+    }
+    writeJson(cachePath, {'pipelineVersion': PIPELINE_VERSION, 'rows': buildCache}) # cache baris build ini
+    writeJson(manifestPath, manifest) # aktifkan build baru
+    return dict(manifest, status='built') # return manifest
+
+if __name__ == '__main__': # jalankan langsung
+    parser = argparse.ArgumentParser(description='Build processed corpus incremental dari database/data/*.csv') # argumen CLI
+    parser.add_argument('--data-dir', default=DATA_DIR, help='direktori CSV scrapper') # input
+    parser.add_argument('--processed-dir', default=PROCESSED_DIR, help='direktori output + manifest') # output
+    parser.add_argument('--threshold', type=int, default=QUALITY_THRESHOLD, help='quality score minimal high quality') # threshold
+    parser.add_argument('--force', action='store_true', help='build ulang walau sumber tidak berubah') # paksa
+    args = parser.parse_args() # parse argumen
+
+    start = time.perf_counter() # mulai timer
+    result = buildCorpus(args.data_dir, args.processed_dir, args.threshold, args.force) # build
+    if result['status'] == 'upToDate': # tidak ada perubahan
+        print(f"Corpus v{result['version']} up to date: {result['highQualityFile']}") # laporan
+    else: # build baru
+        print(f"Corpus v{result['version']}: {result['records']['highQuality']}/{result['records']['processed']} high quality dari {result['records']['raw']} baris mentah -> {result['highQualityFile']}") # laporan
+        print(f"Baris diproses ulang {result['rows']['reprocessed']}, dipakai ulang {result['rows']['reused']}, {time.perf_counter() - start:.1f}s") # statistik incremental
@@ -0,0 +1,146 @@
+# Corpus Scaler - dataset sintetis berskema processed CSV untuk load test matcher (tanpa scraping)
+"""
+Membesarkan processed CSV ke N baris dengan skema yang sama (record_id, data_source,
+category, content, content_cleaned, content_length, quality_score, links, type, ...).
+Baris asli disalin utuh, baris sintetis dibuat dari template baris asli:
+
+- kategori template diambil sesuai proporsi kategori corpus asli
+- sebagian kata diganti kata lain dari distribusi frekuensi kata kategori yang sama
+  (content dan content_cleaned masing-masing dari vocabulary kolomnya sendiri)
+- sebagian kata diberi typo terkontrol (tukar, hapus, dobel, ganti huruf)
+
+Hasilnya dipakai lewat dataLoader dengan CORPUS_PATH:
+
+    python machinelearning/corpusScaler.py --rows 50000 --output /tmp/corpus50k.csv
+    CORPUS_PATH=/tmp/corpus50k.csv python machinelearning/benchmark.py --scales 1
+"""
+import argparse
+import bisect
+import csv
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple
+
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori machinelearning
+if currentDir not in sys.path: # buat import modul sibling
+    sys.path.append(currentDir) # tambah ke Python path
+
+TYPO_OPERATIONS = ('swap', 'drop', 'double', 'substitute') # jenis typo yang disuntikkan
+TYPO_ALPHABET = 'abcdefghijklmnopqrstuvwxyz' # huruf pengganti
+MIN_TYPO_LENGTH = 4 # kata lebih pendek tidak diberi typo
+
+def makeTypo(word: str, rng: random.Random, operation: Optional[str] = None) -> str: # satu varian typo dari kata
+    if len(word) < MIN_TYPO_LENGTH: # terlalu pendek
+        return word # kata asli
+    operation = operation or rng.choice(TYPO_OPERATIONS) # jenis typo
+    position = rng.randrange(1, len(word) - 1) # huruf pertama dipertahankan
+    if operation == 'swap': # tukar dua huruf bersebelahan
+        return word[:position] + word[position + 1] + word[position] + word[position + 2:] # huruf ditukar
+    if operation == 'drop': # huruf hilang
+        return word[:position] + word[position + 1:] # huruf dihapus
+    if operation == 'double': # huruf dobel
+        return word[:position] + word[position] + word[position:] # huruf diulang
+    return word[:position] + rng.choice(TYPO_ALPHABET) + word[position + 1:] # huruf diganti
+
+class WordSampler: # sampling kata sesuai frekuensi
+    def __init__(self, counts: Counter): # build distribusi kumulatif
+        self.words = list(counts) # kata
+        self.cumulative = list(accumulate(counts[word] for word in self.words)) # frekuensi kumulatif
+
+    def sample(self, rng: random.Random) -> str: # satu kata acak berbobot frekuensi
+        return self.words[bisect.bisect_right(self.cumulative, rng.random() * self.cumulative[-1])] # inverse CDF
+
+def mutateText(text: str, sampler: Optional[WordSampler], rng: random.Random, replaceRate: float, typoRate: float) -> Tuple[str, int]: # ganti kata + suntik typo
+    words = text.split() # token
+    typoCount = 0 # jumlah typo
+    for position, word in enumerate(words): # loop kata
+        roll = rng.random() # satu angka acak per kata
+        if roll < replaceRate and sampler is not None: # ganti kata dari vocabulary kategori
+            words[position] = sampler.sample(rng) # kata pengganti
+        elif roll < replaceRate + typoRate and len(word) >= MIN_TYPO_LENGTH: # typo
+            words[position] = makeTypo(word, rng) # varian typo
+            typoCount += 1 # hitung typo
+    return ' '.join(words), typoCount # text baru dan jumlah typo
+
+def buildSamplers(rows: List[Dict], column: str) -> Dict[str, WordSampler]: # sampler kata per kategori
+    counts: Dict[str, Counter] = defaultdict(Counter) # kategori -> frekuensi kata
+    for row in rows: # loop baris
+        if isinstance(row.get(column), str): # kolom terisi
+            counts[row['category']].update(row[column].split()) # tambah frekuensi
+    return {category: WordSampler(wordCounts) for category, wordCounts in counts.items() if wordCounts} # sampler per kategori
+
+def generateRows(rows: List[Dict], targetRows: int, seed: int = 0, replaceRate: float = 0.2, typoRate: float = 0.05) -> Tuple[List[Dict], Dict]: # baris asli + sintetis sampai targetRows
+    """Return (baris, statistik); baris asli selalu ikut di depan dengan urutan sama"""
+    rng = random.Random(seed) # random deterministik
+    byCategory: Dict[str, List[Dict]] = defaultdict(list) # kategori -> baris template
+    for row in rows: # loop baris asli
+        byCategory[row['category']].append(row) # kelompokkan
+    categories = sorted(byCategory) # urutan kategori stabil
+    categoryCumulative = list(accumulate(len(byCategory[category]) for category in categories)) # proporsi kategori
+    contentSamplers = buildSamplers(rows, 'content') # vocabulary content
+    cleanedSamplers = buildSamplers(rows, 'content_cleaned') # vocabulary content_cleaned
+
+    output = [dict(row) for row in rows] # baris asli
+    nextRecordId = max((int(row['record_id']) for row in rows), default=0) + 1 # record_id baru
+    processedDate = time.strftime('%Y-%m-%d %H:%M:%S') # tanggal generate
+    typoCount = 0 # total typo
+    while len(output) < targetRows: # sampai target
+        category = categories[bisect.bisect_right(categoryCumulative, rng.randrange(categoryCumulative[-1]))] # kategori sesuai proporsi
+        template = rng.choice(byCategory[category]) # baris template
+        row = dict(template) # salinan template
+        row['content'], contentTypos = mutateText(str(template['content']), contentSamplers.get(category), rng, replaceRate, typoRate) # content sintetis
+        if isinstance(template.get('content_cleaned'), str): # kolom bersih terisi
+            row['content_cleaned'], _ = mutateText(template['content_cleaned'], cleanedSamplers.get(category), rng, replaceRate, typoRate) # content_cleaned sintetis
+        row['content_length'] = len(row['content']) # panjang baru
+        row['record_id'] = nextRecordId # id unik
+        row['original_index'] = template.get('original_index', template['record_id']) # asal template
+        row['processed_date'] = processedDate # tanggal generate
+        nextRecordId += 1 # id berikutnya
+        typoCount += contentTypos # akumulasi typo
+        output.append(row) # simpan baris
+    stats = { # ringkasan
+        'originalRows': len(rows), # baris asli
+        'syntheticRows': len(output) - len(rows), # baris sintetis
+        'typoWords': typoCount, # kata dengan typo (content)
+        'categories': dict(Counter(row['category'] for row in output)) # campuran kategori
+    }
+    return output, stats # return baris dan statistik
+
+def scaleCorpus(inputCsv: str, outputCsv: str, targetRows: int, seed: int = 0, replaceRate: float = 0.2, typoRate: float = 0.05) -> Dict: # CSV -> CSV sintetis
+    """Baca processed CSV, tulis CSV sintetis berskema sama (atomik), return statistik"""
+    import pandas as pd # pandas hanya dibutuhkan tool ini
+    frame = pd.read_csv(inputCsv) # baca corpus asli
+    rows = frame.to_dict('records') # baris dict
+    rows = [{key: (None if isinstance(value, float) and value != value else value) for key, value in row.items()} for row in rows] # NaN -> None
+    output, stats = generateRows(rows, targetRows, seed, replaceRate, typoRate) # generate baris
+    tempPath = f"{outputCsv}.tmp{os.getpid()}" # tulis ke file sementara dulu
+    pd.DataFrame(output, columns=list(frame.columns)).to_csv(tempPath, index=False) # skema kolom sama
+    os.replace(tempPath, outputCsv) # ganti file secara atomik
+    return stats # return statistik
+
+if __name__ == '__main__': # jalankan langsung
+    from dataLoader import activeProcessedFile # corpus default
+    parser = argparse.ArgumentParser(description='Generate corpus sintetis dari processed CSV') # argumen CLI
+    parser.add_argument('--input', default=activeProcessedFile(), help='processed CSV sumber') # input
+    parser.add_argument('--output', required=True, help='CSV hasil (pakai lewat CORPUS_PATH)') # output
+    size = parser.add_mutually_exclusive_group(required=True) # ukuran target
+    size.add_argument('--rows', type=int, help='jumlah baris total') # baris absolut
+    size.add_argument('--factor', type=float, help='kelipatan jumlah baris asli') # kelipatan
+    parser.add_argument('--seed', type=int, default=0, help='seed random') # seed
+    parser.add_argument('--replace-rate', type=float, default=0.2, help='peluang kata diganti kata kategori yang sama') # rate ganti
+    parser.add_argument('--typo-rate', type=float, default=0.05, help='peluang kata diberi typo') # rate typo
+    args = parser.parse_args() # parse argumen
+
+    targetRows = args.rows # target baris
+    if targetRows is None: # pakai kelipatan
+        with open(args.input, encoding='utf-8', newline='') as inputFile: # hitung baris asli
+            originalRows = sum(1 for _ in csv.reader(inputFile)) - 1 # tanpa header (field multiline aman)
+        targetRows = int(round(originalRows * args.factor)) # baris asli x faktor
+    start = time.perf_counter() # mulai timer
+    stats = scaleCorpus(args.input, args.output, targetRows, args.seed, args.replace_rate, args.typo_rate) # generate corpus
+    print(f"{args.output}: {stats['originalRows']} asli + {stats['syntheticRows']} sintetis, {stats['typoWords']} typo, {time.perf_counter() - start:.1f}s") # ringkasan
+    print(f"Kategori: {stats['categories']}") # campuran kategori
@@ -0,0 +1,314 @@
+# Corpus Snapshot - processed CSV di-compile sekali jadi file biner yang dibuka dengan mmap
+"""
+Format snapshot (semua section rata 8 byte, dibaca zero-copy dengan np.frombuffer di atas mmap):
+
+    MAGIC (8 byte) | uint32 versi | uint32 reserved | uint64 panjang header | header JSON | section...
+
+Header menyimpan stamp file sumber (ukuran, mtime), jumlah baris, jenis kolom dan offset tiap section.
+Isi section:
+- kolom CSV secara columnar: angka sebagai array int64/float64, teks sebagai blob UTF-8 + offset + mask null
+- tabel token yang di-intern (semua token content/processed, raw dan clean)
+- fitur entry precomputed: id token per entry (content, processed, versi clean) + content lowercase
+- tabel link: daftar link http per baris yang sudah di-parse
+
+Karena file di-mmap read-only, worker gunicorn yang di-fork berbagi page yang sama. Entry dan
+fitur dibaca lewat view (SnapshotColumn, SnapshotIdRows) yang men-decode satu baris saat diakses,
+jadi tidak ada list/dict per baris yang resident di tiap process.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from linkIndex import parseLinks # parse kolom links (sama dengan findRelevantLinks)
+from structuredLog import getLogger # logger terstruktur
+
+logger = getLogger('data') # logger stage load corpus
+
+SNAPSHOT_MAGIC = b'ITBCORP\x00' # penanda file snapshot
+SNAPSHOT_VERSION = 2 # versi format snapshot (2: section content lowercase)
+SNAPSHOT_EXTENSION = '.corpus' # ekstensi file snapshot (di sebelah CSV)
+_PREAMBLE = struct.Struct('<8sIIQ') # magic, versi, reserved, panjang header
+
+def snapshotPathFor(csvPath: str) -> str: # path snapshot untuk satu CSV
+    return os.path.splitext(csvPath)[0] + SNAPSHOT_EXTENSION # ganti ekstensi
+
+def sourceStamp(csvPath: str) -> Optional[List[int]]: # stamp (ukuran, mtime) file sumber
+    try:
+        stat = os.stat(csvPath) # info file
+        return [stat.st_size, stat.st_mtime_ns] # stamp sumber
+    except OSError: # file tidak ada
+        return None # tanpa stamp
+
+def _align(offset: int) -> int: # bulatkan ke kelipatan 8
+    return (offset + 7) & ~7 # offset rata 8 byte
+
+def _encodeStrings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]: # list string -> (offset, blob UTF-8)
+    encoded = [value.encode('utf-8') for value in values] # encode semua string
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64) # offset awal/akhir tiap string
+    if encoded: # ada string
+        offsets[1:] = np.cumsum([len(item) for item in encoded]) # offset kumulatif
+    return offsets, np.frombuffer(b''.join(encoded), dtype=np.uint8) # offset + blob
+
+def _encodeIdLists(idLists: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]: # list id per baris -> (offset, id flat)
+    offsets = np.zeros(len(idLists) + 1, dtype=np.int64) # offset per baris
+    if idLists: # ada baris
+        offsets[1:] = np.cumsum([len(ids) for ids in idLists]) # offset kumulatif
+    flat = np.fromiter((tokenId for ids in idLists for tokenId in ids), dtype=np.int32, count=int(offsets[-1])) # id flat
+    return offsets, flat # offset + id
+
+class _TokenTable: # tabel token yang di-intern saat compile
+    def __init__(self): # konstruktor tabel
+        self.ids: Dict[str, int] = {} # token -> id
+        self.tokens: List[str] = [] # id -> token
+
+    def idsFor(self, tokens) -> List[int]: # id untuk deretan token
+        result = [] # id token
+        for token in tokens: # loop token
+            tokenId = self.ids.get(token) # id lama
+            if tokenId is None: # token baru
+                tokenId = self.ids[token] = len(self.tokens) # id baru
+                self.tokens.append(token) # simpan token
+            result.append(tokenId) # simpan id
+        return result # return id
+
+def compileCorpusSnapshot(csvPath: str, snapshotPath: Optional[str] = None) -> str: # compile CSV jadi snapshot biner
+    """Baca CSV sekali dengan pandas, tulis snapshot (atomik) dan return path-nya"""
+    import pandas as pd # pandas hanya dibutuhkan saat compile
+    from dataLoader import cleanToken # normalisasi token yang sama dengan matcher
+
+    snapshotPath = snapshotPath or snapshotPathFor(csvPath) # path default
+    stamp = sourceStamp(csvPath) # stamp sumber sebelum dibaca
+    df = pd.read_csv(csvPath) # parse CSV
+    rowCount = len(df) # jumlah baris
+    sections: Dict[str, np.ndarray] = {} # nama section -> array
+    columns = [] # metadata kolom
+
+    for name in df.columns: # loop kolom CSV
+        series = df[name] # kolom
+        if pd.api.types.is_integer_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype): # kolom integer
+            sections[f'col.{name}'] = series.to_numpy(dtype=np.int64) # array int64
+            columns.append({'name': name, 'kind': 'int'}) # jenis kolom
+        elif pd.api.types.is_float_dtype(series.dtype): # kolom float
+            sections[f'col.{name}'] = series.to_numpy(dtype=np.float64) # array float64
+            columns.append({'name': name, 'kind': 'float'}) # jenis kolom
+        else: # kolom teks
+            values = series.tolist() # nilai python
+            nullMask = np.array([not isinstance(value, str) for value in values], dtype=np.uint8) # 1 = kosong (NaN)
+            offsets, blob = _encodeStrings([value if isinstance(value, str) else '' for value in values]) # blob teks
+            sections[f'col.{name}.offsets'] = offsets # offset teks
+            sections[f'col.{name}.data'] = blob # isi teks
+            sections[f'col.{name}.null'] = nullMask # mask null
+            columns.append({'name': name, 'kind': 'str'}) # jenis kolom
+
+    # Fitur token per entry (sama dengan dataLoader.compileEntry)
+    tokenTable = _TokenTable() # tabel token intern
+    featureLists = {'contentTokens': [], 'contentWordsClean': [], 'processedTokens': [], 'processedWordsClean': []} # id per entry
+    contentLowers = [] # content lowercase per entry (buat substring match)
+    contents = df['content'].tolist() if 'content' in df.columns else [''] * rowCount # content
+    processedContents = df['content_cleaned'].tolist() if 'content_cleaned' in df.columns else [None] * rowCount # content bersih
+    for content, processedContent in zip(contents, processedContents): # loop entry
+        contentLower = content.lower() if isinstance(content, str) else '' # content lowercase
+        contentLowers.append(contentLower) # simpan content lowercase
+        if processedContent is None: # kolom tidak ada (compileEntry pakai contentLower)
+            processedContent = contentLower # fallback
+        elif not isinstance(processedContent, str): # nilai kosong (NaN)
+            processedContent = '' # anggap kosong
+        contentTokens = contentLower.split() # token content
+        processedTokens = processedContent.split() # token processed
+        featureLists['contentTokens'].append(tokenTable.idsFor(contentTokens)) # id token content
+        featureLists['contentWordsClean'].append(tokenTable.idsFor(cleanToken(word) for word in contentTokens if len(word) > 1)) # id kata content clean
+        featureLists['processedTokens'].append(tokenTable.idsFor(processedTokens)) # id token processed
+        featureLists['processedWordsClean'].append(tokenTable.idsFor(cleanToken(word) for word in processedTokens if len(word) > 1)) # id kata processed clean
+    for name, idLists in featureLists.items(): # simpan fitur
+        sections[f'feat.{name}.offsets'], sections[f'feat.{name}.ids'] = _encodeIdLists(idLists) # id per entry
+    sections['feat.contentLower.offsets'], sections['feat.contentLower.data'] = _encodeStrings(contentLowers) # content lowercase
+    sections['tokens.offsets'], sections['tokens.data'] = _encodeStrings(tokenTable.tokens) # tabel token
+
+    # Tabel link per baris
+    linkTable = _TokenTable() # tabel link intern
+    linkLists = [linkTable.idsFor(parseLinks(links)) for links in (df['links'].tolist() if 'links' in df.columns else [None] * rowCount)] # id link per baris
+    sections['links.rows.offsets'], sections['links.rows.ids'] = _encodeIdLists(linkLists) # link per baris
+    sections['links.offsets'], sections['links.data'] = _encodeStrings(linkTable.tokens) # tabel link
+
+    # Layout section (offset relatif terhadap awal data)
+    layout = {} # nama -> [offset, dtype, jumlah]
+    offset = 0 # offset berjalan
+    for name, array in sections.items(): # loop section
+        layout[name] = [offset, array.dtype.str, int(array.size)] # posisi section
+        offset = _align(offset + array.nbytes) # section berikutnya rata 8
+    header = json.dumps({ # header snapshot
+        'version': SNAPSHOT_VERSION, # versi format
+        'source': os.path.basename(csvPath), # nama CSV sumber
+        'sourceStamp': stamp, # stamp sumber
+        'rowCount': rowCount, # jumlah baris
+        'columns': columns, # jenis kolom
+        'sections': layout # offset section
+    }).encode('utf-8') # header JSON
+    dataStart = _align(_PREAMBLE.size + len(header)) # awal data
+
+    tempPath = f"{snapshotPath}.tmp{os.getpid()}" # tulis ke file sementara dulu
+    with open(tempPath, 'wb') as snapshotFile: # buka file
+        snapshotFile.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(header))) # preamble
+        snapshotFile.write(header) # header
+        for name, array in sections.items(): # tulis section
+            snapshotFile.seek(dataStart + layout[name][0]) # posisi section
+            snapshotFile.write(array.tobytes()) # isi section
+        snapshotFile.truncate(dataStart + offset) # panjang file final
+    os.replace(tempPath, snapshotPath) # ganti file secara atomik
+    return snapshotPath # return path snapshot
+
+def _rowIndex(row: int, size: int) -> int: # index baris (negatif dari belakang) dengan IndexError seperti list
+    if row < 0: # index dari belakang
+        row += size # index absolut
+    if not 0 <= row < size: # di luar jumlah baris
+        raise IndexError('snapshot row index out of range') # sama dengan list
+    return row # index valid
+
+class SnapshotColumn(Sequence): # satu kolom / tabel string sebagai view di atas mmap, nilai di-decode saat diakses
+    def __init__(self, snapshot: 'CorpusSnapshot', prefix: str, kind: str = 'str', nullable: bool = False): # view section prefix
+        self._mmap = snapshot._mmap # mapping read-only
+        self._kind = kind # str / int / float
+        if kind != 'str': # kolom angka
+            self._values = snapshot.array(prefix) # array int64/float64 zero-copy
+            self._size = int(self._values.size) # jumlah baris
+            return # tidak perlu offset
+        self._offsets = snapshot.array(f'{prefix}.offsets') # offset string (zero-copy)
+        self._blobStart = snapshot._dataStart + snapshot.header['sections'][f'{prefix}.data'][0] # awal blob UTF-8 di mmap
+        self._null = snapshot.array(f'{prefix}.null') if nullable else None # mask null (NaN seperti pandas)
+        self._size = int(self._offsets.size) - 1 # jumlah baris
+
+    def __len__(self) -> int: # jumlah baris
+        return self._size # jumlah baris
+
+    def __getitem__(self, row): # nilai satu baris (slice -> list)
+        if isinstance(row, slice): # slice
+            return [self[position] for position in range(*row.indices(self._size))] # list nilai
+        row = _rowIndex(row, self._size) # index valid
+        if self._kind != 'str': # kolom angka
+            return self._values[row].item() # int/float python
+        if self._null is not None and self._null[row]: # nilai kosong
+            return float('nan') # NaN seperti pandas
+        return self._mmap[self._blobStart + int(self._offsets[row]):self._blobStart + int(self._offsets[row + 1])].decode('utf-8') # decode satu string
+
+    def containing(self, needle: str) -> List[int]: # baris yang memuat needle (sama dengan needle in value)
+        """Cari langsung di blob mmap; UTF-8 self-synchronizing jadi hasil sama dengan substring str"""
+        if not needle: # string kosong ada di semua baris
+            return list(range(self._size)) # semua baris
+        pattern = needle.encode('utf-8') # pattern bytes
+        blobEnd = self._blobStart + int(self._offsets[-1]) # akhir blob
+        rows = [] # baris yang cocok
+        position = self._mmap.find(pattern, self._blobStart, blobEnd) # kemunculan pertama
+        while position != -1: # masih ada kemunculan
+            row = int(np.searchsorted(self._offsets, position - self._blobStart, side='right')) - 1 # baris tempat kemunculan
+            rowEnd = self._blobStart + int(self._offsets[row + 1]) # akhir baris
+            if position + len(pattern) <= rowEnd: # tidak menyeberang ke baris berikutnya
+                rows.append(row) # simpan baris
+                position = self._mmap.find(pattern, rowEnd, blobEnd) # lanjut dari baris berikutnya
+            else: # menyeberang batas baris
+                position = self._mmap.find(pattern, position + 1, blobEnd) # cari kemunculan berikutnya
+        return rows # urut sesuai posisi baris
+
+class SnapshotIdRows(Sequence): # id token per baris sebagai view, di-resolve ke tuple string saat diakses
+    def __init__(self, snapshot: 'CorpusSnapshot', prefix: str, table: List[str]): # view section prefix
+        self._offsets = snapshot.array(f'{prefix}.offsets') # offset per baris (zero-copy)
+        self._ids = snapshot.array(f'{prefix}.ids') # id flat (zero-copy)
+        self._table = table # id -> string
+        self._size = int(self._offsets.size) - 1 # jumlah baris
+
+    def __len__(self) -> int: # jumlah baris
+        return self._size # jumlah baris
+
+    def __getitem__(self, row): # tuple string satu baris (slice -> list)
+        if isinstance(row, slice): # slice
+            return [self[position] for position in range(*row.indices(self._size))] # list tuple
+        row = _rowIndex(row, self._size) # index valid
+        table = self._table # tabel lokal
+        return tuple(table[tokenId] for tokenId in self._ids[int(self._offsets[row]):int(self._offsets[row + 1])].tolist()) # token baris ini
+
+class CorpusSnapshot: # snapshot corpus yang dibuka dengan mmap
+    def __init__(self, path: str): # buka snapshot
+        self.path = path # path file
+        with open(path, 'rb') as snapshotFile: # buka file
+            self._mmap = mmap.mmap(snapshotFile.fileno(), 0, access=mmap.ACCESS_READ) # mapping read-only (page dibagi antar process)
+        magic, version, _, headerLength = _PREAMBLE.unpack_from(self._mmap, 0) # baca preamble
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION: # bukan snapshot / versi lain
+            raise ValueError(f"Unsupported corpus snapshot: {path}") # tolak file
+        self.header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + headerLength].decode('utf-8')) # header JSON
+        self._dataStart = _align(_PREAMBLE.size + headerLength) # awal data
+        self.rowCount = self.header['rowCount'] # jumlah baris
+        self.columns = {column['name']: column['kind'] for column in self.header['columns']} # nama -> jenis kolom
+        self._tokens = None # tabel token (lazy)
+
+    def isFresh(self, csvPath: str) -> bool: # snapshot masih sesuai dengan CSV
+        return self.header.get('sourceStamp') == sourceStamp(csvPath) # bandingkan stamp
+
+    def array(self, name: str) -> np.ndarray: # view zero-copy satu section
+        offset, dtype, count = self.header['sections'][name] # posisi section
+        return np.frombuffer(self._mmap, dtype=np.dtype(dtype), count=count, offset=self._dataStart + offset) # view di atas mmap
+
+    def _strings(self, prefix: str) -> List[str]: # decode tabel string
+        offsets = self.array(f'{prefix}.offsets').tolist() # offset string
+        offset = self.header['sections'][f'{prefix}.data'][0] + self._dataStart # awal blob
+        blob = self._mmap[offset:offset + offsets[-1]] # blob UTF-8
+        return [blob[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])] # list string
+
+    def column(self, name: str) -> list: # nilai satu kolom sebagai list python
+        kind = self.columns[name] # jenis kolom
+        if kind != 'str': # kolom angka
+            return self.array(f'col.{name}').tolist() # int/float python
+        values = self._strings(f'col.{name}') # nilai teks
+        nullMask = self.array(f'col.{name}.null') # mask null
+        return [float('nan') if isNull else value for value, isNull in zip(values, nullMask.tolist())] # NaN seperti pandas
+
+    def columnView(self, name: str) -> SnapshotColumn: # kolom sebagai view (decode per baris)
+        return SnapshotColumn(self, f'col.{name}', self.columns[name], nullable=True) # view kolom
+
+    def contentLower(self) -> SnapshotColumn: # content lowercase per entry sebagai view
+        return SnapshotColumn(self, 'feat.contentLower') # view content lowercase
+
+    def tokens(self) -> List[str]: # tabel token yang di-intern
+        if self._tokens is None: # belum di-decode
+            self._tokens = [sys.intern(token) for token in self._strings('tokens')] # decode + intern
+        return self._tokens # return token
+
+    def tokenRows(self, name: str) -> SnapshotIdRows: # token per entry satu fitur (contentTokens, contentWordsClean, ...)
+        return SnapshotIdRows(self, f'feat.{name}', self.tokens()) # view id token
+
+    def cleanWords(self) -> List[str]: # kata clean unik (content + processed) tanpa decode per entry
+        ids = np.unique(np.concatenate([self.array('feat.contentWordsClean.ids'), self.array('feat.processedWordsClean.ids')])) # id unik
+        tokens = self.tokens() # tabel token
+        return [tokens[tokenId] for tokenId in ids.tolist()] # kata clean
+
+    def linkLists(self) -> List[List[str]]: # link http per baris
+        return [list(row) for row in SnapshotIdRows(self, 'links.rows', self._strings('links'))] # link per baris
+
+def openCorpusSnapshot(csvPath: str, compileIfStale: bool = True) -> Optional[CorpusSnapshot]: # buka snapshot yang sesuai dengan CSV
+    """Return snapshot yang masih fresh; compile ulang kalau belum ada/basi (best effort)"""
+    snapshotPath = snapshotPathFor(csvPath) # path snapshot
+    if os.path.exists(snapshotPath): # snapshot ada
+        try:
+            snapshot = CorpusSnapshot(snapshotPath) # buka snapshot
+            if snapshot.isFresh(csvPath): # masih sesuai CSV
+                return snapshot # pakai snapshot
+        except (OSError, ValueError) as e: # file rusak / versi lama
+            logger.warning("Corpus snapshot load error %s: %s", snapshotPath, e) # log error
+    if not compileIfStale or not os.path.exists(csvPath): # tidak compile
+        return None # caller parse CSV
+    try:
+        compileCorpusSnapshot(csvPath, snapshotPath) # compile ulang
+        logger.info("Corpus snapshot compiled to %s", snapshotPath) # log compile
+        return CorpusSnapshot(snapshotPath) # buka snapshot baru
+    except Exception as e: # direktori read-only / CSV rusak
+        logger.warning("Corpus snapshot compile error %s: %s", csvPath, e) # log error, caller parse CSV
+        return None # caller parse CSV
+
+if __name__ == "__main__": # compile corpus: python corpusSnapshot.py [csv ...]
+    from dataLoader import activeProcessedFile # CSV default
+    for csvPath in sys.argv[1:] or [activeProcessedFile()]: # loop CSV
+        print(f"{csvPath} -> {compileCorpusSnapshot(csvPath)}") # compile snapshot
@@ -1,51 +1,147 @@
 # Enhanced Data Loader - Load processed high-quality CSV
-import pandas as pd  # Library untuk manipulasi data
+import glob  # Cari file processed
+import json  # Format manifest
 import os  # OS interface untuk file operations
 import sys  # System utilities
+from collections.abc import Sequence  # Base class view entry/fitur snapshot
 
 currentDir = os.path.dirname(os.path.abspath(__file__))  # Dapatkan direktori saat ini
 sys.path.append(currentDir)  # Tambah ke Python path
 
-def loadCsvData():  # Load enhanced dataset dari processed CSV
-    processedFile = os.path.join(  # Path ke file processed
-        os.path.dirname(__file__), 
-        'database', 
-        'processed', 
-        'itb_chatbot_high_quality_20250621_190153.csv'
-    )
+from structuredLog import getLogger  # Logger terstruktur
+
+logger = getLogger('data')  # Logger stage load corpus
+
+PROCESSED_DIR = os.path.join(currentDir, 'database', 'processed')  # Direktori data processed
+MANIFEST_NAME = 'manifest.json'  # Manifest build corpus (ditulis corpusBuilder)
+HIGH_QUALITY_PREFIX = 'itb_chatbot_high_quality_'  # Prefix file processed high quality (diikuti timestamp + versi build)
+CORPUS_PATH = os.environ.get('CORPUS_PATH')  # Override corpus (corpus sintetis/load test), None = ikuti manifest corpusBuilder
+
+def loadManifest(manifestPath=None):  # Manifest build corpus, None kalau belum ada / rusak
+    try:
+        with open(manifestPath or os.path.join(PROCESSED_DIR, MANIFEST_NAME), 'r', encoding='utf-8') as manifestFile:  # Buka manifest
+            return json.load(manifestFile)  # Parse JSON
+    except (OSError, ValueError):  # Belum pernah build / file rusak
+        return None  # Tanpa manifest
+
+def resolveProcessedFile(processedDir=None):  # File high quality aktif: dari manifest, fallback file terbaru
+    processedDir = processedDir or PROCESSED_DIR  # Direktori processed (dibaca saat dipanggil)
+    manifest = loadManifest(os.path.join(processedDir, MANIFEST_NAME))  # Manifest build terakhir
+    if manifest and manifest.get('highQualityFile'):  # Manifest menunjuk file aktif
+        manifestFile = os.path.join(processedDir, manifest['highQualityFile'])  # Path file aktif
+        if os.path.exists(manifestFile):  # File masih ada
+            return manifestFile  # Pakai file dari manifest
+    candidates = sorted(glob.glob(os.path.join(processedDir, HIGH_QUALITY_PREFIX + '*.csv')))  # Build lama tanpa manifest
+    return candidates[-1] if candidates else os.path.join(processedDir, HIGH_QUALITY_PREFIX + 'latest.csv')  # Timestamp terbaru
+
+def manifestVersion(processedDir=None):  # Nomor build corpus di manifest, None kalau belum ada manifest
+    manifest = loadManifest(os.path.join(processedDir or PROCESSED_DIR, MANIFEST_NAME))  # Manifest build terakhir
+    return manifest.get('version') if manifest else None  # Versi build
+
+def activeProcessedFile():  # Corpus aktif: CORPUS_PATH, selain itu file dari manifest (di-resolve setiap dipanggil, bukan saat import)
+    return CORPUS_PATH or resolveProcessedFile()  # Path corpus
+
+def fileStamp(path):  # Stamp (path, mtime, size) file, None kalau tidak ada / tidak terbaca
+    if not path:  # Tanpa path
+        return None  # Tidak ada stamp
+    try:
+        stat = os.stat(path)  # Info file
+        return (path, stat.st_mtime_ns, stat.st_size)  # Stamp file
+    except OSError:  # File hilang
+        return None  # Tidak ada stamp
+
+def corpusStamp():  # Versi corpus aktif (versi manifest, stamp file) - sama untuk detector dan matcher
+    return (manifestVersion(), fileStamp(activeProcessedFile()))  # Berubah kalau build baru dipublish atau file diganti
+
+SNAPSHOT_ENABLED = os.environ.get('CORPUS_SNAPSHOT', '1') != '0'  # Pakai snapshot biner (corpusSnapshot) kalau ada
+FEATURE_CACHE_SIZE = int(os.environ.get('FEATURE_CACHE_SIZE', '2048'))  # Jumlah EntryFeatures snapshot yang disimpan setelah dirakit (0 = selalu rakit ulang)
+
+# Field entry -> (kolom CSV, default kalau kolom tidak ada)
+ENTRY_COLUMNS = (
+    ('source', 'data_source', None),  # Sumber data
+    ('content', 'content', None),  # Konten asli
+    ('processed_content', 'content_cleaned', None),  # Konten bersih
+    ('category', 'category', None),  # Kategori konten
+    ('quality_score', 'quality_score', None),  # Skor kualitas
+    ('content_length', 'content_length', None),  # Panjang konten
+    ('type', 'type', ''),  # Tipe konten
+    ('links', 'links', ''),  # Link terkait
+    ('record_id', 'record_id', None)  # ID record
+)
+
+class SnapshotEntries(Sequence):  # Entry dict per baris, di-decode dari kolom snapshot saat diakses
+    """Sama dengan hasil iterrows di loadCsvData, tapi tidak ada dict per baris yang resident:
+    page mmap snapshot dibagi antar worker yang di-fork"""
+    def __init__(self, snapshot):  # View entry di atas snapshot
+        self.snapshot = snapshot  # Snapshot sumber
+        self._columns = tuple((key, snapshot.columnView(name) if name in snapshot.columns or default is None else None, default) for key, name, default in ENTRY_COLUMNS)  # Field -> view kolom (kolom wajib hilang -> KeyError)
+
+    def __len__(self):  # Jumlah entry
+        return self.snapshot.rowCount  # Jumlah baris snapshot
+
+    def __getitem__(self, row):  # Entry dict satu baris (slice -> list)
+        if isinstance(row, slice):  # Slice
+            return [self[position] for position in range(*row.indices(len(self)))]  # List entry
+        return {key: column[row] if column is not None else default for key, column, default in self._columns}  # Decode satu baris
+
+    def values(self, key):  # Nilai satu field semua entry (hanya kolom itu yang di-decode)
+        for field, column, default in self._columns:  # Cari field
+            if field == key:  # Field ditemukan
+                return list(column) if column is not None else [default] * len(self)  # Nilai kolom
+        raise KeyError(key)  # Field tidak dikenal
+
+def loadCsvColumns(csvPath, columns):  # Kolom CSV sebagai list python (None kalau kolom tidak ada), tanpa DataFrame resident
+    if SNAPSHOT_ENABLED:  # Snapshot aktif
+        from corpusSnapshot import openCorpusSnapshot  # Import lazy
+        snapshot = openCorpusSnapshot(csvPath)  # Buka/compile snapshot
+        if snapshot is not None:  # Snapshot tersedia
+            return {name: snapshot.column(name) if name in snapshot.columns else None for name in columns}  # Kolom dari snapshot
+    import pandas as pd  # Import lazy
+    frame = pd.read_csv(csvPath)  # Parse CSV (DataFrame dibuang setelah kolom diambil)
+    return {name: frame[name].tolist() if name in frame.columns else None for name in columns}  # Kolom sebagai list
+
+def loadCsvData(processedFile=None):  # Load enhanced dataset dari processed CSV (default corpus aktif)
+    processedFile = processedFile or activeProcessedFile()  # Path ke file processed (manifest dibaca saat load)
 
     if os.path.exists(processedFile):  # Cek file processed ada
         try:  # Coba load file processed
-            print(f"📂 Loading enhanced dataset: {os.path.basename(processedFile)}")  # Log loading
-            df = pd.read_csv(processedFile)  # Baca CSV dengan pandas
-
-            allData = []  # List untuk semua data
-            for _, row in df.iterrows():  # Loop setiap row
-                entry = {  # Format data entry
-                    'source': row['data_source'],  # Sumber data
-                    'content': row['content'],  # Konten asli
-                    'processed_content': row['content_cleaned'],  # Konten bersih
-                    'category': row['category'],  # Kategori konten
-                    'quality_score': row['quality_score'],  # Skor kualitas
-                    'content_length': row['content_length'],  # Panjang konten
-                    'type': row.get('type', ''),  # Tipe konten
-                    'links': row.get('links', ''),  # Link terkait
-                    'record_id': row['record_id']  # ID record
-                }
-                allData.append(entry)  # Tambah ke list
-
-            print(f"✅ Loaded {len(allData)} high-quality entries")  # Log sukses
-            print(f"📊 Categories: {len(set(entry['category'] for entry in allData))}")  # Log kategori
-            print(f"⭐ Avg quality: {sum(entry['quality_score'] for entry in allData)/len(allData):.1f}/100")  # Log rata-rata kualitas
+            logger.info("Loading enhanced dataset: %s", os.path.basename(processedFile))  # Log loading
+            snapshot = None  # Snapshot biner
+            if SNAPSHOT_ENABLED:  # Snapshot aktif
+                from corpusSnapshot import openCorpusSnapshot  # Import lazy
+                snapshot = openCorpusSnapshot(processedFile)  # Buka/compile snapshot
+
+            if snapshot is not None:  # Snapshot tersedia (tanpa parse CSV)
+                allData = SnapshotEntries(snapshot)  # Entry dibaca dari kolom snapshot saat diakses
+                fieldValues = allData.values  # Statistik dari kolom saja
+            else:  # Parse CSV
+                import pandas as pd  # Import lazy
+                df = pd.read_csv(processedFile)  # Baca CSV dengan pandas
+
+                allData = []  # List untuk semua data
+                for _, row in df.iterrows():  # Loop setiap row
+                    entry = {  # Format data entry
+                        'source': row['data_source'],  # Sumber data
+                        'content': row['content'],  # Konten asli
+                        'processed_content': row['content_cleaned'],  # Konten bersih
+                        'category': row['category'],  # Kategori konten
+                        'quality_score': row['quality_score'],  # Skor kualitas
+                        'content_length': row['content_length'],  # Panjang konten
+                        'type': row.get('type', ''),  # Tipe konten
+                        'links': row.get('links', ''),  # Link terkait
+                        'record_id': row['record_id']  # ID record
+                    }
+                    allData.append(entry)  # Tambah ke list
+                fieldValues = lambda key: [entry[key] for entry in allData]  # Nilai field dari list entry
+
+            logger.info("Loaded %d high-quality entries, %d categories, avg quality %.1f/100", len(allData), len(set(fieldValues('category'))), sum(fieldValues('quality_score')) / len(allData))  # Log sukses + kategori + rata-rata kualitas
 
             return allData  # Return data
 
         except Exception as e:  # Tangkap error loading
-            print(f"⚠️  Error loading processed data: {e}")  # Log error
-            print("🔄 Falling back to original CSV files...")  # Log fallback
+            logger.error("Error loading processed data %s: %s, falling back to original CSV files", processedFile, e)  # Log error + fallback
     else:  # File processed tidak ada
-        print(f"⚠️  Processed file not found: {processedFile}")  # Log not found
-        print("🔄 Using original CSV files...")  # Log fallback
+        logger.warning("Processed file not found: %s, using original CSV files", processedFile)  # Log not found + fallback
 
     return loadOriginalCsvData()  # Fallback ke original
 
@@ -59,6 +155,7 @@ def loadOriginalCsvData():  # Load original CSV files
     ]
 
     allData = []  # List untuk semua data
+    import pandas as pd  # Import lazy (fallback saja)
 
     for csvFile in csvFiles:  # Loop setiap file CSV
         filePath = os.path.join(dataDir, csvFile)  # Path lengkap file
@@ -84,12 +181,115 @@ def loadOriginalCsvData():  # Load original CSV files
                             allData.append(entry)  # Tambah ke list
 
             except Exception as e:  # Tangkap error loading
-                print(f"Error loading {csvFile}: {e}")  # Log error
+                logger.error("Error loading %s: %s", csvFile, e)  # Log error
                 continue  # Lanjut ke file berikutnya
 
-    print(f"Loaded {len(allData)} data entries from original CSV files")  # Log total loaded
+    logger.info("Loaded %d data entries from original CSV files", len(allData))  # Log total loaded
     return allData  # Return data
 
+class EntryFeatures:  # Fitur token per entry yang tidak bergantung query
+    """Precomputed token features dari satu entry (dipakai matcher tanpa split/clean ulang)"""
+    __slots__ = (
+        'contentLower',  # Content lowercase (buat substring match)
+        'contentTokenSet',  # Set token content.lower().split() (buat word overlap)
+        'contentWords',  # Tuple kata content (len > 1)
+        'contentWordsClean',  # Tuple kata content versi alnum lowercase
+        'processedTokenSet',  # Set token processed content (buat jaccard)
+        'processedWords',  # Tuple kata processed content (len > 1)
+        'processedWordsClean'  # Tuple kata processed versi alnum lowercase
+    )
+
+class TokenFeatures:  # Fitur karakter per kata vocabulary (dipakai bersama semua entry)
+    """Precomputed character features dari satu kata clean"""
+    __slots__ = ('bigrams', 'trigrams', 'soundex', 'norep')  # N-gram set, kode soundex, bentuk tanpa huruf berulang
+
+class SnapshotEntryFeatures(Sequence):  # EntryFeatures per baris dari id token snapshot, dirakit saat diakses
+    """Urutan sama dengan SnapshotEntries; contentLower berupa view kolom (punya containing() buat substring retrieval).
+    Entry yang sering jadi kandidat disimpan di LRU kecil (FEATURE_CACHE_SIZE), sisanya tetap di page mmap"""
+    def __init__(self, snapshot, cacheSize=None):  # View fitur di atas snapshot
+        from lruCache import LruCache  # Import lazy
+        self._cache = LruCache(FEATURE_CACHE_SIZE if cacheSize is None else cacheSize)  # Baris -> EntryFeatures yang sudah dirakit
+        self.contentLower = snapshot.contentLower()  # Content lowercase per entry (view)
+        self._contentTokens = snapshot.tokenRows('contentTokens')  # Token content per entry
+        self._contentWordsClean = snapshot.tokenRows('contentWordsClean')  # Kata content clean
+        self._processedTokens = snapshot.tokenRows('processedTokens')  # Token processed
+        self._processedWordsClean = snapshot.tokenRows('processedWordsClean')  # Kata processed clean
+
+    def __len__(self):  # Jumlah entry
+        return len(self.contentLower)  # Jumlah baris
+
+    def __getitem__(self, row):  # EntryFeatures satu baris (slice -> list)
+        if isinstance(row, slice):  # Slice
+            return [self[position] for position in range(*row.indices(len(self)))]  # List fitur
+        features = self._cache.get(row)  # Cek LRU dulu
+        if features is None:  # Belum dirakit
+            features = self._compileRow(row)  # Rakit dari id token
+            self._cache.put(row, features)  # Simpan ke LRU
+        return features  # Return record fitur
+
+    def clearCache(self):  # Kosongkan LRU fitur yang sudah dirakit
+        self._cache.clear()  # Semua baris dirakit ulang dari view
+
+    def _compileRow(self, row):  # Rakit EntryFeatures satu baris dari view
+        contentTokens = self._contentTokens[row]  # Token content
+        processedTokens = self._processedTokens[row]  # Token processed
+        features = EntryFeatures()  # Record fitur baru
+        features.contentLower = self.contentLower[row]  # Content lowercase
+        features.contentTokenSet = frozenset(contentTokens)  # Set token content
+        features.contentWords = tuple(word for word in contentTokens if len(word) > 1)  # Kata content
+        features.contentWordsClean = self._contentWordsClean[row]  # Kata content clean
+        features.processedTokenSet = frozenset(processedTokens)  # Set token processed
+        features.processedWords = tuple(word for word in processedTokens if len(word) > 1)  # Kata processed
+        features.processedWordsClean = self._processedWordsClean[row]  # Kata processed clean
+        return features  # Return record fitur
+
+def cleanToken(word):  # Bersihkan kata jadi alnum lowercase
+    return ''.join(c.lower() for c in word if c.isalnum())  # Sama dengan normalisasi matcher
+
+def compileEntry(entry):  # Hitung fitur token satu entry
+    content = entry['content']  # Konten asli
+    contentLower = content.lower()  # Konten lowercase
+    processedContent = entry.get('processed_content', contentLower)  # Konten bersih
+    if not isinstance(processedContent, str):  # Nilai kosong (NaN)
+        processedContent = ''  # Anggap kosong
+
+    contentTokens = contentLower.split()  # Token content
+    contentWords = tuple(sys.intern(word) for word in contentTokens if len(word) > 1)  # Kata content (di-intern)
+    processedTokens = processedContent.split()  # Token processed
+    processedWords = tuple(sys.intern(word) for word in processedTokens if len(word) > 1)  # Kata processed (di-intern)
+
+    features = EntryFeatures()  # Record fitur baru
+    features.contentLower = contentLower  # Simpan content lowercase
+    features.contentTokenSet = frozenset(contentTokens)  # Set token content
+    features.contentWords = contentWords  # Kata content
+    features.contentWordsClean = tuple(sys.intern(cleanToken(word)) for word in contentWords)  # Kata content clean
+    features.processedTokenSet = frozenset(processedTokens)  # Set token processed
+    features.processedWords = processedWords  # Kata processed
+    features.processedWordsClean = tuple(sys.intern(cleanToken(word)) for word in processedWords)  # Kata processed clean
+    return features  # Return record fitur
+
+def compileEntries(dataEntries, soundexFn=None):  # Compile fitur semua entry + tabel fitur kata
+    from fuzzyIndex import getNgrams, removeRepeatedChars  # Helper n-gram yang sama dengan fuzzy index
+
+    if isinstance(dataEntries, SnapshotEntries):  # Entry dari snapshot
+        entryFeatures = SnapshotEntryFeatures(dataEntries.snapshot)  # Fitur dari id token precomputed (view)
+        cleanWords = dataEntries.snapshot.cleanWords()  # Kata clean unik tanpa decode per entry
+    else:  # Entry dari CSV
+        entryFeatures = [compileEntry(entry) for entry in dataEntries]  # Fitur per entry (urutan sama dengan dataEntries)
+        cleanWords = (word for features in entryFeatures for word in features.contentWordsClean + features.processedWordsClean)  # Semua kata clean
+    tokenTable = {}  # Kata clean -> TokenFeatures
+    for word in cleanWords:  # Loop kata clean
+        if len(word) < 2 or word in tokenTable:  # Terlalu pendek / sudah ada
+            continue  # Skip kata
+        tokenFeatures = TokenFeatures()  # Record fitur kata
+        tokenFeatures.bigrams = frozenset(getNgrams(word.lower(), 2))  # Bigram set
+        tokenFeatures.trigrams = frozenset(getNgrams(word.lower(), 3))  # Trigram set
+        tokenFeatures.soundex = soundexFn(word) if soundexFn else None  # Kode soundex
+        tokenFeatures.norep = removeRepeatedChars(word)  # Bentuk tanpa huruf berulang
+        tokenTable[word] = tokenFeatures  # Simpan ke tabel
+
+    return entryFeatures, tokenTable  # Return fitur entry dan tabel kata
+
 def getSampleData():  # Ambil sample data untuk testing
     data = loadCsvData()  # Load semua data
     return data[:10] if data else []  # Return 10 data pertama atau empty
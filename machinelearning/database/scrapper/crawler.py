@@ -0,0 +1,300 @@
+# Crawler - fetcher bersama (session, retry, batas per host, conditional GET) + extractor pluggable buat scrapper ITB
+"""
+Pengganti tiga script scrapper yang masing-masing melakukan satu requests.get blocking.
+Semua target di-crawl lewat satu Fetcher:
+
+- satu requests.Session dengan connection pool dan retry (429/5xx, backoff, Retry-After)
+- thread pool, dengan batas request bersamaan dan jeda minimal antar request per host
+- robots.txt dihormati (dibaca sekali per host)
+- conditional GET: ETag / Last-Modified disimpan di HttpCache, 304 memakai body cache
+- re-crawl incremental: kalau hash body sama dengan yang terakhir di-extract dan CSV
+  output masih ada, extract + tulis ulang dilewati
+
+Extractor didaftarkan dengan registerExtractor(name) dan menerima (body, url) -> baris.
+Extractor bawaan 'tagRows' menghasilkan skema lama [type, content, links] dari tag h1-h5/p/li.
+
+    python machinelearning/database/scrapper/crawler.py                  # semua target
+    python machinelearning/database/scrapper/crawler.py wikipedia_itb --force
+    python machinelearning/database/scrapper/crawler.py --fixtures DIR   # offline, lewat fixtureServer
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori scrapper
+mlDir = os.path.dirname(os.path.dirname(currentDir)) # direktori machinelearning
+for path in (currentDir, mlDir): # import fixtureServer dan structuredLog
+    if path not in sys.path: # belum ada
+        sys.path.append(path) # tambah ke Python path
+from structuredLog import getLogger # logger terstruktur
+
+logger = getLogger('scraper') # logger stage scraper
+
+DEFAULT_CACHE_DIR = os.path.join(currentDir, '.cache') # validator + body hasil fetch
+USER_AGENT = 'itbchatbot-scraper/1.0' # identitas crawler
+TAG_NAMES = ['h1', 'h2', 'h3', 'h4', 'h5', 'p', 'li'] # tag yang di-extract
+TAG_COLUMNS = ['type', 'content', 'links'] # skema CSV scrapper
+RETRY_STATUSES = (429, 500, 502, 503, 504) # status yang di-retry
+
+EXTRACTORS: Dict[str, Callable[[bytes, str], List[List[str]]]] = {} # nama -> extractor
+
+def registerExtractor(name: str) -> Callable: # decorator pendaftaran extractor
+    def decorator(fn: Callable) -> Callable: # simpan extractor
+        EXTRACTORS[name] = fn # daftar
+        return fn # fungsi asli
+    return decorator # return decorator
+
+@registerExtractor('tagRows')
+def extractTagRows(body: bytes, url: str) -> List[List[str]]: # baris [tag, text, link] (sama dengan script lama)
+    soup = BeautifulSoup(body, 'html.parser') # parse HTML
+    rows = [] # baris hasil
+    for tag in soup.find_all(TAG_NAMES): # loop tag konten
+        links = [a['href'] for a in tag.find_all('a', href=True)] # semua link di dalam tag
+        rows.append([tag.name, tag.get_text(strip=True), ' '.join(links)]) # tipe tag, isi teks, link
+    return rows # return baris
+
+class CrawlTarget: # satu halaman yang di-crawl
+    def __init__(self, name: str, url: str, outputFile: str, extractor: str = 'tagRows', columns: List[str] = TAG_COLUMNS): # konstruktor target
+        self.name = name # nama target
+        self.url = url # URL halaman
+        self.outputFile = outputFile # nama CSV output
+        self.extractor = extractor # nama extractor
+        self.columns = list(columns) # header CSV
+
+    def rebased(self, baseUrl: str) -> 'CrawlTarget': # target yang sama di host lain (mis. fixture server)
+        parts = urlsplit(self.url) # pecah URL asli
+        path = parts.path + ('?' + parts.query if parts.query else '') # path + query asli
+        return CrawlTarget(self.name, baseUrl.rstrip('/') + path, self.outputFile, self.extractor, self.columns) # target baru
+
+TARGETS = { # target bawaan (pengganti tiga script)
+    'tentang_itb': CrawlTarget('tentang_itb', 'https://itb.ac.id/tentang-itb', 'tentang_itb_full.csv'), # halaman tentang ITB
+    'wikipedia_itb': CrawlTarget('wikipedia_itb', 'https://id.wikipedia.org/wiki/Institut_Teknologi_Bandung', 'wikipedia_itb_full.csv'), # artikel wikipedia
+    'multikampus': CrawlTarget('multikampus', 'https://itb.ac.id/multikampus', 'multikampus_full.csv') # halaman multikampus
+}
+
+class HttpCache: # validator (ETag / Last-Modified) + body terakhir per URL di disk
+    def __init__(self, cacheDir: str = DEFAULT_CACHE_DIR): # buka / buat cache
+        self.cacheDir = cacheDir # direktori cache
+        self.indexPath = os.path.join(cacheDir, 'index.json') # metadata per URL
+        self._lock = threading.Lock() # akses dari banyak thread fetch
+        try:
+            with open(self.indexPath, 'r', encoding='utf-8') as indexFile: # baca metadata
+                self.entries: Dict[str, Dict] = json.load(indexFile) # URL -> metadata
+        except (OSError, ValueError): # belum ada / rusak
+            self.entries = {} # cache kosong
+
+    def _bodyPath(self, url: str) -> str: # file body untuk URL
+        return os.path.join(self.cacheDir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.body') # nama dari hash URL
+
+    def get(self, url: str) -> Optional[Dict]: # metadata URL
+        with self._lock: # baca konsisten
+            entry = self.entries.get(url) # metadata
+            return dict(entry) if entry else None # salinan
+
+    def body(self, url: str) -> Optional[bytes]: # body tersimpan
+        try:
+            with open(self._bodyPath(url), 'rb') as bodyFile: # baca body
+                return bodyFile.read() # isi
+        except OSError: # body hilang
+            return None # tanpa body
+
+    def store(self, url: str, body: bytes, etag: Optional[str], lastModified: Optional[str]) -> str: # simpan body + validator, return hash body
+        os.makedirs(self.cacheDir, exist_ok=True) # pastikan direktori ada
+        bodyPath = self._bodyPath(url) # file body
+        tempPath = f"{bodyPath}.tmp{threading.get_ident()}" # tulis atomik
+        with open(tempPath, 'wb') as bodyFile: # tulis body
+            bodyFile.write(body) # isi
+        os.replace(tempPath, bodyPath) # ganti atomik
+        contentHash = hashlib.sha256(body).hexdigest() # hash isi
+        with self._lock: # update metadata
+            entry = self.entries.setdefault(url, {}) # metadata URL
+            entry.update({'etag': etag, 'lastModified': lastModified, 'contentHash': contentHash, 'fetchedAt': time.time()}) # validator baru
+        return contentHash # return hash
+
+    def update(self, url: str, **fields): # ubah field metadata (fetchedAt, extractedHash, ...)
+        with self._lock: # update metadata
+            self.entries.setdefault(url, {}).update(fields) # simpan field
+
+    def save(self): # tulis metadata secara atomik
+        os.makedirs(self.cacheDir, exist_ok=True) # pastikan direktori ada
+        with self._lock: # snapshot konsisten
+            payload = json.dumps(self.entries, indent=1, sort_keys=True) # metadata JSON
+        tempPath = f"{self.indexPath}.tmp{os.getpid()}" # file sementara
+        with open(tempPath, 'w', encoding='utf-8') as indexFile: # tulis JSON
+            indexFile.write(payload) # isi
+        os.replace(tempPath, self.indexPath) # ganti atomik
+
+class Fetcher: # session bersama + batas per host + conditional GET
+    def __init__(self, cache: HttpCache, perHostLimit: int = 2, hostDelay: float = 0.5, timeout: float = 20.0, retries: int = 3, respectRobots: bool = True, userAgent: str = USER_AGENT): # konstruktor fetcher
+        self.cache = cache # cache validator + body
+        self.perHostLimit = max(1, perHostLimit) # request bersamaan per host
+        self.hostDelay = hostDelay # jeda minimal antar request ke host yang sama (detik)
+        self.timeout = timeout # timeout per request
+        self.respectRobots = respectRobots # cek robots.txt
+        self.session = requests.Session() # connection pool bersama
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=RETRY_STATUSES, allowed_methods=frozenset(['GET', 'HEAD']), respect_retry_after_header=True, raise_on_status=False) # retry transient
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=self.perHostLimit * 4, max_retries=retry) # pool koneksi per host
+        self.session.mount('http://', adapter) # adapter http
+        self.session.mount('https://', adapter) # adapter https
+        self.session.headers['User-Agent'] = userAgent # identitas crawler
+        self._lock = threading.Lock() # akses state per host
+        self._hostSlots: Dict[str, threading.Semaphore] = {} # host -> slot request bersamaan
+        self._nextRequestAt: Dict[str, float] = {} # host -> waktu paling awal request berikutnya
+        self._robots: Dict[str, RobotFileParser] = {} # host -> aturan robots.txt
+        self._robotsLock = threading.Lock() # satu pembacaan robots.txt per host
+
+    def _hostSlot(self, host: str) -> threading.Semaphore: # semaphore host
+        with self._lock: # akses eksklusif
+            slot = self._hostSlots.get(host) # slot host
+            if slot is None: # host baru
+                slot = self._hostSlots[host] = threading.Semaphore(self.perHostLimit) # batas per host
+            return slot # return semaphore
+
+    def _waitTurn(self, host: str): # jaga jeda antar request ke host yang sama
+        with self._lock: # pesan giliran
+            now = time.monotonic() # waktu sekarang
+            startAt = max(now, self._nextRequestAt.get(host, 0.0)) # giliran request ini
+            self._nextRequestAt[host] = startAt + self.hostDelay # giliran berikutnya
+        if startAt > now: # belum giliran
+            time.sleep(startAt - now) # tunggu
+
+    def allowed(self, url: str) -> bool: # robots.txt mengizinkan URL ini
+        if not self.respectRobots: # cek dimatikan
+            return True # selalu boleh
+        parts = urlsplit(url) # pecah URL
+        origin = f"{parts.scheme}://{parts.netloc}" # host
+        with self._robotsLock: # robots.txt dibaca sekali per host walau banyak thread
+            robots = self._robots.get(origin) # aturan host
+            if robots is None: # belum dibaca
+                robots = self._robots[origin] = self._readRobots(origin) # baca + cache
+        return robots.can_fetch(self.session.headers['User-Agent'], url) # cek izin
+
+    def _readRobots(self, origin: str) -> RobotFileParser: # ambil + parse robots.txt satu host
+        robots = RobotFileParser() # parser baru
+        try:
+            response = self.session.get(origin + '/robots.txt', timeout=self.timeout) # ambil robots.txt
+            if response.status_code in (401, 403): # akses ditolak
+                robots.disallow_all = True # semua dilarang (sama dengan RobotFileParser.read)
+            elif response.status_code >= 400: # tidak ada robots.txt
+                robots.allow_all = True # semua boleh
+            else: # aturan tersedia
+                robots.parse(response.text.splitlines()) # parse aturan
+        except requests.RequestException as e: # host tidak terjangkau
+            logger.warning("robots.txt %s tidak terbaca: %s", origin, e) # log
+            robots.allow_all = True # jangan blokir karena robots.txt gagal
+        return robots # return aturan
+
+    def fetch(self, url: str) -> Dict: # GET dengan validator cache, return {status, body, contentHash, httpStatus}
+        cached = self.cache.get(url) # metadata terakhir
+        headers = {} # header conditional
+        if cached and self.cache.body(url) is not None: # validator hanya berguna kalau body masih ada
+            if cached.get('etag'): # validator ETag
+                headers['If-None-Match'] = cached['etag'] # header ETag
+            if cached.get('lastModified'): # validator waktu
+                headers['If-Modified-Since'] = cached['lastModified'] # header tanggal
+        host = urlsplit(url).netloc # host target
+        with self._hostSlot(host): # batas request bersamaan per host
+            self._waitTurn(host) # jeda sopan
+            start = time.perf_counter() # mulai timer
+            response = self.session.get(url, headers=headers, timeout=self.timeout) # request
+        logger.info("GET %s -> %d (%.0fms)", url, response.status_code, (time.perf_counter() - start) * 1000.0) # log fetch
+        if response.status_code == 304: # tidak berubah sejak fetch terakhir
+            self.cache.update(url, fetchedAt=time.time()) # catat waktu cek
+            return {'status': 'notModified', 'body': self.cache.body(url), 'contentHash': cached['contentHash'], 'httpStatus': 304} # body dari cache
+        response.raise_for_status() # error HTTP (setelah retry)
+        contentHash = self.cache.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified')) # simpan body + validator
+        return {'status': 'fetched', 'body': response.content, 'contentHash': contentHash, 'httpStatus': response.status_code} # body baru
+
+    def close(self): # tutup connection pool
+        self.session.close() # tutup session
+
+def writeRows(outputPath: str, columns: List[str], rows: List[List[str]]): # tulis CSV scrapper secara atomik
+    tempPath = f"{outputPath}.tmp{os.getpid()}" # file sementara
+    with open(tempPath, mode='w', newline='', encoding='utf-8') as outputFile: # buka file
+        writer = csv.writer(outputFile) # CSV writer
+        writer.writerow(columns) # header
+        writer.writerows(rows) # baris
+    os.replace(tempPath, outputPath) # ganti atomik
+
+def crawlTarget(fetcher: Fetcher, target: CrawlTarget, outputDir: str, force: bool = False) -> Dict: # fetch + extract satu target
+    outputPath = os.path.abspath(os.path.join(outputDir, target.outputFile)) # CSV output
+    result = {'name': target.name, 'url': target.url, 'outputPath': outputPath} # ringkasan
+    if not fetcher.allowed(target.url): # dilarang robots.txt
+        result.update(status='blocked', rows=0) # tidak di-fetch
+        return result # return ringkasan
+    fetched = fetcher.fetch(target.url) # GET (conditional)
+    previous = fetcher.cache.get(target.url) or {} # metadata extract terakhir
+    if not force and previous.get('extractedHash') == fetched['contentHash'] and previous.get('outputPath') == outputPath and os.path.exists(outputPath): # isi sama, CSV masih ada
+        result.update(status='unchanged', rows=previous.get('rows', 0), fetch=fetched['status']) # tidak perlu extract ulang
+        return result # return ringkasan
+    rows = EXTRACTORS[target.extractor](fetched['body'], target.url) # extract baris
+    writeRows(outputPath, target.columns, rows) # tulis CSV
+    fetcher.cache.update(target.url, extractedHash=fetched['contentHash'], outputPath=outputPath, rows=len(rows)) # catat hasil extract
+    result.update(status='written', rows=len(rows), fetch=fetched['status']) # ringkasan
+    return result # return ringkasan
+
+def crawl(targets: List[CrawlTarget], outputDir: str = '.', cacheDir: str = DEFAULT_CACHE_DIR, workers: int = 4, force: bool = False, **fetcherOptions) -> List[Dict]: # crawl banyak target paralel
+    """Return ringkasan per target (urut input): status written / unchanged / blocked / error"""
+    cache = HttpCache(cacheDir) # cache validator + body
+    fetcher = Fetcher(cache, **fetcherOptions) # fetcher bersama
+    os.makedirs(outputDir, exist_ok=True) # pastikan direktori output ada
+    def runOne(target: CrawlTarget) -> Dict: # satu target, error tidak menggagalkan target lain
+        try:
+            return crawlTarget(fetcher, target, outputDir, force) # crawl target
+        except Exception as e: # network / HTTP / extractor error
+            logger.error("Crawl %s gagal: %s", target.url, e) # log error
+            return {'name': target.name, 'url': target.url, 'status': 'error', 'rows': 0, 'error': str(e)} # ringkasan error
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool: # fetch paralel
+            return list(pool.map(runOne, targets)) # hasil urut input
+    finally:
+        cache.save() # simpan validator
+        fetcher.close() # tutup session
+
+def printResults(results: List[Dict]): # laporan per target ke stdout
+    for result in results: # loop hasil
+        if result['status'] == 'error': # gagal
+            print(f"❌ {result['name']}: {result['error']}") # laporan error
+        else: # berhasil / dilewati
+            print(f"✅ {result['name']}: {result['rows']} baris ({result['status']}) -> '{result.get('outputPath', '')}'") # laporan
+
+def runTargets(names: List[str], outputDir: str = '.', **crawlOptions) -> List[Dict]: # crawl target bawaan + laporan ke stdout
+    results = crawl([TARGETS[name] for name in names], outputDir, **crawlOptions) # crawl
+    printResults(results) # laporan
+    return results # return ringkasan
+
+if __name__ == '__main__': # jalankan langsung
+    parser = argparse.ArgumentParser(description='Crawl halaman ITB ke CSV [type, content, links]') # argumen CLI
+    parser.add_argument('targets', nargs='*', default=list(TARGETS), help=f"target ({', '.join(TARGETS)})") # target
+    parser.add_argument('--output-dir', default='.', help='direktori CSV output') # output
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='direktori cache ETag/Last-Modified + body') # cache
+    parser.add_argument('--workers', type=int, default=4, help='thread fetch') # thread
+    parser.add_argument('--per-host', type=int, default=2, help='request bersamaan maksimal per host') # batas host
+    parser.add_argument('--delay', type=float, default=0.5, help='jeda minimal antar request ke host yang sama (detik)') # jeda
+    parser.add_argument('--force', action='store_true', help='extract + tulis ulang walau isi tidak berubah') # paksa
+    parser.add_argument('--fixtures', default='', help='crawl offline dari direktori fixture lewat fixtureServer lokal') # offline
+    parser.add_argument('--fixtures-port', type=int, default=8765, help='port fixtureServer (tetap, supaya URL cache sama antar run)') # port offline
+    args = parser.parse_args() # parse argumen
+
+    options = {'cacheDir': args.cache_dir, 'workers': args.workers, 'force': args.force, 'perHostLimit': args.per_host, 'hostDelay': args.delay} # opsi crawl
+    if args.fixtures: # mode offline
+        from fixtureServer import serveFixtures # HTTP stand-in lokal
+        with serveFixtures(args.fixtures, port=args.fixtures_port) as server: # jalankan server fixture
+            targets = [TARGETS[name].rebased(server.baseUrl) for name in args.targets] # path sama, host lokal
+            printResults(crawl(targets, args.output_dir, **options)) # crawl lokal + laporan
+    else: # crawl online
+        runTargets(args.targets, args.output_dir, **options) # crawl target asli
@@ -0,0 +1,79 @@
+# Fixture Server - HTTP stand-in lokal buat menjalankan crawler tanpa internet
+"""
+Menyajikan file di satu direktori lewat http.server, lengkap dengan ETag dan
+Last-Modified, serta 304 untuk If-None-Match / If-Modified-Since, jadi alur conditional
+GET dan re-crawl incremental bisa dicoba offline:
+
+    with serveFixtures('fixtures/') as server:
+        crawl([target.rebased(server.baseUrl) for target in TARGETS.values()], outputDir)
+
+fixtures/ berisi halaman contoh dengan path yang sama dengan URL target (tentang-itb,
+multikampus, wiki/Institut_Teknologi_Bandung); tests/test_crawler.py memakainya.
+
+Setiap request dicatat di server.requestLog (path, status) supaya jumlah fetch dan
+hasil conditional GET bisa diperiksa.
+"""
+import email.utils
+import hashlib
+import io
+import os
+import threading
+from contextlib import contextmanager
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler): # handler file statis + validator cache
+    def send_head(self): # header response (dipakai GET dan HEAD)
+        path = self.translate_path(self.path) # path file di direktori fixture
+        if not os.path.isfile(path): # bukan file fixture
+            self.server.requestLog.append((self.path, 404)) # catat request
+            self.send_error(404, 'Fixture tidak ada') # 404
+            return None # tanpa body
+        with open(path, 'rb') as fixtureFile: # baca fixture
+            body = fixtureFile.read() # isi file
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"' # validator isi
+        modified = int(os.path.getmtime(path)) # waktu ubah (detik, sesuai presisi header)
+        if self._notModified(etag, modified): # validator client masih cocok
+            self.server.requestLog.append((self.path, 304)) # catat request
+            self.send_response(304) # tidak berubah
+            self.send_header('ETag', etag) # validator sama
+            self.end_headers() # selesai header
+            return None # tanpa body
+        self.server.requestLog.append((self.path, 200)) # catat request
+        self.send_response(200) # isi lengkap
+        self.send_header('Content-Type', self.guess_type(path)) # tipe isi
+        self.send_header('Content-Length', str(len(body))) # panjang isi
+        self.send_header('ETag', etag) # validator isi
+        self.send_header('Last-Modified', email.utils.formatdate(modified, usegmt=True)) # validator waktu
+        self.end_headers() # selesai header
+        return io.BytesIO(body) # body dikirim copyfile
+
+    def _notModified(self, etag: str, modified: int) -> bool: # cek If-None-Match / If-Modified-Since
+        ifNoneMatch = self.headers.get('If-None-Match') # validator ETag client
+        if ifNoneMatch is not None: # ETag diutamakan
+            return etag in [tag.strip() for tag in ifNoneMatch.split(',')] or ifNoneMatch.strip() == '*' # ETag cocok
+        ifModifiedSince = self.headers.get('If-Modified-Since') # validator waktu client
+        if ifModifiedSince: # ada tanggal
+            try:
+                return modified <= email.utils.parsedate_to_datetime(ifModifiedSince).timestamp() # belum berubah sejak tanggal itu
+            except (TypeError, ValueError): # tanggal tidak valid
+                return False # kirim isi lengkap
+        return False # tanpa validator
+
+    def log_message(self, format, *args): # matikan log per request ke stderr
+        pass # diam
+
+@contextmanager
+def serveFixtures(directory: str, host: str = '127.0.0.1', port: int = 0) -> Iterator[ThreadingHTTPServer]: # jalankan server di thread, yield server (baseUrl, requestLog)
+    handler = lambda *args, **kwargs: FixtureRequestHandler(*args, directory=directory, **kwargs) # handler dengan direktori fixture
+    server = ThreadingHTTPServer((host, port), handler) # port 0 = port bebas
+    server.requestLog = [] # (path, status) per request
+    server.baseUrl = f"http://{host}:{server.server_address[1]}" # base URL (port yang didapat)
+    thread = threading.Thread(target=server.serve_forever, daemon=True) # thread server
+    thread.start() # mulai melayani
+    try:
+        yield server # server yang sedang jalan
+    finally:
+        server.shutdown() # stop loop
+        server.server_close() # tutup socket
+        thread.join() # tunggu thread selesai
@@ -0,0 +1,247 @@
+# Fuzzy Vocabulary Index - BK-tree + n-gram postings buat ekspansi typo query word
+"""
+Index fuzzy di level vocabulary corpus. Kalau NumPy tersedia, kandidat difilter sekaligus
+lewat batchSimilarity.batchFuzzyCandidates. Tanpa NumPy, kandidat diambil dari:
+  - BK-tree (kata dalam radius edit distance, komponen Levenshtein bisa > 0)
+  - postings bigram/trigram (kata yang berbagi n-gram)
+  - postings bentuk tanpa huruf berulang (pattern typo, skor 0.95)
+Kandidat di luar radius BK-tree dipangkas dengan upper bound skor advancedFuzzySimilarity.
+Kata yang tidak masuk kandidat sama sekali punya skor <= 0.425, jadi hasil identik dengan
+scan vocabulary penuh selama threshold >= MIN_EXACT_THRESHOLD.
+"""
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from lruCache import LruCache
+from pipelineMetrics import countFuzzyComparisons
+
+MIN_EXACT_THRESHOLD = 0.43 # di bawah ini pruning tidak dijamin exact, pakai scan penuh
+BOUND_EPSILON = 1e-9 # toleransi pembulatan float saat membandingkan upper bound
+
+def getNgrams(string: str, n: int) -> set: # set n-gram karakter (sama dengan nGramSimilarity)
+    return set(string[i:i+n] for i in range(len(string) - n + 1)) # set n-grams
+
+def removeRepeatedChars(string: str) -> str: # hapus huruf berulang berturut (sama dengan patternTypoRecognition)
+    result = [] # list karakter hasil
+    prevChar = "" # karakter sebelumnya
+    for char in string: # loop karakter
+        if char != prevChar: # beda dari sebelumnya
+            result.append(char) # simpan karakter
+            prevChar = char # update previous
+    return ''.join(result) # gabung jadi string
+
+def _ngramJaccard(countA: int, countB: int, shared: int) -> float: # jaccard dari ukuran set dan irisan
+    if countA == 0 and countB == 0: # kedua kosong
+        return 1.0 # perfect match (sesuai nGramSimilarity)
+    if countA == 0 or countB == 0: # salah satu kosong
+        return 0.0 # no match
+    return shared / (countA + countB - shared) # |A & B| / |A | B|
+
+def boundedLevenshtein(s1: str, s2: str, maxDistance: int) -> int: # Levenshtein dengan batas atas
+    """Edit distance exact kalau <= maxDistance, selain itu maxDistance + 1"""
+    if abs(len(s1) - len(s2)) > maxDistance: # selisih panjang sudah melebihi batas
+        return maxDistance + 1 # pasti di luar batas
+    if len(s1) < len(s2): # pastikan s1 lebih panjang
+        s1, s2 = s2, s1 # tukar posisi
+    if not s2: # s2 kosong
+        return len(s1) # jarak = panjang s1
+    previousRow = list(range(len(s2) + 1)) # row pertama
+    for i, c1 in enumerate(s1): # loop karakter s1
+        currentRow = [i + 1] # row saat ini
+        rowMin = i + 1 # nilai minimum di row ini
+        for j, c2 in enumerate(s2): # loop karakter s2
+            cost = min(previousRow[j + 1] + 1, currentRow[j] + 1, previousRow[j] + (c1 != c2)) # insert/delete/substitute
+            currentRow.append(cost) # simpan cost
+            if cost < rowMin: # update minimum row
+                rowMin = cost # minimum baru
+        if rowMin > maxDistance: # semua jalur sudah melebihi batas
+            return maxDistance + 1 # early exit
+        previousRow = currentRow # update previous row
+    return min(previousRow[-1], maxDistance + 1) # jarak (dibatasi)
+
+class BKTree: # Burkhard-Keller tree buat pencarian radius edit distance
+    """BK-tree di atas metric edit distance"""
+    def __init__(self, distanceFn: Callable[[str, str], int]): # konstruktor tree
+        self.distanceFn = distanceFn # fungsi jarak exact (dipakai saat build)
+        self.root = None # node akar: (word, wordId, children)
+
+    def add(self, word: str, wordId: int): # tambah kata ke tree
+        if self.root is None: # tree kosong
+            self.root = (word, wordId, {}) # jadikan akar
+            return # selesai
+        node = self.root # mulai dari akar
+        while True: # turun sampai ketemu slot kosong
+            distance = self.distanceFn(word, node[0]) # jarak ke node
+            child = node[2].get(distance) # anak dengan jarak yang sama
+            if child is None: # slot kosong
+                node[2][distance] = (word, wordId, {}) # pasang node baru
+                return # selesai
+            node = child # lanjut ke anak
+
+    def search(self, word: str, radius: int) -> Dict[int, int]: # cari kata dalam radius
+        """Return {wordId: distance} untuk semua kata dengan jarak <= radius"""
+        results = {} # hasil pencarian
+        if self.root is None: # tree kosong
+            return results # return kosong
+        stack = [self.root] # node yang akan dikunjungi
+        while stack: # DFS
+            nodeWord, nodeId, children = stack.pop() # ambil node
+            # jarak > (key anak terjauh + radius) tidak mengubah hasil, jadi hitung dengan batas saja
+            cap = radius + (max(children) if children else 0) # batas jarak yang masih relevan
+            distance = boundedLevenshtein(word, nodeWord, cap) # jarak ke node (dibatasi)
+            if distance <= radius: # dalam radius
+                results[nodeId] = distance # simpan hasil
+            if distance > cap: # tidak ada anak yang relevan
+                continue # lanjut node lain
+            low, high = distance - radius, distance + radius # rentang jarak anak yang relevan (triangle inequality)
+            for childDistance, child in children.items(): # loop anak
+                if low <= childDistance <= high: # anak mungkin berisi kata dalam radius
+                    stack.append(child) # kunjungi anak
+        return results # return hasil
+
+class FuzzyVocabularyIndex: # index fuzzy di atas vocabulary corpus
+    def __init__(self, vocabulary: List[str], similarityFn: Callable[[str, str], float], distanceFn: Callable[[str, str], int], soundexFn: Callable[[str], str], maxDistance: int = 4, cacheSize: int = 4096, tokenFeatures: Optional[Dict] = None, useVectorized: bool = True): # build index
+        self.words = list(vocabulary) # kata vocabulary (sudah clean, len >= 2)
+        self.similarityFn = similarityFn # advancedFuzzySimilarity (boleh versi memo)
+        self.soundexFn = soundexFn # fungsi soundex
+        self.maxDistance = maxDistance # radius maksimal adaptive distance
+        self.expansionCache = LruCache(cacheSize) # cache hasil ekspansi per query word
+
+        self.lengths = [] # panjang kata
+        self.bigramCounts = [] # jumlah bigram unik
+        self.trigramCounts = [] # jumlah trigram unik
+        self.soundexCodes = [] # kode soundex
+        self.norepLengths = [] # panjang bentuk tanpa huruf berulang
+        self.bigramPostings: Dict[str, List[int]] = {} # bigram -> word ids
+        self.trigramPostings: Dict[str, List[int]] = {} # trigram -> word ids
+        self.norepPostings: Dict[str, List[int]] = {} # bentuk tanpa huruf berulang -> word ids
+        self.bkTree = BKTree(distanceFn) # BK-tree edit distance (fallback kalau NumPy tidak tersedia)
+        self.vocabularyMatrix = None # VocabularyMatrix buat filter kandidat vectorized
+        norepForms = [] # bentuk norep tiap kata
+
+        tokenFeatures = tokenFeatures or {} # fitur kata precomputed dari dataLoader.compileEntries
+        for wordId, word in enumerate(self.words): # loop vocabulary
+            features = tokenFeatures.get(word) # fitur precomputed kalau ada
+            if features is not None and features.soundex is not None: # pakai fitur precomputed
+                bigrams, trigrams, norep, soundexCode = features.bigrams, features.trigrams, features.norep, features.soundex # fitur kata
+            else: # hitung fitur
+                lowered = word.lower() # sama dengan normalisasi nGramSimilarity
+                bigrams = getNgrams(lowered, 2) # bigram kata
+                trigrams = getNgrams(lowered, 3) # trigram kata
+                norep = removeRepeatedChars(word) # bentuk tanpa huruf berulang
+                soundexCode = soundexFn(word) # kode soundex
+            self.lengths.append(len(word)) # simpan panjang
+            self.bigramCounts.append(len(bigrams)) # simpan jumlah bigram
+            self.trigramCounts.append(len(trigrams)) # simpan jumlah trigram
+            self.soundexCodes.append(soundexCode) # simpan soundex
+            self.norepLengths.append(len(norep)) # simpan panjang norep
+            for gram in bigrams: # index bigram
+                self.bigramPostings.setdefault(gram, []).append(wordId) # tambah postings
+            for gram in trigrams: # index trigram
+                self.trigramPostings.setdefault(gram, []).append(wordId) # tambah postings
+            self.norepPostings.setdefault(norep, []).append(wordId) # index norep
+            norepForms.append(norep) # simpan norep
+
+        if useVectorized: # coba filter kandidat dengan NumPy
+            try:
+                from batchSimilarity import VocabularyMatrix # import lazy (butuh numpy + scipy)
+                self.vocabularyMatrix = VocabularyMatrix(self.words, self.soundexCodes, norepForms) # build matrix vocabulary
+            except ImportError: # NumPy/SciPy tidak tersedia
+                self.vocabularyMatrix = None # pakai BK-tree
+        if self.vocabularyMatrix is None: # jalur BK-tree
+            for wordId, word in enumerate(self.words): # loop vocabulary
+                self.bkTree.add(word, wordId) # tambah ke BK-tree
+
+    def _upperBound(self, queryLength: int, queryBigrams: int, queryTrigrams: int, querySoundex: str, queryNorepLength: int, wordId: int, sharedBigrams: int, sharedTrigrams: int) -> float: # upper bound advancedFuzzySimilarity
+        """Batas atas skor untuk kata di luar radius edit distance (skor Levenshtein = 0).
+        Bobot mengikuti advancedFuzzySimilarity di matching.py."""
+        wordLength = self.lengths[wordId] # panjang kata
+        totalLength = queryLength + wordLength # total panjang
+        lengthDiff = abs(queryLength - wordLength) # selisih panjang
+        bigramScore = _ngramJaccard(queryBigrams, self.bigramCounts[wordId], sharedBigrams) # bigram exact
+        trigramScore = _ngramJaccard(queryTrigrams, self.trigramCounts[wordId], sharedTrigrams) # trigram exact
+        charFreqBound = max(0.0, 1.0 - lengthDiff / totalLength) # selisih frekuensi >= selisih panjang
+        phoneticScore = 0.8 if querySoundex == self.soundexCodes[wordId] else 0.0 # phonetic exact
+        sequenceBound = 2.0 * min(queryLength, wordLength) / totalLength # ratio <= 2*min/total
+        norepLength = self.norepLengths[wordId] # panjang norep kata
+        patternBound = min(queryNorepLength, norepLength) / max(queryNorepLength, norepLength) * 0.9 # containment terbaik
+        bound = (bigramScore * 0.20 + trigramScore * 0.15 + charFreqBound * 0.15 + phoneticScore * 0.10 + sequenceBound * 0.10 + patternBound * 0.05) # gabung komponen
+        if lengthDiff <= 2: # bonus panjang mirip
+            bound += 0.05 # length bonus
+        return bound # return batas atas
+
+    def _scanAll(self, queryClean: str, threshold: float) -> Dict[str, float]: # scan vocabulary penuh
+        results = {} # hasil ekspansi
+        for word in self.words: # loop vocabulary
+            similarity = self.similarityFn(queryClean, word) # hitung similarity
+            if similarity >= threshold: # cukup mirip
+                results[word] = similarity # simpan skor
+        countFuzzyComparisons(len(self.words)) # metric comparison
+        return results # return hasil
+
+    def findSimilar(self, queryClean: str, threshold: float = 0.5) -> Dict[str, float]: # ekspansi fuzzy satu query word
+        """Return {kata vocabulary: similarity} untuk semua kata dengan similarity >= threshold"""
+        cacheKey = (queryClean, threshold) # key cache
+        cached = self.expansionCache.get(cacheKey) # cek cache
+        if cached is not None: # cache hit
+            return cached # return hasil cache
+
+        if threshold < MIN_EXACT_THRESHOLD or not queryClean: # pruning tidak aman
+            results = self._scanAll(queryClean, threshold) # scan penuh
+            self.expansionCache.put(cacheKey, results) # simpan cache
+            return results # return hasil
+
+        if self.vocabularyMatrix is not None: # filter kandidat vectorized
+            results = self._findSimilarVectorized(queryClean, threshold) # satu batch NumPy
+            self.expansionCache.put(cacheKey, results) # simpan cache
+            return results # return hasil
+
+        lowered = queryClean.lower() # normalisasi n-gram
+        queryBigrams = getNgrams(lowered, 2) # bigram query
+        queryTrigrams = getNgrams(lowered, 3) # trigram query
+        queryNorep = removeRepeatedChars(queryClean) # norep query
+        querySoundex = self.soundexFn(queryClean) # soundex query
+
+        sharedBigrams = Counter() # word id -> jumlah bigram sama
+        for gram in queryBigrams: # loop bigram query
+            sharedBigrams.update(self.bigramPostings.get(gram, ())) # hitung irisan
+        sharedTrigrams = Counter() # word id -> jumlah trigram sama
+        for gram in queryTrigrams: # loop trigram query
+            sharedTrigrams.update(self.trigramPostings.get(gram, ())) # hitung irisan
+
+        exactIds = set(self.bkTree.search(queryClean, self.maxDistance)) # kata dalam radius edit distance
+        exactIds.update(self.norepPostings.get(queryNorep, ())) # kata dengan pattern typo sama
+        candidateIds = exactIds | set(sharedBigrams) | set(sharedTrigrams) # semua kandidat
+
+        results = {} # hasil ekspansi
+        comparisons = 0 # similarity penuh yang dihitung
+        for wordId in candidateIds: # loop kandidat
+            if wordId not in exactIds: # di luar radius: cek upper bound dulu
+                bound = self._upperBound(len(queryClean), len(queryBigrams), len(queryTrigrams), querySoundex, len(queryNorep), wordId, sharedBigrams[wordId], sharedTrigrams[wordId]) # batas atas skor
+                if bound < threshold - BOUND_EPSILON: # tidak mungkin lolos threshold
+                    continue # skip similarity penuh
+            word = self.words[wordId] # kata vocabulary
+            similarity = self.similarityFn(queryClean, word) # hitung similarity penuh
+            comparisons += 1 # hitung comparison
+            if similarity >= threshold: # cukup mirip
+                results[word] = similarity # simpan skor
+        countFuzzyComparisons(comparisons) # metric comparison
+
+        self.expansionCache.put(cacheKey, results) # simpan cache
+        return results # return hasil
+
+    def _findSimilarVectorized(self, queryClean: str, threshold: float) -> Dict[str, float]: # ekspansi via VocabularyMatrix
+        from batchSimilarity import batchFuzzyCandidates # import lazy
+
+        queryNorep = removeRepeatedChars(queryClean) # norep query
+        candidateIds = set(batchFuzzyCandidates(queryClean, self.vocabularyMatrix, self.soundexFn(queryClean), queryNorep, threshold, self.maxDistance).tolist()) # kandidat batas atas
+        candidateIds.update(self.norepPostings.get(queryNorep, ())) # pattern typo selalu skor 0.95
+
+        results = {} # hasil ekspansi
+        for wordId in sorted(candidateIds): # loop kandidat
+            word = self.words[wordId] # kata vocabulary
+            similarity = self.similarityFn(queryClean, word) # similarity penuh (memo)
+            if similarity >= threshold: # cukup mirip
+                results[word] = similarity # simpan skor
+        countFuzzyComparisons(len(candidateIds)) # metric comparison
+        return results # return hasil
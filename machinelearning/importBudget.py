@@ -0,0 +1,81 @@
+# Import Budget - cek waktu import modul ML dengan python -X importtime (cold start worker)
+"""
+Import matching, nlpIntentDetector dan preprocessing di subprocess baru dengan
+-X importtime, lalu cek tiga hal: total waktu import di bawah budget, modul berat
+(pandas, sklearn, nltk, scipy) tidak ikut ter-import, dan tidak ada koneksi network
+selama import. Exit code 1 kalau ada yang dilanggar, jadi bisa dipasang di CI:
+
+    python machinelearning/importBudget.py --budget-ms 300
+
+Pengecekan yang sama dijalankan pytest lewat tests/test_importBudget.py.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori machinelearning
+
+IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', '300')) # budget total import (ms)
+BUDGET_MODULES = ['matching', 'nlpIntentDetector', 'preprocessing'] # modul yang di-import pipeline
+HEAVY_MODULES = ['pandas', 'sklearn', 'nltk', 'scipy'] # modul yang hanya boleh di-import lazy
+
+CHILD_SCRIPT = """
+import json, socket, sys
+def refuseNetwork(*args, **kwargs): # connect saat import = pelanggaran budget
+    raise RuntimeError('network access during import')
+socket.socket.connect = refuseNetwork
+socket.create_connection = refuseNetwork
+for name in {modules!r}:
+    __import__(name)
+sys.stdout.write(json.dumps(sorted(name for name in {heavy!r} if name in sys.modules)))
+"""
+
+def parseImportTime(stderr: str) -> List[Tuple[str, int, int]]: # parse output -X importtime
+    """Return [(modul, self us, cumulative us)] untuk import top-level"""
+    rows = [] # hasil parse
+    for line in stderr.splitlines(): # loop baris
+        if not line.startswith('import time:') or 'self [us]' in line: # bukan baris data
+            continue # skip
+        selfTime, cumulative, name = line[len('import time:'):].split('|', 2) # kolom
+        if name.startswith('  '): # import nested (sudah masuk cumulative parent)
+            continue # skip
+        rows.append((name.strip(), int(selfTime), int(cumulative))) # simpan baris
+    return rows # return baris top-level
+
+def measureImports(modules: List[str] = BUDGET_MODULES) -> Dict: # import modul di subprocess baru
+    code = CHILD_SCRIPT.format(modules=modules, heavy=HEAVY_MODULES) # script child
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=currentDir, capture_output=True, text=True) # jalankan import
+    rows = parseImportTime(result.stderr) # waktu import
+    return {
+        'ok': result.returncode == 0, # import berhasil
+        'error': result.stderr.strip().splitlines()[-1] if result.returncode != 0 and result.stderr.strip() else None, # pesan error
+        'totalMs': sum(cumulative for name, _, cumulative in rows if name in modules) / 1000.0, # total waktu import modul pipeline (tanpa startup interpreter)
+        'slowest': sorted(rows, key=lambda row: row[2], reverse=True)[:10], # import top-level paling lambat
+        'heavyLoaded': json.loads(result.stdout) if result.returncode == 0 else [] # modul berat yang ter-import
+    }
+
+def checkBudget(budgetMs: float = IMPORT_BUDGET_MS) -> List[str]: # cek budget, return daftar pelanggaran
+    report = measureImports() # ukur import
+    print(f"Import time: {report['totalMs']:.1f}ms (budget {budgetMs:.0f}ms)") # log total
+    for name, _, cumulative in report['slowest']: # import paling lambat
+        print(f"  {cumulative / 1000.0:8.1f}ms  {name}") # log per modul
+    violations = [] # pelanggaran
+    if not report['ok']: # import gagal (termasuk akses network)
+        violations.append(f"import failed: {report['error']}") # catat error
+    if report['totalMs'] > budgetMs: # lewat budget
+        violations.append(f"import time {report['totalMs']:.1f}ms > {budgetMs:.0f}ms") # catat waktu
+    if report['heavyLoaded']: # modul berat ter-import eager
+        violations.append(f"heavy modules imported eagerly: {', '.join(report['heavyLoaded'])}") # catat modul
+    return violations # return pelanggaran
+
+if __name__ == '__main__': # jalankan langsung
+    parser = argparse.ArgumentParser(description='Cek budget waktu import modul ML') # argumen CLI
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS, help='budget total import (ms)') # budget
+    args = parser.parse_args() # parse argumen
+    violations = checkBudget(args.budget_ms) # cek budget
+    for violation in violations: # log pelanggaran
+        print(f"FAIL: {violation}") # log
+    sys.exit(1 if violations else 0) # exit code buat CI
@@ -0,0 +1,128 @@
+# Inverted Index - token -> postings buat retrieval kandidat di matchWithCsvData
+"""
+Index dibangun sekali dari entry dataLoader. Saat query, hanya dokumen yang
+berbagi token (atau ekspansi fuzzy dari token query) yang di-scoring ulang,
+sehingga skor dan urutan top-K sama dengan scan linear.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from pipelineMetrics import countFuzzyComparisons
+
+def cleanWord(word: str) -> str: # bersihkan kata jadi alnum lowercase
+    """Normalisasi kata sama seperti findFuzzyMatches/enhancedWordMatching"""
+    return ''.join(c.lower() for c in word if c.isalnum()) # hanya alnum lowercase
+
+def _addPosting(postings: Dict[str, Dict[int, int]], token: str, docId: int): # tambah token ke postings
+    docs = postings.get(token) # postings token ini
+    if docs is None: # token baru
+        docs = postings[token] = {} # buat postings baru
+    docs[docId] = docs.get(docId, 0) + 1 # tambah term frequency
+
+class FuzzyLookup: # hasil ekspansi fuzzy query word -> kata vocabulary
+    """Skor fuzzy (>= threshold) antara query word dan kata vocabulary untuk satu query (atau gabungan satu batch)"""
+    def __init__(self, threshold: float): # konstruktor lookup
+        self.threshold = threshold # threshold fuzzy yang dipakai
+        self.expansions: Dict[str, Dict[str, float]] = {} # clean query -> {clean word: similarity}
+
+    def getExpansions(self, queryClean: str) -> Dict[str, float]: # ambil ekspansi query word
+        return self.expansions.get(queryClean, {}) # dict kosong kalau tidak ada
+
+    def similarity(self, queryClean: str, wordClean: str) -> float: # pengganti advancedFuzzySimilarity
+        """Similarity dari hasil ekspansi; pasangan di bawah threshold dianggap 0.0"""
+        return self.expansions.get(queryClean, {}).get(wordClean, 0.0) # lookup skor
+
+class InvertedIndex: # inverted index buat data entries
+    def __init__(self, entryFeatures: List): # build index dari EntryFeatures (dataLoader.compileEntries)
+        self.size = len(entryFeatures) # jumlah dokumen
+        self.contentLower: Sequence[str] = getattr(entryFeatures, 'contentLower', None) # content lowercase per dokumen (view snapshot kalau ada)
+        ownContent = self.contentLower is None # fitur berupa list biasa
+        if ownContent: # kumpulkan content lowercase sendiri
+            self.contentLower = [] # buat substring check
+        self.rawPostings: Dict[str, Dict[int, int]] = {} # token content.lower().split() -> postings
+        self.wordPostings: Dict[str, Dict[int, int]] = {} # clean content word (len > 1) -> postings
+        self.processedRawPostings: Dict[str, Dict[int, int]] = {} # token processed_content.split() -> postings
+        self.processedWordPostings: Dict[str, Dict[int, int]] = {} # clean processed word (len > 1) -> postings
+
+        for docId, features in enumerate(entryFeatures): # loop setiap dokumen
+            if ownContent: # list biasa
+                self.contentLower.append(features.contentLower) # simpan buat substring check (shared string)
+
+            for token in features.contentLower.split(): # token content (tf dihitung sekali saat build)
+                _addPosting(self.rawPostings, token, docId) # postings overlap
+            for word in features.contentWordsClean: # kata content clean
+                _addPosting(self.wordPostings, word, docId) # postings word matching
+            for token in features.processedTokenSet: # token processed
+                self.processedRawPostings.setdefault(token, {})[docId] = 1 # postings jaccard (set)
+            for word in features.processedWordsClean: # kata processed clean
+                _addPosting(self.processedWordPostings, word, docId) # postings processed fallback
+
+        vocabulary = set(self.wordPostings) | set(self.processedWordPostings) # semua clean word
+        self.fuzzyVocabulary = sorted(word for word in vocabulary if len(word) >= 2) # kata yang ikut fuzzy matching
+        self.fuzzyIndex = None # FuzzyVocabularyIndex opsional (dipasang oleh matching)
+
+    def buildFuzzyLookup(self, queryWords: Iterable[str], similarityFn: Callable[[str, str], float], threshold: float = 0.5) -> FuzzyLookup: # ekspansi fuzzy query words
+        """Bandingkan setiap query word dengan vocabulary sekali saja (bukan per dokumen)"""
+        lookup = FuzzyLookup(threshold) # lookup baru
+        for queryWord in queryWords: # loop query words
+            queryClean = cleanWord(queryWord) # clean query word
+            if len(queryClean) < 2 or queryClean in lookup.expansions: # terlalu pendek / sudah diekspansi
+                continue # skip
+            if self.fuzzyIndex is not None: # pakai index fuzzy vocabulary
+                lookup.expansions[queryClean] = self.fuzzyIndex.findSimilar(queryClean, threshold) # satu probe index
+                continue # lanjut query word berikutnya
+            expansions = {} # kata vocabulary yang mirip
+            for word in self.fuzzyVocabulary: # scan vocabulary
+                similarity = similarityFn(queryClean, word) # hitung similarity
+                if similarity >= threshold: # cukup mirip
+                    expansions[word] = similarity # simpan skor
+            countFuzzyComparisons(len(self.fuzzyVocabulary)) # metric comparison
+            lookup.expansions[queryClean] = expansions # simpan ekspansi
+        return lookup # return lookup
+
+    def _addWordCandidates(self, queryWords: Iterable[str], postings: Dict[str, Dict[int, int]], fuzzyLookup: FuzzyLookup, candidateIds: Set[int]): # kandidat dari word matching
+        for queryWord in queryWords: # loop query words
+            queryClean = cleanWord(queryWord) # clean query word
+            candidateIds.update(postings.get(queryClean, ())) # exact match
+            for word in fuzzyLookup.getExpansions(queryClean): # ekspansi fuzzy
+                candidateIds.update(postings.get(word, ())) # fuzzy match
+
+    def getCandidates(self, userQueryLower: str, originalQueryWords: List[str], processedQuery: str, processedQueryWords: List[str], fuzzyLookup: FuzzyLookup, docRange: Optional[range] = None) -> List[int]: # ambil dokumen kandidat
+        """Dokumen yang mungkin punya skor > 0, urut sesuai posisi entry (hanya docRange kalau diisi)"""
+        return self.getCandidatesBatch([(userQueryLower, originalQueryWords, processedQuery, processedQueryWords)], fuzzyLookup, docRange)[0] # batch satu query
+
+    def getCandidatesBatch(self, queries: List[Tuple[str, List[str], str, List[str]]], fuzzyLookup: FuzzyLookup, docRange: Optional[range] = None) -> List[List[int]]: # kandidat banyak query
+        """getCandidates untuk setiap (userQueryLower, originalQueryWords, processedQuery, processedQueryWords);
+        substring semua query dicek dalam satu pass atas content. fuzzyLookup harus berisi ekspansi kata semua query.
+        docRange membatasi kandidat ke satu shard docId (worker scoring paralel)"""
+        candidateSets: List[Set[int]] = [set() for _ in queries] # set kandidat per query
+
+        # 1. Substring match (dicek di level C lewat operator in), satu pass corpus untuk semua query
+        findContaining = getattr(self.contentLower, 'containing', None) # view snapshot: cari langsung di blob mmap
+        if findContaining is not None: # tanpa decode content per dokumen
+            for position, query in enumerate(queries): # loop query
+                candidateSets[position].update(findContaining(query[0])) # dokumen yang memuat query
+        else: # list content biasa
+            queryLowers = [(position, query[0]) for position, query in enumerate(queries)] # query lowercase
+            for docId in docRange if docRange is not None else range(len(self.contentLower)): # loop content (shard saja kalau ada docRange)
+                contentLower = self.contentLower[docId] # content lowercase dokumen
+                for position, userQueryLower in queryLowers: # loop query
+                    if userQueryLower in contentLower: # query substring content
+                        candidateSets[position].add(docId) # tambah kandidat
+
+        for (userQueryLower, originalQueryWords, processedQuery, processedQueryWords), candidateIds in zip(queries, candidateSets): # loop query
+            # 2. Word overlap
+            for token in set(userQueryLower.split()): # token query
+                candidateIds.update(self.rawPostings.get(token, ())) # dokumen dengan token sama
+
+            # 3. Enhanced word matching (exact + fuzzy) pada kata asli
+            self._addWordCandidates(originalQueryWords, self.wordPostings, fuzzyLookup, candidateIds) # kandidat word matching
+
+            # 4. Jaccard dan processed fallback pada processed text
+            if processedQuery: # jaccard butuh processed query
+                for token in set(processedQuery.split()): # token processed query
+                    candidateIds.update(self.processedRawPostings.get(token, ())) # dokumen dengan token sama
+            self._addWordCandidates(processedQueryWords, self.processedWordPostings, fuzzyLookup, candidateIds) # kandidat processed fallback
+
+        if docRange is not None: # kandidat satu shard
+            return [sorted(docId for docId in candidateIds if docId in docRange) for candidateIds in candidateSets] # urut sesuai posisi entry
+        return [sorted(candidateIds) for candidateIds in candidateSets] # urut sesuai posisi entry
@@ -0,0 +1,111 @@
+# Link Index - index link per kategori buat findRelevantLinks (tanpa DataFrame resident)
+"""
+Pengganti filter isin + iterrows di findRelevantLinks. Saat build, baris yang punya link
+dikelompokkan per kategori, link di-parse sekali dan content di-lowercase sekali.
+Skor baris = jumlah query word (dengan duplikat) yang substring content + quality/100,
+urut skor turun lalu posisi baris (sama dengan sort stabil versi DataFrame):
+
+- postings word -> baris yang content-nya memuat word (substring), dicari sekali per word
+  lewat satu teks gabungan lalu di-cache
+- baris tanpa hit diurutkan per kategori berdasarkan quality sekali saat build
+- top-K = merge (heap) baris ber-hit dengan daftar quality, berhenti setelah K baris
+"""
+import heapq
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from lruCache import LruCache
+
+POSTINGS_CACHE_SIZE = 4096 # jumlah word yang postings-nya disimpan
+ROW_SEPARATOR = '\x00' # pemisah content di teks gabungan (tidak muncul di query word)
+
+def parseLinks(links) -> List[str]: # daftar link http dari kolom links (sama dengan findRelevantLinks)
+    if not isinstance(links, str): # nilai kosong (NaN)
+        return [] # tanpa link
+    linkList = re.split(r'[,\s]+', links) # split link
+    return [link.strip() for link in linkList if link.strip() and link.startswith('http')] # link valid
+
+def hasLinks(links) -> bool: # sama dengan filter links.notna() & (links != '')
+    return links is not None and links == links and links != '' # bukan None/NaN/kosong
+
+class LinkIndex: # index baris berlink per kategori
+    def __init__(self, categories: Sequence, contents: Sequence, links: Optional[Sequence], qualityScores: Optional[Sequence]): # build dari kolom dataset
+        rowCount = len(contents) # jumlah baris dataset
+        links = links if links is not None else [None] * rowCount # kolom links opsional
+        qualityScores = qualityScores if qualityScores is not None else [0] * rowCount # kolom quality opsional
+        self.rowCount = rowCount # jumlah baris dataset
+        self.positions: List[int] = [] # posisi baris asli (urutan DataFrame)
+        self.contents: List[str] = [] # content asli (buat preview)
+        self.categories: List = [] # kategori per baris
+        self.qualities: List[float] = [] # quality / 100
+        self.linkLists: List[List[str]] = [] # link http per baris
+        self.categoryRows: Dict = {} # kategori -> id baris index (urut posisi)
+        for position in range(rowCount): # loop baris dataset
+            if not hasLinks(links[position]): # baris tanpa link tidak pernah dipakai
+                continue # skip
+            rowId = len(self.positions) # id baris di index
+            self.positions.append(position) # posisi asli
+            self.contents.append(str(contents[position])) # content asli
+            self.categories.append(categories[position]) # kategori
+            self.qualities.append(qualityScores[position] / 100.0) # bonus quality (sama dengan versi DataFrame)
+            self.linkLists.append(parseLinks(str(links[position]))) # link di-parse sekali
+            self.categoryRows.setdefault(categories[position], []).append(rowId) # partisi kategori
+
+        lowered = [content.lower() for content in self.contents] # content lowercase
+        self.loweredText = ROW_SEPARATOR.join(lowered) # teks gabungan buat pencarian substring
+        self.rowStarts: List[int] = [] # offset awal tiap baris di teks gabungan
+        offset = 0 # offset berjalan
+        for content in lowered: # loop baris
+            self.rowStarts.append(offset) # awal baris
+            offset += len(content) + 1 # lewati content + separator
+        self.postings = LruCache(POSTINGS_CACHE_SIZE) # word -> frozenset id baris
+        self._targetCache: Dict[Tuple, Tuple[frozenset, List[Tuple[float, int]]]] = {} # kategori target -> (id baris, urutan quality)
+
+    def rowsContaining(self, word: str) -> frozenset: # id baris yang content-nya memuat word (substring)
+        rows = self.postings.get(word) # cek cache
+        if rows is not None: # cache hit
+            return rows # return postings
+        if ROW_SEPARATOR in word: # word bisa melintasi batas baris
+            rows = frozenset(rowId for rowId, content in enumerate(self.contents) if word in content.lower()) # cek per baris
+        else:
+            found = set() # baris yang memuat word
+            text, rowStarts = self.loweredText, self.rowStarts # akses lokal
+            start = text.find(word) # kemunculan pertama
+            while start != -1: # loop kemunculan
+                rowId = bisect_right(rowStarts, start) - 1 # baris pemilik offset
+                found.add(rowId) # catat baris
+                if rowId + 1 < len(rowStarts): # loncat ke baris berikutnya
+                    start = text.find(word, rowStarts[rowId + 1]) # kemunculan di baris berikutnya
+                else:
+                    break # baris terakhir
+            rows = frozenset(found) # postings
+        self.postings.put(word, rows) # simpan cache
+        return rows # return postings
+
+    def _targetRows(self, targetCategories: Iterable) -> Tuple[frozenset, List[Tuple[float, int]]]: # baris kategori target + urutan quality
+        key = tuple(targetCategories) # key cache
+        cached = self._targetCache.get(key) # cek cache
+        if cached is None: # belum dihitung
+            rowIds = sorted({rowId for category in set(key) for rowId in self.categoryRows.get(category, ())}) # gabungan partisi (urut posisi)
+            byQuality = sorted(((-self.qualities[rowId], rowId) for rowId in rowIds)) # skor tanpa hit, urut skor lalu posisi
+            cached = (frozenset(rowIds), byQuality) # simpan
+            self._targetCache[key] = cached # cache per kombinasi kategori
+        return cached # return baris target
+
+    def topRows(self, targetCategories: Iterable, queryWords: List[str], topK: int) -> List[Tuple[int, float]]: # [(id baris, skor)] urut skor turun
+        targetSet, byQuality = self._targetRows(targetCategories) # baris kategori target
+        if not targetSet: # tidak ada baris berlink
+            return [] # hasil kosong
+        hitCounts = Counter() # id baris -> jumlah query word yang cocok
+        for word, multiplicity in Counter(queryWords).items(): # word unik (duplikat dihitung ulang)
+            for rowId in self.rowsContaining(word) & targetSet: # baris target yang memuat word
+                hitCounts[rowId] += multiplicity # tambah hit
+        # skor = hit (bilangan bulat, persis) + quality/100; urut (-skor, posisi) seperti sort stabil
+        scored = sorted((-(float(hits) + self.qualities[rowId]), rowId) for rowId, hits in hitCounts.items()) # baris ber-hit
+        unscored = ((negScore, rowId) for negScore, rowId in byQuality if rowId not in hitCounts) # baris tanpa hit
+        merged = heapq.merge(scored, unscored) # gabung dua daftar terurut
+        if topK > 0: # ambil K teratas saja
+            return [(rowId, -negScore) for negScore, rowId in (next(merged) for _ in range(min(topK, len(targetSet))))] # top-K
+        return [(rowId, -negScore) for negScore, rowId in merged][:topK] # semantik slice [:topK] untuk topK <= 0
@@ -0,0 +1,54 @@
+# LRU Cache - cache thread-safe dengan batas ukuran dan statistik hit/miss
+import threading  # Lock buat akses dari banyak request thread
+from collections import OrderedDict  # Dict yang menyimpan urutan akses
+
+_MISSING = object()  # Sentinel buat key yang tidak ada
+
+class LruCache:  # cache LRU dengan eviction berbasis ukuran
+    """Size-bounded LRU cache yang aman dipakai bersama oleh banyak thread"""
+    def __init__(self, maxSize: int = 1024):  # konstruktor cache
+        self.maxSize = maxSize  # jumlah maksimal item
+        self._data = OrderedDict()  # key -> value, urut dari yang paling lama dipakai
+        self._lock = threading.Lock()  # lock akses data
+        self.hits = 0  # jumlah cache hit
+        self.misses = 0  # jumlah cache miss
+        self.evictions = 0  # jumlah item yang dibuang
+
+    def get(self, key, default=None):  # ambil item dari cache
+        with self._lock:  # akses eksklusif
+            value = self._data.get(key, _MISSING)  # cari item
+            if value is _MISSING:  # tidak ada
+                self.misses += 1  # catat miss
+                return default  # return default
+            self._data.move_to_end(key)  # tandai baru dipakai
+            self.hits += 1  # catat hit
+            return value  # return item
+
+    def put(self, key, value):  # simpan item ke cache
+        if self.maxSize <= 0:  # cache dimatikan
+            return  # tidak simpan apa-apa
+        with self._lock:  # akses eksklusif
+            self._data[key] = value  # simpan item
+            self._data.move_to_end(key)  # tandai baru dipakai
+            while len(self._data) > self.maxSize:  # melebihi kapasitas
+                self._data.popitem(last=False)  # buang item paling lama
+                self.evictions += 1  # catat eviction
+
+    def clear(self):  # kosongkan cache
+        with self._lock:  # akses eksklusif
+            self._data.clear()  # hapus semua item
+
+    def stats(self) -> dict:  # statistik cache
+        with self._lock:  # baca konsisten
+            lookups = self.hits + self.misses  # total lookup
+            return {  # ringkasan statistik
+                'size': len(self._data),  # jumlah item
+                'maxSize': self.maxSize,  # kapasitas
+                'hits': self.hits,  # jumlah hit
+                'misses': self.misses,  # jumlah miss
+                'evictions': self.evictions,  # jumlah eviction
+                'hitRate': self.hits / lookups if lookups else 0.0  # rasio hit
+            }
+
+    def __len__(self):  # jumlah item di cache
+        return len(self._data)  # panjang data
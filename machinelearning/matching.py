@@ -2,15 +2,27 @@
 import os  # OS interface untuk file path
 import sys  # System utilities
 import re  # Regular expression
-from sklearn.feature_extraction.text import TfidfVectorizer  # TF-IDF vectorizer
-from sklearn.metrics.pairwise import cosine_similarity  # Cosine similarity
-import numpy as np  # Numerical operations
+import atexit  # Shutdown process pool saat exit
+import heapq  # Bounded heap top-K dan merge shard
+import threading  # Lock pembuatan process pool + swap corpus
+import time  # Jeda cek versi corpus
+import logging  # Level log (DEBUG guard)
+import multiprocessing  # Start method fork untuk worker scoring
+from concurrent.futures import ProcessPoolExecutor  # Process pool scoring paralel
+from contextlib import contextmanager  # Corpus tetap selama satu request
+from functools import lru_cache, wraps  # Memo similarity kata + decorator corpus request
 from difflib import SequenceMatcher  # Python fuzzy matching
 
 currentDir = os.path.dirname(os.path.abspath(__file__))  # Dapatkan direktori saat ini
 sys.path.append(currentDir)  # Tambah ke Python path
 
-from dataLoader import loadCsvData  # Import data loader
+from dataLoader import loadCsvData, compileEntry, compileEntries, activeProcessedFile, corpusStamp, PROCESSED_DIR, CORPUS_PATH  # Import data loader
+from invertedIndex import InvertedIndex, FuzzyLookup, cleanWord  # Import inverted index
+from fuzzyIndex import FuzzyVocabularyIndex  # Import BK-tree fuzzy index
+from structuredLog import getLogger  # Logger terstruktur
+from pipelineMetrics import timed, observeCandidates  # Metrics per stage
+
+logger = getLogger('matching')  # Logger stage matching
 
 def levenshteinDistance(s1, s2):  # Hitung Levenshtein distance
     if len(s1) < len(s2):  # Pastikan s1 lebih panjang
@@ -217,6 +229,13 @@ def advancedFuzzySimilarity(s1, s2, maxDistance=4): # enhanced fuzzy similarity
     
     return max(0.0, min(1.0, finalScore)) # return final score
 
+FUZZY_CACHE_SIZE = 200000 # jumlah maksimal pasangan kata yang di-memo
+
+@lru_cache(maxsize=FUZZY_CACHE_SIZE)
+def cachedFuzzySimilarity(s1Clean, s2Clean): # advancedFuzzySimilarity dengan memo LRU
+    """Memo advancedFuzzySimilarity untuk pasangan kata yang sudah di-clean"""
+    return advancedFuzzySimilarity(s1Clean, s2Clean) # hitung sekali per pasangan
+
 # Keep old function for backward compatibility
 def fuzzySimilarity(s1, s2, maxDistance=4): # hitung fuzzy similarity antara dua string
     """
@@ -225,8 +244,9 @@ def fuzzySimilarity(s1, s2, maxDistance=4): # hitung fuzzy similarity antara dua
     """
     return advancedFuzzySimilarity(s1, s2, maxDistance) # return advanced fuzzy similarity
 
-def findFuzzyMatches(queryWord, contentWords, threshold=0.5): # cari fuzzy matches untuk query word
+def findFuzzyMatches(queryWord, contentWords, threshold=0.5, similarityFn=None, contentWordsClean=None): # cari fuzzy matches untuk query word
     matches = [] # list matches
+    similarityFn = similarityFn or advancedFuzzySimilarity # default advanced fuzzy
     
     # Clean query word from special characters
     queryClean = ''.join(c.lower() for c in queryWord if c.isalnum()) # clean query word
@@ -235,13 +255,14 @@ def findFuzzyMatches(queryWord, contentWords, threshold=0.5): # cari fuzzy match
     if len(queryClean) < 2: # query terlalu pendek
         return matches # return empty matches
     
-    for word in contentWords: # loop content words
-        wordClean = ''.join(c.lower() for c in word if c.isalnum()) # clean word
-        
+    if contentWordsClean is None: # belum ada versi clean precomputed
+        contentWordsClean = [''.join(c.lower() for c in word if c.isalnum()) for word in contentWords] # clean words
+    
+    for word, wordClean in zip(contentWords, contentWordsClean): # loop content words
         if len(wordClean) < 2: # word terlalu pendek
             continue # skip word
             
-        similarity = advancedFuzzySimilarity(queryClean, wordClean) # hitung similarity
+        similarity = similarityFn(queryClean, wordClean) # hitung similarity
         if similarity >= threshold: # similarity cukup tinggi
             matches.append({ # tambah ke matches
                 'word': word, # original word
@@ -254,11 +275,13 @@ def findFuzzyMatches(queryWord, contentWords, threshold=0.5): # cari fuzzy match
     
     return sorted(matches, key=lambda x: x['similarity'], reverse=True) # return sorted matches
 
-def enhancedWordMatching(queryWords, contentWords, fuzzyThreshold=0.5): # enhanced word matching dengan advanced fuzzydef enhancedWordMatching(queryWords, contentWords, fuzzyThreshold=0.5): # enhanced word matching dengan advanced fuzzy
+def enhancedWordMatching(queryWords, contentWords, fuzzyThreshold=0.5, similarityFn=None, contentWordsClean=None): # enhanced word matching dengan advanced fuzzy
     exactMatches = 0 # exact matches count
     fuzzyMatches = 0 # fuzzy matches count
     totalFuzzyScore = 0.0 # total fuzzy score
     matchDetails = [] # match details list
+    if contentWordsClean is None: # belum ada versi clean precomputed
+        contentWordsClean = [''.join(c.lower() for c in word if c.isalnum()) for word in contentWords] # clean content words
     
     for queryWord in queryWords: # loop query words
         # Clean the query word
@@ -266,8 +289,7 @@ def enhancedWordMatching(queryWords, contentWords, fuzzyThreshold=0.5): # enhanc
         
         # First try exact match (including original and cleaned versions)
         exactFound = False # exact match found flag
-        for contentWord in contentWords: # loop content words
-            contentClean = ''.join(c.lower() for c in contentWord if c.isalnum()) # clean content word
+        for contentWord, contentClean in zip(contentWords, contentWordsClean): # loop content words
             if queryWord.lower() == contentWord.lower() or queryClean == contentClean: # exact match
                 exactMatches += 1 # increment exact matches
                 matchDetails.append({ # tambah match detail
@@ -281,7 +303,7 @@ def enhancedWordMatching(queryWords, contentWords, fuzzyThreshold=0.5): # enhanc
         
         if not exactFound: # no exact match found
             # Try advanced fuzzy matching
-            fuzzyResults = findFuzzyMatches(queryWord, contentWords, fuzzyThreshold) # fuzzy matching
+            fuzzyResults = findFuzzyMatches(queryWord, contentWords, fuzzyThreshold, similarityFn, contentWordsClean) # fuzzy matching
             if fuzzyResults: # ada fuzzy results
                 bestFuzzy = fuzzyResults[0] # best fuzzy match
                 fuzzyMatches += 1 # increment fuzzy matches
@@ -320,6 +342,13 @@ def jaccardSimilarity(a, b):
         return 0.0
     return len(intersection) / len(union)
 
+def jaccardSetSimilarity(setA, setB): # jaccard dari token set yang sudah jadi
+    """Sama dengan jaccardSimilarity, untuk token set precomputed"""
+    union = setA | setB # gabungan token
+    if not union: # kedua kosong
+        return 0.0 # no similarity
+    return len(setA & setB) / len(union) # jaccard similarity
+
 def tfidfSimilarity(query, documents): # hitung similarity menggunakan TF-IDF dan cosine similarity
     """Menghitung similarity menggunakan TF-IDF dan cosine similarity"""
     if not documents: # no documents
@@ -329,6 +358,8 @@ def tfidfSimilarity(query, documents): # hitung similarity menggunakan TF-IDF da
     allTexts = [query] + documents # combine all texts
     
     try:
+        from sklearn.feature_extraction.text import TfidfVectorizer # import lazy (sklearn berat, bukan jalur default)
+        from sklearn.metrics.pairwise import cosine_similarity # import lazy
         vectorizer = TfidfVectorizer(stop_words=None, lowercase=True) # TF-IDF vectorizer
         tfidfMatrix = vectorizer.fit_transform(allTexts) # transform texts
         
@@ -339,23 +370,131 @@ def tfidfSimilarity(query, documents): # hitung similarity menggunakan TF-IDF da
         similarities = cosine_similarity(queryVector, documentVectors).flatten() # cosine similarity
         return similarities # return similarities
     except Exception as e:
-        print(f"TF-IDF Error: {e}") # log error
+        logger.warning("TF-IDF error: %s", e) # log error
         return [0.0] * len(documents) # return zeros
 
-# Load data real dari CSV
-_dataCache = None # cache data global
+# Corpus matcher: entry + cache turunan (fitur, index, TF-IDF) selalu dari build yang sama.
+# Corpus diganti utuh kalau versi corpus (dataLoader.corpusStamp, sama dengan detector) berubah,
+# dan setiap request memakai satu corpus dari awal sampai akhir walau ada swap di tengah jalan.
+CORPUS_CHECK_INTERVAL = 5.0 # jeda minimal (detik) antar cek versi corpus
+
+class MatcherCorpus: # satu versi corpus matcher beserta cache turunannya
+    def __init__(self, dataEntries, stamp, pinned=False): # konstruktor corpus
+        self.dataEntries = dataEntries # entry corpus
+        self.stamp = stamp # versi corpus (corpusStamp, atau ('set', n) untuk setProcessedData)
+        self.pinned = pinned # dipasang manual (benchmark / corpus sintetis): tidak mengikuti manifest
+        self.features = None # (entryFeatures, tokenTable), dibangun lazy
+        self.index = None # InvertedIndex, dibangun lazy
+        self.tfidf = None # TfidfIndex, dibangun lazy
+
+_corpus = None # corpus aktif (read-only setelah dipublish, diganti utuh)
+_corpusLastCheck = 0.0 # waktu terakhir cek versi corpus
+_corpusGeneration = 0 # jumlah setProcessedData (versi corpus manual)
+_corpusLock = threading.Lock() # load/swap corpus
+_requestCorpus = threading.local() # corpus yang dipakai request yang sedang berjalan di thread ini
+
+def _loadCorpus(): # load corpus aktif dari disk (versi dicatat sebelum load)
+    path = activeProcessedFile() # corpus aktif (CORPUS_PATH / manifest)
+    stamp = corpusStamp() # versi corpus
+    try:
+        dataEntries = loadCsvData(path)  # Load data dari CSV
+        logger.info("Loaded %d data entries from CSV files", len(dataEntries)) # log jumlah data
+    except Exception as e:
+        logger.error("Error loading data: %s", e) # log error
+        dataEntries = [] # set empty list
+    return MatcherCorpus(dataEntries, stamp) # corpus baru
+
+def getCorpus(): # corpus untuk request ini (atau corpus aktif di luar request)
+    """MatcherCorpus yang dipakai: corpus request berjalan kalau ada, selain itu corpus aktif (load sekali)"""
+    global _corpus # pake corpus global
+    corpus = getattr(_requestCorpus, 'corpus', None) # corpus request berjalan
+    if corpus is not None: # di dalam request
+        return corpus # tetap corpus yang sama
+    corpus = _corpus # baca referensi sekali
+    if corpus is None: # belum di-load
+        with _corpusLock: # satu thread yang load
+            if _corpus is None: # masih kosong
+                _corpus = _loadCorpus() # load corpus
+            corpus = _corpus # corpus aktif
+    return corpus # return corpus
+
+def reloadProcessedData(force: bool = False): # swap corpus kalau versi corpus berubah
+    """Load ulang corpus kalau manifest/file corpus berubah (corpus setProcessedData tetap, kecuali force),
+    bangun fitur + index sebelum swap supaya request lain tetap dilayani corpus lama"""
+    global _corpus, _corpusLastCheck # pake corpus global
+    with _corpusLock: # satu thread saja yang rebuild
+        _corpusLastCheck = time.monotonic() # catat waktu cek
+        current = _corpus # corpus aktif
+        if current is not None and not force and (current.pinned or corpusStamp() == current.stamp): # tidak perlu load ulang
+            return current # pakai corpus lama
+        corpus = _loadCorpus() # corpus baru
+        if current is not None and current.dataEntries and not corpus.dataEntries: # corpus baru gagal dimuat
+            logger.error("Corpus reload failed, keeping previous corpus") # log gagal reload
+            return current # pertahankan corpus lama
+        if current is not None: # swap (bukan load pertama)
+            _buildIndex(corpus) # fitur + index dibangun sebelum dipublish
+            shutdownScoringPool() # worker masih memegang corpus lama
+        _corpus = corpus # swap referensi (atomik)
+        if current is not None and wantsScoringPool(corpus): # scoring paralel aktif
+            startScoringPool(corpus) # worker baru dengan corpus baru
+        return corpus # return corpus baru
+
+def refreshProcessedData(): # corpus aktif, cek versi corpus paling sering tiap CORPUS_CHECK_INTERVAL
+    global _corpusLastCheck # update waktu cek
+    corpus = getCorpus() # corpus aktif
+    if corpus.pinned or getattr(_requestCorpus, 'corpus', None) is not None: # corpus manual / di dalam request
+        return corpus # tanpa cek
+    now = time.monotonic() # waktu sekarang
+    if now - _corpusLastCheck >= CORPUS_CHECK_INTERVAL: # waktunya cek
+        _corpusLastCheck = now # catat waktu cek
+        if corpusStamp() != corpus.stamp: # build baru / file berubah
+            return reloadProcessedData() # swap corpus
+    return corpus # corpus aktif
+
+def getCorpusVersion(): # versi corpus matcher aktif (buat invalidasi cache response)
+    """Stamp corpus yang dipakai matchWithCsvData (cek perubahan dulu, jadi versi tidak basi)"""
+    return refreshProcessedData().stamp # versi corpus
+
+@contextmanager
+def requestCorpus(): # satu corpus untuk seluruh request (entry, fitur, index, TF-IDF tidak tercampur build)
+    if getattr(_requestCorpus, 'corpus', None) is not None: # request bersarang (matchIntent -> matchWithCsvData)
+        yield _requestCorpus.corpus # corpus yang sama
+        return # selesai
+    _requestCorpus.corpus = refreshProcessedData() # pin corpus aktif
+    try:
+        yield _requestCorpus.corpus # jalankan request
+    finally:
+        _requestCorpus.corpus = None # lepas pin
+
+def usesRequestCorpus(fn): # decorator entry point matching: jalankan di dalam requestCorpus
+    @wraps(fn)
+    def wrapper(*args, **kwargs): # fungsi asli dengan corpus ter-pin
+        with requestCorpus(): # corpus request
+            return fn(*args, **kwargs) # jalankan
+    return wrapper # return wrapper
 
 def getProcessedData(): # ambil cached processed data
-    """Get cached processed data"""
-    global _dataCache # pake global cache
-    if _dataCache is None: # cache kosong
-        try:
-            _dataCache = loadCsvData()  # Load data dari CSV
-            print(f"Loaded {len(_dataCache)} data entries from CSV files") # log jumlah data
-        except Exception as e:
-            print(f"Error loading data: {e}") # log error
-            _dataCache = [] # set empty list
-    return _dataCache # return cached data
+    """Get cached processed data (entry corpus request berjalan)"""
+    return getCorpus().dataEntries # entry corpus
+
+def setProcessedData(dataEntries): # ganti corpus matcher (benchmark / corpus sintetis)
+    """Pakai dataEntries sebagai corpus dan buang semua cache turunan (fitur, index, TF-IDF, pool);
+    corpus ini tidak mengikuti manifest sampai reloadProcessedData(force=True)"""
+    global _corpus, _corpusGeneration # pake corpus global
+    shutdownScoringPool() # worker masih memegang corpus lama
+    with _corpusLock: # sama dengan swap di reload
+        _corpusGeneration += 1 # versi corpus manual baru
+        _corpus = MatcherCorpus(dataEntries, ('set', _corpusGeneration), pinned=True) # corpus baru
+
+def clearMemoCaches(): # kosongkan memo yang diisi query (benchmark cold pass), corpus dan index tetap
+    cachedFuzzySimilarity.cache_clear() # memo similarity pasangan kata
+    corpus = _corpus # corpus aktif
+    if corpus is None: # belum di-load
+        return # tidak ada memo corpus
+    if corpus.index is not None and corpus.index.fuzzyIndex is not None: # index fuzzy sudah dibangun
+        corpus.index.fuzzyIndex.expansionCache.clear() # memo ekspansi per query word
+    if corpus.features is not None and hasattr(corpus.features[0], 'clearCache'): # fitur view snapshot
+        corpus.features[0].clearCache() # LRU fitur yang sudah dirakit
 
 # Fallback dummy intents untuk case tertentu
 FALLBACK_INTENTS = [
@@ -365,128 +504,508 @@ FALLBACK_INTENTS = [
     {"intent": "info_itb", "pattern": "institut teknologi bandung", "answer": "ITB (Institut Teknologi Bandung) adalah perguruan tinggi teknik terkemuka di Indonesia yang didirikan pada tahun 1959."},
 ]
 
-def matchWithCsvData(userQuery, threshold=0.3, topK=3): # match user query dengan data CSV
-    print(f"[MATCHING] Starting match for query: '{userQuery}'") # log start matching    
+FUZZY_THRESHOLD = 0.5 # threshold fuzzy yang dipakai semua strategi matching
+TFIDF_WEIGHT = 0.5 # bobot skor TF-IDF (strategi opsional)
+TFIDF_TOP_K = 20 # jumlah dokumen teratas dari index TF-IDF
+TFIDF_INDEX_FILE = os.path.splitext(CORPUS_PATH)[0] + '.tfidf.pkl' if CORPUS_PATH else os.path.join(PROCESSED_DIR, 'tfidf_index.pkl') # file index TF-IDF (di sebelah CORPUS_PATH; index lama di-fit ulang kalau hash corpus beda)
+
+# Index TF-IDF persisten (fit sekali, load dari disk di worker lain)
+def getTfidfIndex(): # ambil cached TF-IDF index
+    """Get TF-IDF index atas content corpus (load dari disk atau fit sekali)"""
+    corpus = getCorpus() # corpus request
+    if corpus.tfidf is None: # cache kosong
+        dataEntries = corpus.dataEntries # ambil processed data
+        if not dataEntries: # data kosong
+            return None # tidak ada index
+        try:
+            from tfidfIndex import loadOrBuildTfidfIndex # import lazy (sklearn)
+            corpus.tfidf = loadOrBuildTfidfIndex([str(entry['content']) for entry in dataEntries], TFIDF_INDEX_FILE) # load/fit index
+        except Exception as e:
+            logger.error("TF-IDF index error: %s", e) # log error
+            return None # strategi TF-IDF dilewati
+    return corpus.tfidf # return cached index
+
+# Fitur token per entry (query-independent) dihitung sekali per corpus
+def _buildFeatures(corpus): # fitur corpus (dibangun sekali)
+    if corpus.features is None: # cache kosong
+        corpus.features = compileEntries(corpus.dataEntries, soundex) # compile fitur
+    return corpus.features # return cached features
+
+def getEntryFeatures(): # ambil cached precomputed entry features
+    """Get cached EntryFeatures (urutan sama dengan getProcessedData) dan tabel fitur kata"""
+    return _buildFeatures(getCorpus()) # fitur corpus request
+
+# Inverted index dibangun sekali per corpus
+def _buildIndex(corpus): # index corpus (dibangun sekali, None kalau gagal)
+    if corpus.index is None: # cache kosong
+        if not corpus.dataEntries: # data kosong
+            return None # tidak ada index
+        try:
+            entryFeatures, tokenTable = _buildFeatures(corpus) # fitur precomputed
+            index = InvertedIndex(entryFeatures) # build index
+            index.fuzzyIndex = FuzzyVocabularyIndex(index.fuzzyVocabulary, cachedFuzzySimilarity, levenshteinDistance, soundex, tokenFeatures=tokenTable) # index fuzzy vocabulary
+            corpus.index = index # publish index
+            logger.info("Built inverted index: %d tokens, %d fuzzy vocabulary words", len(index.rawPostings), len(index.fuzzyVocabulary)) # log index
+        except Exception as e:
+            logger.error("Error building inverted index: %s", e) # log error
+            return None # fallback ke scan linear
+    return corpus.index # return cached index
+
+def getInvertedIndex(): # ambil cached inverted index
+    """Get cached inverted index over processed data"""
+    return _buildIndex(getCorpus()) # index corpus request
+
+# Scoring paralel: entry kandidat di-shard ke process pool persisten (opsional)
+PARALLEL_SHARDS = int(os.environ.get('MATCH_PARALLEL_SHARDS', str(os.cpu_count() or 1))) # jumlah shard/worker process
+PARALLEL_MIN_ENTRIES = int(os.environ.get('MATCH_PARALLEL_MIN_ENTRIES', '5000')) # corpus lebih kecil dari ini tetap serial
+PARALLEL_ENABLED = os.environ.get('MATCH_PARALLEL', '0') == '1' # matchIntent/matchIntentBatch scoring paralel (pool di-fork saat warm-up)
+
+_scoringPool = None # list executor satu worker per shard (worker k selalu memegang shard docId k)
+_scoringPoolCorpus = None # corpus yang di-fork ke worker pool
+_scoringPoolLock = threading.Lock() # cegah pool dibuat dua kali
+_workerShard = None # range docId milik worker ini (di-set initializer, None di parent)
+FORK_AVAILABLE = 'fork' in multiprocessing.get_all_start_methods() # worker mewarisi corpus parent (tidak ada di Windows)
+
+def shardRanges(size, shardCount): # bagi docId 0..size-1 jadi range berurutan, satu per worker
+    shardCount = max(1, min(shardCount, size)) # tidak lebih banyak shard dari entry
+    shardSize = -(-size // shardCount) # ukuran shard (ceil)
+    return [range(start, min(size, start + shardSize)) for start in range(0, size, shardSize)] # range per shard
+
+def _initScoringWorker(corpus, shard): # initializer worker: pakai corpus parent yang diwarisi lewat fork (tanpa load ulang)
+    global _corpus, _workerShard # corpus + shard worker
+    _corpus = corpus # corpus yang sama dengan parent (setProcessedData / build manifest)
+    _workerShard = shard # docId yang di-scoring worker ini untuk setiap query
+    _requestCorpus.corpus = None # pin request parent ikut ter-fork, jangan dipakai
+    _buildFeatures(corpus) # compile fitur entry (biasanya sudah ada dari parent)
+
+def startScoringPool(corpus=None): # fork worker scoring (satu process per shard) untuk corpus aktif sekarang
+    """Dipanggil saat warm-up (sebelum ada request thread) dan setelah swap corpus, tidak pernah lazy dari request.
+    Fitur + index dibangun dulu supaya worker mewarisinya; pool lama dimatikan. Return pool, None kalau tidak bisa"""
+    global _scoringPool, _scoringPoolCorpus # pake global pool
+    corpus = corpus or getCorpus() # corpus aktif
+    if not FORK_AVAILABLE or not corpus.dataEntries: # spawn akan load corpus dari file, bukan corpus parent
+        return None # scoring serial
+    _buildIndex(corpus) # fitur + index ikut ter-fork
+    shutdownScoringPool() # worker memegang corpus lama
+    with _scoringPoolLock: # akses eksklusif
+        context = multiprocessing.get_context('fork') # worker mewarisi corpus
+        pool = [ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_initScoringWorker, initargs=(corpus, shard)) for shard in shardRanges(len(corpus.dataEntries), PARALLEL_SHARDS)] # satu executor per shard
+        for future in [executor.submit(os.getpid) for executor in pool]: # executor baru fork process saat submit pertama
+            future.result() # worker sudah jalan sebelum fungsi ini selesai
+        _scoringPool = pool # publish pool
+        _scoringPoolCorpus = corpus # corpus worker
+    logger.info("Started %d scoring workers for %d entries", len(pool), len(corpus.dataEntries)) # log pool
+    return pool # return pool
+
+def wantsScoringPool(corpus): # corpus ini di-scoring paralel oleh matchIntent/matchIntentBatch
+    return PARALLEL_ENABLED and FORK_AVAILABLE and len(corpus.dataEntries) >= PARALLEL_MIN_ENTRIES # flag + fork + corpus cukup besar
+
+def getScoringPool(corpus): # ambil worker scoring untuk corpus ini, None kalau tidak ada
+    """Pool yang di-fork startScoringPool dengan corpus ini; None (scoring serial) kalau pool belum dimulai
+    atau corpus bukan corpus pool (request lama saat corpus di-swap)"""
+    with _scoringPoolLock: # akses eksklusif
+        return _scoringPool if _scoringPool is not None and _scoringPoolCorpus is corpus else None # pool untuk corpus lain tidak dipakai
+
+def shutdownScoringPool(): # matikan process pool scoring
+    global _scoringPool, _scoringPoolCorpus # pake global pool
+    with _scoringPoolLock: # akses eksklusif
+        if _scoringPool is not None: # pool aktif
+            for executor in _scoringPool: # worker per shard
+                executor.shutdown(wait=True) # tunggu worker selesai
+            _scoringPool = None # reset pool
+            _scoringPoolCorpus = None # reset corpus worker
+
+def _resetScoringPoolAfterFork(): # worker pool milik parent, bukan proses anak (gunicorn worker, worker scoring)
+    global _scoringPool, _scoringPoolCorpus, _scoringPoolLock # state global
+    _scoringPoolLock = threading.Lock() # lock baru (startScoringPool fork sambil memegang lock lama)
+    _scoringPool = None # process parent tidak bisa dipakai dari anak
+    _scoringPoolCorpus = None # reset corpus worker
+
+if hasattr(os, 'register_at_fork'): # POSIX
+    os.register_at_fork(after_in_child=_resetScoringPoolAfterFork) # anak mulai tanpa pool
+atexit.register(shutdownScoringPool) # matikan pool saat exit
+
+def _scoreShard(stamp, queryArgs, expansions, tfidfScores, topK): # scoring shard milik worker ini (jalan di worker process)
+    """Kandidat dicari sendiri di shard worker (index + ekspansi parent, atau semua docId shard di mode linear),
+    jadi yang dikirim parent hanya argumen query. Return (jumlah kandidat skor > 0, top-K [(-score, docId, methods)] urut),
+    None kalau corpus worker bukan corpus parent"""
+    corpus = getCorpus() # corpus worker (diwarisi initializer)
+    if corpus.stamp != stamp: # docId menunjuk corpus lain
+        return None # parent scoring serial
+    shard = _workerShard # docId milik worker ini
+    dataEntries = corpus.dataEntries # entry corpus
+    if expansions is not None: # mode index: kandidat + fuzzy dari ekspansi query parent
+        index = _buildIndex(corpus) # index corpus (biasanya sudah dibangun parent sebelum fork)
+        if index is None: # index gagal dibangun
+            return None # parent scoring serial
+        fuzzyLookup = FuzzyLookup(FUZZY_THRESHOLD) # lookup baru
+        fuzzyLookup.expansions = expansions # ekspansi query word
+        _, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, _ = queryArgs # argumen query
+        docIds = index.getCandidates(userQueryLower, originalQueryWords, processedQuery, processedQueryWords, fuzzyLookup, shard) # kandidat shard ini (sama dengan kandidat parent)
+        similarityFn = fuzzyLookup.similarity # similarity dari ekspansi
+        entryFeatures = _buildFeatures(corpus)[0] # fitur precomputed
+    else: # mode linear
+        docIds = shard # semua entry shard
+        similarityFn = advancedFuzzySimilarity # hitung langsung
+        entryFeatures = None # fitur dihitung per entry
+    extraIds = [i for i in tfidfScores if i in shard] # top-K TF-IDF di shard ini (juga kandidat)
+    if extraIds: # tambah ke kandidat
+        docIds = sorted(set(docIds).union(extraIds)) # kandidat + TF-IDF
+
+    positives = 0 # jumlah entry dengan skor > 0
+    heap = [] # min-heap (score, -docId, methods) berukuran topK
+    for i in docIds: # loop entry shard
+        features = entryFeatures[i] if entryFeatures is not None else None # fitur entry
+        score, matchMethods = scoreEntry(dataEntries[i], *queryArgs, similarityFn, features) # hitung skor entry
+        if i in tfidfScores: # dokumen ada di top-K TF-IDF
+            score += tfidfScores[i] * TFIDF_WEIGHT # tambah skor TF-IDF
+            matchMethods.append(f"tfidf({tfidfScores[i]:.2f})") # tambah method
+        if score > 0: # ada score
+            positives += 1 # hitung kandidat
+            item = (score, -i, matchMethods) # skor sama -> docId kecil menang (sama dengan sort stabil)
+            if len(heap) < topK: # heap belum penuh
+                heapq.heappush(heap, item) # tambah item
+            elif item[:2] > heap[0][:2]: # lebih baik dari yang terburuk
+                heapq.heapreplace(heap, item) # ganti yang terburuk
+    return positives, sorted((-score, -negId, methods) for score, negId, methods in heap) # urut skor desc, docId asc
+
+def scoreCandidatesParallel(candidateIds, queryArgs, fuzzyLookup, tfidfScores, topK): # scoring kandidat di process pool
+    """Setiap worker scoring kandidat di shard docId-nya, top-K parsial di-merge dengan heap. Yang dikirim ke worker
+    hanya argumen query + ekspansi fuzzy + skor TF-IDF (candidateIds tidak, worker mencari ulang di shard-nya).
+    Return (top-K candidates, jumlah kandidat), None kalau process pool tidak bisa dipakai untuk corpus ini (caller scoring serial)"""
+    corpus = getCorpus() # corpus request
+    dataEntries = corpus.dataEntries # corpus parent
+    if not candidateIds: # tidak ada kandidat
+        return [], 0 # hasil kosong
+    pool = getScoringPool(corpus) # worker per shard
+    if pool is None: # fork tidak tersedia / corpus sudah di-swap
+        return None # scoring serial
+    expansions = fuzzyLookup.expansions if fuzzyLookup is not None else None # ekspansi fuzzy query (None = mode linear)
+    futures = [executor.submit(_scoreShard, corpus.stamp, queryArgs, expansions, tfidfScores, topK) for executor in pool] # setiap worker scoring shard-nya sendiri
+    shardResults = [future.result() for future in futures] # tunggu semua shard
+    if any(result is None for result in shardResults): # worker memegang corpus lain
+        logger.warning("Scoring worker corpus mismatch, scoring serially") # log fallback
+        return None # scoring serial
+    merged = heapq.merge(*(results for _, results in shardResults)) # merge top-K shard (urut skor desc, docId asc)
+    candidates = [{'entry': dataEntries[i], 'score': -negScore, 'methods': methods} for negScore, i, methods in list(merged)[:topK]] # top-K global
+    return candidates, sum(positives for positives, _ in shardResults) # kandidat + jumlah total
+
+# Top-K dengan early termination (gaya WAND/MaxScore): batas atas skor per entry dari postings
+BOUND_EPSILON = 1e-9 # margin error floating point batas atas
+
+def _wordMatchBounds(index, queryWords, postings, fuzzyLookup, exactWeight, fuzzyWeight, typoBonus): # batas atas enhancedWordMatching per dokumen
+    """Return (docId -> batas atas skor word matching, docId -> similarity fuzzy terbaik)"""
+    bounds = {} # docId -> batas atas
+    bestSimilarity = {} # docId -> similarity ekspansi terbaik (buat strategi fallback fuzzy)
+    if not queryWords: # tidak ada query word
+        return bounds, bestSimilarity # kosong
+    totalWords = len(queryWords) # pembagi skor (termasuk duplikat)
+    for queryWord in queryWords: # loop query word (duplikat dihitung, sama dengan enhancedWordMatching)
+        queryClean = cleanWord(queryWord) # clean query word
+        exactDocs = postings.get(queryClean, {}) # dokumen dengan exact match
+        wordBest = {} # docId -> similarity fuzzy terbaik untuk query word ini
+        if len(queryClean) >= 2: # findFuzzyMatches skip kata pendek
+            for word, similarity in fuzzyLookup.getExpansions(queryClean).items(): # ekspansi fuzzy
+                for docId in postings.get(word, ()): # dokumen yang punya kata ini
+                    if similarity > wordBest.get(docId, 0.0): # similarity lebih tinggi
+                        wordBest[docId] = similarity # simpan
+        for docId in exactDocs: # exact match
+            bounds[docId] = bounds.get(docId, 0.0) + exactWeight / totalWords # skor exact
+        for docId, similarity in wordBest.items(): # fuzzy match
+            if docId not in exactDocs: # exact didahulukan
+                bounds[docId] = bounds.get(docId, 0.0) + fuzzyWeight * similarity / totalWords + typoBonus # skor fuzzy + bonus typo
+            if similarity > bestSimilarity.get(docId, 0.0): # similarity terbaik semua query word
+                bestSimilarity[docId] = similarity # simpan
+    return bounds, bestSimilarity # batas atas
+
+def _queryBoundState(index, fuzzyLookup, queryArgs): # bagian batas atas yang hanya bergantung query
+    userQuery, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, threshold = queryArgs # argumen query
+    # Strategy 2 (kata asli, bobot 0.9) dan fallback processed (bobot 0.7), sama dengan scoreEntry
+    wordBounds, bestSimilarity = _wordMatchBounds(index, originalQueryWords, index.wordPostings, fuzzyLookup, 0.9 * 0.9, 0.9 * 0.8, 0.3) # batas kata asli
+    processedBounds, _ = _wordMatchBounds(index, processedQueryWords, index.processedWordPostings, fuzzyLookup, 0.7 * 0.9, 0.7 * 0.8, 0.0) # batas processed fallback
+    return userQueryLower, wordBounds, processedBounds, bestSimilarity, set(processedQuery.split()), set(userQueryLower.split()), threshold # state batas atas
+
+def _entryBound(state, i, features, tfidfScores): # batas atas skor satu entry untuk satu query
+    userQueryLower, wordBounds, processedBounds, bestSimilarity, processedQuerySet, queryWordsSet, threshold = state # state query
+    bound = 1.0 if userQueryLower in features.contentLower else 0.0 # substring (exact)
+    bound += wordBounds[i] if i in wordBounds else processedBounds.get(i, 0.0) # word matching (elif seperti scoreEntry)
+    jaccardScore = jaccardSetSimilarity(processedQuerySet, features.processedTokenSet) # jaccard (exact)
+    if jaccardScore > threshold: # di atas threshold
+        bound += jaccardScore * 0.5 # skor jaccard
+    overlap = len(queryWordsSet & features.contentTokenSet) # overlap (exact)
+    if overlap > 0: # ada overlap
+        bound += overlap / len(queryWordsSet) * 0.3 # skor overlap
+    if bestSimilarity.get(i, 0.0) > 0.7: # fallback fuzzy
+        bound += bestSimilarity[i] * 0.4 # batas fallback fuzzy
+    return bound + tfidfScores.get(i, 0.0) * TFIDF_WEIGHT # TF-IDF (exact)
+
+def _rankByBounds(bounds, fuzzyLookup, entryFeatures, queryArgs, tfidfScores, topK): # scoring penuh urut batas atas sampai tidak bisa masuk top-K
+    dataEntries = getProcessedData() # corpus
+    heapSize = max(topK, 1) # best match tetap dibutuhkan walau topK <= 0
+    heap = [] # min-heap (score, -docId, methods)
+    for i in sorted(bounds, key=lambda docId: (-bounds[docId], docId)): # batas atas tertinggi dulu
+        if bounds[i] <= 0: # sisa kandidat pasti skor 0
+            break # selesai
+        if len(heap) == heapSize and bounds[i] + BOUND_EPSILON < heap[0][0]: # tidak bisa mengalahkan skor ke-K
+            break # early termination (sisa batas atas lebih kecil)
+        score, matchMethods = scoreEntry(dataEntries[i], *queryArgs, fuzzyLookup.similarity, entryFeatures[i]) # scoring penuh
+        if i in tfidfScores: # dokumen ada di top-K TF-IDF
+            score += tfidfScores[i] * TFIDF_WEIGHT # tambah skor TF-IDF
+            matchMethods.append(f"tfidf({tfidfScores[i]:.2f})") # tambah method
+        if score > 0: # ada score
+            item = (score, -i, matchMethods) # skor sama -> docId kecil menang (sama dengan sort stabil)
+            if len(heap) < heapSize: # heap belum penuh
+                heapq.heappush(heap, item) # tambah item
+            elif item[:2] > heap[0][:2]: # lebih baik dari yang terburuk
+                heapq.heapreplace(heap, item) # ganti yang terburuk
+    ranked = sorted(heap, key=lambda item: (-item[0], -item[1])) # urut skor desc, docId asc
+    return [{'entry': dataEntries[-negId], 'score': score, 'methods': methods} for score, negId, methods in ranked] # top-K
+
+def scoreCandidatesTopK(candidateIds, index, fuzzyLookup, entryFeatures, queryArgs, tfidfScores, topK): # scoring top-K dengan early termination
+    """Hitung batas atas murah per kandidat, lalu scoring penuh urut batas atas sampai
+    batas atas tidak bisa lagi mengalahkan skor ke-K. Return (top-K candidates, jumlah kandidat)"""
+    state = _queryBoundState(index, fuzzyLookup, queryArgs) # bagian batas atas per query
+    bounds = {i: _entryBound(state, i, entryFeatures[i], tfidfScores) for i in candidateIds} # docId -> batas atas skor
+    candidateCount = sum(1 for bound in bounds.values() if bound > 0) # setiap komponen positif tepat saat skor aslinya positif
+    return _rankByBounds(bounds, fuzzyLookup, entryFeatures, queryArgs, tfidfScores, topK), candidateCount # top-K + jumlah
+
+def scoreQueriesTopK(candidateLists, index, fuzzyLookup, entryFeatures, queryArgsList, topK): # scoreCandidatesTopK untuk banyak query
+    """Batas atas semua query dihitung dalam satu pass atas gabungan kandidat (fitur entry diambil
+    sekali per dokumen), lalu top-K per query. Return [(top-K candidates, jumlah kandidat)] urut query"""
+    states = [_queryBoundState(index, fuzzyLookup, queryArgs) for queryArgs in queryArgsList] # bagian batas atas per query
+    docQueries = {} # docId -> query yang menjadikannya kandidat
+    for position, candidateIds in enumerate(candidateLists): # loop query
+        for i in candidateIds: # kandidat query ini
+            docQueries.setdefault(i, []).append(position) # tandai query
+    bounds = [{} for _ in queryArgsList] # per query: docId -> batas atas
+    for i in sorted(docQueries): # satu pass atas gabungan kandidat
+        features = entryFeatures[i] # fitur entry
+        for position in docQueries[i]: # query yang butuh dokumen ini
+            bounds[position][i] = _entryBound(states[position], i, features, {}) # batas atas (tanpa TF-IDF)
+    results = [] # hasil per query
+    for queryBounds, queryArgs in zip(bounds, queryArgsList): # loop query
+        candidateCount = sum(1 for bound in queryBounds.values() if bound > 0) # jumlah kandidat skor > 0
+        results.append((_rankByBounds(queryBounds, fuzzyLookup, entryFeatures, queryArgs, {}, topK), candidateCount)) # top-K query ini
+    return results # hasil urut query
+
+def scoreEntry(entry, userQuery, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, threshold=0.3, similarityFn=None, features=None): # hitung skor satu entry
+    """Skor matching satu entry terhadap query (semua strategi)"""
+    if features is None: # belum ada fitur precomputed
+        features = compileEntry(entry) # hitung fitur entry
+    
+    score = 0.0 # skor matching entry ini
+    matchMethods = [] # list method yang dipakai
+    
+    # Strategy 1: Exact substring matching (highest priority)
+    if userQueryLower in features.contentLower: # exact substring match
+        score += 1.0 # tambah score
+        matchMethods.append("substring") # tambah method
+    
+    # Strategy 2: Enhanced word matching with advanced fuzzy support
+    # Use original query words for better fuzzy matching (before aggressive preprocessing)
+    # First try with original words for better typo tolerance
+    fuzzyScore, fuzzyDetails = enhancedWordMatching(originalQueryWords, features.contentWords, FUZZY_THRESHOLD, similarityFn, features.contentWordsClean) # enhanced matching
+    
+    if fuzzyScore > 0: # ada fuzzy match
+        score += fuzzyScore * 0.9  # Increased weight for fuzzy matching
+        
+        # Detailed logging for fuzzy matches
+        fuzzyTypes = [detail['match_type'] for detail in fuzzyDetails] # ambil match types
+        exactCount = fuzzyTypes.count('exact') # hitung exact matches
+        advancedFuzzyCount = fuzzyTypes.count('advanced_fuzzy') # hitung advanced fuzzy
+        
+        methodDesc = f"enhanced_word(exact:{exactCount},fuzzy:{advancedFuzzyCount},score:{fuzzyScore:.2f})" # method description
+        matchMethods.append(methodDesc) # tambah ke methods
+        
+        # Extra bonus for advanced fuzzy matches (typo tolerance)
+        if advancedFuzzyCount > 0: # ada advanced fuzzy
+            typoBonus = advancedFuzzyCount * 0.3  # Increased bonus for advanced typo handling
+            score += typoBonus # tambah typo bonus
+            
+            if logger.isEnabledFor(logging.DEBUG): # info fuzzy hanya dirakit kalau trace aktif (loop per entry)
+                fuzzyMatchInfo = [] # list fuzzy match info
+                for detail in fuzzyDetails: # loop fuzzy details
+                    if detail['match_type'] == 'advanced_fuzzy': # advanced fuzzy match
+                        if 'clean_query' in detail and 'clean_word' in detail: # ada clean query dan word
+                            fuzzyMatchInfo.append(f"{detail['clean_query']}->{detail['clean_word']}") # tambah info
+                        else:
+                            fuzzyMatchInfo.append(f"{detail['query_word']}->{detail['matched_word']}") # tambah info alternatif
+                
+                logger.debug("Found advanced fuzzy matches for '%s': %s", userQuery, fuzzyMatchInfo) # log fuzzy matches
+            matchMethods.append(f"advanced_typo_bonus({typoBonus:.2f})") # tambah method
+    # Fallback: try processed words if original didn't work well
+    elif len(processedQueryWords) > 0: # ada processed query words
+        fallbackScore, fallbackDetails = enhancedWordMatching(processedQueryWords, features.processedWords, FUZZY_THRESHOLD, similarityFn, features.processedWordsClean) # fallback matching
+        
+        if fallbackScore > 0: # ada fallback score
+            score += fallbackScore * 0.7  # Lower weight for processed fallback
+            matchMethods.append(f"processed_fallback({fallbackScore:.2f})") # tambah method
+    
+    # Strategy 3: Jaccard similarity on processed text
+    jaccardScore = jaccardSetSimilarity(set(processedQuery.split()), features.processedTokenSet) # jaccard similarity
+    if jaccardScore > threshold: # di atas threshold
+        score += jaccardScore * 0.5 # tambah score
+        matchMethods.append(f"jaccard({jaccardScore:.2f})") # tambah method
+    
+    # Strategy 4: Basic word overlap (fallback)
+    queryWordsSet = set(userQueryLower.split()) # set query words
+    overlap = len(queryWordsSet & features.contentTokenSet) # hitung overlap
+    if overlap > 0: # ada overlap
+        overlapScore = overlap / len(queryWordsSet) # hitung overlap score
+        score += overlapScore * 0.3 # tambah score
+        matchMethods.append(f"overlap({overlapScore:.2f})") # tambah method
+    
+    # Strategy 5: Advanced fuzzy matching as fallback
+    # Try advanced fuzzy matching for any remaining unmatched words
+    for queryWord in originalQueryWords: # loop original query words
+        fuzzyMatches = findFuzzyMatches(queryWord, features.contentWords, FUZZY_THRESHOLD, similarityFn, features.contentWordsClean) # fuzzy matches
+        if fuzzyMatches: # ada fuzzy matches
+            bestMatch = fuzzyMatches[0] # ambil best match
+            if bestMatch['similarity'] > 0.7:  # High similarity threshold for fallback
+                fallbackScore = bestMatch['similarity'] * 0.4 # hitung fallback score
+                score += fallbackScore # tambah score
+                matchMethods.append(f"fallback_fuzzy({fallbackScore:.2f})") # tambah method
+                break  # Only one fallback bonus per entry
+    
+    return score, matchMethods # return skor dan methods
+
+@timed('match', countComparisons=True)
+@usesRequestCorpus
+def matchWithCsvData(userQuery, threshold=0.3, topK=3, useIndex=True, useTfidf=False, parallel=False, earlyTermination=True): # match user query dengan data CSV
+    logger.debug("Starting match for query: '%s'", userQuery) # log start matching
     # Get processed data
     dataEntries = getProcessedData() # ambil processed data    
     if not dataEntries: # data kosong
-        print("[MATCHING] No data loaded, using fallback") # log fallback
+        logger.warning("No data loaded, using fallback") # log fallback
         return matchFallbackIntents(userQuery) # return fallback match
     
     userQueryLower = userQuery.lower() # lowercase user query
     candidates = [] # list candidates
-      # 1. Preprocessing query
+    # 1. Preprocessing query
     try:
         from preprocessing import preprocess # import preprocessing
         processedQuery = preprocess(userQuery) # preprocess query
-        print(f"[MATCHING] Processed query: '{processedQuery}'") # log processed query
+        logger.debug("Processed query: '%s'", processedQuery) # log processed query
     except Exception as e:
-        print(f"[MATCHING] Preprocessing error: {e}") # log error
+        logger.warning("Preprocessing error: %s", e) # log error
         processedQuery = userQueryLower # fallback ke lowercase
     
     # Prepare query words for fuzzy matching - USE ORIGINAL WORDS FIRST
     originalQueryWords = [word for word in userQueryLower.split() if len(word) > 1] # original words
     processedQueryWords = [word for word in processedQuery.split() if len(word) > 1] # processed words
-      # 2. Enhanced matching strategies with fuzzy support
-    for i, entry in enumerate(dataEntries): # loop semua data entries
-        content = entry['content'] # content entry
-        processedContent = entry.get('processed_content', content.lower()) # processed content
-        
-        score = 0.0 # skor matching entry ini
-        matchMethods = [] # list method yang dipakai
-        
-        # Strategy 1: Exact substring matching (highest priority)
-        if userQueryLower in content.lower(): # exact substring match
-            score += 1.0 # tambah score
-            matchMethods.append("substring") # tambah method        # Strategy 2: Enhanced word matching with advanced fuzzy support
-        # Use original query words for better fuzzy matching (before aggressive preprocessing)
-        contentWords = [word for word in content.lower().split() if len(word) > 1] # content words
-          # First try with original words for better typo tolerance
-        fuzzyScore, fuzzyDetails = enhancedWordMatching(originalQueryWords, contentWords, fuzzyThreshold=0.5) # enhanced matching
-        
-        if fuzzyScore > 0: # ada fuzzy match
-            score += fuzzyScore * 0.9  # Increased weight for fuzzy matching
-            
-            # Detailed logging for fuzzy matches
-            fuzzyTypes = [detail['match_type'] for detail in fuzzyDetails] # ambil match types
-            exactCount = fuzzyTypes.count('exact') # hitung exact matches
-            advancedFuzzyCount = fuzzyTypes.count('advanced_fuzzy') # hitung advanced fuzzy
-            
-            methodDesc = f"enhanced_word(exact:{exactCount},fuzzy:{advancedFuzzyCount},score:{fuzzyScore:.2f})" # method description
-            matchMethods.append(methodDesc) # tambah ke methods
-            
-            # Extra bonus for advanced fuzzy matches (typo tolerance)
-            if advancedFuzzyCount > 0: # ada advanced fuzzy
-                typoBonus = advancedFuzzyCount * 0.3  # Increased bonus for advanced typo handling
-                score += typoBonus # tambah typo bonus
-                
-                fuzzyMatchInfo = [] # list fuzzy match info
-                for detail in fuzzyDetails: # loop fuzzy details
-                    if detail['match_type'] == 'advanced_fuzzy': # advanced fuzzy match
-                        if 'clean_query' in detail and 'clean_word' in detail: # ada clean query dan word
-                            fuzzyMatchInfo.append(f"{detail['clean_query']}->{detail['clean_word']}") # tambah info
-                        else:
-                            fuzzyMatchInfo.append(f"{detail['query_word']}->{detail['matched_word']}") # tambah info alternatif
-                
-                print(f"[MATCHING] Found advanced fuzzy matches for '{userQuery}': {fuzzyMatchInfo}") # log fuzzy matches
-                matchMethods.append(f"advanced_typo_bonus({typoBonus:.2f})") # tambah method        
-        # Fallback: try processed words if original didn't work well
-        elif len(processedQueryWords) > 0: # ada processed query words
-            processedContentWords = [word for word in processedContent.split() if len(word) > 1] # processed content words
-            fallbackScore, fallbackDetails = enhancedWordMatching(processedQueryWords, processedContentWords, fuzzyThreshold=0.5) # fallback matching
-            
-            if fallbackScore > 0: # ada fallback score
-                score += fallbackScore * 0.7  # Lower weight for processed fallback
-                matchMethods.append(f"processed_fallback({fallbackScore:.2f})") # tambah method
-        
-        # Strategy 3: Jaccard similarity on processed text
-        jaccardScore = jaccardSimilarity(processedQuery, processedContent) # jaccard similarity
-        if jaccardScore > threshold: # di atas threshold
-            score += jaccardScore * 0.5 # tambah score
-            matchMethods.append(f"jaccard({jaccardScore:.2f})") # tambah method
-        
-        # Strategy 4: Basic word overlap (fallback)
-        queryWordsSet = set(userQueryLower.split()) # set query words
-        contentWordsSet = set(content.lower().split()) # set content words
-        overlap = len(queryWordsSet & contentWordsSet) # hitung overlap
-        if overlap > 0: # ada overlap
-            overlapScore = overlap / len(queryWordsSet) # hitung overlap score
-            score += overlapScore * 0.3 # tambah score
-            matchMethods.append(f"overlap({overlapScore:.2f})") # tambah method
-          # Strategy 4: Advanced fuzzy matching as fallback
-        # Try advanced fuzzy matching for any remaining unmatched words
-        for queryWord in originalQueryWords: # loop original query words
-            fuzzyMatches = findFuzzyMatches(queryWord, contentWords, threshold=0.5) # fuzzy matches
-            if fuzzyMatches: # ada fuzzy matches
-                bestMatch = fuzzyMatches[0] # ambil best match
-                if bestMatch['similarity'] > 0.7:  # High similarity threshold for fallback
-                    fallbackScore = bestMatch['similarity'] * 0.4 # hitung fallback score
-                    score += fallbackScore # tambah score
-                    matchMethods.append(f"fallback_fuzzy({fallbackScore:.2f})") # tambah method
-                    break  # Only one fallback bonus per entry
-        
-        if score > 0: # ada score
-            candidates.append({ # tambah ke candidates
-                'entry': entry, # entry data
-                'score': score, # score matching
-                'methods': matchMethods # methods yang dipakai
-            })    
-    # Sort by score
-    candidates.sort(key=lambda x: x['score'], reverse=True) # sort candidates by score
     
-    print(f"[MATCHING] Found {len(candidates)} candidates") # log jumlah candidates
+    # 2. Candidate retrieval: hanya entry yang berbagi token/ekspansi fuzzy dengan query
+    index = getInvertedIndex() if useIndex else None # ambil inverted index
+    if index is not None: # index tersedia
+        fuzzyLookup = index.buildFuzzyLookup(originalQueryWords + processedQueryWords, cachedFuzzySimilarity, FUZZY_THRESHOLD) # ekspansi fuzzy per query word
+        candidateIds = index.getCandidates(userQueryLower, originalQueryWords, processedQuery, processedQueryWords, fuzzyLookup) # dokumen kandidat
+        similarityFn = fuzzyLookup.similarity # similarity dari hasil ekspansi
+        entryFeatures = getEntryFeatures()[0] # fitur precomputed
+    else: # scan linear
+        candidateIds = range(len(dataEntries)) # semua entry
+        fuzzyLookup = None # tanpa ekspansi
+        similarityFn = advancedFuzzySimilarity # hitung langsung
+        entryFeatures = None # fitur dihitung per entry
+    
+    # Optional: TF-IDF cosine dari index persisten sebagai strategi tambahan
+    tfidfScores = {} # docId -> skor TF-IDF
+    if useTfidf: # strategi TF-IDF aktif
+        tfidfIndex = getTfidfIndex() # ambil index TF-IDF
+        if tfidfIndex is not None: # index tersedia
+            tfidfScores = dict(tfidfIndex.search(userQuery, TFIDF_TOP_K)) # top-K TF-IDF
+            candidateIds = sorted(set(candidateIds) | set(tfidfScores)) # tambah ke kandidat
+    
+    # 3. Enhanced matching strategies with fuzzy support
+    queryArgs = (userQuery, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, threshold) # argumen query (string kecil)
+    scored = scoreCandidatesParallel(candidateIds, queryArgs, fuzzyLookup, tfidfScores, topK) if parallel and len(dataEntries) >= PARALLEL_MIN_ENTRIES else None # scoring paralel (None kalau pool tidak tersedia)
+    if scored is not None: # hasil process pool
+        candidates, candidateCount = scored # top-K + jumlah kandidat
+    elif earlyTermination and index is not None: # top-K dengan batas atas skor
+        candidates, candidateCount = scoreCandidatesTopK(candidateIds, index, fuzzyLookup, entryFeatures, queryArgs, tfidfScores, topK) # scoring dengan early termination
+    else: # scoring serial
+        for i in candidateIds: # loop entry kandidat
+            entry = dataEntries[i] # entry data
+            features = entryFeatures[i] if entryFeatures is not None else None # fitur entry
+            score, matchMethods = scoreEntry(entry, userQuery, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, threshold, similarityFn, features) # hitung skor entry
+            if i in tfidfScores: # dokumen ada di top-K TF-IDF
+                score += tfidfScores[i] * TFIDF_WEIGHT # tambah skor TF-IDF
+                matchMethods.append(f"tfidf({tfidfScores[i]:.2f})") # tambah method
+        
+            if score > 0: # ada score
+                candidates.append({ # tambah ke candidates
+                    'entry': entry, # entry data
+                    'score': score, # score matching
+                    'methods': matchMethods # methods yang dipakai
+                })    
+        # Sort by score
+        candidates.sort(key=lambda x: x['score'], reverse=True) # sort candidates by score
+        candidateCount = len(candidates) # jumlah candidates
+    
+    observeCandidates(candidateCount) # metric kandidat per query
+    logger.debug("Found %d candidates", candidateCount, extra={'candidates': candidateCount}) # log jumlah candidates
     
     if candidates: # ada candidates
         bestMatch = candidates[0] # ambil best match
-        print(f"[MATCHING] Best match: {bestMatch['entry']['content'][:100]}... (score: {bestMatch['score']:.2f}, methods: {bestMatch['methods']})") # log best match
-          # Format response
+        logger.debug("Best match: %.100s... (score: %.2f, methods: %s)", bestMatch['entry']['content'], bestMatch['score'], bestMatch['methods']) # log best match
+        # Format response
         response = formatResponse(bestMatch['entry'], candidates[:topK]) # format response
         return response # return response
     
     # Fallback to simple intents
-    print("[MATCHING] No good matches found, trying fallback") # log fallback
+    logger.debug("No good matches found, trying fallback") # log fallback
     return matchFallbackIntents(userQuery) # fallback ke simple intents
 
+@timed('match_batch', countComparisons=True)
+@usesRequestCorpus
+def matchWithCsvDataBatch(userQueries, threshold=0.3, topK=3, processedQueries=None, parallel=False): # matchWithCsvData untuk banyak query sekaligus
+    """Sama dengan [matchWithCsvData(q, threshold, topK) for q in userQueries] (strategi default index + early termination).
+    Ekspansi fuzzy dihitung sekali atas gabungan kata semua query, kandidat diambil dengan satu pass corpus,
+    batas atas skor semua query dihitung dengan satu pass kandidat. processedQueries (opsional, None per item
+    = preprocess di sini) dipakai kalau caller sudah menjalankan preprocess. parallel: setiap query di-scoring
+    di worker shard (sama dengan matchWithCsvData(parallel=True))."""
+    dataEntries = getProcessedData() # ambil processed data
+    if not dataEntries: # data kosong
+        logger.warning("No data loaded, using fallback") # log fallback
+        return [matchFallbackIntents(userQuery) for userQuery in userQueries] # fallback per query
+    index = getInvertedIndex() # ambil inverted index
+    if index is None: # index gagal dibangun
+        return [matchWithCsvData(userQuery, threshold, topK) for userQuery in userQueries] # scan linear per query
+
+    queryArgsList = [] # argumen query (sama dengan matchWithCsvData)
+    for position, userQuery in enumerate(userQueries): # loop query
+        userQueryLower = userQuery.lower() # lowercase user query
+        processedQuery = processedQueries[position] if processedQueries is not None else None # hasil preprocess caller
+        if processedQuery is None: # belum di-preprocess
+            try:
+                from preprocessing import preprocess # import preprocessing
+                processedQuery = preprocess(userQuery) # preprocess query
+            except Exception as e:
+                logger.warning("Preprocessing error: %s", e) # log error
+                processedQuery = userQueryLower # fallback ke lowercase
+        originalQueryWords = [word for word in userQueryLower.split() if len(word) > 1] # original words
+        processedQueryWords = [word for word in processedQuery.split() if len(word) > 1] # processed words
+        queryArgsList.append((userQuery, userQueryLower, processedQuery, originalQueryWords, processedQueryWords, threshold)) # argumen query
+
+    allQueryWords = [word for queryArgs in queryArgsList for word in queryArgs[3] + queryArgs[4]] # gabungan kata semua query
+    fuzzyLookup = index.buildFuzzyLookup(allQueryWords, cachedFuzzySimilarity, FUZZY_THRESHOLD) # ekspansi fuzzy sekali per kata unik
+    candidateLists = index.getCandidatesBatch([(queryArgs[1], queryArgs[3], queryArgs[2], queryArgs[4]) for queryArgs in queryArgsList], fuzzyLookup) # kandidat per query
+    rankedLists = None # top-K per query
+    if parallel and len(dataEntries) >= PARALLEL_MIN_ENTRIES: # scoring paralel per query
+        rankedLists = [scoreCandidatesParallel(candidateIds, queryArgs, fuzzyLookup, {}, topK) for candidateIds, queryArgs in zip(candidateLists, queryArgsList)] # top-K dari worker shard
+        if any(ranked is None for ranked in rankedLists): # pool tidak tersedia
+            rankedLists = None # scoring serial
+    if rankedLists is None: # scoring serial
+        rankedLists = scoreQueriesTopK(candidateLists, index, fuzzyLookup, getEntryFeatures()[0], queryArgsList, topK) # top-K per query
+
+    responses = [] # response urut query
+    for userQuery, (candidates, candidateCount) in zip(userQueries, rankedLists): # loop hasil
+        observeCandidates(candidateCount) # metric kandidat per query
+        if candidates: # ada candidates
+            responses.append(formatResponse(candidates[0]['entry'], candidates[:topK])) # format response
+        else: # tidak ada kandidat
+            responses.append(matchFallbackIntents(userQuery)) # fallback ke simple intents
+    return responses # response urut query
+
 def formatResponse(bestEntry, allCandidates): # format response dari data yang ditemukan
     """Format response dari data yang ditemukan"""
     
@@ -550,17 +1069,31 @@ def matchFallbackIntents(userText): # match ke fallback intents
     
     return None # ga ada match
 
+NO_MATCH_ANSWER = "Maaf, saya tidak dapat menemukan informasi yang sesuai dengan pertanyaan Anda. Bisa Anda coba pertanyaan lain tentang ITB?" # jawaban kalau tidak ada match sama sekali
+
 def matchIntent(userText): # main matching function - entry point
     """Main matching function - entry point"""
-    print(f"[MATCHING] matchIntent called with: '{userText}'") # log function call
+    logger.debug("matchIntent called with: '%s'", userText) # log function call
     
     # Try matching with CSV data first
-    result = matchWithCsvData(userText) # match dengan csv data
+    result = matchWithCsvData(userText, parallel=PARALLEL_ENABLED) # match dengan csv data (MATCH_PARALLEL=1: worker shard)
     
     if result: # ada result
-        print(f"[MATCHING] Found match: {result[:100]}...") # log result
+        logger.debug("Found match: %.100s...", result) # log result
         return result # return result
     
     # Ultimate fallback
-    print("[MATCHING] No matches found, returning default response") # log fallback
-    return "Maaf, saya tidak dapat menemukan informasi yang sesuai dengan pertanyaan Anda. Bisa Anda coba pertanyaan lain tentang ITB?" # return default
+    logger.debug("No matches found, returning default response") # log fallback
+    return NO_MATCH_ANSWER # return default
+
+def matchIntentBatch(userTexts, processedQueries=None): # matchIntent untuk banyak pertanyaan
+    """Sama dengan [matchIntent(text) for text in userTexts] lewat matchWithCsvDataBatch"""
+    return [result if result else NO_MATCH_ANSWER for result in matchWithCsvDataBatch(userTexts, processedQueries=processedQueries, parallel=PARALLEL_ENABLED)] # default kalau tidak ada match
+
+def warmUpMatcher(): # load corpus + index, fork worker scoring kalau MATCH_PARALLEL aktif
+    """Dipanggil saat startup sebelum ada request thread. Return inverted index (None kalau gagal dibangun)"""
+    index = getInvertedIndex() # corpus + fitur + index
+    corpus = getCorpus() # corpus aktif
+    if index is not None and wantsScoringPool(corpus): # scoring paralel aktif
+        startScoringPool(corpus) # fork worker sekarang, bukan di request pertama
+    return index # return index
@@ -1,30 +1,40 @@
 """
 Advanced NLP-based Intent Detection untuk pemahaman bahasa manusia yang natural
 """
-import re
-import nltk
-import pandas as pd
 import os
+import sys
+import threading
+import time
 from collections import Counter
 from difflib import SequenceMatcher
 from typing import Dict, List, Tuple, Set, Optional
 import math
 
-# Download required NLTK data (jalankan sekali)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    try:
-        nltk.download('punkt', quiet=True)
-    except:
-        pass
+currentDir = os.path.dirname(os.path.abspath(__file__)) # direktori machinelearning
+if currentDir not in sys.path: # buat import modul sibling
+    sys.path.append(currentDir) # tambah ke Python path
+from semanticMatcher import CompiledSemanticMatcher # matcher semantik yang di-compile
+from lruCache import LruCache # cache LRU thread-safe
+from dataLoader import loadCsvColumns, corpusStamp, fileStamp, resolveProcessedFile, CORPUS_PATH # load kolom CSV (lewat snapshot biner kalau ada) + corpus aktif/manifest
+from linkIndex import LinkIndex # index link per kategori
+from textNormalizer import normalizeQuery # engine normalisasi teks
+from structuredLog import getLogger # logger terstruktur
+from pipelineMetrics import timed # metrics per stage
+
+logger = getLogger('nlp') # logger stage nlp
+
+SIMILARITY_CACHE_SIZE = int(os.environ.get('SIMILARITY_CACHE_SIZE', '50000')) # kapasitas cache similarity per detector
 
 class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
-    def __init__(self): # konstruktor detector
+    def __init__(self, datasetPath: Optional[str] = None): # konstruktor detector (datasetPath: CSV buat link, default corpus aktif)
+        self.similarityCache = LruCache(SIMILARITY_CACHE_SIZE) # memo (kata1, kata2) -> ratio, dipakai bersama request thread
+        
         # Load dataset untuk link references
         self.datasetLoaded = False # flag dataset udah dimuat
-        self.datasetDf = None # dataframe dataset
-        self.loadDataset() # muat dataset
+        self.linkIndex = None # index link per kategori (pengganti DataFrame dataset)
+        self.datasetPath = None # path dataset yang dimuat
+        self.pinnedDataset = datasetPath is not None # dataset eksplisit (tidak mengikuti manifest)
+        self.loadDataset(datasetPath) # muat dataset
         
         # Semantic word embeddings (simplified)
         self.semanticClusters = { # cluster kata semantik buat grouping
@@ -81,6 +91,9 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
                 'weight': 0.7 # bobot lebih rendah
             }
         }        
+        # Compile cluster + keyword intent sekali (automaton exact + index fuzzy)
+        self.semanticMatcher = self.compileSemanticMatcher() # matcher semantik
+        
         # Predefined answers
         self.answers = { # jawaban predefined buat intent
             'kepanjanganItb': "ITB adalah singkatan dari Institut Teknologi Bandung, yaitu perguruan tinggi teknik terkemuka di Indonesia yang didirikan pada tahun 1959.", # jawaban kepanjangan
@@ -89,27 +102,25 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
             'infoUmumItb': "Institut Teknologi Bandung (ITB) adalah perguruan tinggi teknik terkemuka di Indonesia yang didirikan tahun 1959. ITB memiliki 12 fakultas dengan berbagai program studi teknik dan sains, berlokasi di Bandung, Jawa Barat." # jawaban info umum
         }
     
-    def loadDataset(self): # muat dataset csv buat akses link
-        """Load dataset CSV untuk mencari link yang relevan"""
+    def loadDataset(self, datasetPath: Optional[str] = None): # muat dataset csv buat akses link
+        """Load dataset CSV untuk mencari link yang relevan (datasetPath eksplisit tidak pakai fallback direktori)"""
         try:
             # coba muat high quality dataset dulu (dari working directory ML)
-            possiblePaths = [ # list path yang mungkin
-                'database/processed/itb_chatbot_high_quality_20250621_190153.csv',
-                '../database/processed/itb_chatbot_high_quality_20250621_190153.csv',
-                '../../database/processed/itb_chatbot_high_quality_20250621_190153.csv',
-                os.path.join(os.path.dirname(__file__), 'database', 'processed', 'itb_chatbot_high_quality_20250621_190153.csv'),
-                os.path.join(os.path.dirname(__file__), '..', 'database', 'processed', 'itb_chatbot_high_quality_20250621_190153.csv')
+            possiblePaths = [datasetPath] if datasetPath else [ # list path yang mungkin
+                CORPUS_PATH, # corpus override dataLoader
+                resolveProcessedFile() # file high quality dari manifest build corpus (dibaca sekarang, bukan saat import)
             ]
             
             for highQualityPath in possiblePaths: # coba setiap path
-                if os.path.exists(highQualityPath): # kalau file ada
-                    self.datasetDf = pd.read_csv(highQualityPath) # muat dataset
+                if highQualityPath and os.path.exists(highQualityPath): # kalau file ada
+                    self.linkIndex = self.buildLinkIndex(highQualityPath) # muat dataset jadi index link
                     self.datasetLoaded = True # set flag loaded
-                    print(f"Dataset loaded from {highQualityPath}: {len(self.datasetDf)} records") # konfirmasi loaded
+                    self.datasetPath = os.path.abspath(highQualityPath) # simpan path dataset
+                    logger.info("Dataset loaded from %s: %d records", highQualityPath, self.linkIndex.rowCount) # konfirmasi loaded
                     return # keluar kalau berhasil
             
             # kalau tidak ada yang cocok, coba cari di direktori processed
-            processedDirs = [ # list direktori processed yang mungkin
+            processedDirs = [] if datasetPath else [ # list direktori processed yang mungkin
                 'database/processed/',
                 '../database/processed/',
                 '../../database/processed/',
@@ -123,21 +134,27 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
                     if csvFiles: # kalau ada file
                         latestFile = sorted(csvFiles)[-1] # ambil file terbaru
                         filePath = os.path.join(processedDir, latestFile) # gabung path
-                        self.datasetDf = pd.read_csv(filePath) # muat dataset
+                        self.linkIndex = self.buildLinkIndex(filePath) # muat dataset jadi index link
                         self.datasetLoaded = True # set flag loaded
-                        print(f"Dataset loaded from {filePath}: {len(self.datasetDf)} records") # konfirmasi loaded
+                        self.datasetPath = os.path.abspath(filePath) # simpan path dataset
+                        logger.info("Dataset loaded from %s: %d records", filePath, self.linkIndex.rowCount) # konfirmasi loaded
                         return # keluar kalau berhasil
             
-            print("No high quality dataset found in any location") # tidak ada dataset
+            logger.warning("No high quality dataset found in any location") # tidak ada dataset
             self.datasetLoaded = False # set flag tidak loaded
             
         except Exception as e: # handle error
-            print(f"Error loading dataset: {e}") # print error
+            logger.error("Error loading dataset: %s", e) # log error
             self.datasetLoaded = False # set flag tidak loaded
     
+    def buildLinkIndex(self, csvPath: str) -> LinkIndex: # kolom dataset -> index link (DataFrame tidak disimpan)
+        columns = loadCsvColumns(csvPath, ['category', 'content', 'links', 'quality_score']) # kolom yang dipakai findRelevantLinks
+        return LinkIndex(columns['category'], columns['content'], columns['links'], columns['quality_score']) # build index
+
+    @timed('find_relevant_links')
     def findRelevantLinks(self, intent: str, query: str, topK: int = 3) -> List[Dict[str, str]]: # cari link yang relevan
         """Cari link ITB yang relevan berdasarkan intent dan query"""
-        if not self.datasetLoaded or self.datasetDf is None: # kalau dataset tidak loaded
+        if not self.datasetLoaded or self.linkIndex is None: # kalau dataset tidak loaded
             return [] # return kosong
         
         relevantLinks = [] # list link yang relevan
@@ -154,113 +171,56 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
             
             targetCategories = categoryMapping.get(intent, ['umum']) # ambil kategori target
             
-            # filter dataset berdasarkan kategori
-            filteredDf = self.datasetDf[self.datasetDf['category'].isin(targetCategories)] # filter by category
-            
-            # filter yang punya link (bukan kosong)
-            filteredDf = filteredDf[filteredDf['links'].notna() & (filteredDf['links'] != '')] # filter yang ada link
-            
-            if len(filteredDf) == 0: # kalau tidak ada data
-                return [] # return kosong
-            
-            # scoring berdasarkan relevansi dengan query
+            # scoring berdasarkan relevansi dengan query (partisi kategori + postings word di index)
             queryWords = self.preprocessText(query).split() # split query jadi words
-            
-            scores = [] # list scores
-            for idx, row in filteredDf.iterrows(): # loop setiap row
-                score = 0.0 # skor awal
-                content = str(row['content']).lower() # content lowercase
-                
-                # scoring berdasarkan kecocokan kata
-                for word in queryWords: # loop setiap word di query
-                    if word in content: # kalau word ada di content
-                        score += 1.0 # tambah skor
-                
-                # bonus skor berdasarkan quality_score
-                qualityScore = row.get('quality_score', 0) # ambil quality score
-                score += qualityScore / 100.0  # normalize quality score
-                
-                scores.append((idx, score)) # tambah ke list scores
-            
-            # sort berdasarkan score tertinggi
-            scores.sort(key=lambda x: x[1], reverse=True) # sort descending
+            index = self.linkIndex # index link
             
             # ambil top K results
-            for idx, score in scores[:topK]: # ambil top K
-                row = filteredDf.loc[idx] # ambil row
-                links = str(row['links']) # ambil links
-                
-                # parse multiple links (dipisah spasi atau koma)
-                linkList = re.split(r'[,\s]+', links) # split links
-                linkList = [link.strip() for link in linkList if link.strip() and link.startswith('http')] # filter valid links
+            for rowId, score in index.topRows(targetCategories, queryWords, topK): # top K baris berlink
+                linkList = index.linkLists[rowId] # link yang sudah di-parse
                 
                 if linkList: # kalau ada valid links
+                    content = index.contents[rowId] # content asli
                     relevantLinks.append({ # tambah ke result
-                        'content': str(row['content'])[:100] + '...' if len(str(row['content'])) > 100 else str(row['content']), # content preview
+                        'content': content[:100] + '...' if len(content) > 100 else content, # content preview
                         'links': linkList[:2], # maksimal 2 link
-                        'category': row['category'], # kategori
+                        'category': index.categories[rowId], # kategori
                         'score': score # skor relevansi
                     })
             
         except Exception as e: # handle error
-            print(f"Error finding relevant links: {e}") # print error
+            logger.warning("Error finding relevant links: %s", e) # log error
         
         return relevantLinks # return hasil
     def preprocessText(self, text: str) -> str: # preprocessing text buat normalisasi
         """Advanced text preprocessing"""
-        # Convert to lowercase
-        text = text.lower().strip() # lowercase dan trim whitespace
-        
-        # Handle common typos and variations
-        typoCorrections = { # koreksi typo umum
-            'gimana': 'bagaimana', # gimana -> bagaimana
-            'apaan': 'apa', # apaan -> apa
-            'dimana': 'di mana', # dimana -> di mana
-            'napa': 'apa', # napa -> apa
-            'gmana': 'bagaimana' # gmana -> bagaimana
-        }        
-        for typo, correct in typoCorrections.items(): # loop koreksi typo
-            text = re.sub(r'\b' + typo + r'\b', correct, text) # replace typo dengan benar
-          # Remove extra whitespace and punctuation
-        text = re.sub(r'[^\w\s]', ' ', text) # hapus punctuation
-        text = re.sub(r'\s+', ' ', text) # normalize whitespace
-        
-        return text.strip() # return cleaned text
+        # lowercase, koreksi typo (token utuh), punctuation jadi spasi, rapikan whitespace
+        return normalizeQuery(text) # satu pass lewat engine normalisasi
+    def compileSemanticMatcher(self) -> CompiledSemanticMatcher: # compile semanticClusters dan keyword intent
+        """Compile ulang matcher (panggil lagi kalau semanticClusters/intentRules diubah)"""
+        intentKeywords = [keyword for rules in self.intentRules.values() for keyword in rules['keywords']] # keyword intent
+        return CompiledSemanticMatcher(self.semanticClusters, intentKeywords) # matcher baru
     def extractSemanticFeatures(self, text: str) -> Dict[str, List[str]]: # ekstrak fitur semantik dari text
         """Extract semantic features from text"""
-        features = { # dict fitur yang ditemukan
-            'questionWords': [], # kata tanya
-            'entities': [], # entitas
-            'informalPatterns': [], # pola informal
-            'keywords': [] # kata kunci
-        }
-        
-        words = text.split() # split jadi kata-kata
-        
-        # Find semantic matches with exact and fuzzy matching
-        for category, clusters in self.semanticClusters.items(): # loop semua kategori
-            for clusterName, wordList in clusters.items(): # loop cluster dalam kategori
-                for word in wordList: # loop kata dalam cluster
-                    # Exact match
-                    if word in text: # kalo ada exact match
-                        if clusterName not in features[category]: # belum ada di features
-                            features[category].append(clusterName) # tambah ke features
-                        if word not in features['keywords']: # belum ada di keywords
-                            features['keywords'].append(word) # tambah ke keywords
-                    # Fuzzy match for typos
-                    else:
-                        for textWord in words: # loop kata di text
-                            similarity = self.calculateSimilarity(word, textWord) # hitung similarity
-                            if similarity > 0.8:  # High similarity for feature extraction
-                                if clusterName not in features[category]: # belum ada di features
-                                    features[category].append(clusterName) # tambah ke features
-                                if textWord not in features['keywords']: # belum ada di keywords
-                                    features['keywords'].append(textWord) # tambah ke keywords
-        
-        return features # return semua fitur
+        return self.semanticMatcher.match(text, self.calculateSimilarity).features() # satu pass lewat matcher
+    
     def calculateSimilarity(self, word1: str, word2: str) -> float: # hitung similarity antar kata
         """Calculate similarity between words"""
-        return SequenceMatcher(None, word1, word2).ratio() # pake sequence matcher
+        key = (word1, word2) # ratio tidak simetris, urutan kata jadi bagian key
+        similarity = self.similarityCache.get(key) # cek memo dulu
+        if similarity is None: # belum pernah dihitung
+            similarity = SequenceMatcher(None, word1, word2).ratio() # pake sequence matcher
+            self.similarityCache.put(key, similarity) # simpan ke memo
+        return similarity # return similarity
+    
+    def clearCaches(self): # kosongkan memo yang diisi query (benchmark cold pass)
+        self.similarityCache.clear() # memo similarity kata
+        if self.linkIndex is not None: # index link dimuat
+            self.linkIndex.postings.clear() # memo postings substring
+    
+    def getCacheStats(self) -> Dict[str, Dict]: # statistik cache detector
+        """Hit/miss/eviction cache similarity buat sizing SIMILARITY_CACHE_SIZE"""
+        return {'similarity': self.similarityCache.stats()} # statistik cache
     
     def fuzzyMatchConcepts(self, text: str, conceptWords: List[str]) -> float: # fuzzy matching konsep
         """Fuzzy matching untuk konsep"""
@@ -273,10 +233,23 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
                     maxSimilarity = max(maxSimilarity, similarity) # update max similarity
         
         return maxSimilarity # return similarity terbesar
+    @timed('detect_intent_nlp', countComparisons=True)
     def detectIntentNlp(self, query: str) -> Tuple[str, float, Dict]: # deteksi intent pake nlp
         """Advanced NLP-based intent detection"""
         processedQuery = self.preprocessText(query) # preprocess query dulu
-        features = self.extractSemanticFeatures(processedQuery) # ekstrak fitur semantik
+        semanticMatch = self.semanticMatcher.match(processedQuery, self.calculateSimilarity) # match phrase sekali
+        return self.scoreIntents(semanticMatch) # skor semua intent
+
+    @timed('detect_intent_nlp_batch', countComparisons=True)
+    def detectIntentNlpBatch(self, queries: List[str]) -> List[Tuple[str, float, Dict]]: # deteksi intent banyak query sekaligus
+        """Sama dengan [detectIntentNlp(q) for q in queries], index fuzzy diprobe sekali per token unik semua query"""
+        processedQueries = [self.preprocessText(query) for query in queries] # preprocess semua query
+        semanticMatches = self.semanticMatcher.matchMany(processedQueries, self.calculateSimilarity) # match phrase semua query
+        return [self.scoreIntents(semanticMatch) for semanticMatch in semanticMatches] # skor intent per query
+
+    def scoreIntents(self, semanticMatch) -> Tuple[str, float, Dict]: # skor intentRules dari hasil match semantik
+        """Return (intent terbaik, skor, skor semua intent) untuk satu query yang sudah di-match"""
+        features = semanticMatch.features() # ekstrak fitur semantik
         
         intentScores = {} # dict skor semua intent        
         for intent, rules in self.intentRules.items(): # loop semua intent dan rules
@@ -292,7 +265,7 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
                 else:
                     # Fuzzy matching for must_have
                     conceptWords = self.semanticClusters['entities'].get(mustConcept, []) # ambil concept words
-                    fuzzyScore = self.fuzzyMatchConcepts(processedQuery, conceptWords) # fuzzy match
+                    fuzzyScore = semanticMatch.fuzzyMatchConcepts(conceptWords) # fuzzy match
                     if fuzzyScore > 0.7: # threshold fuzzy
                         mustHaveScore += fuzzyScore # tambah fuzzy score
                         matchedFeatures.append(f"fuzzy_must:{mustConcept}({fuzzyScore:.2f})") # tambah ke matched
@@ -319,7 +292,7 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
                         elif shouldConcept in self.semanticClusters['entities']: # ada di entities
                             allWords = self.semanticClusters['entities'][shouldConcept] # ambil words
                         
-                        fuzzyScore = self.fuzzyMatchConcepts(processedQuery, allWords) # fuzzy match
+                        fuzzyScore = semanticMatch.fuzzyMatchConcepts(allWords) # fuzzy match
                         if fuzzyScore > 0.6: # threshold fuzzy
                             groupScore = fuzzyScore # set grup score
                             matchedFeatures.append(f"fuzzy_should:{shouldConcept}({fuzzyScore:.2f})") # tambah ke matched
@@ -333,12 +306,12 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
             # Keyword matching with fuzzy support
             keywordScore = 0.0 # skor keyword matching
             for keyword in rules['keywords']: # loop semua keywords
-                if keyword in processedQuery: # exact match keyword
+                if semanticMatch.containsPhrase(keyword): # exact match keyword
                     keywordScore += 1.0 # tambah skor
                     matchedFeatures.append(f"keyword:{keyword}") # tambah ke matched
                 else:
                     # Fuzzy keyword matching
-                    fuzzyScore = self.fuzzyMatchConcepts(processedQuery, [keyword]) # fuzzy match keyword
+                    fuzzyScore = semanticMatch.fuzzyMatchConcepts([keyword]) # fuzzy match keyword
                     if fuzzyScore > 0.7: # threshold fuzzy keyword
                         keywordScore += fuzzyScore # tambah fuzzy score
                         matchedFeatures.append(f"fuzzy_keyword:{keyword}({fuzzyScore:.2f})") # tambah ke matched
@@ -401,7 +374,14 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
     def getAnswerWithLinks(self, query: str) -> Dict[str, any]: # method utama buat dapetin jawaban dengan link
         """Method utama untuk mendapatkan jawaban dengan link yang relevan"""
         intent, confidence, _ = self.detectIntentNlp(query) # deteksi intent
-        
+        return self.answerForIntent(query, intent, confidence) # jawaban + link
+
+    def getAnswersWithLinks(self, queries: List[str]) -> List[Dict[str, any]]: # getAnswerWithLinks untuk banyak query
+        """Sama dengan [getAnswerWithLinks(q) for q in queries] dengan deteksi intent batch"""
+        detections = self.detectIntentNlpBatch(queries) # deteksi intent semua query
+        return [self.answerForIntent(query, intent, confidence) for query, (intent, confidence, _) in zip(queries, detections)] # jawaban per query
+
+    def answerForIntent(self, query: str, intent: str, confidence: float) -> Dict[str, any]: # jawaban dari intent yang sudah terdeteksi
         if confidence < 0.3: # kalau confidence rendah
             return { # return default response
                 'answer': "Maaf, saya kurang memahami pertanyaan Anda. Bisa tolong diperjelas?", # jawaban default
@@ -417,6 +397,81 @@ class NaturalLanguageIntentDetector: # detector nlp buat intent recognition
         
         return result # return hasil lengkap
 
+# Registry detector global - satu instance dipakai bersama semua request thread
+# dan worker (dibangun sebelum fork kalau app di-preload)
+DATASET_CHECK_INTERVAL = 5.0 # jeda minimal (detik) antar cek perubahan dataset
+
+_detectorInstance = None # instance detector aktif (read-only setelah dibangun)
+_detectorStamp = None # stamp dataset saat detector dibangun
+_detectorFailedStamp = None # stamp dataset yang gagal dimuat saat reload (dicoba lagi hanya kalau berubah lagi)
+_detectorLastCheck = 0.0 # waktu terakhir cek stamp dataset
+_detectorLock = threading.Lock() # lock buat build/swap detector
+
+def _getDatasetStamp(detector): # stamp (versi manifest, stamp file) dataset yang seharusnya dipakai detector
+    """Detector default mengikuti manifest: corpus di-resolve ulang, jadi build baru (file baru) terdeteksi"""
+    if detector.pinnedDataset: # dataset eksplisit (benchmark / corpus sintetis)
+        return (None, fileStamp(detector.datasetPath)) # hanya file itu
+    stamp = corpusStamp() # versi corpus aktif (sama dengan yang dipakai matcher)
+    if stamp[1] is None: # manifest belum ada / file hilang
+        return (stamp[0], fileStamp(detector.datasetPath)) # file hasil fallback direktori
+    return stamp # versi build + file
+
+def preloadNlpIntentDetector(): # bangun detector di startup (sebelum fork worker)
+    """Build detector sekali dan daftarkan ke registry global"""
+    global _detectorInstance, _detectorStamp, _detectorLastCheck # pake registry global
+    with _detectorLock: # cegah build ganda
+        if _detectorInstance is None: # belum ada detector
+            detector = NaturalLanguageIntentDetector() # build detector baru
+            _detectorStamp = _getDatasetStamp(detector) # catat stamp dataset
+            _detectorLastCheck = time.monotonic() # catat waktu cek
+            _detectorInstance = detector # publish detector
+        return _detectorInstance # return detector aktif
+
+def reloadNlpIntentDetector(force: bool = False): # hot-swap detector kalau dataset berubah
+    """Rebuild detector kalau file dataset atau versi manifest berubah, lalu swap secara atomik"""
+    global _detectorInstance, _detectorStamp, _detectorFailedStamp, _detectorLastCheck # pake registry global
+    with _detectorLock: # satu thread saja yang rebuild
+        _detectorLastCheck = time.monotonic() # catat waktu cek
+        current = _detectorInstance # detector aktif
+        targetStamp = _getDatasetStamp(current) if current is not None else None # stamp dataset sebelum build
+        if current is not None and not force: # cek perlu rebuild atau tidak
+            if targetStamp in (_detectorStamp, _detectorFailedStamp): # dataset tidak berubah / sudah gagal dimuat
+                return current # pakai detector lama
+
+        detector = NaturalLanguageIntentDetector() # build detector baru (request lain tetap jalan pakai yang lama)
+        if current is not None and not detector.datasetLoaded and current.datasetLoaded: # dataset baru gagal dimuat
+            _detectorFailedStamp = targetStamp # tidak di-rebuild lagi sampai dataset berubah lagi
+            logger.error("Dataset reload failed, keeping previous detector") # log gagal reload
+            return current # pertahankan detector lama
+        _detectorFailedStamp = None # reload sukses
+        _detectorStamp = _getDatasetStamp(detector) # stamp dataset baru
+        _detectorInstance = detector # swap referensi (atomik)
+        return detector # return detector baru
+
+def setNlpIntentDetector(detector): # pasang detector yang sudah dibangun (benchmark / corpus sintetis)
+    """Ganti detector aktif tanpa rebuild; stamp diambil dari dataset detector itu"""
+    global _detectorInstance, _detectorStamp, _detectorFailedStamp, _detectorLastCheck # pake registry global
+    with _detectorLock: # sama dengan swap di reload
+        _detectorStamp = _getDatasetStamp(detector) # stamp dataset detector baru
+        _detectorFailedStamp = None # dataset detector baru dianggap belum pernah gagal
+        _detectorLastCheck = time.monotonic() # catat waktu cek
+        _detectorInstance = detector # swap referensi (atomik)
+
 # Factory function
-def getNlpIntentDetector(): # factory function buat detector
-    return NaturalLanguageIntentDetector() # return instance detector
+def getNlpIntentDetector(): # ambil detector dari registry global
+    """Return detector bersama, rebuild otomatis kalau dataset berubah"""
+    global _detectorLastCheck # update waktu cek
+    detector = _detectorInstance # baca referensi sekali (tanpa lock)
+    if detector is None: # belum di-preload
+        return preloadNlpIntentDetector() # build sekarang
+
+    now = time.monotonic() # waktu sekarang
+    if now - _detectorLastCheck >= DATASET_CHECK_INTERVAL: # waktunya cek dataset
+        _detectorLastCheck = now # catat waktu cek
+        if _getDatasetStamp(detector) not in (_detectorStamp, _detectorFailedStamp): # dataset berubah (dan belum gagal dimuat)
+            return reloadNlpIntentDetector() # hot-swap detector
+    return detector # return detector aktif
+
+def getDatasetVersion(): # versi dataset detector aktif (buat invalidasi cache response)
+    """Stamp (versi manifest, (path, mtime, size)) dataset dari detector yang sedang dipakai"""
+    return _detectorStamp # berubah setiap kali detector di-hot-swap
@@ -0,0 +1,145 @@
+# Pipeline Metrics - counter + histogram per stage pipeline, diekspor sebagai Prometheus text
+"""
+Registry metrics kecil tanpa dependency (format exposition Prometheus 0.0.4).
+Histogram menyimpan hitungan per bucket (bisect + satu lock per metric), jadi observe
+cukup murah untuk dibiarkan aktif di production. Set METRICS_ENABLED=0 untuk mematikan.
+
+Stage yang diukur: preprocess, detect_intent_nlp, find_relevant_links, match,
+request (seluruh detectIntentService), dan versi batch detect_intent_nlp_batch,
+match_batch, request_batch (seluruh detectIntentServiceBatch). Jumlah fuzzy comparison dikumpulkan per
+thread (countFuzzyComparisons) lalu di-observe per query oleh stage yang dibungkus timed().
+"""
+import functools
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') != '0' # instrumentasi aktif
+METRIC_PREFIX = 'itbchatbot' # prefix nama metric
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0) # detik
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000) # jumlah kandidat / comparison
+
+def formatValue(value: float) -> str: # angka versi Prometheus
+    if value == math.inf: # bucket terakhir
+        return '+Inf' # infinity
+    if float(value).is_integer(): # bilangan bulat
+        return str(int(value)) # tanpa .0
+    return repr(float(value)) # float presisi penuh
+
+def formatLabels(labelNames: Sequence[str], labelValues: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str: # {a="x",b="y"}
+    pairs = list(zip(labelNames, labelValues)) + ([extra] if extra else []) # pasangan label
+    if not pairs: # tanpa label
+        return '' # string kosong
+    escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') # escape nilai label
+    return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}' # label set
+
+class Counter: # counter monoton per label set
+    def __init__(self, name: str, helpText: str, labelNames: Sequence[str] = ()): # konstruktor counter
+        self.name = name # nama metric
+        self.helpText = helpText # deskripsi
+        self.labelNames = tuple(labelNames) # nama label
+        self._values: Dict[Tuple[str, ...], float] = {} # label values -> nilai
+        self._lock = threading.Lock() # lock update
+
+    def inc(self, amount: float = 1.0, **labels): # tambah counter
+        key = tuple(str(labels.get(name, '')) for name in self.labelNames) # label values
+        with self._lock: # update atomik
+            self._values[key] = self._values.get(key, 0.0) + amount # tambah nilai
+
+    def render(self) -> List[str]: # baris exposition
+        lines = [f"# HELP {self.name} {self.helpText}", f"# TYPE {self.name} counter"] # header
+        with self._lock: # snapshot konsisten
+            items = sorted(self._values.items()) # urut label
+        for labelValues, value in items: # loop label set
+            lines.append(f"{self.name}{formatLabels(self.labelNames, labelValues)} {formatValue(value)}") # satu sample
+        return lines # return baris
+
+class Histogram: # histogram bucket kumulatif per label set
+    def __init__(self, name: str, helpText: str, buckets: Sequence[float], labelNames: Sequence[str] = ()): # konstruktor histogram
+        self.name = name # nama metric
+        self.helpText = helpText # deskripsi
+        self.buckets = tuple(sorted(buckets)) # batas atas bucket (tanpa +Inf)
+        self.labelNames = tuple(labelNames) # nama label
+        self._series: Dict[Tuple[str, ...], List[float]] = {} # label values -> [count per bucket..., +Inf, sum]
+        self._lock = threading.Lock() # lock update
+
+    def observe(self, value: float, **labels): # catat satu observasi
+        key = tuple(str(labels.get(name, '')) for name in self.labelNames) # label values
+        bucketIndex = bisect_left(self.buckets, value) # bucket pertama dengan batas >= value (le)
+        with self._lock: # update atomik
+            series = self._series.get(key) # seri label ini
+            if series is None: # seri baru
+                series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0] # bucket + Inf + sum
+            series[bucketIndex] += 1 # hitungan bucket (non-kumulatif, dijumlah saat render)
+            series[-1] += value # total nilai
+
+    def render(self) -> List[str]: # baris exposition
+        lines = [f"# HELP {self.name} {self.helpText}", f"# TYPE {self.name} histogram"] # header
+        with self._lock: # snapshot konsisten
+            items = sorted((key, list(series)) for key, series in self._series.items()) # salinan seri
+        for labelValues, series in items: # loop label set
+            cumulative = 0 # hitungan kumulatif
+            for bound, count in zip(self.buckets + (math.inf,), series[:-1]): # loop bucket
+                cumulative += count # kumulatif sampai bucket ini
+                lines.append(f"{self.name}_bucket{formatLabels(self.labelNames, labelValues, ('le', formatValue(bound)))} {cumulative}") # sample bucket
+            lines.append(f"{self.name}_sum{formatLabels(self.labelNames, labelValues)} {formatValue(series[-1])}") # total nilai
+            lines.append(f"{self.name}_count{formatLabels(self.labelNames, labelValues)} {cumulative}") # jumlah observasi
+        return lines # return baris
+
+stageDuration = Histogram(f"{METRIC_PREFIX}_stage_duration_seconds", "Latency per stage pipeline", LATENCY_BUCKETS, ('stage',)) # latency stage
+stageErrors = Counter(f"{METRIC_PREFIX}_stage_errors_total", "Exception per stage pipeline", ('stage',)) # error stage
+answersTotal = Counter(f"{METRIC_PREFIX}_answers_total", "Jawaban per cabang yang menjawab", ('source',)) # cabang penjawab
+matchCandidates = Histogram(f"{METRIC_PREFIX}_match_candidates", "Jumlah kandidat matchWithCsvData per query", COUNT_BUCKETS) # kandidat per query
+fuzzyComparisons = Histogram(f"{METRIC_PREFIX}_fuzzy_comparisons", "Jumlah similarity fuzzy penuh per query", COUNT_BUCKETS, ('stage',)) # fuzzy comparison per query
+
+REGISTRY = [stageDuration, stageErrors, answersTotal, matchCandidates, fuzzyComparisons] # urutan export
+
+_local = threading.local() # counter fuzzy comparison per thread
+
+def countFuzzyComparisons(count: int): # tambah jumlah similarity penuh di thread ini
+    _local.fuzzyComparisons = getattr(_local, 'fuzzyComparisons', 0) + count # akumulasi
+
+def takeFuzzyComparisons() -> int: # ambil lalu reset counter thread ini
+    count = getattr(_local, 'fuzzyComparisons', 0) # nilai sekarang
+    _local.fuzzyComparisons = 0 # reset
+    return count # return jumlah
+
+def timed(stage: str, countComparisons: bool = False) -> Callable: # decorator latency (+ fuzzy comparison) satu stage
+    def decorator(fn: Callable) -> Callable: # bungkus fungsi
+        if not METRICS_ENABLED: # instrumentasi mati
+            return fn # fungsi asli tanpa overhead
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs): # fungsi terukur
+            if countComparisons: # hitung comparison milik stage ini saja
+                outerCount = takeFuzzyComparisons() # simpan hitungan caller (stage luar)
+            start = time.perf_counter() # mulai timer
+            try:
+                return fn(*args, **kwargs) # jalankan stage
+            except Exception: # stage gagal
+                stageErrors.inc(stage=stage) # catat error
+                raise # lempar ulang
+            finally:
+                stageDuration.observe(time.perf_counter() - start, stage=stage) # catat latency
+                if countComparisons: # observe comparison stage ini
+                    fuzzyComparisons.observe(takeFuzzyComparisons(), stage=stage) # jumlah per query
+                    countFuzzyComparisons(outerCount) # kembalikan hitungan caller
+        return wrapper # return fungsi terukur
+    return decorator # return decorator
+
+def observeAnswer(source: str): # catat cabang yang menjawab
+    if METRICS_ENABLED: # instrumentasi aktif
+        answersTotal.inc(source=source or 'unknown') # tambah counter
+
+def observeCandidates(count: int): # catat jumlah kandidat satu query
+    if METRICS_ENABLED: # instrumentasi aktif
+        matchCandidates.observe(count) # observe histogram
+
+def renderMetrics() -> str: # semua metric dalam format Prometheus text
+    lines = [] # baris output
+    for metric in REGISTRY: # loop metric
+        lines.extend(metric.render()) # baris metric
+    return '\n'.join(lines) + '\n' # exposition text
@@ -1,17 +1,26 @@
 # Text Preprocessing Pipeline - Normalisasi teks
-import re  # Regular expression untuk pola text
 import csv  # CSV file handler
+import itertools  # Sambung sisa chunk saat resume
+import json  # Format checkpoint
+import os  # Path modul
+import sys  # Python path
+import time  # Timer progress
+from collections import deque  # Antrian chunk in-flight
+from concurrent.futures import ProcessPoolExecutor  # Worker preprocess paralel
+
+currentDir = os.path.dirname(os.path.abspath(__file__))  # Direktori machinelearning
+if currentDir not in sys.path:  # Buat import modul sibling
+    sys.path.append(currentDir)  # Tambah ke Python path
+import textNormalizer  # Engine normalisasi yang di-compile sekali
 
 # Daftar stopword bahasa Indonesia
-STOPWORDS = set([  # Set stopword untuk filter
-    'dan', 'di', 'ke', 'dari', 'yang', 'untuk', 'pada', 'dengan', 'atau', 'juga', 'sebagai', 'dalam', 'adalah', 'itu', 'ini', 'saya', 'kamu', 'kami', 'kita', 'mereka', 'akan', 'tidak', 'bisa', 'telah', 'sudah', 'belum', 'oleh', 'karena', 'agar', 'sehingga', 'supaya', 'tentang', 'tanpa', 'setelah', 'sebelum', 'sesudah', 'sejak', 'hingga', 'sampai', 'selama', 'antara', 'bahwa', 'namun', 'tetapi', 'jadi', 'hanya', 'masih', 'lagi', 'pun', 'lah', 'punya', 'ada'
-])
+STOPWORDS = textNormalizer.STOPWORDS  # Frozenset stopword (dipakai bersama engine)
 
 def caseFolding(text):  # Ubah ke huruf kecil
     return text.lower()  # Convert semua ke lowercase
 
 def removePunctuation(text):  # Hapus tanda baca
-    return re.sub(r'[^\w\s]', '', text)  # Hapus karakter non-alphanumeric
+    return textNormalizer.stripPunctuation(text)  # Hapus karakter non-alphanumeric (str.translate)
 
 def tokenize(text):  # Pecah jadi kata-kata
     return text.split()  # Split berdasarkan spasi
@@ -20,33 +29,134 @@ def removeStopwords(tokens):  # Hapus stopword
     return [word for word in tokens if word not in STOPWORDS]  # Filter stopword
 
 def stemming(tokens):  # Stemming pintar
-    result = []  # List hasil stemming
-    for word in tokens:  # Loop setiap kata
-        if len(word) <= 6:  # Kata pendek tetap utuh
-            result.append(word)  # Tambah tanpa perubahan
-        else:  # Kata panjang di-stem
-            importantTerms = ['akreditasi', 'universitas', 'fakultas', 'teknologi', 'bandung', 'institut', 'kampus', 'program', 'mahasiswa', 'penelitian']  # Term penting
-            if word in importantTerms or any(term in word for term in importantTerms):  # Cek term penting
-                result.append(word)  # Tetap utuh jika penting
-            else:  # Term biasa
-                result.append(word[:6])  # Potong jadi 6 karakter
-    return result  # Return hasil
+    return [textNormalizer.stemToken(word) for word in tokens]  # Kata pendek/penting utuh, sisanya dipotong 6 karakter (memo per token)
 
 def preprocess(text):  # Pipeline lengkap preprocessing
-    text = caseFolding(text)  # Langkah 1: lowercase
-    text = removePunctuation(text)  # Langkah 2: hapus punctuation
-    tokens = tokenize(text)  # Langkah 3: tokenisasi
-    tokens = removeStopwords(tokens)  # Langkah 4: hapus stopword
-    tokens = stemming(tokens)  # Langkah 5: stemming
-    return ' '.join(tokens)  # Join jadi string
-
-def preprocessing(inputCsv, outputCsv, textColumn):  # Preprocess CSV file
-    with open(inputCsv, 'r', encoding='utf-8') as infile, open(outputCsv, 'w', encoding='utf-8', newline='') as outfile:  # Buka file input/output
-        reader = csv.DictReader(infile)  # CSV reader
-        fieldnames = reader.fieldnames + ['preprocessed']  # Tambah kolom preprocessed
-        writer = csv.DictWriter(outfile, fieldnames=fieldnames)  # CSV writer
-        writer.writeheader()  # Tulis header
-        for row in reader:  # Loop setiap row
-            original = row[textColumn]  # Ambil text asli
-            row['preprocessed'] = preprocess(original)  # Preprocess text
-            writer.writerow(row)  # Tulis row baru
+    # lowercase -> hapus punctuation -> tokenisasi -> hapus stopword -> stemming, satu pass lewat engine
+    return textNormalizer.normalizeText(text)  # String hasil
+
+CHUNK_SIZE = 5000  # Jumlah baris per chunk yang dikirim ke worker
+CHECKPOINT_SUFFIX = '.checkpoint'  # File checkpoint di sebelah output
+
+def preprocessChunk(texts):  # Preprocess satu chunk text (jalan di worker process)
+    return [preprocess(text) for text in texts]  # Hasil urut sama dengan input
+
+def readChunks(reader, width, chunkSize):  # Baris CSV per chunk, dengan aturan DictReader/DictWriter
+    while True:  # Sampai file habis
+        chunk = []  # Baris chunk ini
+        for row in reader:  # Lanjut baca
+            if not row:  # Baris kosong dilewati DictReader
+                continue  # Skip
+            if len(row) > width:  # DictWriter menolak field tanpa nama kolom
+                raise ValueError(f"Baris {reader.line_num}: {len(row)} field, header {width} kolom")  # Error baris rusak
+            chunk.append(row + [''] * (width - len(row)))  # Field kurang jadi kosong (restval)
+            if len(chunk) >= chunkSize:  # Chunk penuh
+                break  # Kirim chunk
+        if not chunk:  # File habis
+            return  # Selesai
+        yield chunk  # Chunk berikutnya
+
+def sourceStamp(path):  # (ukuran, mtime) file input buat validasi resume
+    stat = os.stat(path)  # Info file
+    return [stat.st_size, stat.st_mtime_ns]  # Stamp
+
+def loadCheckpoint(checkpointPath, inputCsv, textColumn):  # Checkpoint valid untuk input ini, atau None
+    try:
+        with open(checkpointPath, 'r', encoding='utf-8') as checkpointFile:  # Buka checkpoint
+            checkpoint = json.load(checkpointFile)  # Parse JSON
+    except (OSError, ValueError):  # Tidak ada / rusak
+        return None  # Mulai dari awal
+    if checkpoint.get('inputStamp') != sourceStamp(inputCsv) or checkpoint.get('textColumn') != textColumn:  # Input berubah
+        raise ValueError(f"Checkpoint {checkpointPath} bukan untuk input/kolom ini, hapus dulu untuk mulai ulang")  # Tolak resume
+    return checkpoint  # Checkpoint valid
+
+def saveCheckpoint(checkpointPath, checkpoint):  # Tulis checkpoint secara atomik
+    tempPath = f"{checkpointPath}.tmp{os.getpid()}"  # File sementara
+    with open(tempPath, 'w', encoding='utf-8') as checkpointFile:  # Tulis JSON
+        json.dump(checkpoint, checkpointFile)  # Isi checkpoint
+    os.replace(tempPath, checkpointPath)  # Ganti atomik
+
+def preprocessing(inputCsv, outputCsv, textColumn, workers=None, chunkSize=CHUNK_SIZE, resume=False, progress=None):  # Preprocess CSV file (streaming, per chunk)
+    """Tulis outputCsv = inputCsv + kolom preprocessed, urutan baris sama, memori terbatas
+
+    Chunk dikirim ke process pool (workers=None -> jumlah CPU, <=1 -> tanpa pool) dengan
+    maksimal 2 chunk per worker in-flight. Setelah tiap chunk ditulis, output di-fsync lalu
+    checkpoint (baris selesai + ukuran output) disimpan; resume=True memotong output ke
+    checkpoint terakhir dan melanjutkan dari baris berikutnya. progress(rowsDone, seconds,
+    rowsPerSec) dipanggil setiap chunk. Return jumlah baris yang diproses.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers  # Jumlah worker
+    checkpointPath = outputCsv + CHECKPOINT_SUFFIX  # File checkpoint
+    checkpoint = loadCheckpoint(checkpointPath, inputCsv, textColumn) if resume and os.path.exists(outputCsv) else None  # Posisi resume
+    rowsDone = checkpoint['rowsDone'] if checkpoint else 0  # Baris yang sudah ditulis
+    if checkpoint:  # Buang output setelah checkpoint terakhir (chunk yang belum selesai)
+        with open(outputCsv, 'r+b') as partial:  # Buka output parsial
+            partial.truncate(checkpoint['outputBytes'])  # Potong ke checkpoint
+    elif os.path.exists(checkpointPath):  # Run baru: checkpoint lama menunjuk output yang akan ditimpa
+        os.remove(checkpointPath)  # Jangan sampai resume berikutnya memotong output baru
+
+    with open(inputCsv, 'r', encoding='utf-8', newline='') as infile, open(outputCsv, 'a' if checkpoint else 'w', encoding='utf-8', newline='') as outfile:  # Buka file input/output
+        reader = csv.reader(infile)  # CSV reader (field multiline aman)
+        fieldnames = next(reader, None)  # Header
+        if not fieldnames:  # File kosong
+            raise ValueError(f"{inputCsv} tidak punya header")  # Tanpa kolom
+        textIndex = fieldnames.index(textColumn)  # Posisi kolom text
+        writer = csv.writer(outfile)  # CSV writer
+        if not checkpoint:  # Output baru
+            writer.writerow(fieldnames + ['preprocessed'])  # Tulis header
+        chunks = readChunks(reader, len(fieldnames), chunkSize)  # Stream chunk
+        skipped = 0  # Baris yang sudah ada di output
+        while skipped < rowsDone:  # Lewati baris sebelum checkpoint (parse saja, tanpa preprocess)
+            chunk = next(chunks, None)  # Chunk berikutnya
+            if chunk is None:  # Input lebih pendek dari checkpoint
+                raise ValueError(f"Checkpoint {checkpointPath} melebihi jumlah baris input")  # Checkpoint tidak cocok
+            skipped += len(chunk)  # Hitung baris
+            if skipped > rowsDone:  # Checkpoint di tengah chunk (chunkSize berubah)
+                chunks = itertools.chain([chunk[len(chunk) - (skipped - rowsDone):]], chunks)  # Sisa chunk diproses
+                break  # Lanjut proses
+
+        def writeChunk(rows, results):  # Tulis satu chunk lalu simpan checkpoint
+            nonlocal rowsDone  # Counter baris
+            writer.writerows(row + [result] for row, result in zip(rows, results))  # Baris + kolom preprocessed
+            outfile.flush()  # Kosongkan buffer
+            os.fsync(outfile.fileno())  # Pastikan di disk sebelum checkpoint
+            rowsDone += len(rows)  # Baris selesai
+            saveCheckpoint(checkpointPath, {'inputStamp': sourceStamp(inputCsv), 'textColumn': textColumn, 'rowsDone': rowsDone, 'outputBytes': os.fstat(outfile.fileno()).st_size})  # Checkpoint
+            if progress:  # Laporan progress
+                elapsed = time.perf_counter() - start  # Waktu berjalan
+                progress(rowsDone, elapsed, (rowsDone - resumedRows) / elapsed if elapsed > 0 else 0.0)  # Baris, detik, baris/detik
+
+        start = time.perf_counter()  # Mulai timer
+        resumedRows = rowsDone  # Baris dari run sebelumnya (tidak dihitung di throughput)
+        if workers <= 1:  # Tanpa pool
+            for rows in chunks:  # Loop chunk
+                writeChunk(rows, preprocessChunk([row[textIndex] for row in rows]))  # Proses di process ini
+        else:  # Fan-out ke process pool, tulis berurutan
+            with ProcessPoolExecutor(max_workers=workers) as pool:  # Pool worker
+                pending = deque()  # (baris, future) urut input
+                for rows in chunks:  # Loop chunk
+                    pending.append((rows, pool.submit(preprocessChunk, [row[textIndex] for row in rows])))  # Kirim text saja
+                    if len(pending) >= workers * 2:  # Batas chunk in-flight (memori terbatas)
+                        rows, future = pending.popleft()  # Chunk paling lama
+                        writeChunk(rows, future.result())  # Tulis berurutan
+                while pending:  # Sisa chunk
+                    rows, future = pending.popleft()  # Chunk berikutnya
+                    writeChunk(rows, future.result())  # Tulis berurutan
+    if os.path.exists(checkpointPath):  # Selesai, checkpoint tidak dibutuhkan
+        os.remove(checkpointPath)  # Hapus checkpoint
+    return rowsDone  # Jumlah baris output
+
+if __name__ == '__main__':  # Jalankan langsung
+    import argparse  # Argumen CLI (hanya buat CLI)
+    parser = argparse.ArgumentParser(description='Preprocess kolom text CSV (streaming, paralel, bisa resume)')  # Argumen CLI
+    parser.add_argument('input', help='CSV input')  # Input
+    parser.add_argument('output', help='CSV output (input + kolom preprocessed)')  # Output
+    parser.add_argument('--column', default='content', help='kolom text yang di-preprocess')  # Kolom text
+    parser.add_argument('--workers', type=int, default=None, help='jumlah worker process (default jumlah CPU, 1 = tanpa pool)')  # Worker
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='baris per chunk')  # Ukuran chunk
+    parser.add_argument('--resume', action='store_true', help='lanjutkan dari checkpoint output')  # Resume
+    args = parser.parse_args()  # Parse argumen
+    csv.field_size_limit(sys.maxsize)  # Field scrape bisa sangat panjang
+    report = lambda rows, seconds, rate: print(f"{rows} baris, {seconds:.1f}s, {rate:.0f} baris/detik", file=sys.stderr)  # Progress ke stderr
+    total = preprocessing(args.input, args.output, args.column, args.workers, args.chunk_size, args.resume, report)  # Jalankan pipeline
+    print(f"{args.output}: {total} baris", file=sys.stderr)  # Ringkasan
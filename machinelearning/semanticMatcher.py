@@ -0,0 +1,179 @@
+# Semantic Matcher - semanticClusters dan keyword intent di-compile sekali jadi automaton + index fuzzy
+"""
+Pengganti loop kategori -> cluster -> kata -> token di extractSemanticFeatures dan
+fuzzyMatchConcepts. Exact phrase hit (word in text) dicari dengan satu pass Aho-Corasick
+atas query, typo hit (SequenceMatcher ratio) hanya dihitung untuk pasangan phrase/token
+yang lolos batas atas panjang dan frekuensi karakter. Urutan hasil sama persis dengan
+versi loop karena features dirakit ulang mengikuti urutan phrase yang di-compile.
+"""
+from collections import Counter, deque
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from pipelineMetrics import countFuzzyComparisons
+
+FUZZY_FEATURE_THRESHOLD = 0.8 # threshold typo di extractSemanticFeatures
+FUZZY_CONCEPT_THRESHOLD = 0.7 # threshold typo di fuzzyMatchConcepts (terendah yang dipakai)
+
+class AhoCorasickAutomaton: # automaton multi-pattern buat exact substring match
+    def __init__(self, patterns: Iterable[str]): # build trie + failure link
+        self.transitions: List[Dict[str, int]] = [{}] # state -> {char: state berikutnya}
+        self.outputs: List[Set[str]] = [set()] # state -> pattern yang selesai di state ini
+        for pattern in patterns: # masukkan pattern ke trie
+            if not pattern: # pattern kosong selalu substring
+                self.outputs[0].add(pattern) # match di root
+                continue # lanjut pattern berikutnya
+            state = 0 # mulai dari root
+            for char in pattern: # telusuri karakter
+                nextState = self.transitions[state].get(char) # state anak
+                if nextState is None: # belum ada
+                    nextState = len(self.transitions) # state baru
+                    self.transitions[state][char] = nextState # sambungkan
+                    self.transitions.append({}) # transisi state baru
+                    self.outputs.append(set()) # output state baru
+                state = nextState # pindah state
+            self.outputs[state].add(pattern) # pattern selesai di sini
+
+        self.failures = [0] * len(self.transitions) # failure link per state
+        queue = deque(self.transitions[0].values()) # BFS mulai dari anak root
+        while queue: # BFS trie
+            state = queue.popleft() # state sekarang
+            for char, child in self.transitions[state].items(): # loop anak
+                queue.append(child) # antrikan anak
+                fallback = self.failures[state] # mulai dari failure parent
+                while fallback and char not in self.transitions[fallback]: # naik sampai ada transisi
+                    fallback = self.failures[fallback] # failure berikutnya
+                target = self.transitions[fallback].get(char, 0) # state tujuan failure
+                self.failures[child] = target if target != child else 0 # failure link anak
+                self.outputs[child] |= self.outputs[self.failures[child]] # warisi output suffix
+
+    def findAll(self, text: str) -> Set[str]: # semua pattern yang muncul di text
+        """Set pattern yang merupakan substring text (sama dengan pattern in text)"""
+        found = set(self.outputs[0]) # pattern kosong
+        state = 0 # mulai dari root
+        transitions, failures, outputs = self.transitions, self.failures, self.outputs # akses lokal
+        for char in text: # satu pass atas text
+            while state and char not in transitions[state]: # ikuti failure link
+                state = failures[state] # turun ke suffix
+            state = transitions[state].get(char, 0) # transisi
+            if outputs[state]: # ada pattern selesai
+                found |= outputs[state] # catat pattern
+        return found # return pattern yang ditemukan
+
+class SemanticMatch: # hasil matching satu text terhadap phrase yang di-compile
+    def __init__(self, matcher: 'CompiledSemanticMatcher', text: str, exactPhrases: Set[str], fuzzyScores: Dict[str, List[Tuple[str, float]]], similarityFn: Callable[[str, str], float]): # konstruktor hasil
+        self.matcher = matcher # matcher asal
+        self.text = text # text yang di-match
+        self.exactPhrases = exactPhrases # phrase yang substring text
+        self.fuzzyScores = fuzzyScores # phrase -> [(token, ratio > FUZZY_CONCEPT_THRESHOLD)] urut token
+        self.similarityFn = similarityFn # fungsi similarity buat phrase di luar compile
+
+    def containsPhrase(self, phrase: str) -> bool: # sama dengan phrase in text
+        if phrase in self.matcher.phraseIds: # phrase di-compile
+            return phrase in self.exactPhrases # hasil automaton
+        return phrase in self.text # phrase lain dicek langsung
+
+    def _tokenScores(self, phrase: str) -> List[Tuple[str, float]]: # skor typo phrase ke token text
+        if phrase in self.matcher.phraseIds: # phrase di-compile
+            return self.fuzzyScores.get(phrase, []) # dari index fuzzy
+        scores = [] # hitung langsung
+        tokens = dict.fromkeys(self.text.split()) # token unik urut kemunculan
+        for token in tokens: # loop token
+            similarity = self.similarityFn(phrase, token) # hitung similarity
+            if similarity > FUZZY_CONCEPT_THRESHOLD: # lolos threshold
+                scores.append((token, similarity)) # simpan skor
+        countFuzzyComparisons(len(tokens)) # metric comparison
+        return scores # return skor
+
+    def fuzzyMatchConcepts(self, conceptWords: List[str]) -> float: # sama dengan detector.fuzzyMatchConcepts(text, conceptWords)
+        maxSimilarity = 0.0 # similarity terbesar
+        for conceptWord in conceptWords: # loop concept word
+            for _, similarity in self._tokenScores(conceptWord): # token yang lolos threshold
+                maxSimilarity = max(maxSimilarity, similarity) # update max
+        return maxSimilarity # return similarity terbesar
+
+    def features(self) -> Dict[str, List[str]]: # sama dengan detector.extractSemanticFeatures(text)
+        features = {category: [] for category in self.matcher.categories} # fitur per kategori
+        features['keywords'] = [] # kata kunci
+        keywords = features['keywords'] # akses lokal
+        seenKeywords = set() # keyword yang sudah masuk
+        for category, clusterName, phrase in self.matcher.clusterPhrases: # urutan loop versi asli
+            if phrase in self.exactPhrases: # exact match
+                hitKeywords = (phrase,) # keyword = phrase
+            else: # typo match
+                hitKeywords = tuple(token for token, similarity in self.fuzzyScores.get(phrase, ()) if similarity > FUZZY_FEATURE_THRESHOLD) # keyword = token text
+                if not hitKeywords: # tidak ada yang mirip
+                    continue # phrase berikutnya
+            if clusterName not in features[category]: # cluster belum ada
+                features[category].append(clusterName) # tambah cluster
+            for keyword in hitKeywords: # loop keyword hit
+                if keyword not in seenKeywords: # keyword baru
+                    seenKeywords.add(keyword) # tandai
+                    keywords.append(keyword) # tambah keyword
+        return features # return fitur
+
+class CompiledSemanticMatcher: # semanticClusters + keyword intent yang sudah di-compile
+    def __init__(self, semanticClusters: Dict[str, Dict[str, List[str]]], extraPhrases: Iterable[str] = ()): # compile phrase
+        self.categories = list(semanticClusters) # urutan kategori
+        self.clusterPhrases: List[Tuple[str, str, str]] = [] # (kategori, cluster, phrase) urut loop asli
+        for category, clusters in semanticClusters.items(): # loop kategori
+            for clusterName, wordList in clusters.items(): # loop cluster
+                for phrase in wordList: # loop phrase
+                    self.clusterPhrases.append((category, clusterName, phrase)) # simpan urutan
+
+        phrases = [phrase for _, _, phrase in self.clusterPhrases] + list(extraPhrases) # semua phrase (cluster + keyword intent)
+        self.phraseIds = {phrase: phraseId for phraseId, phrase in enumerate(dict.fromkeys(phrases))} # phrase unik -> id
+        self.phrases = list(self.phraseIds) # id -> phrase
+        self.automaton = AhoCorasickAutomaton(self.phrases) # exact substring dalam satu pass
+        self.phraseCounts = [Counter(phrase) for phrase in self.phrases] # frekuensi karakter per phrase
+        self.lengthBuckets: Dict[int, List[int]] = {} # panjang -> id phrase
+        for phraseId, phrase in enumerate(self.phrases): # loop phrase
+            self.lengthBuckets.setdefault(len(phrase), []).append(phraseId) # bucket panjang
+
+    def _fuzzyCandidates(self, token: str) -> Iterable[int]: # phrase yang mungkin punya ratio > threshold
+        # ratio = 2*M/(la+lb) dengan M <= min(la, lb) -> panjang phrase harus dekat panjang token
+        tokenLength = len(token) # panjang token
+        tokenCounts = None # frekuensi karakter token (lazy)
+        for length, phraseIds in self.lengthBuckets.items(): # loop bucket panjang
+            totalLength = length + tokenLength # total panjang
+            if 2.0 * min(length, tokenLength) / totalLength <= FUZZY_CONCEPT_THRESHOLD: # batas panjang
+                continue # bucket tidak mungkin lolos
+            if tokenCounts is None: # hitung frekuensi sekali
+                tokenCounts = Counter(token) # frekuensi karakter token
+            for phraseId in phraseIds: # loop phrase di bucket
+                # M <= irisan multiset karakter (blok matching adalah subsequence bersama)
+                common = sum((self.phraseCounts[phraseId] & tokenCounts).values()) # irisan karakter
+                if 2.0 * common / totalLength > FUZZY_CONCEPT_THRESHOLD: # batas atas lolos
+                    yield phraseId # kandidat
+
+    def _tokenFuzzyHits(self, token: str, similarityFn: Callable[[str, str], float]) -> List[Tuple[str, float]]: # [(phrase, ratio > threshold)] satu token
+        hits = [] # phrase yang mirip token
+        comparisons = 0 # similarity penuh yang dihitung
+        for phraseId in self._fuzzyCandidates(token): # phrase kandidat
+            phrase = self.phrases[phraseId] # phrase
+            similarity = similarityFn(phrase, token) # ratio exact
+            comparisons += 1 # hitung comparison
+            if similarity > FUZZY_CONCEPT_THRESHOLD: # lolos threshold
+                hits.append((phrase, similarity)) # simpan skor
+        countFuzzyComparisons(comparisons) # metric comparison
+        return hits # return hit
+
+    def _buildMatch(self, text: str, tokenHits: Dict[str, List[Tuple[str, float]]], similarityFn: Callable[[str, str], float]) -> SemanticMatch: # rakit hasil dari hit per token
+        fuzzyScores: Dict[str, List[Tuple[str, float]]] = {} # phrase -> [(token, ratio)]
+        for token in dict.fromkeys(text.split()): # token unik urut kemunculan
+            for phrase, similarity in tokenHits[token]: # phrase yang mirip token
+                fuzzyScores.setdefault(phrase, []).append((token, similarity)) # simpan skor
+        return SemanticMatch(self, text, self.automaton.findAll(text), fuzzyScores, similarityFn) # exact lewat satu pass Aho-Corasick
+
+    def match(self, text: str, similarityFn: Callable[[str, str], float]) -> SemanticMatch: # match satu text
+        """Exact hit lewat automaton, typo hit lewat index fuzzy per token"""
+        tokenHits = {token: self._tokenFuzzyHits(token, similarityFn) for token in dict.fromkeys(text.split())} # hit per token unik
+        return self._buildMatch(text, tokenHits, similarityFn) # hasil match
+
+    def matchMany(self, texts: List[str], similarityFn: Callable[[str, str], float]) -> List[SemanticMatch]: # match banyak text sekaligus
+        """Sama dengan [match(text) for text in texts], tapi index fuzzy diprobe sekali per token unik gabungan semua text"""
+        tokenHits: Dict[str, List[Tuple[str, float]]] = {} # token -> hit (dipakai bersama semua text)
+        for text in texts: # loop text
+            for token in text.split(): # token text
+                if token not in tokenHits: # token belum diprobe
+                    tokenHits[token] = self._tokenFuzzyHits(token, similarityFn) # probe index fuzzy
+        return [self._buildMatch(text, tokenHits, similarityFn) for text in texts] # hasil per text
@@ -0,0 +1,138 @@
+# Structured Log - logging per stage dengan level, sampling dan queue handler (pengganti print di hot path)
+"""
+Lapisan tipis di atas modul logging standar. Semua logger ada di bawah namespace
+'itbchatbot', record dikirim lewat QueueHandler ke satu thread QueueListener, jadi
+request thread tidak pernah menunggu I/O stdout. Konfigurasi lewat environment:
+
+    LOG_LEVEL         DEBUG / INFO / WARNING / ... (default INFO; trace per request ada di DEBUG)
+    LOG_FORMAT        text atau json
+    LOG_SAMPLE_RATES  rate sampling per stage untuk record di bawah WARNING, mis. "matching=0.01,nlp=0.1"
+
+Format pesan memakai argumen %-style, jadi string tidak dirakit kalau level tidak aktif.
+Konfigurasi disimpan di registry logging (bukan di modul ini), jadi aman walau modul
+ter-import dua kali (lewat 'structuredLog' dan 'machinelearning.structuredLog').
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from typing import Dict, Optional
+
+ROOT_LOGGER = 'itbchatbot' # namespace semua logger aplikasi
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper() # level minimum
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'text').lower() # text / json
+LOG_SAMPLE_RATES = os.environ.get('LOG_SAMPLE_RATES', '') # "stage=rate,stage=rate"
+
+RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'stage'} # atribut bawaan LogRecord
+
+def parseSampleRates(spec: str) -> Dict[str, float]: # "matching=0.01,nlp=0.1" -> {stage: rate}
+    rates = {} # stage -> rate
+    for part in spec.split(','): # loop pasangan
+        if '=' not in part: # format salah / kosong
+            continue # skip
+        stage, rate = part.split('=', 1) # pisah stage dan rate
+        try:
+            rates[stage.strip()] = min(1.0, max(0.0, float(rate))) # rate di [0, 1]
+        except ValueError: # rate bukan angka
+            continue # skip
+    return rates # return rate per stage
+
+class StageSamplingFilter(logging.Filter): # sampling record per stage (WARNING ke atas selalu lolos)
+    def __init__(self, rates: Dict[str, float]): # konstruktor filter
+        super().__init__() # init Filter
+        self.rates = rates # stage -> rate
+
+    def filter(self, record: logging.LogRecord) -> bool: # True kalau record diteruskan
+        if record.levelno >= logging.WARNING: # error tidak pernah di-sampling
+            return True # lolos
+        rate = self.rates.get(getattr(record, 'stage', ''), 1.0) # rate stage record
+        return rate >= 1.0 or random.random() < rate # sampling acak
+
+class StageDefaultFilter(logging.Filter): # isi stage '-' untuk record tanpa stage (pengganti Formatter defaults=, Python 3.10+)
+    def filter(self, record: logging.LogRecord) -> bool: # selalu lolos
+        if not hasattr(record, 'stage'): # record bukan dari StageLogger
+            record.stage = '-' # default format text
+        return True # lolos
+
+class JsonFormatter(logging.Formatter): # satu record = satu baris JSON
+    def format(self, record: logging.LogRecord) -> str: # format record
+        payload = { # field standar
+            'ts': round(record.created, 3), # waktu record
+            'level': record.levelname, # level
+            'logger': record.name, # nama logger
+            'stage': getattr(record, 'stage', None), # stage pipeline
+            'msg': record.getMessage() # pesan (format lazy di sini)
+        }
+        for key, value in vars(record).items(): # field tambahan dari extra=
+            if key not in RESERVED_ATTRS: # bukan atribut bawaan
+                payload[key] = value # tambah field
+        if record.exc_info: # ada exception
+            payload['exc'] = self.formatException(record.exc_info) # traceback
+        return json.dumps(payload, default=str, ensure_ascii=False) # JSON satu baris
+
+class StageLogger(logging.LoggerAdapter): # logger yang menempelkan stage ke setiap record
+    def process(self, msg, kwargs): # gabung extra stage dengan extra per call
+        kwargs['extra'] = {**self.extra, **kwargs.get('extra', {})} # stage + field tambahan
+        return msg, kwargs # return pesan dan kwargs
+
+_listener = None # QueueListener aktif
+_configLock = threading.Lock() # lock konfigurasi
+
+def buildHandler() -> logging.Handler: # handler tujuan akhir (dipakai thread listener)
+    handler = logging.StreamHandler(sys.stderr) # tulis ke stderr
+    if LOG_FORMAT == 'json': # format JSON
+        handler.setFormatter(JsonFormatter()) # formatter JSON
+    else: # format text
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(stage)s] %(message)s')) # formatter text
+        handler.addFilter(StageDefaultFilter()) # record tanpa stage (logger pihak ketiga) tetap bisa di-format
+    return handler # return handler
+
+def configureLogging(level: Optional[str] = None, force: bool = False): # pasang QueueHandler + listener di logger root aplikasi
+    """Idempotent: dipanggil otomatis oleh getLogger, force=True buat pasang ulang"""
+    global _listener # listener global
+    with _configLock: # satu thread yang konfigurasi
+        rootLogger = logging.getLogger(ROOT_LOGGER) # logger root aplikasi
+        if getattr(rootLogger, '_itbPid', None) == os.getpid() and not force: # sudah dikonfigurasi di proses ini
+            return # tidak perlu ulang
+        if _listener is not None: # listener lama
+            _listener.stop() # flush dan hentikan
+        for handler in list(rootLogger.handlers): # handler lama
+            rootLogger.removeHandler(handler) # lepas handler
+
+        recordQueue = queue.SimpleQueue() # antrean record (tanpa batas, put tidak pernah blok)
+        queueHandler = logging.handlers.QueueHandler(recordQueue) # handler di request thread
+        queueHandler.addFilter(StageSamplingFilter(parseSampleRates(LOG_SAMPLE_RATES))) # sampling sebelum masuk antrean
+        rootLogger.addHandler(queueHandler) # pasang handler
+        rootLogger.setLevel(level or LOG_LEVEL) # level minimum
+        rootLogger.propagate = False # tidak dobel ke root logging
+        _listener = logging.handlers.QueueListener(recordQueue, buildHandler(), respect_handler_level=True) # thread penulis
+        _listener.start() # mulai thread
+        rootLogger._itbPid = os.getpid() # tandai sudah dikonfigurasi (per proses)
+
+def shutdownLogging(): # flush antrean saat exit
+    global _listener # listener global
+    with _configLock: # akses eksklusif
+        if _listener is not None: # listener aktif
+            _listener.stop() # flush sisa record
+            _listener = None # reset
+
+def _reconfigureAfterFork(): # thread listener tidak ikut ke proses anak (gunicorn --preload, process pool)
+    global _listener, _configLock # state global
+    _configLock = threading.Lock() # lock baru (lock lama bisa terkunci saat fork)
+    _listener = None # listener parent tidak jalan di anak
+    rootLogger = logging.getLogger(ROOT_LOGGER) # logger root aplikasi
+    if getattr(rootLogger, '_itbPid', os.getpid()) != os.getpid(): # parent sudah konfigurasi, anak belum
+        configureLogging(logging.getLevelName(rootLogger.level)) # pasang ulang di anak
+
+if hasattr(os, 'register_at_fork'): # POSIX
+    os.register_at_fork(after_in_child=_reconfigureAfterFork) # listener baru di proses anak
+atexit.register(shutdownLogging) # flush saat exit
+
+def getLogger(stage: str) -> StageLogger: # logger untuk satu stage pipeline (controller, services, matching, nlp, ...)
+    configureLogging() # pastikan handler terpasang
+    return StageLogger(logging.getLogger(f"{ROOT_LOGGER}.{stage}"), {'stage': stage}) # logger dengan stage
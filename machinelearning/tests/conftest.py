@@ -0,0 +1,7 @@
+# Konfigurasi pytest - modul machinelearning di-import flat seperti di pipeline
+import os  # Interface OS untuk file path
+import sys  # Sistem parameter untuk path
+
+mlPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Direktori machinelearning
+if mlPath not in sys.path:  # Cek apakah path sudah ada
+    sys.path.insert(0, mlPath)  # Tambah ke Python path
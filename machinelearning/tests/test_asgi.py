@@ -0,0 +1,143 @@
+# Test ASGI - application dipanggil langsung (scope/receive/send palsu) dengan handleAskRequest yang memblok
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip('flask')  # dependency backend
+pytest.importorskip('flask_cors')  # dependency backend
+backendDir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'backend')  # direktori backend
+if backendDir not in sys.path:  # belum ada
+    sys.path.insert(0, backendDir)  # import asgi seperti uvicorn
+
+import asgi
+from flask import jsonify
+from routes import routes
+
+def httpScope(path='/ask'):  # scope request POST JSON
+    return {'type': 'http', 'method': 'POST', 'path': path, 'headers': [(b'content-type', b'application/json')], 'query_string': b''}  # scope ASGI
+
+def bodyReceiver(question):  # receive dengan body lengkap, lalu menunggu disconnect yang tidak pernah datang
+    messages = [{'type': 'http.request', 'body': json.dumps({'question': question}).encode('utf-8'), 'more_body': False}]  # body satu potong
+    async def receive():  # callable receive
+        if messages:  # masih ada body
+            return messages.pop(0)  # potongan berikutnya
+        await asyncio.Event().wait()  # tunggu selamanya
+    return receive  # callable
+
+def messageQueue():  # receive dari antrean (lifespan)
+    queue = asyncio.Queue()  # event yang dikirim test
+    return queue, queue.get  # antrean + callable receive
+
+async def request(question='apa itu itb'):  # satu request lewat application, return (status, body JSON, header)
+    sent = []  # pesan yang dikirim app
+    async def send(message):  # callable send
+        sent.append(message)  # catat pesan
+    await asgi.application(httpScope(), bodyReceiver(question), send)  # jalankan request
+    start, body = sent  # response start + body
+    return start['status'], json.loads(body['body']), dict(start['headers'])  # hasil
+
+async def waitFor(condition, timeout=5.0):  # tunggu kondisi tanpa memblok event loop
+    deadline = asyncio.get_running_loop().time() + timeout  # batas tunggu
+    while not condition():  # belum terpenuhi
+        assert asyncio.get_running_loop().time() < deadline, 'timeout menunggu kondisi'  # jangan hang
+        await asyncio.sleep(0.01)  # beri giliran task lain
+
+@pytest.fixture
+def blockingAsk(monkeypatch):  # handleAskRequest yang menunggu dilepas test, executor kecil baru per test
+    release = threading.Event()  # dilepas test
+    calls = []  # pertanyaan yang sampai ke handler
+    def handleAskRequest():  # pengganti controller
+        from flask import request  # request Flask aktif
+        calls.append(request.get_json()['question'])  # catat pertanyaan
+        release.wait(10)  # blok sampai dilepas (batas supaya test tidak hang)
+        return jsonify({'intent': 'found', 'answer': 'ok', 'source': 'machine_learning'})  # response
+    monkeypatch.setattr(routes, 'handleAskRequest', handleAskRequest)  # route /ask memanggil ini
+    monkeypatch.setattr(asgi.application, 'executor', asgi.BoundedExecutor(1, 1))  # 1 jalan + 1 antre
+    monkeypatch.setattr(asgi.application, 'requestTimeout', 5.0)  # timeout normal
+    monkeypatch.setattr(asgi.application, 'shutdownTimeout', 5.0)  # drain normal
+    monkeypatch.setattr(asgi.application, 'draining', False)  # belum shutdown
+    yield release, calls  # event + pertanyaan
+    release.set()  # lepas thread yang tersisa
+    asgi.application.executor.shutdown()  # matikan executor test
+
+def test_saturated_executor_returns_503(blockingAsk):  # backpressure: slot jalan + antre penuh
+    release, calls = blockingAsk  # event pelepas
+    async def scenario():
+        running = [asyncio.ensure_future(request('pertama')), asyncio.ensure_future(request('kedua'))]  # isi semua slot
+        await waitFor(lambda: asgi.application.executor.active == 2 and calls == ['pertama'])  # satu jalan, satu antre
+        status, body, headers = await request('ketiga')  # slot penuh
+        assert (status, body['source']) == (503, 'overloaded') and headers[b'retry-after'] == b'1'  # ditolak langsung
+        release.set()  # lepas handler
+        return [await task for task in running]  # request yang diterima selesai normal
+    results = asyncio.run(scenario())  # jalankan
+    assert [status for status, _, _ in results] == [200, 200]  # dijawab
+    assert calls == ['pertama', 'kedua']  # request yang ditolak tidak sampai handler
+
+def test_slow_request_returns_504(blockingAsk, monkeypatch):  # request melewati requestTimeout
+    release, calls = blockingAsk  # event pelepas
+    monkeypatch.setattr(asgi.application, 'requestTimeout', 0.1)  # timeout pendek
+    status, body, _ = asyncio.run(request())  # handler memblok
+    assert (status, body['source']) == (504, 'timeout')  # timeout
+    release.set()  # lepas handler
+    assert asgi.application.executor.drain(5.0)  # slot kembali setelah handler selesai
+
+def test_lifespan_shutdown_drains_active_requests(blockingAsk):  # shutdown menunggu request aktif, request baru ditolak
+    release, calls = blockingAsk  # event pelepas
+    async def scenario():
+        queue, receive = messageQueue()  # event lifespan
+        sent = []  # pesan lifespan
+        async def send(message):  # callable send
+            sent.append(message['type'])  # catat pesan
+        lifespan = asyncio.ensure_future(asgi.application({'type': 'lifespan'}, receive, send))  # task lifespan
+        await queue.put({'type': 'lifespan.startup'})  # server mulai
+        await waitFor(lambda: sent == ['lifespan.startup.complete'])  # startup selesai
+        active = asyncio.ensure_future(request('aktif'))  # request yang sedang jalan
+        await waitFor(lambda: calls == ['aktif'])  # sampai handler
+        await queue.put({'type': 'lifespan.shutdown'})  # server berhenti
+        await waitFor(lambda: asgi.application.draining)  # mulai drain
+        status, body, _ = await request('baru')  # request setelah shutdown dimulai
+        assert (status, body['source']) == (503, 'shutting_down')  # ditolak
+        await asyncio.sleep(0.1)  # beri waktu kalau shutdown tidak menunggu
+        assert sent == ['lifespan.startup.complete']  # belum selesai selama request aktif
+        release.set()  # request aktif selesai
+        await lifespan  # drain selesai
+        assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']  # shutdown setelah drain
+        return await active  # response request aktif
+    status, body, _ = asyncio.run(scenario())  # jalankan
+    assert (status, body['answer']) == (200, 'ok')  # request aktif tetap dijawab
+    assert calls == ['aktif']  # request baru tidak sampai handler
+
+def test_lifespan_shutdown_timeout_cancels_queued(blockingAsk, monkeypatch):  # drain habis waktu: request antre dibatalkan, tidak hang
+    release, calls = blockingAsk  # event pelepas
+    monkeypatch.setattr(asgi.application, 'shutdownTimeout', 0.1)  # drain pendek
+    async def scenario():
+        queue, receive = messageQueue()  # event lifespan
+        running = asyncio.ensure_future(request('jalan'))  # memblok satu-satunya worker
+        await waitFor(lambda: calls == ['jalan'])  # sampai handler
+        queued = asyncio.ensure_future(request('antre'))  # menunggu di antrean executor
+        await waitFor(lambda: asgi.application.executor.active == 2)  # masuk antrean
+        await queue.put({'type': 'lifespan.shutdown'})  # server berhenti
+        await asgi.application({'type': 'lifespan'}, receive, lambda message: asyncio.sleep(0))  # drain timeout lalu shutdown executor
+        status, body, _ = await queued  # request antre
+        release.set()  # lepas request yang jalan
+        await running  # selesai
+        return status, body  # response request antre
+    status, body = asyncio.run(scenario())  # jalankan
+    assert (status, body['source']) == (503, 'shutting_down')  # dibatalkan dengan response, bukan task yang hilang
+    assert calls == ['jalan']  # request antre tidak pernah dijalankan
+
+def test_client_disconnect_before_body_sends_nothing(blockingAsk):  # client putus sebelum body lengkap
+    release, calls = blockingAsk  # event pelepas
+    sent = []  # pesan yang dikirim app
+    messages = [{'type': 'http.request', 'body': b'{"quest', 'more_body': True}, {'type': 'http.disconnect'}]  # body terpotong lalu putus
+    async def receive():  # callable receive
+        return messages.pop(0)  # pesan berikutnya
+    async def send(message):  # callable send
+        sent.append(message)  # catat pesan
+    asyncio.run(asgi.application(httpScope(), receive, send))  # jalankan request
+    assert sent == [] and calls == []  # tanpa response, handler tidak dipanggil
+    assert asgi.application.executor.active == 0  # tidak ada slot terpakai
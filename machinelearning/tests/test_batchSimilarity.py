@@ -0,0 +1,36 @@
+# Test Batch Similarity - skor NumPy harus sama persis dengan fungsi scalar matching.py
+import random
+
+import pytest
+
+import matching
+from batchSimilarity import VocabularyMatrix, batchCharacterFrequencySimilarity, batchLevenshteinDistance, batchNGramSimilarity
+
+def randomWords(count, seed):  # kata acak (termasuk typo dan huruf berulang) yang reproducible
+    rng = random.Random(seed)  # generator sendiri per test
+    return [''.join(rng.choice('aaeiiknorstu') for _ in range(rng.randint(1, 12))) for _ in range(count)]  # alphabet kecil biar banyak overlap
+
+VOCABULARY = ['itb', 'institut', 'teknologi', 'bandung', 'fakultas', 'fakultsa', 'sekolah', 'mahasiswa', 'ganesha', 'informatika',
+              'a', 'ab', 'aa', 'aaaa', 'sttt', 'stei2024', '1959', 'é', 'café', 'İx', 'straße', 'x'] + randomWords(200, 5)  # corpus + edge case
+QUERIES = ['itb', 'fakultsa', 'teknolgi', 'mahasiswaa', 'a', 'ab', '', 'é1', 'İstanbul', 'zzzzzzzzzzzzzzzzzzzzzzzzzzzzzz'] + randomWords(15, 6)  # typo, pendek, kosong, unicode, panjang
+
+@pytest.fixture(scope='module')
+def vocabularyMatrix():  # matrix dibangun sekali per modul
+    return VocabularyMatrix(VOCABULARY)  # matrix vocabulary
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_levenshteinMatchesScalar(vocabularyMatrix, query):  # edit distance penuh dan dibatasi
+    distances = batchLevenshteinDistance(query, vocabularyMatrix)  # tanpa batas
+    capped = batchLevenshteinDistance(query, vocabularyMatrix, 4)  # dibatasi maxDistance
+    expected = [matching.levenshteinDistance(query, word) for word in VOCABULARY]  # scalar
+    assert distances.tolist() == expected  # exact
+    assert capped.tolist() == [min(distance, 5) for distance in expected]  # di atas batas jadi maxDistance + 1
+
+@pytest.mark.parametrize('query', QUERIES)
+@pytest.mark.parametrize('n', [2, 3])
+def test_nGramMatchesScalar(vocabularyMatrix, query, n):  # jaccard n-gram
+    assert batchNGramSimilarity(query, vocabularyMatrix, n).tolist() == [matching.nGramSimilarity(query, word, n) for word in VOCABULARY]  # exact
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_characterFrequencyMatchesScalar(vocabularyMatrix, query):  # 1 - jarak L1 histogram karakter / total karakter (kolom a-z0-9 + karakter tambahan)
+    assert batchCharacterFrequencySimilarity(query, vocabularyMatrix).tolist() == [matching.characterFrequencySimilarity(query, word) for word in VOCABULARY]  # exact
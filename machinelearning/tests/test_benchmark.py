@@ -0,0 +1,28 @@
+# Test Benchmark - satu stage di scale 1: skema JSON hasil dan p99 terisi (pass cukup untuk MIN_P99_SAMPLES)
+import json
+
+import pytest
+
+pytest.importorskip('flask')  # services di-import benchmark
+import benchmark
+
+ROW_KEYS = {'calls', 'passes', 'throughputPerSec', 'meanMs', 'p50Ms', 'p99Ms', 'maxMs', 'scale', 'corpusSize', 'indexBuildSeconds', 'stage', 'workload'}  # kolom baris tanpa pass memori
+META_KEYS = {'commit', 'timestamp', 'python', 'platform', 'cpuCount', 'repeat', 'minP99Samples', 'seed', 'corpus'}  # kolom meta
+
+def test_pass_count_reaches_p99_floor():  # repeat kecil tetap cukup sampel
+    assert benchmark.passCount(['a'] * 4, 3) == 25  # 4 query -> 25 pass
+    assert benchmark.passCount(['a'] * 6, 3) == 17  # pembulatan ke atas
+    assert benchmark.passCount(['a'] * 4, 40) == 40  # repeat lebih besar tetap dipakai
+
+def test_smoke_one_stage_scale_one():  # runBenchmark kecil: skema + p99 tidak null
+    report = json.loads(json.dumps(benchmark.runBenchmark(scales=[1], repeat=1, stageNames=['matchWithCsvData'], memory=False)))  # hasil JSON
+    assert report['version'] == benchmark.BENCHMARK_VERSION  # format output
+    assert set(report['meta']) == META_KEYS  # meta lengkap
+    assert [row['workload'] for row in report['results']] == list(benchmark.WORKLOAD)  # satu baris per kategori
+    for row in report['results']:  # cek setiap baris
+        assert set(row) == ROW_KEYS  # skema baris
+        assert (row['scale'], row['stage']) == (1, 'matchWithCsvData')  # identitas
+        assert row['calls'] >= benchmark.MIN_P99_SAMPLES  # pass cukup
+        assert row['calls'] == row['passes'] * len(benchmark.WORKLOAD[row['workload']])  # setiap pass semua query
+        assert row['p99Ms'] is not None and row['p50Ms'] <= row['p99Ms'] <= row['maxMs']  # p99 terisi dan urut
+        assert row['corpusSize'] > 0 and row['throughputPerSec'] > 0  # corpus termuat, stage jalan
@@ -0,0 +1,166 @@
+# Test Corpus Manifest - nama output per versi build, corpus di-resolve saat load, reload detector + matcher mengikuti manifest
+import csv
+import os
+
+import pytest
+
+import corpusBuilder
+import dataLoader
+import matching
+import nlpIntentDetector
+
+@pytest.fixture
+def processedDir(tmp_path, monkeypatch):  # direktori processed sementara sebagai corpus default
+    directory = str(tmp_path / 'processed')  # output build
+    monkeypatch.setattr(dataLoader, 'PROCESSED_DIR', directory)  # manifest dibaca dari sini
+    monkeypatch.setattr(dataLoader, 'CORPUS_PATH', None)  # tanpa override
+    monkeypatch.setattr(nlpIntentDetector, 'CORPUS_PATH', None)  # tanpa override
+    for name in ('_detectorInstance', '_detectorStamp', '_detectorLastCheck'):  # registry detector dikembalikan setelah test
+        monkeypatch.setattr(nlpIntentDetector, name, getattr(nlpIntentDetector, name))  # simpan nilai lama
+    for name in ('_corpus', '_corpusLastCheck'):  # corpus matcher dikembalikan setelah test
+        monkeypatch.setattr(matching, name, getattr(matching, name))  # simpan nilai lama
+    return directory  # path
+
+def writeSource(dataDir, contents):  # satu CSV scrapper (type, content, links) sebagai sumber build
+    os.makedirs(dataDir, exist_ok=True)  # direktori sumber
+    with open(os.path.join(dataDir, 'contohITB.csv'), 'w', newline='', encoding='utf-8') as file:  # sumber 'contoh'
+        writer = csv.writer(file)  # writer CSV
+        writer.writerow(['type', 'content', 'links'])  # header scrapper
+        for content in contents:  # satu baris per konten
+            writer.writerow(['p', content, 'https://www.itb.ac.id'])  # link bikin skor kualitas lolos
+
+def test_builds_in_same_second_do_not_overwrite(processedDir):  # nama file memuat versi build
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    second = corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build v2 (biasanya detik yang sama)
+    assert (first['version'], second['version']) == (1, 2)  # versi naik
+    for key in ('highQualityFile', 'completeFile', 'summaryFile'):  # semua output
+        assert first[key] != second[key]  # nama beda
+        assert first[key].endswith('_v1.csv') and second[key].endswith('_v2.csv')  # versi di nama
+        assert os.path.exists(os.path.join(processedDir, first[key]))  # build lama tetap ada
+
+def test_existing_output_is_not_overwritten(processedDir, monkeypatch):  # manifest hilang -> versi reset -> nama bentrok
+    monkeypatch.setattr(corpusBuilder.time, 'strftime', lambda format, *args: '20250101_000000')  # jam beku: detik yang sama
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    highQualityPath = os.path.join(processedDir, first['highQualityFile'])  # output v1
+    before = os.path.getmtime(highQualityPath)  # waktu tulis v1
+    os.remove(os.path.join(processedDir, dataLoader.MANIFEST_NAME))  # manifest hilang
+    with pytest.raises(FileExistsError):  # tolak timpa
+        corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1 lagi
+    assert os.path.getmtime(highQualityPath) == before  # file lama utuh
+
+def test_processed_file_resolved_at_load_time(processedDir):  # manifest baru dipakai tanpa re-import
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    assert dataLoader.activeProcessedFile() == os.path.join(processedDir, first['highQualityFile'])  # dari manifest
+    second = corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build v2
+    assert dataLoader.activeProcessedFile() == os.path.join(processedDir, second['highQualityFile'])  # manifest dibaca ulang
+    assert len(dataLoader.loadCsvData()) == second['records']['highQuality']  # loadCsvData memakai build baru
+    assert dataLoader.manifestVersion() == 2  # versi build
+
+def test_reload_follows_manifest_version(processedDir):  # detector default ikut build baru
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    detector = nlpIntentDetector.reloadNlpIntentDetector(force=True)  # detector corpus v1
+    assert detector.datasetPath == os.path.abspath(os.path.join(processedDir, first['highQualityFile']))  # dataset dari manifest
+    assert nlpIntentDetector.getDatasetVersion()[0] == 1  # stamp memuat versi manifest
+    assert nlpIntentDetector.reloadNlpIntentDetector() is detector  # tidak berubah -> detector sama
+
+    second = corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build v2 (file baru, file v1 tidak berubah)
+    reloaded = nlpIntentDetector.reloadNlpIntentDetector()  # cek perubahan
+    assert reloaded is not detector  # hot-swap
+    assert reloaded.datasetPath == os.path.abspath(os.path.join(processedDir, second['highQualityFile']))  # dataset build baru
+    assert nlpIntentDetector.getDatasetVersion()[0] == 2  # cache response ikut invalid
+
+def test_pinned_detector_ignores_manifest(processedDir):  # detector dengan dataset eksplisit (benchmark)
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    pinned = nlpIntentDetector.NaturalLanguageIntentDetector(os.path.join(processedDir, first['highQualityFile']))  # dataset eksplisit
+    nlpIntentDetector.setNlpIntentDetector(pinned)  # pasang
+    corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build v2
+    assert nlpIntentDetector.reloadNlpIntentDetector() is pinned  # tetap detector yang dipasang
+
+def test_matcher_follows_manifest_version(processedDir, tmp_path, monkeypatch):  # matchWithCsvData ikut build baru
+    monkeypatch.setattr(matching, 'CORPUS_CHECK_INTERVAL', 0.0)  # cek versi setiap request
+    dataDir = str(tmp_path / 'data')  # sumber build
+    query = 'jadwal pendaftaran mahasiswa baru'  # pertanyaan yang sama untuk kedua build
+    writeSource(dataDir, ['Jadwal pendaftaran mahasiswa baru dibuka bulan Januari melalui portal seleksi kampus ITB Bandung.'])  # jawaban v1
+    corpusBuilder.buildCorpus(dataDir=dataDir, processedDir=processedDir)  # build v1
+    matching.reloadProcessedData(force=True)  # corpus matcher dari manifest
+    first = matching.matchWithCsvData(query)  # jawaban v1
+    assert 'Januari' in first  # dari build v1
+    firstVersion = matching.getCorpusVersion()  # versi corpus v1
+    assert firstVersion[0] == 1  # versi manifest
+    index = matching.getInvertedIndex()  # index corpus v1
+
+    writeSource(dataDir, ['Jadwal pendaftaran mahasiswa baru dibuka bulan Maret melalui portal seleksi kampus ITB Bandung.'])  # jawaban v2
+    corpusBuilder.buildCorpus(dataDir=dataDir, processedDir=processedDir)  # build v2 (sumber berubah)
+    second = matching.matchWithCsvData(query)  # request berikutnya
+    assert 'Maret' in second and 'Januari' not in second  # jawaban build baru
+    assert matching.getCorpusVersion()[0] == 2 and matching.getCorpusVersion() != firstVersion  # versi ikut naik
+    assert matching.getInvertedIndex() is not index  # index lama dibuang
+
+def test_set_processed_data_ignores_manifest(processedDir, tmp_path):  # corpus setProcessedData (benchmark) tidak ditimpa build baru
+    dataDir = str(tmp_path / 'data')  # sumber build
+    writeSource(dataDir, ['Jadwal pendaftaran mahasiswa baru dibuka bulan Januari melalui portal seleksi kampus ITB Bandung.'])  # isi build
+    corpusBuilder.buildCorpus(dataDir=dataDir, processedDir=processedDir)  # build v1
+    entries = dataLoader.loadCsvData()  # entry build v1
+    matching.setProcessedData(entries)  # corpus manual
+    corpusBuilder.buildCorpus(dataDir=dataDir, processedDir=processedDir, force=True)  # build v2
+    assert matching.reloadProcessedData() is matching.getCorpus()  # tidak ada swap
+    assert matching.getProcessedData() is entries  # tetap corpus yang dipasang
+
+class FakeClock:  # time.monotonic palsu buat DATASET_CHECK_INTERVAL
+    def __init__(self):  # mulai dari nol
+        self.now = 1000.0  # detik
+
+    def monotonic(self):  # pengganti time.monotonic
+        return self.now  # waktu palsu
+
+@pytest.fixture
+def detectorBuilds(monkeypatch):  # catat setiap build NaturalLanguageIntentDetector di registry
+    builds = []  # detector yang dibangun
+    base = nlpIntentDetector.NaturalLanguageIntentDetector  # kelas asli
+    class CountingDetector(base):  # detector yang mencatat build
+        def __init__(self, *args, **kwargs):  # konstruktor detector
+            super().__init__(*args, **kwargs)  # build asli
+            builds.append(self)  # catat build
+    monkeypatch.setattr(nlpIntentDetector, 'NaturalLanguageIntentDetector', CountingDetector)  # dipakai preload/reload
+    monkeypatch.setattr(nlpIntentDetector, '_detectorFailedStamp', None)  # dikembalikan setelah test
+    return builds  # list build
+
+def test_interval_check_hot_swaps_detector(processedDir, detectorBuilds, monkeypatch):  # getNlpIntentDetector cek dataset paling sering tiap DATASET_CHECK_INTERVAL
+    clock = FakeClock()  # jam palsu
+    monkeypatch.setattr(nlpIntentDetector, 'time', clock)  # dipakai registry
+    corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    detector = nlpIntentDetector.reloadNlpIntentDetector(force=True)  # detector corpus v1
+    second = corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build v2
+
+    clock.now += nlpIntentDetector.DATASET_CHECK_INTERVAL / 2  # belum waktunya cek
+    assert nlpIntentDetector.getNlpIntentDetector() is detector  # tanpa cek stamp
+    clock.now += nlpIntentDetector.DATASET_CHECK_INTERVAL  # interval lewat
+    swapped = nlpIntentDetector.getNlpIntentDetector()  # cek stamp -> reload
+    assert swapped is not detector and swapped.datasetPath.endswith(second['highQualityFile'])  # detector build v2
+    assert nlpIntentDetector.getDatasetVersion()[0] == 2  # stamp ikut naik
+    clock.now += nlpIntentDetector.DATASET_CHECK_INTERVAL  # cek berikutnya
+    assert nlpIntentDetector.getNlpIntentDetector() is swapped  # dataset sama -> tanpa rebuild
+    assert len(detectorBuilds) == 2  # v1 + v2 saja
+
+def test_failed_reload_keeps_detector_without_rebuild_loop(processedDir, detectorBuilds, monkeypatch):  # file rusak dicoba lagi hanya kalau berubah lagi
+    monkeypatch.setattr(nlpIntentDetector, 'DATASET_CHECK_INTERVAL', 0.0)  # cek setiap request
+    first = corpusBuilder.buildCorpus(processedDir=processedDir)  # build v1
+    detector = nlpIntentDetector.reloadNlpIntentDetector(force=True)  # detector corpus v1
+    stamp = nlpIntentDetector.getDatasetVersion()  # stamp v1
+    datasetPath = os.path.join(processedDir, first['highQualityFile'])  # file aktif
+    with open(datasetPath, 'w', encoding='utf-8') as file:  # file diganti isi rusak
+        file.write('bukan,corpus\n1,2,3,4\n"\n')  # kolom corpus hilang
+    del detectorBuilds[:]  # hitung build setelah file rusak
+
+    assert nlpIntentDetector.getNlpIntentDetector() is detector  # reload gagal -> detector lama
+    assert len(detectorBuilds) == 1 and not detectorBuilds[0].datasetLoaded  # satu build gagal
+    for _ in range(3):  # request berikutnya
+        assert nlpIntentDetector.getNlpIntentDetector() is detector  # tetap detector lama
+    assert nlpIntentDetector.reloadNlpIntentDetector() is detector  # reload langsung juga tidak rebuild
+    assert len(detectorBuilds) == 1  # tidak ada rebuild ulang untuk file yang sama
+    assert nlpIntentDetector.getDatasetVersion() == stamp  # cache response tetap versi detector lama
+
+    second = corpusBuilder.buildCorpus(processedDir=processedDir, force=True)  # build baru yang valid
+    reloaded = nlpIntentDetector.getNlpIntentDetector()  # dataset berubah lagi -> dicoba lagi
+    assert reloaded is not detector and reloaded.datasetPath.endswith(second['highQualityFile'])  # hot-swap
+    assert len(detectorBuilds) == 2  # satu build baru
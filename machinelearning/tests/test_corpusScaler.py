@@ -0,0 +1,74 @@
+# Test Corpus Scaler - corpus sintetis seeded: skema sama, record_id unik, campuran kategori proporsional, typo tersuntik
+import csv
+import random
+from collections import Counter
+
+import pytest
+
+from corpusBuilder import HIGH_QUALITY_COLUMNS
+from corpusScaler import MIN_TYPO_LENGTH, TYPO_OPERATIONS, generateRows, makeTypo, scaleCorpus
+
+SOURCE_MIX = {'akademik': 20, 'sejarah': 12, 'lokasi': 8}  # jumlah baris sumber per kategori
+
+def sourceRows(seed=11):  # baris processed kecil dengan skema corpusBuilder
+    rng = random.Random(seed)  # generator reproducible
+    words = {'akademik': ['fakultas', 'program', 'studi', 'sarjana', 'informatika'], 'sejarah': ['didirikan', 'tahun', 'sejarah', 'bandung'], 'lokasi': ['alamat', 'jalan', 'ganesha', 'kampus']}  # vocabulary per kategori
+    rows = []  # baris sumber
+    for category, count in SOURCE_MIX.items():  # loop kategori
+        for _ in range(count):  # baris per kategori
+            content = ' '.join(rng.choice(words[category]) for _ in range(8))  # content acak
+            rows.append({
+                'record_id': len(rows) + 1, 'data_source': 'contoh', 'category': category, 'content': content,
+                'content_cleaned': content, 'content_length': len(content), 'quality_score': 80, 'links': None,
+                'type': 'p', 'processed_date': '2025-01-01 00:00:00', 'original_index': len(rows)
+            })  # satu baris
+    rng.shuffle(rows)  # kategori tidak berurutan
+    return rows  # baris sumber
+
+def test_generated_rows_keep_schema_ids_and_mix():  # generateRows seeded
+    rows = sourceRows()  # sumber 40 baris
+    output, stats = generateRows(rows, 4000, seed=7, typoRate=0.1)  # 100x
+    assert len(output) == 4000 and stats['originalRows'] == 40 and stats['syntheticRows'] == 3960  # jumlah baris
+    assert output[:40] == rows  # baris asli utuh di depan
+    assert all(list(row) == list(rows[0]) for row in output)  # skema (urutan kolom) sama dengan sumber
+    assert len({row['record_id'] for row in output}) == len(output)  # record_id unik
+    synthetic = Counter(row['category'] for row in output[40:])  # campuran kategori sintetis
+    for category, count in SOURCE_MIX.items():  # proporsi per kategori
+        assert synthetic[category] / 3960 == pytest.approx(count / 40, abs=0.03)  # sesuai proporsi sumber
+    assert stats['categories'] == dict(Counter(row['category'] for row in output))  # statistik sesuai baris
+    assert stats['typoWords'] > 0  # typo tersuntik
+    assert all(row['content_length'] == len(row['content']) for row in output)  # panjang dihitung ulang
+
+def test_seed_is_deterministic_and_typo_rate_zero_has_no_typos():  # seed sama -> corpus sama
+    rows = sourceRows()  # sumber
+    strip = lambda output: [{key: value for key, value in row.items() if key != 'processed_date'} for row in output]  # tanpa tanggal generate
+    first, _ = generateRows(rows, 500, seed=3)  # run pertama
+    second, _ = generateRows(rows, 500, seed=3)  # seed sama
+    third, _ = generateRows(rows, 500, seed=4)  # seed lain
+    assert strip(first) == strip(second) and strip(first) != strip(third)  # reproducible
+    _, stats = generateRows(rows, 500, seed=3, typoRate=0.0)  # tanpa typo
+    assert stats['typoWords'] == 0  # tidak ada typo
+
+def test_make_typo_operations():  # setiap jenis typo mengubah kata, huruf pertama tetap
+    rng = random.Random(5)  # generator reproducible
+    lengths = {'swap': 0, 'drop': -1, 'double': 1, 'substitute': 0}  # perubahan panjang per operasi
+    for operation in TYPO_OPERATIONS:  # semua operasi
+        for _ in range(50):  # banyak posisi
+            typo = makeTypo('fakultas', rng, operation)  # varian typo
+            assert typo[0] == 'f' and len(typo) == len('fakultas') + lengths[operation]  # huruf pertama + panjang
+    assert makeTypo('itb', rng) == 'itb' and len('itb') < MIN_TYPO_LENGTH  # kata pendek tidak diubah
+
+def test_scale_corpus_csv_has_source_header(tmp_path):  # CSV sintetis berskema sama dengan CSV sumber
+    pytest.importorskip('pandas')  # scaleCorpus memakai pandas
+    sourcePath, outputPath = str(tmp_path / 'source.csv'), str(tmp_path / 'scaled.csv')  # input + output
+    with open(sourcePath, 'w', encoding='utf-8', newline='') as file:  # tulis sumber
+        writer = csv.DictWriter(file, fieldnames=HIGH_QUALITY_COLUMNS)  # skema processed
+        writer.writeheader()  # header
+        writer.writerows(sourceRows())  # baris
+    stats = scaleCorpus(sourcePath, outputPath, 200, seed=1)  # 5x
+    with open(outputPath, encoding='utf-8', newline='') as file:  # baca hasil
+        reader = csv.DictReader(file)  # reader CSV
+        output = list(reader)  # baris hasil
+    assert reader.fieldnames == HIGH_QUALITY_COLUMNS  # header sama
+    assert len(output) == 200 and stats['syntheticRows'] == 160  # jumlah baris
+    assert len({row['record_id'] for row in output}) == 200  # record_id unik di CSV
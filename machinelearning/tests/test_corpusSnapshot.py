@@ -0,0 +1,41 @@
+# Test Corpus Snapshot - view lazy di atas mmap harus sama dengan entry/fitur dari CSV
+import pytest
+
+import dataLoader
+from corpusSnapshot import CorpusSnapshot, compileCorpusSnapshot
+
+@pytest.fixture(scope='module')
+def snapshot(tmp_path_factory):  # snapshot dari processed CSV aktif
+    snapshotPath = tmp_path_factory.mktemp('snapshot') / 'corpus.corpus'  # file sementara
+    return CorpusSnapshot(compileCorpusSnapshot(dataLoader.activeProcessedFile(), str(snapshotPath)))  # compile + buka
+
+@pytest.fixture(scope='module')
+def csvEntries():  # entry dari parse CSV (jalur tanpa snapshot)
+    import pandas as pd
+    frame = pd.read_csv(dataLoader.activeProcessedFile())  # parse CSV
+    return [{key: row.get(name, default) for key, name, default in dataLoader.ENTRY_COLUMNS} for _, row in frame.iterrows()]  # sama dengan loadCsvData
+
+def test_entriesMatchCsv(snapshot, csvEntries):  # SnapshotEntries sama dengan iterrows
+    entries = dataLoader.SnapshotEntries(snapshot)  # view entry
+    assert len(entries) == len(csvEntries)  # jumlah baris
+    for entry, expected in zip(entries, csvEntries):  # loop baris
+        assert entry.keys() == expected.keys()  # field sama
+        for key, value in entry.items():  # loop field
+            assert value == expected[key] or (value != value and expected[key] != expected[key]), key  # NaN == NaN
+    assert entries[-1] == entries[len(entries) - 1]  # index negatif
+    assert entries.values('category') == [entry['category'] for entry in entries]  # nilai satu kolom
+
+def test_entryFeaturesMatchCompileEntry(snapshot):  # SnapshotEntryFeatures sama dengan compileEntry
+    entries = dataLoader.SnapshotEntries(snapshot)  # view entry
+    features, tokenTable = dataLoader.compileEntries(entries)  # fitur view + tabel kata
+    assert isinstance(features, dataLoader.SnapshotEntryFeatures)  # tidak di-materialize
+    expectedFeatures, expectedTable = dataLoader.compileEntries(list(entries))  # jalur list biasa
+    for actual, expected in zip(features, expectedFeatures):  # loop entry
+        for name in dataLoader.EntryFeatures.__slots__:  # loop fitur
+            assert getattr(actual, name) == getattr(expected, name), name  # fitur sama
+    assert tokenTable.keys() == expectedTable.keys()  # kata clean sama
+
+@pytest.mark.parametrize('needle', ['itb', 'institut teknologi', 'a', '', ' ', '. ', 'é', 'tidak ada di corpus'])
+def test_containingMatchesSubstring(snapshot, needle):  # pencarian di blob mmap sama dengan operator in
+    contentLower = snapshot.contentLower()  # view content lowercase
+    assert contentLower.containing(needle) == [row for row, content in enumerate(contentLower) if needle in content]  # baris yang sama
@@ -0,0 +1,96 @@
+# Test Crawler - crawl fixture lewat fixtureServer: written -> unchanged (304) -> written lagi, CSV sama dengan scrapper lama
+import csv
+import os
+import shutil
+import sys
+from urllib.parse import urlsplit
+
+import pytest
+
+pytest.importorskip('bs4')  # dependency scrapper
+pytest.importorskip('requests')  # dependency scrapper
+from bs4 import BeautifulSoup
+
+scrapperDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'database', 'scrapper')  # direktori crawler + fixture
+if scrapperDir not in sys.path:  # belum ada
+    sys.path.insert(0, scrapperDir)  # import crawler / fixtureServer flat
+
+from crawler import TARGETS, crawl
+from fixtureServer import serveFixtures
+
+FIXTURE_DIR = os.path.join(scrapperDir, 'fixtures')  # halaman HTML fixture (path sama dengan URL target)
+
+def oldScraperCsv(body, outputPath):  # isi script scrapper lama (requests.get + bs4 + csv), tanpa network
+    soup = BeautifulSoup(body, "html.parser")
+    rows = []
+    for tag in soup.find_all(["h1", "h2", "h3", "h4", "h5", "p", "li"]):
+        text = tag.get_text(strip=True)
+        links = [a['href'] for a in tag.find_all('a', href=True)]
+        link_str = " ".join(links)
+        rows.append([tag.name, text, link_str])
+    with open(outputPath, mode="w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["type", "content", "links"])
+        for row in rows:
+            writer.writerow(row)
+
+def fixturePath(fixtureDir, target):  # file fixture untuk target (path URL asli)
+    return os.path.join(fixtureDir, *urlsplit(TARGETS[target].url).path.strip('/').split('/'))  # path URL -> file
+
+def readBytes(path):  # isi file
+    with open(path, 'rb') as file:  # baca biner
+        return file.read()  # bytes
+
+@pytest.fixture
+def fixtureDir(tmp_path):  # salinan fixture (boleh diubah test)
+    directory = tmp_path / 'fixtures'  # direktori fixture
+    shutil.copytree(FIXTURE_DIR, directory)  # salin semua halaman
+    return str(directory)  # path
+
+def test_fixtures_exist_for_every_target():  # setiap target bawaan punya halaman fixture
+    for name in TARGETS:  # loop target
+        assert os.path.isfile(fixturePath(FIXTURE_DIR, name)), name  # fixture ada
+
+def test_crawl_written_unchanged_rewritten(fixtureDir, tmp_path):  # alur conditional GET + re-crawl incremental
+    outputDir = str(tmp_path / 'out')  # CSV output
+    options = {'cacheDir': str(tmp_path / 'cache'), 'hostDelay': 0.0, 'workers': 2}  # cache terpisah per test, tanpa jeda
+    names = sorted(TARGETS)  # semua target
+    with serveFixtures(fixtureDir) as server:  # server fixture lokal
+        targets = [TARGETS[name].rebased(server.baseUrl) for name in names]  # path sama, host lokal
+
+        first = crawl(targets, outputDir, **options)  # crawl pertama
+        assert [result['status'] for result in first] == ['written'] * len(names)  # semua ditulis
+        assert [result['fetch'] for result in first] == ['fetched'] * len(names)  # semua 200
+        for name, result in zip(names, first):  # CSV sama dengan scrapper lama
+            expectedPath = str(tmp_path / f"old_{name}.csv")  # CSV referensi
+            oldScraperCsv(readBytes(fixturePath(fixtureDir, name)), expectedPath)  # tulis dengan kode lama
+            assert readBytes(result['outputPath']) == readBytes(expectedPath), name  # byte-identik
+            assert result['rows'] > 0  # fixture punya konten
+
+        del server.requestLog[:]  # hitung request run kedua saja
+        second = crawl(targets, outputDir, **options)  # crawl ulang tanpa perubahan
+        assert [result['status'] for result in second] == ['unchanged'] * len(names)  # tidak ditulis ulang
+        assert [result['fetch'] for result in second] == ['notModified'] * len(names)  # validator dikirim
+        assert sorted(status for path, status in server.requestLog if path != '/robots.txt') == [304] * len(names)  # server menjawab 304
+
+        editedName = names[0]  # fixture yang diubah
+        editedPath = fixturePath(fixtureDir, editedName)  # file fixture
+        editedBody = readBytes(editedPath).replace(b'</body>', b'<p>Paragraf baru <a href="/baru">tautan</a></p>\n</body>')  # tambah paragraf
+        with open(editedPath, 'wb') as file:  # tulis fixture baru
+            file.write(editedBody)  # isi baru (ETag berubah)
+        third = crawl(targets, outputDir, **options)  # crawl setelah fixture berubah
+        statuses = {name: result['status'] for name, result in zip(names, third)}  # status per target
+        assert statuses == {name: 'written' if name == editedName else 'unchanged' for name in names}  # hanya yang berubah ditulis ulang
+        assert third[0]['fetch'] == 'fetched' and third[0]['rows'] == first[0]['rows'] + 1  # body baru, satu baris tambahan
+        expectedPath = str(tmp_path / 'old_edited.csv')  # CSV referensi setelah edit
+        oldScraperCsv(editedBody, expectedPath)  # tulis dengan kode lama
+        assert readBytes(third[0]['outputPath']) == readBytes(expectedPath)  # byte-identik
+
+def test_force_rewrites_unchanged(fixtureDir, tmp_path):  # --force extract ulang walau 304
+    outputDir = str(tmp_path / 'out')  # CSV output
+    options = {'cacheDir': str(tmp_path / 'cache'), 'hostDelay': 0.0}  # cache terpisah
+    with serveFixtures(fixtureDir) as server:  # server fixture lokal
+        targets = [TARGETS['multikampus'].rebased(server.baseUrl)]  # satu target
+        crawl(targets, outputDir, **options)  # crawl pertama
+        forced = crawl(targets, outputDir, force=True, **options)  # paksa
+    assert forced[0]['status'] == 'written' and forced[0]['fetch'] == 'notModified'  # body dari cache, tetap ditulis
@@ -0,0 +1,46 @@
+# Test Fuzzy Index - findSimilar dengan pruning harus sama persis dengan scan brute-force advancedFuzzySimilarity
+import pytest
+
+import matching
+from fuzzyIndex import MIN_EXACT_THRESHOLD, BKTree, FuzzyVocabularyIndex
+
+TYPO_WORDS = ['fakultsa', 'sejarh', 'teknolgi', 'bandng', 'ganesa', 'informatka', 'mahasisw', 'institt', 'kampsu', 'beasiwa']  # typo kata umum
+EDGE_WORDS = ['it', 'ab', 'x1', 'zz', 'itttb', 'kampuuus', 'aaaa', 'ssssssss', '1920', '1959', '2025', 'no10', 'stei2024', 'zzzzzzzzzzzzzzzzzzzz']  # pendek, huruf berulang, digit, panjang
+THRESHOLDS = [0.3, MIN_EXACT_THRESHOLD, 0.5, 0.6, 0.75, 0.9]  # termasuk tepat 0.43 dan satu di bawahnya (jalur scan penuh)
+
+@pytest.fixture(scope='module')
+def vocabulary():  # vocabulary fuzzy corpus asli
+    return list(matching.getInvertedIndex().fuzzyVocabulary)  # kata clean dari index
+
+@pytest.fixture(scope='module')
+def queries(vocabulary):  # typo, edge case, dan beberapa kata vocabulary persis
+    return TYPO_WORDS + EDGE_WORDS + vocabulary[::max(1, len(vocabulary) // 8)][:8]  # sampel kata exact yang reproducible
+
+@pytest.fixture(scope='module')
+def bruteForce(vocabulary, queries):  # skor semua pasangan query x vocabulary, dihitung sekali
+    return {query: {word: matching.advancedFuzzySimilarity(query, word) for word in vocabulary} for query in queries}  # scan penuh tanpa pruning
+
+def buildIndex(vocabulary, bruteForce, useVectorized):  # index baru, skor diambil dari tabel brute-force
+    similarityFn = lambda query, word: bruteForce[query][word]  # skor sama dengan advancedFuzzySimilarity, yang dites cuma pruning kandidat
+    index = FuzzyVocabularyIndex(vocabulary, similarityFn, matching.levenshteinDistance, matching.soundex, useVectorized=useVectorized)  # index jalur yang dites
+    if useVectorized and index.vocabularyMatrix is None:  # NumPy/SciPy tidak tersedia
+        pytest.skip('batchSimilarity tidak tersedia')  # jalur vectorized tidak bisa dites
+    return index  # return index
+
+@pytest.mark.parametrize('useVectorized', [False, True], ids=['bkTree', 'vectorized'])
+def test_findSimilarMatchesBruteForce(vocabulary, queries, bruteForce, useVectorized):  # pruning tidak boleh membuang kata yang lolos threshold
+    index = buildIndex(vocabulary, bruteForce, useVectorized)  # index jalur yang dites
+    for query in queries:  # loop query
+        for threshold in THRESHOLDS:  # loop threshold
+            expected = {word: score for word, score in bruteForce[query].items() if score >= threshold}  # hasil brute-force
+            assert index.findSimilar(query, threshold) == expected, (query, threshold)  # kata dan skor identik
+
+def test_bkTreeSearchMatchesBruteForce(vocabulary, queries):  # radius search BK-tree sama dengan scan Levenshtein
+    tree = BKTree(matching.levenshteinDistance)  # tree baru
+    for wordId, word in enumerate(vocabulary):  # isi tree
+        tree.add(word, wordId)  # tambah kata
+    for query in queries:  # loop query
+        distances = [matching.levenshteinDistance(query, word) for word in vocabulary]  # jarak brute-force, sekali per query
+        for radius in (0, 1, 2, 4):  # beberapa radius
+            expected = {wordId: distance for wordId, distance in enumerate(distances) if distance <= radius}  # kata dalam radius
+            assert tree.search(query, radius) == expected, (query, radius)  # id dan jarak identik
@@ -0,0 +1,8 @@
+# Test Import Budget - import pipeline ML harus di bawah budget dan tanpa modul berat / network
+import importBudget
+
+def test_importWithinBudget():  # cold import di subprocess baru
+    assert importBudget.checkBudget() == []  # tidak ada pelanggaran
+
+def test_violationsReported():  # budget yang mustahil harus gagal
+    assert any(violation.startswith('import time') for violation in importBudget.checkBudget(budgetMs=0))  # waktu lewat budget
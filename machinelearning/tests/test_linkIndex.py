@@ -0,0 +1,83 @@
+# Test Link Index - findRelevantLinks lewat LinkIndex.topRows harus sama dengan versi DataFrame isin/iterrows lama
+import re
+
+import pytest
+
+pd = pytest.importorskip('pandas')  # versi lama memakai DataFrame
+import dataLoader
+import nlpIntentDetector
+
+CATEGORY_MAPPING = {  # mapping intent -> kategori di findRelevantLinks
+    'kepanjanganItb': ['sejarah', 'umum'],
+    'jumlahFakultas': ['akademik', 'fakultas'],
+    'sejarahItb': ['sejarah'],
+    'lokasiItb': ['lokasi', 'fasilitas'],
+    'infoUmumItb': ['sejarah', 'umum', 'akademik']
+}
+INTENTS = list(CATEGORY_MAPPING) + ['intentLain']  # semua intent + intent tanpa mapping (default 'umum')
+QUERIES = [  # kata yang sering muncul, substring, duplikat, typo, kosong
+    'apa kepanjangan itb',
+    'berapa jumlah fakultas di itb',
+    'sejarah itb sejarah',
+    'lokasi kampus ganesha bandung',
+    'gimana info umum itb',
+    'itb',
+    'qwerty zxcv',
+    '',
+]
+TOP_KS = [0, 1, 3, 10, 1000]  # kosong, satu, default, banyak, melebihi jumlah baris
+
+def oldFindRelevantLinks(datasetDf, preprocessText, intent, query, topK):  # findRelevantLinks sebelum LinkIndex (isi method lama)
+    relevantLinks = []
+    targetCategories = CATEGORY_MAPPING.get(intent, ['umum'])
+    filteredDf = datasetDf[datasetDf['category'].isin(targetCategories)]
+    filteredDf = filteredDf[filteredDf['links'].notna() & (filteredDf['links'] != '')]
+    if len(filteredDf) == 0:
+        return []
+    queryWords = preprocessText(query).split()
+    scores = []
+    for idx, row in filteredDf.iterrows():
+        score = 0.0
+        content = str(row['content']).lower()
+        for word in queryWords:
+            if word in content:
+                score += 1.0
+        qualityScore = row.get('quality_score', 0)
+        score += qualityScore / 100.0
+        scores.append((idx, score))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    for idx, score in scores[:topK]:
+        row = filteredDf.loc[idx]
+        links = str(row['links'])
+        linkList = re.split(r'[,\s]+', links)
+        linkList = [link.strip() for link in linkList if link.strip() and link.startswith('http')]
+        if linkList:
+            relevantLinks.append({
+                'content': str(row['content'])[:100] + '...' if len(str(row['content'])) > 100 else str(row['content']),
+                'links': linkList[:2],
+                'category': row['category'],
+                'score': score
+            })
+    return relevantLinks
+
+@pytest.fixture(scope='module')
+def corpus():  # detector + DataFrame dari corpus aktif yang sama
+    path = dataLoader.activeProcessedFile()  # corpus aktif
+    detector = nlpIntentDetector.NaturalLanguageIntentDetector(path)  # detector dengan LinkIndex
+    if detector.linkIndex is None:  # corpus tidak ada
+        pytest.skip('corpus processed tidak tersedia')  # tidak ada yang dibandingkan
+    return detector, pd.read_csv(path)  # detector + DataFrame
+
+def test_corpus_has_rows_for_every_mapped_category(corpus):  # perbandingan tidak kosong semua
+    detector, datasetDf = corpus  # detector + DataFrame
+    linked = datasetDf[datasetDf['links'].notna() & (datasetDf['links'] != '')]  # baris berlink
+    assert set(linked['category']) & {category for categories in CATEGORY_MAPPING.values() for category in categories}  # ada kategori target
+    assert detector.linkIndex.rowCount == len(datasetDf)  # index dibangun dari semua baris
+
+@pytest.mark.parametrize('topK', TOP_KS)
+@pytest.mark.parametrize('intent', INTENTS)
+def test_topRows_matches_dataframe_version(corpus, intent, topK):  # semua intent x query x topK
+    detector, datasetDf = corpus  # detector + DataFrame
+    for query in QUERIES:  # 8 query
+        expected = oldFindRelevantLinks(datasetDf, detector.preprocessText, intent, query, topK)  # versi lama
+        assert detector.findRelevantLinks(intent, query, topK) == expected, (intent, query, topK)  # urutan, skor, link, preview sama
@@ -0,0 +1,81 @@
+# Test LRU Cache - kapasitas, urutan LRU, counter hit/miss/eviction dan memo similarity detector
+from difflib import SequenceMatcher
+
+import pytest
+
+import nlpIntentDetector
+from lruCache import LruCache
+
+def test_eviction_keeps_max_size():  # item paling lama dipakai dibuang, ukuran tidak pernah lewat maxSize
+    cache = LruCache(3)  # tiga item
+    for key in range(10):  # sepuluh put
+        cache.put(key, key * key)  # simpan
+        assert len(cache) <= 3  # kapasitas terjaga
+    assert [cache.get(key) for key in (7, 8, 9)] == [49, 64, 81]  # tiga terakhir tetap
+    assert cache.get(0) is None and cache.get(6, 'hilang') == 'hilang'  # yang lama dibuang, default dikembalikan
+    assert cache.stats()['evictions'] == 7  # 10 put - 3 slot
+
+def test_get_moves_key_to_most_recent():  # get menyelamatkan key dari eviction berikutnya
+    cache = LruCache(2)  # dua item
+    cache.put('a', 1)  # paling lama
+    cache.put('b', 2)  # paling baru
+    assert cache.get('a') == 1  # a jadi paling baru
+    cache.put('c', 3)  # buang b
+    assert cache.get('b') is None and cache.get('a') == 1 and cache.get('c') == 3  # b yang dibuang
+    cache.put('a', 10)  # update key lama juga menandai baru dipakai
+    cache.put('d', 4)  # buang c
+    assert cache.get('c') is None and cache.get('a') == 10  # c yang dibuang
+
+def test_counters_add_up():  # hits + misses = lookup, hitRate konsisten
+    cache = LruCache(2)  # dua item
+    lookups = 0  # jumlah get
+    for key in ['a', 'b', 'a', 'c', 'a', 'b', 'd', 'a']:  # pola akses
+        if cache.get(key) is None:  # miss
+            cache.put(key, key.upper())  # isi memo
+        lookups += 1  # hitung lookup
+    stats = cache.stats()  # statistik
+    assert stats['hits'] + stats['misses'] == lookups  # semua lookup tercatat
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (2, 6, 4)  # hit hanya a ke-2 dan a ke-3, a terakhir sudah dibuang d
+    assert stats['size'] == len(cache) == 2 and stats['maxSize'] == 2  # ukuran
+    assert stats['hitRate'] == pytest.approx(2 / 8)  # rasio hit
+    cache.clear()  # kosongkan
+    assert len(cache) == 0 and cache.stats()['hits'] == 2  # counter tetap setelah clear
+
+def test_disabled_cache():  # maxSize <= 0 -> tidak menyimpan apa-apa
+    cache = LruCache(0)  # cache mati
+    cache.put('a', 1)  # diabaikan
+    assert cache.get('a') is None and len(cache) == 0  # selalu miss
+    assert cache.stats()['misses'] == 1 and cache.stats()['evictions'] == 0  # tanpa eviction
+
+@pytest.fixture(scope='module')
+def detector():  # detector asli (semua test memakai memo miliknya sendiri)
+    return nlpIntentDetector.NaturalLanguageIntentDetector()  # dataset corpus aktif
+
+def test_calculate_similarity_matches_sequence_matcher(detector):  # memo tidak mengubah nilai, urutan kata bagian dari key
+    detector.clearCaches()  # memo kosong
+    pairs = [('fakultas', 'fakultsa'), ('fakultsa', 'fakultas'), ('itb', 'institut'), ('sejarah', 'sejarah'), ('', 'a'), ('abcab', 'cabca')]  # termasuk pasangan tidak simetris
+    for _ in range(2):  # miss lalu hit
+        for word1, word2 in pairs:  # loop pasangan
+            assert detector.calculateSimilarity(word1, word2) == SequenceMatcher(None, word1, word2).ratio()  # nilai sama persis
+
+def test_cache_stats_reflect_memo_use(detector, monkeypatch):  # getCacheStats()['similarity'] mengikuti pemakaian memo
+    monkeypatch.setattr(detector, 'similarityCache', LruCache(4))  # memo kecil buat eviction
+    pairs = [('kampus', 'kampsu'), ('ganesha', 'ganesa'), ('kampus', 'kampsu')]  # pasangan ketiga = hit
+    for word1, word2 in pairs:  # loop pasangan
+        detector.calculateSimilarity(word1, word2)  # isi memo
+    stats = detector.getCacheStats()['similarity']  # statistik memo
+    assert (stats['hits'], stats['misses'], stats['size'], stats['evictions']) == (1, 2, 2, 0)  # dua hitung, satu memo
+    for index in range(5):  # pasangan baru melebihi kapasitas
+        detector.calculateSimilarity(f'kata{index}', 'kata')  # miss
+    stats = detector.getCacheStats()['similarity']  # statistik memo
+    assert (stats['misses'], stats['size'], stats['evictions']) == (7, 4, 3)  # memo terbatas maxSize
+
+def test_detect_intent_uses_similarity_memo(detector):  # query berulang dilayani memo similarity
+    detector.clearCaches()  # memo kosong
+    before = detector.getCacheStats()['similarity']  # statistik awal
+    first = detector.detectIntentNlp('sejarh kampus ganesa')  # query dengan typo (fuzzy)
+    middle = detector.getCacheStats()['similarity']  # setelah query pertama
+    assert middle['misses'] > before['misses'] and middle['size'] > 0  # similarity dihitung dan disimpan
+    assert detector.detectIntentNlp('sejarh kampus ganesa')[:2] == first[:2]  # hasil sama
+    after = detector.getCacheStats()['similarity']  # setelah query kedua
+    assert after['misses'] == middle['misses'] and after['hits'] > middle['hits']  # semua dari memo
@@ -0,0 +1,116 @@
+# Test Pipeline Metrics - exposition histogram/counter Prometheus, nested timed() dan route /metrics
+import os
+import sys
+
+import pytest
+
+import pipelineMetrics
+from pipelineMetrics import Counter, Histogram, countFuzzyComparisons, formatLabels, takeFuzzyComparisons, timed
+
+def test_histogram_render_cumulative_buckets():  # bucket kumulatif, +Inf, _sum dan _count per label set
+    histogram = Histogram('latency_seconds', 'Latency', (0.1, 0.5, 1.0), ('stage',))  # tiga bucket
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0):  # 0.1 masuk le="0.1" (batas inklusif)
+        histogram.observe(value, stage='match')  # observasi stage match
+    histogram.observe(0.2, stage='nlp')  # seri kedua
+    lines = histogram.render()  # baris exposition
+    assert lines[:2] == ['# HELP latency_seconds Latency', '# TYPE latency_seconds histogram']  # header
+    assert lines[2:] == [  # seri urut label, bucket kumulatif
+        'latency_seconds_bucket{stage="match",le="0.1"} 2',
+        'latency_seconds_bucket{stage="match",le="0.5"} 3',
+        'latency_seconds_bucket{stage="match",le="1"} 4',
+        'latency_seconds_bucket{stage="match",le="+Inf"} 5',
+        'latency_seconds_sum{stage="match"} 3.15',
+        'latency_seconds_count{stage="match"} 5',
+        'latency_seconds_bucket{stage="nlp",le="0.1"} 0',
+        'latency_seconds_bucket{stage="nlp",le="0.5"} 1',
+        'latency_seconds_bucket{stage="nlp",le="1"} 1',
+        'latency_seconds_bucket{stage="nlp",le="+Inf"} 1',
+        'latency_seconds_sum{stage="nlp"} 0.2',
+        'latency_seconds_count{stage="nlp"} 1',
+    ]
+
+def test_histogram_without_labels():  # histogram tanpa label: le satu-satunya label
+    histogram = Histogram('candidates', 'Kandidat', (0, 10))  # bucket jumlah
+    histogram.observe(0)  # nol masuk le="0"
+    histogram.observe(25)  # di atas bucket terakhir
+    assert histogram.render()[2:] == ['candidates_bucket{le="0"} 1', 'candidates_bucket{le="10"} 1', 'candidates_bucket{le="+Inf"} 2', 'candidates_sum 25', 'candidates_count 2']  # tanpa label set di _sum/_count
+
+def test_label_values_escaped():  # backslash, kutip dan newline di nilai label
+    assert formatLabels(('source',), ('a"b\\c\nd',)) == '{source="a\\"b\\\\c\\nd"}'  # escape Prometheus
+    counter = Counter('answers_total', 'Jawaban', ('source',))  # counter berlabel
+    counter.inc(source='nlp "yakin"')  # nilai dengan kutip
+    counter.inc(2, source='nlp "yakin"')  # label set sama
+    assert counter.render()[2:] == ['answers_total{source="nlp \\"yakin\\""} 3']  # satu sample, nilai bulat
+    assert formatLabels((), ()) == ''  # tanpa label
+
+@pytest.fixture
+def comparisonHistogram(monkeypatch):  # histogram fuzzy comparison baru + counter thread bersih
+    if not pipelineMetrics.METRICS_ENABLED:  # timed() tidak membungkus
+        pytest.skip('METRICS_ENABLED=0')  # instrumentasi mati
+    histogram = Histogram('fuzzy', 'Fuzzy', pipelineMetrics.COUNT_BUCKETS, ('stage',))  # histogram test
+    monkeypatch.setattr(pipelineMetrics, 'fuzzyComparisons', histogram)  # dipakai timed()
+    monkeypatch.setattr(pipelineMetrics, 'stageDuration', Histogram('duration', 'Duration', pipelineMetrics.LATENCY_BUCKETS, ('stage',)))  # latency test tidak masuk registry
+    takeFuzzyComparisons()  # sisa hitungan test lain
+    return histogram  # histogram test
+
+def observedSum(histogram, stage):  # total comparison yang di-observe satu stage
+    return next(line for line in histogram.render() if line.startswith(f'fuzzy_sum{{stage="{stage}"}}')).split()[-1]  # nilai _sum
+
+def test_nested_timed_restores_outer_comparisons(comparisonHistogram):  # request -> match: hitungan match tidak bocor, hitungan request tidak hilang
+    @timed('match', countComparisons=True)
+    def match():  # stage dalam
+        countFuzzyComparisons(7)  # comparison match
+        return 'hasil'  # hasil stage
+
+    @timed('request', countComparisons=True)
+    def request():  # stage luar
+        countFuzzyComparisons(2)  # comparison sebelum match
+        result = match()  # stage bersarang
+        countFuzzyComparisons(3)  # comparison setelah match
+        return result  # hasil
+
+    countFuzzyComparisons(11)  # hitungan di luar semua stage (caller request)
+    assert request() == 'hasil'  # nilai return diteruskan
+    assert observedSum(comparisonHistogram, 'match') == '7'  # hanya comparison match
+    assert observedSum(comparisonHistogram, 'request') == '5'  # comparison request sebelum + sesudah match
+    assert takeFuzzyComparisons() == 11  # hitungan caller dikembalikan
+
+def test_timed_restores_comparisons_when_stage_raises(comparisonHistogram, monkeypatch):  # stage gagal tetap observe dan mengembalikan hitungan luar
+    errors = Counter('errors', 'Errors', ('stage',))  # counter error test
+    monkeypatch.setattr(pipelineMetrics, 'stageErrors', errors)  # dipakai timed()
+
+    @timed('match', countComparisons=True)
+    def match():  # stage gagal
+        countFuzzyComparisons(4)  # comparison sebelum error
+        raise ValueError('rusak')  # error stage
+
+    countFuzzyComparisons(6)  # hitungan stage luar
+    with pytest.raises(ValueError):  # exception diteruskan
+        match()  # stage gagal
+    assert observedSum(comparisonHistogram, 'match') == '4'  # comparison tetap di-observe
+    assert takeFuzzyComparisons() == 6  # hitungan luar kembali
+    assert errors.render()[2:] == ['errors{stage="match"} 1']  # error dicatat
+
+def test_metrics_route(monkeypatch):  # /metrics mengembalikan exposition text semua registry
+    pytest.importorskip('flask')  # dependency backend
+    backendDir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'backend')  # direktori backend
+    if backendDir not in sys.path:  # belum ada
+        sys.path.insert(0, backendDir)  # import routes seperti backend
+    from flask import Flask
+    from routes.routes import apiBp
+    from services import services
+    histogram = Histogram('itbchatbot_test_seconds', 'Test', (1.0,), ('stage',))  # metric test
+    histogram.observe(0.5, stage='match')  # satu observasi
+    monkeypatch.setattr(services, 'renderMetrics', lambda: '\n'.join(histogram.render()) + '\n')  # registry test
+    app = Flask(__name__)  # app tanpa warm-up asli
+    app.register_blueprint(apiBp)  # route /metrics
+    response = app.test_client().get('/metrics')  # scrape
+    assert response.status_code == 200  # sukses
+    assert response.mimetype == 'text/plain' and 'version=0.0.4' in response.content_type  # format Prometheus
+    assert response.get_data(as_text=True).splitlines() == histogram.render()  # isi exposition
+
+def test_render_metrics_includes_registry():  # renderMetrics menggabungkan semua metric registry
+    text = pipelineMetrics.renderMetrics()  # exposition text
+    assert text.endswith('\n')  # newline akhir
+    for metric in pipelineMetrics.REGISTRY:  # loop metric
+        assert f'# TYPE {metric.name} ' in text  # header setiap metric
@@ -0,0 +1,87 @@
+# Test Preprocessing - run terputus lalu resume (chunk size beda) harus byte-identik dengan satu pass dan DictWriter lama
+import csv
+import os
+import random
+
+import pytest
+
+import preprocessing
+from preprocessing import CHECKPOINT_SUFFIX, preprocess
+
+class Interrupted(Exception):  # proses mati di tengah run
+    pass
+
+def oldPreprocessingCsv(inputCsv, outputCsv, textColumn):  # preprocessing() sebelum streaming (DictReader/DictWriter)
+    with open(inputCsv, 'r', encoding='utf-8') as infile, open(outputCsv, 'w', encoding='utf-8', newline='') as outfile:
+        reader = csv.DictReader(infile)
+        fieldnames = reader.fieldnames + ['preprocessed']
+        writer = csv.DictWriter(outfile, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in reader:
+            original = row[textColumn]
+            row['preprocessed'] = preprocess(original)
+            writer.writerow(row)
+
+def readBytes(path):  # isi file
+    with open(path, 'rb') as file:  # baca biner
+        return file.read()  # bytes
+
+@pytest.fixture
+def inputCsv(tmp_path):  # CSV seeded: koma, kutip, multiline, Unicode, baris pendek dan baris kosong
+    rng = random.Random(20250623)  # seed tetap
+    words = ['Institut', 'Teknologi', 'Bandung', 'fakultas', 'mahasiswanya', 'pendaftaran', 'gimana', 'apa', 'itu', 'ITB?', 'kampus,', '"Ganesha"', 'café', 'riset…', 'dan', 'di']  # token teks
+    path = str(tmp_path / 'input.csv')  # file input
+    with open(path, 'w', encoding='utf-8', newline='') as file:  # tulis input
+        writer = csv.writer(file)  # writer CSV
+        writer.writerow(['id', 'content', 'links'])  # header
+        for index in range(53):  # jumlah baris tidak habis dibagi chunk size
+            content = ' '.join(rng.choice(words) for _ in range(rng.randint(0, 12)))  # teks acak
+            if index % 9 == 4:  # field multiline
+                content += '\nbaris kedua'  # newline di dalam field
+            if index % 11 == 7:  # baris pendek (field kurang)
+                writer.writerow([index, content])  # tanpa links
+            else:  # baris lengkap
+                writer.writerow([index, content, f"https://itb.ac.id/{index}"])  # dengan links
+            if index % 13 == 5:  # baris kosong dilewati DictReader
+                file.write('\r\n')  # baris kosong
+    return path  # path input
+
+def interruptAfter(rows):  # progress yang mematikan run setelah checkpoint melewati jumlah baris
+    def progress(rowsDone, seconds, rowsPerSec):  # dipanggil setelah checkpoint disimpan
+        if rowsDone >= rows:  # cukup jauh
+            raise Interrupted(rowsDone)  # mati di tengah run
+    return progress  # callable progress
+
+def test_resume_with_other_chunk_size_is_byte_identical(inputCsv, tmp_path):  # terputus -> resume == satu pass == DictWriter lama
+    expectedPath = str(tmp_path / 'old.csv')  # output implementasi lama
+    oldPreprocessingCsv(inputCsv, expectedPath, 'content')  # DictWriter
+    singlePath = str(tmp_path / 'single.csv')  # satu pass
+    assert preprocessing.preprocessing(inputCsv, singlePath, 'content', workers=1) == 53  # semua baris
+    assert readBytes(singlePath) == readBytes(expectedPath)  # sama dengan kode lama
+
+    outputPath = str(tmp_path / 'resumed.csv')  # run yang terputus
+    with pytest.raises(Interrupted):  # mati setelah 3 chunk
+        preprocessing.preprocessing(inputCsv, outputPath, 'content', workers=1, chunkSize=7, progress=interruptAfter(21))  # chunk 7 baris
+    assert os.path.exists(outputPath + CHECKPOINT_SUFFIX)  # checkpoint tertinggal
+    with open(outputPath, 'ab') as partial:  # chunk berikutnya sempat setengah ditulis
+        partial.write(b'99,"setengah baris')  # sampah setelah checkpoint
+    assert preprocessing.preprocessing(inputCsv, outputPath, 'content', workers=2, chunkSize=5, resume=True) == 53  # checkpoint di tengah chunk 5 baris
+    assert readBytes(outputPath) == readBytes(singlePath)  # byte-identik dengan satu pass
+    assert not os.path.exists(outputPath + CHECKPOINT_SUFFIX)  # checkpoint dihapus setelah selesai
+
+def test_fresh_run_deletes_stale_checkpoint(inputCsv, tmp_path, monkeypatch):  # run tanpa resume tidak mewariskan checkpoint lama
+    outputPath = str(tmp_path / 'out.csv')  # output
+    with pytest.raises(Interrupted):  # run pertama terputus, checkpoint tertinggal
+        preprocessing.preprocessing(inputCsv, outputPath, 'content', workers=1, chunkSize=10, progress=interruptAfter(30))  # 3 chunk
+    def failingChunk(texts):  # run kedua mati sebelum chunk pertama selesai
+        raise Interrupted(0)  # belum ada checkpoint baru
+    monkeypatch.setattr(preprocessing, 'preprocessChunk', failingChunk)  # preprocess gagal
+    with pytest.raises(Interrupted):  # run baru (tanpa resume) terputus
+        preprocessing.preprocessing(inputCsv, outputPath, 'content', workers=1, chunkSize=10)  # output ditimpa header saja
+    assert not os.path.exists(outputPath + CHECKPOINT_SUFFIX)  # checkpoint run pertama dibuang
+    monkeypatch.undo()  # preprocess normal lagi
+
+    assert preprocessing.preprocessing(inputCsv, outputPath, 'content', workers=1, resume=True) == 53  # resume tanpa checkpoint = mulai ulang
+    expectedPath = str(tmp_path / 'old.csv')  # output implementasi lama
+    oldPreprocessingCsv(inputCsv, expectedPath, 'content')  # DictWriter
+    assert readBytes(outputPath) == readBytes(expectedPath)  # tidak ada baris yang hilang/dobel
@@ -0,0 +1,99 @@
+# Test Response Cache - TTL, urutan LRU, batas byte, item kebesaran, cache mati dan invalidasi versi
+import os
+import sys
+
+import pytest
+
+backendDir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'backend')  # direktori backend
+if backendDir not in sys.path:  # belum ada
+    sys.path.insert(0, backendDir)  # import services seperti backend
+
+from services import responseCache
+from services.responseCache import ResponseCache, estimateSize
+
+@pytest.fixture
+def clock(monkeypatch):  # time.monotonic yang dimajukan manual oleh test
+    now = [1000.0]  # detik
+    monkeypatch.setattr(responseCache.time, 'monotonic', lambda: now[0])  # dipakai get/put
+    return now  # now[0] += detik
+
+def response(answer):  # response detectIntentService kecil
+    return {'intent': None, 'answer': answer, 'source': 'csv_matching'}  # bentuk response
+
+def test_ttl_expiry(clock):  # item lebih tua dari ttlSeconds dibuang saat get
+    cache = ResponseCache(maxEntries=8, ttlSeconds=10, maxBytes=0)  # TTL 10 detik
+    cache.put('apa itu itb', response('ITB'))  # simpan
+    clock[0] += 4  # umur 4 detik
+    assert cache.get('apa itu itb') == (response('ITB'), 4)  # hit dengan umur
+    clock[0] += 6  # umur tepat 10 detik (masih berlaku)
+    assert cache.get('apa itu itb') is not None  # batas inklusif
+    clock[0] += 0.5  # lewat TTL
+    assert cache.get('apa itu itb') is None  # kedaluwarsa
+    stats = cache.stats()  # statistik
+    assert (stats['hits'], stats['misses'], stats['expirations'], stats['size'], stats['bytes']) == (2, 1, 1, 0, 0)  # item dibuang
+
+def test_ttl_zero_never_expires(clock):  # ttlSeconds <= 0 = tanpa TTL
+    cache = ResponseCache(maxEntries=8, ttlSeconds=0, maxBytes=0)  # tanpa TTL
+    cache.put('q', response('a'))  # simpan
+    clock[0] += 10 ** 6  # jauh di masa depan
+    assert cache.get('q') is not None and cache.stats()['expirations'] == 0  # tetap hit
+
+def test_lru_order(clock):  # get memindahkan key ke paling baru, eviction membuang yang paling lama dipakai
+    cache = ResponseCache(maxEntries=2, ttlSeconds=0, maxBytes=0)  # dua item
+    cache.put('a', response('A'))  # paling lama
+    cache.put('b', response('B'))  # paling baru
+    assert cache.get('a') is not None  # a jadi paling baru
+    cache.put('c', response('C'))  # kapasitas penuh -> buang b
+    assert cache.get('b') is None  # b dibuang
+    assert cache.get('a') is not None and cache.get('c') is not None  # a dan c tetap
+    cache.put('a', response('A2'))  # ganti item lama (bukan eviction)
+    assert cache.get('a')[0] == response('A2')  # nilai baru
+    stats = cache.stats()  # statistik
+    assert (stats['size'], stats['evictions']) == (2, 1)  # satu eviction
+
+def test_max_bytes_eviction(clock):  # total ukuran melebihi maxBytes -> item paling lama dibuang
+    size = estimateSize(response('x' * 10))  # ukuran satu response
+    cache = ResponseCache(maxEntries=100, ttlSeconds=0, maxBytes=size * 2)  # muat dua response
+    for key in 'abc':  # tiga response ukuran sama
+        cache.put(key, response('x' * 10))  # simpan
+    stats = cache.stats()  # statistik
+    assert (stats['size'], stats['bytes'], stats['evictions']) == (2, size * 2, 1)  # satu dibuang karena byte
+    assert cache.get('a') is None and cache.get('c') is not None  # yang paling lama dibuang
+
+def test_oversized_entry_rejected(clock):  # response lebih besar dari seluruh cache tidak disimpan dan tidak membuang item lain
+    small = response('kecil')  # response kecil
+    cache = ResponseCache(maxEntries=10, ttlSeconds=0, maxBytes=estimateSize(small) * 2)  # cache kecil
+    cache.put('small', small)  # simpan
+    cache.put('big', response('x' * 1000))  # kebesaran
+    assert cache.get('big') is None  # tidak disimpan
+    assert cache.get('small') is not None  # item lama utuh
+    assert cache.stats()['evictions'] == 0  # tanpa eviction
+
+def test_disabled_cache(clock):  # maxEntries <= 0 -> put tidak menyimpan apa-apa
+    for maxEntries in (0, -1):  # nol dan negatif
+        cache = ResponseCache(maxEntries=maxEntries, ttlSeconds=10, maxBytes=0)  # cache mati
+        cache.put('q', response('a'))  # diabaikan
+        assert cache.get('q') is None  # selalu miss
+        assert cache.stats()['size'] == 0 and cache.stats()['evictions'] == 0  # kosong
+
+def test_version_change_invalidates(clock):  # versi dataset berubah -> semua item dibuang, invalidations hanya kalau ada item
+    cache = ResponseCache(maxEntries=8, ttlSeconds=0, maxBytes=0)  # cache biasa
+    cache.put('q', response('v1'), version=1)  # item versi 1
+    assert cache.get('q', version=1) is not None  # hit versi sama
+    assert cache.get('q', version=2) is None  # versi baru -> miss
+    assert cache.stats()['invalidations'] == 1 and cache.stats()['size'] == 0  # cache direset
+    assert cache.get('q', version=3) is None  # versi berubah lagi, cache sudah kosong
+    assert cache.stats()['invalidations'] == 1  # reset cache kosong tidak dihitung
+    cache.put('q', response('v3'), version=3)  # simpan versi 3
+    assert cache.get('q', version=3)[0] == response('v3')  # hit versi 3
+
+def test_stats_hit_rate(clock):  # hitRate = hits / (hits + misses)
+    cache = ResponseCache(maxEntries=8, ttlSeconds=0, maxBytes=0)  # cache biasa
+    assert cache.stats()['hitRate'] == 0.0  # belum ada lookup
+    cache.put('q', response('a'))  # simpan
+    cache.get('q')  # hit
+    cache.get('lain')  # miss
+    cache.get('q')  # hit
+    assert cache.stats()['hitRate'] == pytest.approx(2 / 3)  # dua dari tiga
+    cache.clear()  # kosongkan
+    assert cache.stats()['size'] == 0 and cache.stats()['bytes'] == 0  # kosong, counter tetap
@@ -0,0 +1,76 @@
+# Test Semantic Matcher - matcher yang di-compile harus sama dengan loop lama detector
+import random
+
+import pytest
+
+from nlpIntentDetector import NaturalLanguageIntentDetector
+
+class LoopSemanticMatch:  # implementasi lama: substring per phrase + similarity per pasangan kata
+    def __init__(self, detector, text):  # konstruktor hasil
+        self.detector = detector  # detector (calculateSimilarity + cluster)
+        self.text = text  # processed query
+
+    def containsPhrase(self, phrase):  # keyword in processedQuery
+        return phrase in self.text  # substring
+
+    def fuzzyMatchConcepts(self, conceptWords):  # detector.fuzzyMatchConcepts(processedQuery, ...)
+        return self.detector.fuzzyMatchConcepts(self.text, conceptWords)  # loop lama
+
+    def features(self):  # extractSemanticFeatures sebelum di-compile
+        features = {'questionWords': [], 'entities': [], 'informalPatterns': [], 'keywords': []}  # dict fitur
+        words = self.text.split()  # split jadi kata-kata
+        for category, clusters in self.detector.semanticClusters.items():  # loop semua kategori
+            for clusterName, wordList in clusters.items():  # loop cluster dalam kategori
+                for word in wordList:  # loop kata dalam cluster
+                    if word in self.text:  # exact match
+                        if clusterName not in features[category]:
+                            features[category].append(clusterName)
+                        if word not in features['keywords']:
+                            features['keywords'].append(word)
+                    else:  # fuzzy match buat typo
+                        for textWord in words:
+                            if self.detector.calculateSimilarity(word, textWord) > 0.8:
+                                if clusterName not in features[category]:
+                                    features[category].append(clusterName)
+                                if textWord not in features['keywords']:
+                                    features['keywords'].append(textWord)
+        return features  # semua fitur
+
+@pytest.fixture(scope='module')
+def detector():  # satu detector untuk semua test
+    return NaturalLanguageIntentDetector()  # detector baru
+
+def generateQueries(detector, count, seed):  # query dari phrase cluster/keyword, sebagian dengan typo
+    rng = random.Random(seed)  # generator reproducible
+    vocabulary = [word for clusters in detector.semanticClusters.values() for words in clusters.values() for word in words]  # phrase cluster
+    vocabulary += [keyword for rules in detector.intentRules.values() for keyword in rules['keywords']]  # keyword intent
+    vocabulary += ['itb', 'kampus', 'yang', 'nya', 'dong', '?', 'dmn', 'fakultsa', 'sjarah']  # filler + typo
+
+    def typo(word):  # insert / delete / substitusi acak
+        chars = list(word)  # karakter kata
+        for _ in range(rng.randint(1, 2)):  # 1-2 edit
+            position = rng.randrange(len(chars) + 1)  # posisi edit
+            operation = rng.randint(0, 2)  # jenis edit
+            if operation == 0:
+                chars.insert(position, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+            elif operation == 1 and len(chars) > 1 and position < len(chars):
+                del chars[position]
+            elif position < len(chars):
+                chars[position] = rng.choice('aeiouknst')
+        return ''.join(chars)  # kata typo
+
+    queries = ["apa itu itb", "itb dimana", "berapa fakultas itb", "fakultsa itb", "Bagaimana sejarah ITB?", "kepanjangan itb apaan", "", "x"]  # kasus tetap
+    for _ in range(count):  # query acak
+        queries.append(' '.join(typo(rng.choice(vocabulary)) if rng.random() < 0.5 else rng.choice(vocabulary) for _ in range(rng.randint(1, 5))))  # 1-5 kata
+    return queries  # semua query
+
+def test_compiledMatcherMatchesLoop(detector):  # fitur + skor intent sama dengan implementasi loop
+    for query in generateQueries(detector, 300, 0):  # loop query
+        processedQuery = detector.preprocessText(query)  # query yang diproses
+        loopMatch = LoopSemanticMatch(detector, processedQuery)  # referensi loop
+        assert detector.extractSemanticFeatures(processedQuery) == loopMatch.features(), query  # fitur semantik
+        assert detector.detectIntentNlp(query) == detector.scoreIntents(loopMatch), query  # intent, confidence, semua skor
+
+def test_batchDetectionMatchesScalar(detector):  # matchMany sama dengan match per query
+    queries = generateQueries(detector, 100, 1)  # query acak
+    assert detector.detectIntentNlpBatch(queries) == [detector.detectIntentNlp(query) for query in queries]  # urutan input terjaga
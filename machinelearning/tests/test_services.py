@@ -0,0 +1,164 @@
+# Test Services - cache response per versi corpus (detector + matcher) dan metadata/fallback batch dengan pipeline palsu
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('flask')  # dependency backend
+backendDir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'backend')  # direktori backend
+if backendDir not in sys.path:  # belum ada
+    sys.path.insert(0, backendDir)  # import services seperti backend
+
+from services import services
+from services.responseCache import ResponseCache
+
+class FakeDetector:  # detector palsu: jawab kalau pertanyaan memuat kata kunci
+    def __init__(self, answers):  # kata kunci -> jawaban NLP
+        self.answers = answers  # jawaban NLP
+        self.calls = []  # pertanyaan yang dievaluasi
+
+    def preprocessText(self, text):  # normalisasi key NLP (lowercase + koreksi typo seperti detector asli)
+        return text.lower().strip().replace('gimana', 'bagaimana')  # key NLP (preprocess tetap beda untuk varian typo)
+
+    def getAnswerWithLinks(self, question):  # jawaban satu pertanyaan
+        self.calls.append(question)  # catat evaluasi
+        for keyword, answer in self.answers.items():  # cari kata kunci
+            if keyword in question.lower():  # cocok
+                return {'intent': keyword, 'answer': answer, 'confidence': 0.9, 'hasLinks': False}  # yakin
+        return {'intent': None, 'answer': '', 'confidence': 0.0}  # tidak yakin
+
+    def getAnswersWithLinks(self, questions):  # jawaban batch
+        return [self.getAnswerWithLinks(question) for question in questions]  # satu per satu
+
+class FailingBatchDetector(FakeDetector):  # batch selalu gagal, pertanyaan memuat 'rusak' gagal per pertanyaan
+    def getAnswerWithLinks(self, question):  # jawaban satu pertanyaan
+        if 'rusak' in question:  # pertanyaan yang bikin detector error
+            raise ValueError('detector error')  # error per pertanyaan
+        return super().getAnswerWithLinks(question)  # jawaban normal
+
+    def getAnswersWithLinks(self, questions):  # jawaban batch
+        raise ValueError('batch error')  # seluruh batch gagal
+
+def fakePipeline(detector, corpus, versions):  # pipeline dengan corpus matcher yang bisa diganti test
+    def matchIntent(question):  # jawaban matcher dari corpus aktif
+        return corpus.get(question.lower())  # None kalau tidak ada
+    return services.IntentPipeline(
+        preprocess=lambda text: text.lower(),
+        getDetector=lambda: detector,
+        preloadDetector=lambda: detector,
+        getDatasetVersion=lambda: (versions['detector'], versions['matcher']),
+        matchIntent=matchIntent,
+        matchIntentBatch=lambda questions, processedQueries=None: [matchIntent(question) for question in questions],
+        warmUpMatcher=lambda: None
+    )
+
+@pytest.fixture
+def installPipeline(monkeypatch):  # pasang pipeline palsu + cache response kosong
+    monkeypatch.setattr(services, 'responseCache', ResponseCache(maxEntries=64, ttlSeconds=300))  # cache baru per test (tidak ikut RESPONSE_CACHE_SIZE=0 dari benchmark)
+    def install(pipeline):  # pasang pipeline
+        monkeypatch.setattr(services, '_pipeline', pipeline)  # dipakai getPipeline
+        return pipeline  # pipeline
+    return install  # helper
+
+def test_assembled_version_covers_matcher_corpus(monkeypatch):  # versi cache dari assemblePipeline memuat versi matcher
+    from machinelearning import matching, nlpIntentDetector  # modul yang di-bind assemblePipeline
+    versions = {'detector': ('detector', 1), 'matcher': ('matcher', 1)}  # versi corpus palsu
+    monkeypatch.setattr(nlpIntentDetector, 'getDatasetVersion', lambda: versions['detector'])  # versi detector
+    monkeypatch.setattr(matching, 'getCorpusVersion', lambda: versions['matcher'])  # versi matcher
+    pipeline = services.assemblePipeline()  # pipeline asli
+    first = pipeline.getDatasetVersion()  # versi awal
+    versions['matcher'] = ('matcher', 2)  # hanya corpus matcher berubah
+    assert pipeline.getDatasetVersion() != first  # cache ikut invalid
+
+def test_matcher_corpus_change_invalidates_cached_answer(installPipeline):  # response matching tidak basi setelah corpus matcher berubah
+    versions = {'detector': 1, 'matcher': 1}  # detector tetap, matcher berubah
+    corpus = {'jadwal wisuda': 'Wisuda bulan Juli.'}  # corpus matcher v1
+    installPipeline(fakePipeline(FakeDetector({}), corpus, versions))  # NLP tidak pernah yakin
+    first = services.runIntentPipeline('Jadwal wisuda')  # dijawab matcher
+    assert first['answer'] == 'Wisuda bulan Juli.' and first['cache']['hit'] is False  # miss
+    assert services.runIntentPipeline('Jadwal wisuda')['cache']['hit'] is True  # hit dari cache
+
+    corpus['jadwal wisuda'] = 'Wisuda bulan Oktober.'  # corpus matcher v2
+    versions['matcher'] = 2  # versi matcher naik
+    second = services.runIntentPipeline('Jadwal wisuda')  # setelah corpus berubah
+    assert second['answer'] == 'Wisuda bulan Oktober.' and second['cache']['hit'] is False  # jawaban baru, bukan cache
+    batch = services.runIntentPipelineBatch(['Jadwal wisuda'])  # jalur batch memakai versi yang sama
+    assert batch[0]['answer'] == 'Wisuda bulan Oktober.'  # tidak ada jawaban v1
+
+def test_batch_hit_only_for_response_cache(installPipeline):  # duplikat dalam batch bukan cache hit
+    detector = FakeDetector({'itb': 'ITB di Bandung.', 'daftar': 'Daftar lewat portal.'})  # NLP yakin untuk kedua topik
+    installPipeline(fakePipeline(detector, {}, {'detector': 1, 'matcher': 1}))  # pipeline palsu
+    questions = ['Apa itu ITB', 'apa itu itb', 'gimana daftar', 'bagaimana daftar', 'apa itu itb']  # varian huruf, varian typo (key beda), duplikat
+    first = services.runIntentPipelineBatch(questions)  # cache kosong
+    assert [response['cache']['hit'] for response in first] == [False] * 5  # tidak ada yang dari responseCache
+    assert [response['cache']['batchDeduped'] for response in first] == [False, True, False, False, True]  # varian huruf + duplikat dilayani hasil batch
+    assert detector.calls == ['Apa itu ITB', 'gimana daftar', 'bagaimana daftar']  # satu evaluasi NLP per key NLP
+    second = services.runIntentPipelineBatch(questions)  # batch yang sama lagi
+    assert [response['cache']['hit'] for response in second] == [True] * 5  # semua dari responseCache
+    assert [response['answer'] for response in second] == [response['answer'] for response in first]  # jawaban sama
+    assert detector.calls == ['Apa itu ITB', 'gimana daftar', 'bagaimana daftar']  # tanpa evaluasi baru
+
+def test_batch_nlp_failure_falls_back_per_question(installPipeline):  # error batch NLP tidak melempar semua pertanyaan ke matching
+    detector = FailingBatchDetector({'itb': 'ITB di Bandung.', 'rusak': 'tidak pernah dijawab'})  # batch gagal, 'rusak' gagal
+    corpus = {'apa itu itb': 'Jawaban matching ITB.', 'data rusak': 'Jawaban matching rusak.'}  # jawaban matcher
+    installPipeline(fakePipeline(detector, corpus, {'detector': 1, 'matcher': 1}))  # pipeline palsu
+    responses = services.runIntentPipelineBatch(['apa itu itb', 'data rusak'])  # satu pertanyaan bikin detector error
+    assert [response['source'] for response in responses] == ['nlp_intent_detector', 'machine_learning']  # hanya pertanyaan gagal ke matching
+    assert [response['answer'] for response in responses] == ['ITB di Bandung.', 'Jawaban matching rusak.']  # jawaban sama dengan jalur per pertanyaan
+    assert [services.runIntentPipeline(question)['answer'] for question in ['apa itu itb', 'data rusak']] == ['ITB di Bandung.', 'Jawaban matching rusak.']  # jalur tunggal
+
+class LoadedDetector(FakeDetector):  # detector palsu dengan dataset termuat
+    datasetLoaded = True  # dibaca warmUpService
+
+def raiseError(message):  # callable warm-up yang gagal
+    def fail():  # callable tanpa argumen
+        raise RuntimeError(message)  # error warm-up
+    return fail  # callable
+
+@pytest.fixture
+def readyClient(monkeypatch):  # Flask test client dengan route API dan readiness baru
+    from flask import Flask
+    from routes.routes import apiBp
+    monkeypatch.setattr(services, '_readiness', {'pipeline': False, 'nlpDetector': False, 'matcher': False})  # belum warm-up
+    app = Flask(__name__)  # app tanpa warm-up asli
+    app.register_blueprint(apiBp)  # route /ready
+    return app.test_client()  # test client
+
+@pytest.mark.parametrize('failing', ['nlpDetector', 'matcher'])
+def test_ready_reports_failed_warm_up(installPipeline, readyClient, failing):  # warm-up gagal -> 503 dengan check yang gagal
+    pipeline = fakePipeline(LoadedDetector({}), {}, {'detector': 1, 'matcher': 1})  # pipeline palsu
+    pipeline.warmUpMatcher = lambda: object()  # index terbangun
+    if failing == 'nlpDetector':  # detector gagal dibangun
+        pipeline.preloadDetector = raiseError('dataset rusak')  # error preload
+    else:  # matcher gagal dibangun
+        pipeline.warmUpMatcher = raiseError('index rusak')  # error index
+    installPipeline(pipeline)  # dipakai getPipeline
+    services._readiness['pipeline'] = True  # pipeline sudah dirakit (installPipeline melewati assemblePipeline)
+
+    assert services.warmUpService() is False  # warm-up tidak sukses
+    response = readyClient.get('/ready')  # probe readiness
+    assert response.status_code == 503  # belum siap
+    body = response.get_json()  # status komponen
+    assert body['ready'] is False  # tidak siap
+    assert [name for name, ok in body['checks'].items() if not ok] == [failing]  # hanya check yang gagal
+
+def test_ready_after_successful_warm_up(installPipeline, readyClient):  # semua komponen siap -> 200
+    pipeline = fakePipeline(LoadedDetector({}), {}, {'detector': 1, 'matcher': 1})  # pipeline palsu
+    pipeline.warmUpMatcher = lambda: object()  # index terbangun
+    installPipeline(pipeline)  # dipakai getPipeline
+    services._readiness['pipeline'] = True  # pipeline sudah dirakit
+    assert readyClient.get('/ready').status_code == 503  # sebelum warm-up
+    assert services.warmUpService() is True  # warm-up sukses
+    response = readyClient.get('/ready')  # probe readiness
+    assert response.status_code == 200 and response.get_json() == {'ready': True, 'checks': {'pipeline': True, 'nlpDetector': True, 'matcher': True}}  # siap
+
+def test_missing_callable_fails_at_boot(monkeypatch, readyClient):  # callable ML wajib hilang -> assemblePipeline/warmUpService raise
+    from machinelearning import nlpIntentDetector  # modul yang di-bind assemblePipeline
+    monkeypatch.delattr(nlpIntentDetector, 'preloadNlpIntentDetector')  # callable wajib hilang
+    monkeypatch.setattr(services, '_pipeline', None)  # belum dirakit
+    with pytest.raises(services.PipelineError, match='preloadNlpIntentDetector'):  # fail fast dengan nama callable
+        services.assemblePipeline()  # rakit pipeline
+    with pytest.raises(services.PipelineError):  # app.py tidak boot
+        services.warmUpService()  # warm-up startup
+    response = readyClient.get('/ready')  # probe readiness
+    assert response.status_code == 503 and response.get_json()['checks']['pipeline'] is False  # pipeline tidak pernah siap
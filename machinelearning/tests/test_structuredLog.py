@@ -0,0 +1,23 @@
+# Test Structured Log - format text tanpa Formatter(defaults=) (Python 3.8/3.9)
+import logging
+
+import structuredLog
+
+def formatRecord(handler, **extra):  # jalankan filter handler + formatter seperti di thread listener
+    record = logging.LogRecord('itbchatbot.test', logging.INFO, __file__, 1, 'halo %s', ('dunia',), None)  # record manual
+    for key, value in extra.items():  # field extra
+        setattr(record, key, value)  # tempel ke record
+    assert handler.filter(record)  # filter handler meloloskan record
+    return handler.format(record)  # string hasil format
+
+def test_text_format_without_stage(monkeypatch):  # record logger pihak ketiga (tanpa stage)
+    monkeypatch.setattr(structuredLog, 'LOG_FORMAT', 'text')  # format text
+    assert formatRecord(structuredLog.buildHandler()).endswith('INFO [-] halo dunia')  # stage default '-'
+
+def test_text_format_with_stage(monkeypatch):  # record dari StageLogger
+    monkeypatch.setattr(structuredLog, 'LOG_FORMAT', 'text')  # format text
+    assert formatRecord(structuredLog.buildHandler(), stage='nlp').endswith('INFO [nlp] halo dunia')  # stage asli
+
+def test_json_format_keeps_missing_stage_null(monkeypatch):  # filter default hanya untuk format text
+    monkeypatch.setattr(structuredLog, 'LOG_FORMAT', 'json')  # format JSON
+    assert '"stage": null' in formatRecord(structuredLog.buildHandler())  # tetap null
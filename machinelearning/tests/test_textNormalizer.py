@@ -0,0 +1,103 @@
+# Test Text Normalizer - normalizeText/normalizeQuery harus byte-identik dengan implementasi regex lama
+import random
+import re
+
+import pytest
+
+from textNormalizer import normalizeQuery, normalizeText
+
+STOPWORDS = set([  # stopword preprocessing lama (disalin, bukan di-import dari engine)
+    'dan', 'di', 'ke', 'dari', 'yang', 'untuk', 'pada', 'dengan', 'atau', 'juga', 'sebagai', 'dalam', 'adalah', 'itu', 'ini', 'saya', 'kamu', 'kami', 'kita', 'mereka', 'akan', 'tidak', 'bisa', 'telah', 'sudah', 'belum', 'oleh', 'karena', 'agar', 'sehingga', 'supaya', 'tentang', 'tanpa', 'setelah', 'sebelum', 'sesudah', 'sejak', 'hingga', 'sampai', 'selama', 'antara', 'bahwa', 'namun', 'tetapi', 'jadi', 'hanya', 'masih', 'lagi', 'pun', 'lah', 'punya', 'ada'
+])
+IMPORTANT_TERMS = ['akreditasi', 'universitas', 'fakultas', 'teknologi', 'bandung', 'institut', 'kampus', 'program', 'mahasiswa', 'penelitian']  # term penting lama
+TYPO_CORRECTIONS = {'gimana': 'bagaimana', 'apaan': 'apa', 'dimana': 'di mana', 'napa': 'apa', 'gmana': 'bagaimana'}  # koreksi typo lama
+
+def regexPreprocess(text):  # preprocessing.preprocess sebelum textNormalizer
+    text = text.lower()  # lowercase
+    text = re.sub(r'[^\w\s]', '', text)  # hapus punctuation
+    tokens = [word for word in text.split() if word not in STOPWORDS]  # hapus stopword
+    result = []  # hasil stemming
+    for word in tokens:  # stemming lama
+        if len(word) <= 6 or word in IMPORTANT_TERMS or any(term in word for term in IMPORTANT_TERMS):  # pendek / penting
+            result.append(word)  # utuh
+        else:  # term biasa
+            result.append(word[:6])  # potong 6 karakter
+    return ' '.join(result)  # string hasil
+
+def regexPreprocessText(text):  # NaturalLanguageIntentDetector.preprocessText sebelum textNormalizer
+    text = text.lower().strip()  # lowercase + strip
+    for typo, correct in TYPO_CORRECTIONS.items():  # koreksi typo berurutan
+        text = re.sub(r'\b' + typo + r'\b', correct, text)  # typo utuh
+    text = re.sub(r'[^\w\s]', ' ', text)  # punctuation jadi spasi
+    text = re.sub(r'\s+', ' ', text)  # rapikan spasi
+    return text.strip()  # string hasil
+
+GOLDEN = [  # kasus pinggir yang pernah/mungkin beda
+    '',  # kosong
+    '   ',  # spasi saja
+    'Gimana cara daftar ke ITB?',  # typo di awal + tanda tanya
+    'gimana?apaan!dimana,napa.gmana',  # typo dipisah punctuation tanpa spasi
+    '(gimana)',  # typo dalam kurung
+    'gimana-nya',  # typo + tanda hubung
+    'gimana_nya',  # underscore termasuk \w, bukan typo utuh
+    'gimanaa gimana2 2gimana',  # typo jadi bagian kata lain
+    'dimana…dimana',  # ellipsis Unicode
+    '«gimana» “apaan” ‘napa’',  # kutip Unicode
+    'gimana—dimana–gmana',  # em dash / en dash
+    '¿dimana? ¡napa!',  # tanda baca Spanyol
+    'gimana、apaan。dimana',  # tanda baca CJK
+    'GIMANA\tAPAAN\nDIMANA\r\nnapa\x0bgmana\x0c',  # whitespace ASCII campur
+    'gimana\u00a0apaan\u2003dimana\u3000napa\u2028gmana',  # whitespace Unicode (nbsp, em space, ideographic, line separator)
+    'gimana\u200bapaan',  # zero-width space (bukan \s, bukan \w)
+    'gimana\x1capaan\x1fnapa\x85dimana',  # separator C0/C1 yang dianggap whitespace
+    'gimana\u0301 apaan\u0308 dimana\u20dd',  # combining mark setelah typo
+    'İstanbul ĞIMANA Straße ǅemal',  # lowercase Unicode (İ jadi dua codepoint)
+    'akreditasi universitas teknologinya mahasiswanya penelitiannya',  # important term + substring
+    'pendaftaran mahasiswa baru, beasiswa & biaya kuliah!!!',  # stopword + stem + punctuation
+    'apa itu ITB? ITB itu institut teknologi bandung.',  # stopword + important term
+    'emoji 😀 gimana 👍🏽 apaan',  # emoji (bukan \w)
+    'angka ١٢٣ ²³ ½ dan ⅓',  # digit Unicode / superscript / pecahan
+    'café naïve coöperate façade',  # huruf beraksen
+    'ｇｉｍａｎａ　ａｐａａｎ',  # fullwidth
+]
+
+@pytest.mark.parametrize('text', GOLDEN)
+def test_golden_normalizeText(text):  # preprocess lama
+    assert normalizeText(text) == regexPreprocess(text)  # byte-identik
+
+@pytest.mark.parametrize('text', GOLDEN)
+def test_golden_normalizeQuery(text):  # preprocessText lama
+    assert normalizeQuery(text) == regexPreprocessText(text)  # byte-identik
+
+def randomTexts(count, seed):  # teks acak: typo token, kata, punctuation dan whitespace Unicode
+    rng = random.Random(seed)  # generator reproducible
+    pieces = list(TYPO_CORRECTIONS) + ['GIMANA', 'Dimana', 'mana', 'di', 'apa', 'itb', 'mahasiswanya', 'pendaftaran', 'kampus', 'fakultasnya', 'x', '_', '2']  # token
+    punctuation = list('?!.,;:()[]{}"\'-_/\\@#$%^&*+=<>|~`') + ['…', '—', '–', '«', '»', '“', '”', '‘', '’', '¿', '¡', '、', '。', '・', '‐', '\u0301', '\u200b', '😀']  # punctuation ASCII + Unicode
+    whitespace = [' ', '  ', '\t', '\n', '\r\n', '\x0b', '\x0c', '\x1c', '\x85', '\u00a0', '\u2003', '\u3000', '\u2028']  # whitespace ASCII + Unicode
+    texts = []  # hasil
+    for _ in range(count):  # satu teks per iterasi
+        parts = []  # potongan teks
+        for _ in range(rng.randint(0, 12)):  # jumlah potongan
+            kind = rng.random()  # jenis potongan
+            if kind < 0.45:
+                parts.append(rng.choice(pieces))
+            elif kind < 0.75:
+                parts.append(rng.choice(punctuation))
+            elif kind < 0.95:
+                parts.append(rng.choice(whitespace))
+            else:
+                parts.append(chr(rng.randrange(0x80, 0x3000)))  # codepoint acak (isi tabel translate lazy)
+        texts.append(''.join(parts))  # typo sering menempel langsung ke punctuation
+    return texts  # teks acak
+
+def test_property_matches_regex_implementation():  # 3000 teks acak
+    for text in randomTexts(3000, seed=20250622):  # seed tetap
+        assert normalizeText(text) == regexPreprocess(text), text  # preprocess
+        assert normalizeQuery(text) == regexPreprocessText(text), text  # preprocessText
+
+def test_every_bmp_codepoint_classified_like_regex():  # tabel translate vs [^\w\s] per karakter
+    text = ''.join(chr(codepoint) for codepoint in range(0x10000) if not 0xd800 <= codepoint <= 0xdfff)  # semua BMP tanpa surrogate
+    chunks = [text[start:start + 64] for start in range(0, len(text), 64)]  # potongan pendek
+    for chunk in chunks:  # cek per potongan
+        assert normalizeQuery(chunk) == regexPreprocessText(chunk), repr(chunk)  # punctuation -> spasi
+        assert normalizeText(chunk) == regexPreprocess(chunk), repr(chunk)  # punctuation dihapus
@@ -0,0 +1,69 @@
+# Test TF-IDF Index - search harus sama dengan cosine brute force, index basi di-fit ulang
+import numpy as np
+import pytest
+
+import tfidfIndex
+from tfidfIndex import TfidfIndex, corpusHash, loadOrBuildTfidfIndex
+
+DOCUMENTS = [  # corpus kecil dengan term yang tumpang tindih
+    "institut teknologi bandung didirikan tahun 1920",
+    "kampus ganesha berada di kota bandung",
+    "fakultas teknik sipil dan lingkungan itb",
+    "sekolah teknik elektro dan informatika itb",
+    "kampus jatinangor dan kampus cirebon",
+    "program studi teknik informatika di kampus ganesha",
+    "resep nasi goreng",
+]
+
+def bruteForceRanking(index, query):  # cosine query ke setiap dokumen dari vektor dense
+    documentVectors = index.documentMatrix.toarray()  # matrix dokumen dense
+    queryVector = index.vectorizer.transform([query]).toarray().ravel()  # vektor query dense
+    similarities = [float(np.dot(vector, queryVector) / (np.linalg.norm(vector) * np.linalg.norm(queryVector) or 1.0)) for vector in documentVectors]  # cosine per dokumen
+    return sorted(((docId, score) for docId, score in enumerate(similarities) if score > 0), key=lambda item: -item[1])  # urut skor, buang skor 0
+
+@pytest.mark.parametrize('topK', [1, 3, len(DOCUMENTS) + 5])
+@pytest.mark.parametrize('query', ["kampus ganesha", "teknik informatika itb", "bandung", "qwerty zxcv"])
+def test_searchMatchesBruteForceCosine(query, topK):  # argpartition top-K == sort penuh
+    index = TfidfIndex.fit(DOCUMENTS)  # fit index
+    ranking = index.search(query, topK)  # top-K index
+    expected = bruteForceRanking(index, query)  # semua dokumen skor > 0
+    assert [score for _, score in ranking] == pytest.approx([score for _, score in expected[:topK]])  # skor top-K sama dan urut turun
+    assert all(score == pytest.approx(dict(expected)[docId]) for docId, score in ranking)  # skor milik docId yang benar (seri boleh beda urutan)
+    assert index.search(query, 0) == []  # top-0 kosong
+
+def test_saveLoadRoundTrip(tmp_path):  # index dari disk sama dengan index yang di-fit
+    path = str(tmp_path / 'tfidf.pkl')  # file index
+    index = TfidfIndex.fit(DOCUMENTS)  # fit index
+    index.save(path)  # simpan
+    loaded = TfidfIndex.load(path, corpusHash(DOCUMENTS))  # load dengan hash corpus yang sama
+    assert loaded is not None and loaded.sourceHash == index.sourceHash  # index valid
+    assert loaded.search("kampus ganesha", 3) == index.search("kampus ganesha", 3)  # hasil sama
+    assert TfidfIndex.load(str(tmp_path / 'missing.pkl')) is None  # file belum ada
+
+def test_loadRejectsCorruptFile(tmp_path):  # file rusak -> fit ulang, bukan exception
+    path = tmp_path / 'tfidf.pkl'  # file index
+    path.write_bytes(b'bukan pickle')  # isi rusak
+    assert TfidfIndex.load(str(path)) is None  # perlu build
+
+def test_staleHashRefits(tmp_path, monkeypatch):  # corpus berubah -> index lama dibuang, fit ulang dan simpan
+    path = str(tmp_path / 'tfidf.pkl')  # file index
+    loadOrBuildTfidfIndex(DOCUMENTS[:3], path)  # index corpus lama di disk
+    fits = []  # corpus yang di-fit
+    fit = TfidfIndex.fit.__func__  # fit asli
+    monkeypatch.setattr(TfidfIndex, 'fit', classmethod(lambda cls, documents: fits.append(list(documents)) or fit(cls, documents)))  # catat fit
+
+    index = loadOrBuildTfidfIndex(DOCUMENTS, path)  # corpus baru, hash beda
+    assert fits == [DOCUMENTS]  # fit ulang atas corpus baru
+    assert index.sourceHash == corpusHash(DOCUMENTS)  # hash corpus baru
+    assert index.documentMatrix.shape[0] == len(DOCUMENTS)  # semua dokumen baru
+    assert TfidfIndex.load(path, corpusHash(DOCUMENTS)) is not None  # index baru tersimpan
+
+    fits.clear()  # reset catatan
+    assert loadOrBuildTfidfIndex(DOCUMENTS, path).search("bandung", 2) == index.search("bandung", 2)  # hash cocok -> load dari disk
+    assert fits == []  # tanpa fit ulang
+
+def test_versionMismatchRefits(tmp_path, monkeypatch):  # format index lama tidak dipakai
+    path = str(tmp_path / 'tfidf.pkl')  # file index
+    TfidfIndex.fit(DOCUMENTS).save(path)  # index versi sekarang
+    monkeypatch.setattr(tfidfIndex, 'INDEX_VERSION', tfidfIndex.INDEX_VERSION + 1)  # format naik versi
+    assert TfidfIndex.load(path, corpusHash(DOCUMENTS)) is None  # perlu build
@@ -0,0 +1,160 @@
+# Test Top-K Matching - index + early termination harus sama dengan scan linear
+import pytest
+
+import matching
+from preprocessing import preprocess
+
+QUERIES = [  # exact, typo, multi-word, no-match
+    "apa itu itb",  # exact
+    "jurusan informatika",  # exact
+    "fakultsa itb",  # typo
+    "sjarah kampus ganesha",  # typo
+    "berapa fakultas yang ada di itb dan kapan itb didirikan",  # multi-word
+    "Bagaimana sejarah ITB?",  # multi-word + punctuation
+    "qwerty zxcv",  # no-match
+    "xq",  # no-match pendek
+]
+
+@pytest.fixture
+def rankedMatch(monkeypatch):  # matchWithCsvData yang return ranking top-K, bukan teks jawaban
+    candidateCounts = []  # jumlah kandidat per panggilan
+    monkeypatch.setattr(matching, 'formatResponse', lambda bestEntry, candidates: [(candidate['entry']['content'], candidate['score']) for candidate in candidates])  # ranking top-K
+    monkeypatch.setattr(matching, 'observeCandidates', candidateCounts.append)  # catat jumlah kandidat
+
+    def run(query, topK, **options):  # satu jalur scoring
+        ranking = matching.matchWithCsvData(query, topK=topK, **options)  # ranking / jawaban fallback
+        return ranking, candidateCounts[-1]  # ranking + jumlah kandidat skor > 0
+    return run
+
+@pytest.fixture
+def tfidfIndexFile(monkeypatch, tmp_path):  # index TF-IDF test di direktori sementara, bukan database/processed
+    monkeypatch.setattr(matching, 'TFIDF_INDEX_FILE', str(tmp_path / 'tfidf_index.pkl'))  # file index sementara
+    monkeypatch.setattr(matching.getCorpus(), 'tfidf', None)  # fit ulang, dibuang setelah test
+
+def assertSameAsLinearScan(rankedMatch, query, topK, **options):  # tiga jalur scoring harus identik
+    linear, linearCount = rankedMatch(query, topK, useIndex=False, **options)  # scan semua entry
+    indexed, indexedCount = rankedMatch(query, topK, earlyTermination=False, **options)  # kandidat index, scoring penuh
+    default, _ = rankedMatch(query, topK, **options)  # index + batas atas top-K
+    assert indexedCount == linearCount  # index tidak membuang dokumen dengan skor > 0
+    for ranking in (indexed, default):  # index saja, index + early termination
+        if not isinstance(linear, list):  # jawaban fallback (tidak ada kandidat)
+            assert ranking == linear  # fallback sama
+            continue  # jalur berikutnya
+        assert [content for content, _ in ranking] == [content for content, _ in linear]  # urutan top-K sama
+        assert [score for _, score in ranking] == pytest.approx([score for _, score in linear])  # skor sama
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_indexAndEarlyTerminationMatchLinearScan(rankedMatch, query):  # topK default
+    assertSameAsLinearScan(rankedMatch, query, 3)  # top-3
+
+@pytest.mark.parametrize('topK', [1, 10])
+@pytest.mark.parametrize('query', ["apa itu itb", "fakultsa itb"])
+def test_topKSizes(rankedMatch, query, topK):  # early termination dengan top-K kecil dan besar
+    assertSameAsLinearScan(rankedMatch, query, topK)  # top-1 / top-10
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_tfidfMatchesLinearScan(rankedMatch, tfidfIndexFile, query):  # skor TF-IDF ikut di kandidat, batas atas dan shard
+    assertSameAsLinearScan(rankedMatch, query, 3, useTfidf=True)  # top-3 dengan strategi TF-IDF
+    assert matching.getTfidfIndex() is not None  # index TF-IDF benar-benar dipakai
+
+def test_batchMatchesScalar():  # matchWithCsvDataBatch sama dengan per query
+    assert matching.matchWithCsvDataBatch(QUERIES) == [matching.matchWithCsvData(query) for query in QUERIES]  # urutan input terjaga
+
+@pytest.fixture
+def parallelScoring(monkeypatch):  # process pool untuk corpus kecil, dimatikan setelah test
+    if not matching.FORK_AVAILABLE:  # worker tidak bisa mewarisi corpus
+        pytest.skip('fork tidak tersedia, matchWithCsvData scoring serial')  # jalur paralel tidak dipakai
+    monkeypatch.setattr(matching, 'PARALLEL_MIN_ENTRIES', 1)  # corpus asli cukup besar
+    monkeypatch.setattr(matching, 'PARALLEL_SHARDS', 2)  # dua worker, kandidat dibagi dua shard
+    monkeypatch.setattr(matching, '_corpus', matching.getCorpus())  # corpus dikembalikan setelah test
+    assert matching.startScoringPool() is not None  # worker di-fork sebelum request (bukan lazy)
+    yield  # jalankan test
+    matching.shutdownScoringPool()  # worker memegang corpus test
+
+def assertParallelSameAsLinearScan(rankedMatch, query, useTfidf=False, **options):  # shard di process pool + merge heap == scan linear serial
+    linear, linearCount = rankedMatch(query, 3, useIndex=False, useTfidf=useTfidf)  # scan semua entry, serial
+    ranking, count = rankedMatch(query, 3, parallel=True, useTfidf=useTfidf, **options)  # scoring paralel
+    assert count == linearCount  # jumlah kandidat skor > 0 sama
+    if not isinstance(linear, list):  # jawaban fallback
+        assert ranking == linear  # fallback sama
+        return  # selesai
+    assert matching._scoringPool is not None  # process pool benar-benar dipakai
+    assert [content for content, _ in ranking] == [content for content, _ in linear]  # urutan top-K sama
+    assert [score for _, score in ranking] == pytest.approx([score for _, score in linear])  # skor sama
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_parallelMatchesLinearScan(rankedMatch, parallelScoring, query):  # kandidat index, ekspansi fuzzy dari parent
+    assertParallelSameAsLinearScan(rankedMatch, query, earlyTermination=False)  # mode index
+
+@pytest.mark.parametrize('query', ["fakultsa itb", "qwerty zxcv"])
+def test_parallelLinearModeMatchesLinearScan(rankedMatch, parallelScoring, query):  # tanpa index: worker hitung similarity sendiri
+    assertParallelSameAsLinearScan(rankedMatch, query, useIndex=False)  # mode linear
+
+@pytest.mark.parametrize('query', ["apa itu itb", "fakultsa itb"])
+def test_parallelTfidfMatchesLinearScan(rankedMatch, parallelScoring, tfidfIndexFile, query):  # top-K TF-IDF ikut kandidat shard worker
+    assertParallelSameAsLinearScan(rankedMatch, query, earlyTermination=False, useTfidf=True)  # mode index + TF-IDF
+
+def test_shardRangesCoverCorpus():  # shard worker berurutan, tidak tumpang tindih, tanpa shard kosong
+    for size, shardCount in [(10, 3), (2, 8), (1, 1), (7, 7)]:  # corpus lebih besar / lebih kecil dari jumlah shard
+        shards = matching.shardRanges(size, shardCount)  # range per worker
+        assert [docId for shard in shards for docId in shard] == list(range(size))  # semua docId tepat sekali
+        assert len(shards) == min(size, shardCount) and all(shards)  # jumlah shard
+
+def test_shardCandidatesMatchFullCandidates():  # kandidat yang dicari worker di shard-nya == kandidat parent dipotong per shard
+    index = matching.getInvertedIndex()  # index corpus
+    for query in ["apa itu itb", "fakultsa itb"]:  # query dengan kandidat
+        queryLower = query.lower()  # lowercase
+        words = [word for word in queryLower.split() if len(word) > 1]  # kata query
+        processedQuery = preprocess(query)  # processed query
+        processedWords = [word for word in processedQuery.split() if len(word) > 1]  # kata processed
+        fuzzyLookup = index.buildFuzzyLookup(words + processedWords, matching.cachedFuzzySimilarity, matching.FUZZY_THRESHOLD)  # ekspansi fuzzy
+        full = index.getCandidates(queryLower, words, processedQuery, processedWords, fuzzyLookup)  # kandidat semua docId
+        shards = matching.shardRanges(index.size, 3)  # tiga worker
+        assert [docId for shard in shards for docId in index.getCandidates(queryLower, words, processedQuery, processedWords, fuzzyLookup, shard)] == full  # gabungan shard == kandidat penuh
+
+def test_parallelWorkersUseSetProcessedDataCorpus(rankedMatch, parallelScoring, caplog):  # worker memakai corpus parent, bukan file corpus aktif
+    entries = list(reversed(matching.getProcessedData()))  # docId beda dengan file corpus
+    matching.setProcessedData(entries)  # corpus sintetis (mis. benchmark), pool lama dimatikan
+    matching.startScoringPool()  # worker dengan corpus baru
+    for query in ["apa itu itb", "fakultsa itb"]:  # query dengan kandidat
+        linear, _ = rankedMatch(query, 5, earlyTermination=False)  # serial di parent
+        parallel, _ = rankedMatch(query, 5, parallel=True, earlyTermination=False)  # shard di worker
+        assert [content for content, _ in parallel] == [content for content, _ in linear]  # docId worker = docId parent
+    assert matching._scoringPoolCorpus is matching.getCorpus()  # pool di-fork dengan corpus ini
+    assert 'corpus mismatch' not in caplog.text  # hasil dari worker, bukan fallback serial
+
+def test_scoringPoolNotUsedForReplacedCorpus(parallelScoring):  # request lama setelah corpus di-swap
+    old = matching.getCorpus()  # corpus sebelum swap
+    matching.setProcessedData(list(old.dataEntries))  # corpus baru
+    assert matching.getScoringPool(matching.getCorpus()) is None  # tidak di-fork lazy dari request
+    matching.startScoringPool()  # worker dengan corpus baru
+    assert matching.getScoringPool(old) is None  # corpus lama -> scoring serial
+    assert matching.getScoringPool(matching.getCorpus()) is not None  # corpus aktif -> pool
+
+def test_matchParallelFlag(parallelScoring, monkeypatch):  # MATCH_PARALLEL: matchIntent/matchIntentBatch memakai worker, hasil sama
+    queries = ["apa itu itb", "fakultsa itb", "qwerty zxcv"]  # query dengan / tanpa kandidat
+    serial = [matching.matchIntent(query) for query in queries]  # flag mati
+    serialBatch = matching.matchIntentBatch(queries)  # batch flag mati
+    calls = []  # scoring paralel yang terpakai
+    scoreParallel = matching.scoreCandidatesParallel  # fungsi asli
+    monkeypatch.setattr(matching, 'scoreCandidatesParallel', lambda *args: calls.append(args) or scoreParallel(*args))  # catat panggilan
+    monkeypatch.setattr(matching, 'PARALLEL_ENABLED', True)  # MATCH_PARALLEL=1
+    assert [matching.matchIntent(query) for query in queries] == serial  # hasil sama dengan serial
+    assert matching.matchIntentBatch(queries) == serialBatch  # batch sama dengan serial
+    assert len(calls) == 2 * len(queries)  # semua query lewat worker shard
+
+def test_warmUpAndReloadStartScoringPool(monkeypatch):  # pool di-fork saat warm-up dan setelah swap corpus
+    if not matching.FORK_AVAILABLE:  # worker tidak bisa mewarisi corpus
+        pytest.skip('fork tidak tersedia, matchWithCsvData scoring serial')  # jalur paralel tidak dipakai
+    monkeypatch.setattr(matching, 'PARALLEL_MIN_ENTRIES', 1)  # corpus asli cukup besar
+    monkeypatch.setattr(matching, 'PARALLEL_SHARDS', 2)  # dua worker
+    monkeypatch.setattr(matching, '_corpus', matching.getCorpus())  # corpus dikembalikan setelah test
+    try:
+        assert matching.warmUpMatcher() is not None and matching._scoringPool is None  # flag mati -> tanpa worker
+        monkeypatch.setattr(matching, 'PARALLEL_ENABLED', True)  # MATCH_PARALLEL=1
+        matching.warmUpMatcher()  # warm-up startup
+        assert matching.getScoringPool(matching.getCorpus()) is not None  # worker siap sebelum request pertama
+        corpus = matching.reloadProcessedData(force=True)  # swap corpus
+        assert matching.getScoringPool(corpus) is not None  # worker baru untuk corpus baru
+    finally:
+        matching.shutdownScoringPool()  # worker memegang corpus test
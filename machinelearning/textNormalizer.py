@@ -0,0 +1,76 @@
+# Text Normalizer - engine normalisasi teks yang di-compile sekali, dipakai preprocess dan preprocessText
+"""
+Pengganti rangkaian re.sub per langkah di preprocessing.preprocess dan
+NaturalLanguageIntentDetector.preprocessText. Hasilnya byte-identik dengan versi lama:
+
+- punctuation ([^\\w\\s]) dihapus/diganti spasi lewat str.translate; tabel translate
+  mengisi sendiri karakter yang belum pernah dilihat (dicek dengan regex yang sama),
+  jadi semantik Unicode \\w/\\s tetap persis
+- koreksi typo jadi satu token map: typo di-match utuh (\\b...\\b) dan token hasil
+  split setelah punctuation = run \\w maksimal, jadi lookup per token setara re.sub
+- stopword + stemming per token di-memo (lru_cache berbatas), important term jadi
+  frozenset + satu regex gabungan pengganti any(term in word ...)
+"""
+import os
+import re
+from functools import lru_cache
+
+WORD_OR_SPACE = re.compile(r'[\w\s]') # karakter yang dipertahankan (kebalikan [^\w\s])
+TOKEN_CACHE_SIZE = int(os.environ.get('TOKEN_CACHE_SIZE', '65536')) # jumlah token yang hasil normalisasinya di-memo
+
+STOPWORDS = frozenset([ # stopword bahasa Indonesia
+    'dan', 'di', 'ke', 'dari', 'yang', 'untuk', 'pada', 'dengan', 'atau', 'juga', 'sebagai', 'dalam', 'adalah', 'itu', 'ini', 'saya', 'kamu', 'kami', 'kita', 'mereka', 'akan', 'tidak', 'bisa', 'telah', 'sudah', 'belum', 'oleh', 'karena', 'agar', 'sehingga', 'supaya', 'tentang', 'tanpa', 'setelah', 'sebelum', 'sesudah', 'sejak', 'hingga', 'sampai', 'selama', 'antara', 'bahwa', 'namun', 'tetapi', 'jadi', 'hanya', 'masih', 'lagi', 'pun', 'lah', 'punya', 'ada'
+])
+IMPORTANT_TERMS = frozenset(['akreditasi', 'universitas', 'fakultas', 'teknologi', 'bandung', 'institut', 'kampus', 'program', 'mahasiswa', 'penelitian']) # term yang tidak di-stem
+IMPORTANT_TERM_PATTERN = re.compile('|'.join(re.escape(term) for term in sorted(IMPORTANT_TERMS))) # satu scan substring semua term
+STEM_LENGTH = 6 # panjang potongan stem
+
+TYPO_CORRECTIONS = { # koreksi typo umum (token utuh)
+    'gimana': 'bagaimana', # gimana -> bagaimana
+    'apaan': 'apa', # apaan -> apa
+    'dimana': 'di mana', # dimana -> di mana
+    'napa': 'apa', # napa -> apa
+    'gmana': 'bagaimana' # gmana -> bagaimana
+}
+
+class PunctuationTable(dict): # tabel str.translate untuk [^\w\s], diisi lazy per codepoint
+    def __init__(self, replacement): # None = hapus, ' ' = ganti spasi
+        super().__init__() # dict kosong
+        self.replacement = replacement # pengganti punctuation
+        for codepoint in range(256): # isi Latin-1 di depan (kasus umum)
+            self.__missing__(codepoint) # hitung + simpan
+
+    def __missing__(self, codepoint: int): # karakter yang belum pernah dilihat
+        value = codepoint if WORD_OR_SPACE.match(chr(codepoint)) else self.replacement # sama dengan regex per karakter
+        self[codepoint] = value # simpan (jumlah codepoint terbatas)
+        return value # return pengganti
+
+DELETE_PUNCTUATION = PunctuationTable(None) # re.sub(r'[^\w\s]', '', text)
+SPACE_PUNCTUATION = PunctuationTable(' ') # re.sub(r'[^\w\s]', ' ', text)
+
+def stripPunctuation(text: str) -> str: # hapus punctuation
+    return text.translate(DELETE_PUNCTUATION) # satu pass translate
+
+def isImportantTerm(word: str) -> bool: # word memuat important term
+    return word in IMPORTANT_TERMS or IMPORTANT_TERM_PATTERN.search(word) is not None # set dulu, lalu scan substring
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def stemToken(word: str) -> str: # stemming satu token (sama dengan preprocessing.stemming)
+    if len(word) <= STEM_LENGTH or isImportantTerm(word): # kata pendek / penting tetap utuh
+        return word # token asli
+    return word[:STEM_LENGTH] # potong jadi 6 karakter
+
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def normalizeToken(token: str) -> str: # stopword + stemming satu token, '' kalau dibuang
+    return '' if token in STOPWORDS else stemToken(token) # token hasil pipeline
+
+def clearTokenCaches(): # kosongkan memo token (benchmark cold pass)
+    stemToken.cache_clear() # memo stemming
+    normalizeToken.cache_clear() # memo stopword + stemming
+
+def normalizeText(text: str) -> str: # lower -> hapus punctuation -> stopword -> stem (preprocessing.preprocess)
+    return ' '.join(filter(None, map(normalizeToken, text.lower().translate(DELETE_PUNCTUATION).split()))) # token non-kosong
+
+def normalizeQuery(text: str) -> str: # lower -> koreksi typo -> punctuation jadi spasi -> rapikan spasi (detector.preprocessText)
+    getCorrection = TYPO_CORRECTIONS.get # akses lokal
+    return ' '.join([getCorrection(token, token) for token in text.lower().translate(SPACE_PUNCTUATION).split()]) # token terkoreksi
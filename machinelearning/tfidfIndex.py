@@ -0,0 +1,102 @@
+# TF-IDF Index - vectorizer di-fit sekali atas corpus dan disimpan ke disk
+"""
+Index TF-IDF persisten: TfidfVectorizer di-fit sekali atas content corpus dataLoader,
+matrix dokumen disimpan sebagai CSR yang sudah L2-normalized. Query cukup di-transform
+lalu di-dot dengan matrix dokumen (= cosine similarity) dan diambil top-K via argpartition.
+File index disimpan di sebelah processed CSV dan divalidasi dengan hash corpus,
+jadi worker cukup load tanpa refit.
+"""
+import hashlib
+import os
+import pickle
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from structuredLog import getLogger # logger terstruktur
+
+logger = getLogger('data') # logger stage load corpus
+
+INDEX_VERSION = 1 # versi format file index
+
+def corpusHash(documents: List[str]) -> str: # hash isi corpus buat validasi index di disk
+    digest = hashlib.sha1() # hasher
+    for document in documents: # loop dokumen
+        digest.update(document.encode('utf-8')) # isi dokumen
+        digest.update(b'\x00') # pemisah dokumen
+    return digest.hexdigest() # hash hex
+
+class TfidfIndex: # index TF-IDF atas corpus
+    def __init__(self, vectorizer: TfidfVectorizer, documentMatrix: sparse.csr_matrix, sourceHash: str): # konstruktor index
+        self.vectorizer = vectorizer # vectorizer yang sudah di-fit
+        self.documentMatrix = documentMatrix # matrix dokumen (CSR, L2-normalized)
+        self.sourceHash = sourceHash # hash corpus sumber
+
+    @classmethod
+    def fit(cls, documents: List[str]) -> 'TfidfIndex': # fit index dari dokumen
+        """Fit TfidfVectorizer sekali atas seluruh corpus"""
+        vectorizer = TfidfVectorizer(stop_words=None, lowercase=True) # vectorizer sama dengan tfidfSimilarity
+        documentMatrix = sparse.csr_matrix(vectorizer.fit_transform(documents)) # matrix dokumen (norm l2)
+        return cls(vectorizer, documentMatrix, corpusHash(documents)) # index baru
+
+    def scores(self, query: str) -> np.ndarray: # cosine similarity query ke semua dokumen
+        queryVector = self.vectorizer.transform([query]) # vektor query (L2-normalized)
+        return np.asarray(self.documentMatrix.dot(queryVector.T).todense()).ravel() # sparse dot = cosine
+
+    def search(self, query: str, topK: int = 10) -> List[Tuple[int, float]]: # top-K dokumen
+        """Return [(docId, score)] urut skor tertinggi, hanya dokumen dengan skor > 0"""
+        similarities = self.scores(query) # skor semua dokumen
+        if topK <= 0 or len(similarities) == 0: # tidak ada yang diminta
+            return [] # hasil kosong
+        if topK < len(similarities): # ambil top-K parsial
+            topIds = np.argpartition(-similarities, topK - 1)[:topK] # top-K tanpa full sort
+        else:
+            topIds = np.arange(len(similarities)) # semua dokumen
+        topIds = topIds[np.argsort(-similarities[topIds], kind='stable')] # urutkan top-K saja
+        return [(int(docId), float(similarities[docId])) for docId in topIds if similarities[docId] > 0] # buang skor 0
+
+    def save(self, path: str): # simpan index ke disk
+        tempPath = f"{path}.tmp{os.getpid()}" # tulis ke file sementara dulu
+        with open(tempPath, 'wb') as indexFile: # buka file
+            pickle.dump({ # payload index
+                'version': INDEX_VERSION, # versi format
+                'sourceHash': self.sourceHash, # hash corpus
+                'vectorizer': self.vectorizer, # vectorizer
+                'documentMatrix': self.documentMatrix # matrix dokumen
+            }, indexFile, protocol=pickle.HIGHEST_PROTOCOL) # serialisasi
+        os.replace(tempPath, path) # ganti file secara atomik
+
+    @classmethod
+    def load(cls, path: str, expectedHash: Optional[str] = None) -> Optional['TfidfIndex']: # load index dari disk
+        """Load index; return None kalau file tidak ada, versi beda, atau corpus sudah berubah"""
+        if not os.path.exists(path): # file belum ada
+            return None # perlu build
+        try:
+            with open(path, 'rb') as indexFile: # buka file
+                payload = pickle.load(indexFile) # baca payload
+        except Exception as e: # file rusak
+            logger.warning("TF-IDF index load error %s: %s", path, e) # log error
+            return None # perlu build
+        if payload.get('version') != INDEX_VERSION: # format lama
+            return None # perlu build
+        if expectedHash is not None and payload.get('sourceHash') != expectedHash: # corpus berubah
+            return None # perlu build
+        return cls(payload['vectorizer'], payload['documentMatrix'], payload['sourceHash']) # index dari disk
+
+def loadOrBuildTfidfIndex(documents: List[str], path: str) -> TfidfIndex: # load dari disk atau fit baru
+    """Load index yang cocok dengan corpus, kalau tidak ada fit lalu simpan ke disk"""
+    expectedHash = corpusHash(documents) # hash corpus sekarang
+    index = TfidfIndex.load(path, expectedHash) # coba load
+    if index is not None: # index valid
+        logger.info("TF-IDF index loaded from %s", path) # log load
+        return index # pakai index disk
+
+    index = TfidfIndex.fit(documents) # fit index baru
+    try:
+        index.save(path) # simpan buat worker lain
+        logger.info("TF-IDF index saved to %s", path) # log simpan
+    except OSError as e: # direktori read-only
+        logger.warning("TF-IDF index save error %s: %s", path, e) # log error, index tetap dipakai di memori
+    return index # return index